@@ -0,0 +1,618 @@
+# -*- coding: utf-8 -*-
+"""benchmarks.py
+timing benchmarks for performance-sensitive Damon tools and methods.
+
+Each bench_*() function builds artificial data of increasing size,
+times the competing code paths on identical inputs, checks that they
+agree, and prints a table of results.  The return value is the same
+table as a list of rows so that it can be stored or compared.
+
+Example:
+
+>>>  import damon1.benchmarks as bm
+>>>  bm.bench_faccoord()
+
+Copyright (c) 2016, Mark H. Moulton
+
+"""
+#234567890123456789012345678901234567890123456789012345678901234567890123456789
+
+import time
+
+import numpy as np
+import numpy.random as npr
+np.seterr(all='ignore')
+
+from tabulate import tabulate
+
+import damon1.tools as tools
+
+
+def _make_coord_data(nrows, ncols, ndim, p_nan, seed, nanval=-999.,
+                     nforms=None):
+    """Build row x col data with a known ndim structure.  Cells are
+    missing at random or, if `nforms` is given, by test form."""
+
+    rs = npr.RandomState(seed)
+    R = rs.randn(nrows, ndim)
+    C = rs.randn(ncols, ndim)
+    data = np.dot(R, C.T) + rs.randn(nrows, ncols) * 0.5
+    if nforms is None:
+        data[rs.rand(nrows, ncols) < p_nan] = nanval
+    else:
+        forms = rs.rand(nforms, ncols) < p_nan
+        data[forms[rs.randint(0, nforms, nrows)]] = nanval
+    return data, C
+
+
+def bench_faccoord(nrows=[10000, 100000, 1000000], ncols=30, ndim=3,
+                   p_nan=0.20, nforms=None, loop_max=20000, seed=1,
+                   printout=True):
+    """Time the 'Loop' and 'Batch' (or 'Pattern') engines of
+    tools.faccoord().
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of target entities (rows) to solve.
+    ncols : int
+        Number of opposing entities (columns).
+    ndim : int
+        Dimensionality of the coordinates.
+    p_nan : float
+        Proportion of cells made missing.
+    nforms : {None, int}
+        If given, rows are assigned to `nforms` fixed test forms that
+        share their missing cells, and the 'Pattern' engine (with
+        tools.miss_patterns() timed as part of it) is compared with
+        'Loop' instead of 'Batch'.
+    loop_max : int
+        The 'Loop' engine is timed on at most `loop_max` rows and its
+        time extrapolated linearly beyond that, since it is linear in
+        the number of rows and would otherwise dominate the run.
+    seed : int
+        Random seed for the artificial data.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, loop seconds, batch/pattern seconds, speedup, max abs diff]
+        for each entry in `nrows`.  Extrapolated loop times are
+        marked with '*'.
+
+    """
+    nanval = -999.
+    fast = 'Batch' if nforms is None else 'Pattern'
+    header = ['nrows', 'Loop (s)', fast + ' (s)', 'Speedup', 'Max diff']
+    rows = []
+
+    for n in nrows:
+        data, C = _make_coord_data(n, ncols, ndim, p_nan, seed, nanval,
+                                   nforms)
+        index = tools.csr_index(data, nanval)
+        logn = np.log(np.sum(data != nanval, axis=0) + 1.)[:, np.newaxis]
+        W = tools.weight_coord(C, logn, 'R', nanval)
+
+        def run(engine, nrun):
+            start = np.zeros((nrun, ndim))
+            t0 = time.time()
+            patterns = None
+            if engine == 'Pattern':
+                patterns = tools.miss_patterns(index[:nrun], ncols)
+            out = tools.faccoord([0, start, False], index[:nrun], data[:nrun],
+                                 C, W, 'LstSq', None, None, 'IgnoreCells',
+                                 nanval, engine, patterns)
+            return time.time() - t0, out['FacCoord']
+
+        n_loop = min(n, loop_max)
+        t_loop, v_loop = run('Loop', n_loop)
+        t_batch, v_batch = run(fast, n)
+        extrap = n_loop < n
+        t_loop = t_loop * n / float(n_loop)
+        diff = np.max(np.abs(v_loop - v_batch[:n_loop]))
+
+        rows.append([str(n), '%.3f%s' % (t_loop, '*' if extrap else ''),
+                     '%.3f' % t_batch, '%.1fx' % (t_loop / t_batch),
+                     '%.2e' % diff])
+
+    if printout:
+        print '\nfaccoord() IgnoreCells/LstSq engines:', ncols, 'cols,', \
+              ndim, 'dims,', p_nan, 'missing', \
+              '' if nforms is None else 'on %d forms' % nforms
+        print tabulate([header] + rows, headers='firstrow')
+        if max(nrows) > loop_max:
+            print '* extrapolated from', loop_max, 'rows'
+        print
+
+    return rows
+
+
+def bench_coord_accel(nrows=[2000, 20000], ncols=80, ndim=6, coord_dim=3,
+                      p_nan=0.50, meths=['SOR', 'Anderson'],
+                      runspecs=[0.00001, 300], seed=3, printout=True):
+    """Time Damon.coord() with and without convergence acceleration.
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of rows.
+    ncols : int
+        Number of columns.
+    ndim : int
+        Dimensionality of the artificial data.
+    coord_dim : int
+        Dimensionality at which coord() is run.  Running below the true
+        dimensionality gives the slow convergence acceleration targets.
+    p_nan : float
+        Proportion of cells made missing.
+    meths : list
+        runspecs acceleration flags to compare with plain iteration.
+    runspecs : list
+        [StopWhenChange, MaxIteration] used for all runs.
+    seed : int
+        Random seed for the artificial data and starter coordinates.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, method, iterations, seconds, speedup, max abs diff in
+        estimates from the plain run] for each entry in `nrows` and
+        method.
+
+    """
+    import damon1.core as core
+
+    header = ['nrows', 'Method', 'Iterations', 'Time (s)', 'Speedup',
+              'Max diff']
+    rows = []
+
+    for n in nrows:
+        data = core.create_data(nfac0=n, nfac1=ncols, ndim=ndim, p_nan=p_nan,
+                                noise=0.5, seed=seed, verbose=None)['data']
+        data.standardize()
+
+        for meth in [None] + meths:
+            d = core.Damon(data.standardize_out, 'datadict', 'RCD',
+                           verbose=None)
+            t0 = time.time()
+            d.coord([[coord_dim]], runspecs + ([meth] if meth else []),
+                    seed=seed)
+            t = time.time() - t0
+            est = np.dot(d.coord_out['fac0coord']['coredata'],
+                         d.coord_out['fac1coord']['coredata'].T)
+            if meth is None:
+                t_plain, est_plain = t, est
+            rows.append([str(n), str(meth), str(len(d.coord_out['changelog'])),
+                         '%.3f' % t, '%.1fx' % (t_plain / t),
+                         '%.2e' % np.max(np.abs(est - est_plain))])
+
+    if printout:
+        print '\ncoord() acceleration:', ncols, 'cols,', ndim, 'dims,', \
+              coord_dim, 'coord dims,', p_nan, 'missing'
+        print tabulate([header] + rows, headers='firstrow')
+        print
+
+    return rows
+
+
+def _make_block_data(nrows, ncols, nslow, p_link, seed, nanval=-999.):
+    """Build row x col data of two weakly linked blocks.  The last
+    `nslow` rows and cols have 6 dims, the rest 3, and each block has
+    only a proportion `p_link` of valid cells in the other block's
+    cols.  Fitted in 3 dims, the first block converges fast and the
+    second slowly."""
+
+    rs = npr.RandomState(seed)
+    fast_rows, fast_cols = nrows - nslow[0], ncols - nslow[1]
+    R = rs.randn(nrows, 6)
+    C = rs.randn(ncols, 6)
+    R[:fast_rows, 3:] = 0
+    data = np.dot(R, C.T) + rs.randn(nrows, ncols) * 0.5
+    valid = rs.rand(nrows, ncols) > 0.1
+    valid[:fast_rows, fast_cols:] = rs.rand(fast_rows, nslow[1]) < p_link
+    valid[fast_rows:, :fast_cols] = rs.rand(nslow[0], fast_cols) < p_link
+    data[~valid] = nanval
+    return data
+
+
+def bench_coord_freeze(nrows=[5000, 20000], ncols=80, slow=0.2,
+                       p_link=0.01, specs=['Freeze', {'Freeze':[0.00001, 10]}],
+                       runspecs=[0.00001, 300], seed=3, printout=True):
+    """Time Damon.coord() with and without per-entity freezing.
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of rows.
+    ncols : int
+        Number of columns.
+    slow : float
+        Proportion of rows and cols in the slowly converging block.
+    p_link : float
+        Proportion of valid cells linking each block to the other.
+    specs : list
+        runspecs freezing flags to compare with plain iteration.
+    runspecs : list
+        [StopWhenChange, MaxIteration] used for all runs.
+    seed : int
+        Random seed for the artificial data and starter coordinates.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, method, iterations, row entities solved, seconds,
+        speedup, max abs diff in estimates from the plain run] for
+        each entry in `nrows` and method.
+
+    """
+    import damon1.core as core
+
+    header = ['nrows', 'Method', 'Iterations', 'Row solves', 'Time (s)',
+              'Speedup', 'Max diff']
+    rows = []
+
+    for n in nrows:
+        data = _make_block_data(n, ncols, [int(n * slow), int(ncols * slow)],
+                                p_link, seed)
+
+        for spec in [None] + specs:
+            d = core.Damon(data, 'array', 'RCD', nanval=-999., verbose=None)
+            t0 = time.time()
+            d.coord([[3]], runspecs + ([spec] if spec else []), seed=seed)
+            t = time.time() - t0
+            est = np.dot(d.coord_out['fac0coord']['coredata'],
+                         d.coord_out['fac1coord']['coredata'].T)
+            its = len(d.coord_out['changelog'])
+            if spec is None:
+                t_plain, est_plain = t, est
+                solves = n * its
+            else:
+                solves = int(np.sum(d.coord_out['activelog'][:, 1]))
+            rows.append([str(n), str(spec), str(its), str(solves),
+                         '%.3f' % t, '%.1fx' % (t_plain / t),
+                         '%.2e' % np.max(np.abs(est - est_plain))])
+
+    if printout:
+        print '\ncoord() freezing:', ncols, 'cols,', slow, 'slow,', p_link, \
+              'linking'
+        print tabulate([header] + rows, headers='firstrow')
+        print
+
+    return rows
+
+
+def bench_irls(nrows=[2000, 20000, 100000], ncols=30, ndim=3, p_nan=0.20,
+               runspecs=[0.001, 10], loop_max=5000, seed=1, printout=True):
+    """Time faccoord() with solve_meth = 'IRLS', one entity at a time
+    ('Loop') against tools.irls_batch() ('Batch').
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of target entities (rows) to solve.
+    ncols : int
+        Number of opposing entities (columns).
+    ndim : int
+        Dimensionality of the coordinates.
+    p_nan : float
+        Proportion of cells made missing.
+    runspecs : list
+        IRLS [StopWhenChange, MaxIteration] per entity.
+    loop_max : int
+        The 'Loop' engine is timed on at most `loop_max` rows and its
+        time extrapolated linearly beyond that.
+    seed : int
+        Random seed for the artificial data.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, loop seconds, batch seconds, speedup, max abs diff]
+        for each entry in `nrows`.  Extrapolated loop times are
+        marked with '*'.
+
+    """
+    nanval = -999.
+    specs = {'runspecs':runspecs, 'ecutmaxpos':[0.5, 1.4], 'pcut':0.5}
+    header = ['nrows', 'Loop (s)', 'Batch (s)', 'Speedup', 'Max diff']
+    rows = []
+
+    for n in nrows:
+        rs = npr.RandomState(seed)
+        R = rs.randn(n, ndim)
+        C = rs.randn(ncols, ndim) * 0.5
+        data = (rs.rand(n, ncols) < 1 / (1 + np.exp(-np.dot(R, C.T))))
+        data = data.astype(float)
+        data[rs.rand(n, ncols) < p_nan] = nanval
+        index = tools.csr_index(data, nanval)
+        U = rs.randn(ncols, ndim) * 0.3
+
+        def run(engine, nrun):
+            t0 = time.time()
+            out = tools.faccoord([0, np.zeros((nrun, ndim)), False],
+                                 index[:nrun], data[:nrun], U, None, 'IRLS',
+                                 specs, None, 'IgnoreCells', nanval, engine)
+            return time.time() - t0, out['FacCoord']
+
+        n_loop = min(n, loop_max)
+        t_loop, v_loop = run('Loop', n_loop)
+        t_batch, v_batch = run('Batch', n)
+        extrap = n_loop < n
+        t_loop = t_loop * n / float(n_loop)
+        diff = np.max(np.abs(v_loop - v_batch[:n_loop]))
+
+        rows.append([str(n), '%.3f%s' % (t_loop, '*' if extrap else ''),
+                     '%.3f' % t_batch, '%.1fx' % (t_loop / t_batch),
+                     '%.2e' % diff])
+
+    if printout:
+        print '\nfaccoord() IRLS engines:', ncols, 'cols,', ndim, 'dims,', \
+              p_nan, 'missing'
+        print tabulate([header] + rows, headers='firstrow')
+        if max(nrows) > loop_max:
+            print '* extrapolated from', loop_max, 'rows'
+        print
+
+    return rows
+
+
+def bench_rasch(nrows=[10000, 100000, 500000], ncols=60, cats=[0, 1],
+                p_nan=0.10, nforms=None, collapse=None, sparse=None,
+                iterations=10, seed=1, printout=True):
+    """Time Damon.rasch() iterations on Rasch-like data.
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of persons (rows).
+    ncols : int
+        Number of items (columns).
+    cats : list of int
+        Response categories, e.g. [0, 1] or [0, 1, 2, 3].
+    p_nan : float
+        Proportion of cells made missing.
+    nforms : {None, int}
+        If given, persons are assigned to `nforms` fixed test forms
+        that share their missing items, rather than cells being made
+        missing at random.
+    collapse : {None, 'Patterns', 'Scores'}
+        rasch()'s collapse argument.  With fixed forms, 'Scores'
+        reduces the persons to at most nforms x (max score + 1) rows.
+    sparse : {None, True}
+        rasch()'s sparse argument.  Run each setting in a fresh
+        process to compare peak memory.
+    iterations : int
+        rasch() is run for exactly this many iterations (plus its
+        final pass), so times are comparable across sizes and
+        versions.
+    seed : int
+        Random seed for the artificial data.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, seconds per iteration, nanoseconds per cell per
+        iteration, total seconds, peak MB] for each entry in `nrows`.
+        Iteration times come from rasch()'s monitor records, and
+        include the final pass over all rows; the total includes
+        building rasch_out.  Peak MB is the peak for
+        the process so far, so it only grows down the table.
+
+    """
+    import damon1.core as core
+
+    header = ['nrows', 's/iteration', 'ns/cell/it', 'Total (s)', 'Peak MB']
+    rows = []
+
+    for n in nrows:
+        data = core.create_data(nfac0=n, nfac1=ncols, ndim=1, seed=seed,
+                                facmetric=[1, 0.001], noise=0.5,
+                                validchars=['All', cats, 'Num'],
+                                p_nan=p_nan if nforms is None else 0.0,
+                                verbose=None)['data']
+        if nforms is not None:
+            rs = npr.RandomState(seed)
+            forms = rs.rand(nforms, ncols) < p_nan
+            core_ = data.data_out['coredata']
+            core_[forms[rs.randint(0, nforms, n)]] = data.data_out['nanval']
+        d = core.Damon(data.data_out, 'datadict', 'RCD', verbose=None)
+        del data
+
+        log = []
+        t0 = time.time()
+        d.rasch(groups=None, runspecs=[0.0, iterations], monitor=log.append,
+                collapse=collapse, sparse=sparse)
+        t = time.time() - t0
+        t_it = np.mean([rec['seconds'] for rec in log])
+        peak = tools.peak_memory()
+
+        rows.append([str(n), '%.3f' % t_it,
+                     '%.1f' % (1e9 * t_it / (n * ncols)), '%.2f' % t,
+                     '%.0f' % peak if peak is not None else 'n/a'])
+
+    if printout:
+        print '\nrasch():', ncols, 'items,', len(cats), 'categories,', \
+              p_nan, 'missing', \
+              '' if nforms is None else 'on %d forms' % nforms, \
+              '' if collapse is None else 'collapsed by ' + collapse, \
+              '' if sparse is None else 'sparse', \
+              iterations, 'iterations'
+        print tabulate([header] + rows, headers='firstrow')
+        print
+
+    return rows
+
+
+def bench_rasch_solver(nrows=[10000, 100000], ncols=60, cats=[0, 1, 2, 3],
+                       p_nan=0.10, solvers=['PROX', 'Newton', ['PROX', 'Newton']],
+                       runspecs=[0.001, 300], seed=1, printout=True):
+    """Compare the iterations and time of Damon.rasch() solvers.
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of persons (rows).
+    ncols : int
+        Number of items (columns).
+    cats : list of int
+        Response categories, e.g. [0, 1] or [0, 1, 2, 3].
+    p_nan : float
+        Proportion of cells made missing.
+    solvers : list
+        rasch() solver arguments to compare with the default.
+    runspecs : list
+        [stop_when_change, max_iteration] used for all runs.
+    seed : int
+        Random seed for the artificial data.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, solver, iterations, halved steps, converged, seconds,
+        speedup, max abs diff in person measures from the default run]
+        for each entry in `nrows` and solver.
+
+    """
+    import damon1.core as core
+
+    header = ['nrows', 'Solver', 'Iterations', 'Halved', 'Converged',
+              'Time (s)', 'Speedup', 'Max diff']
+    rows = []
+
+    for n in nrows:
+        data = core.create_data(nfac0=n, nfac1=ncols, ndim=1, seed=seed,
+                                facmetric=[1, 0.001], noise=0.5,
+                                validchars=['All', cats, 'Num'],
+                                p_nan=p_nan, verbose=None)['data']
+
+        for solver in [None] + solvers:
+            d = core.Damon(data.data_out, 'datadict', 'RCD', verbose=None)
+            t0 = time.time()
+            d.rasch(groups=None, runspecs=runspecs, solver=solver)
+            t = time.time() - t0
+            its = d.rasch_out['iterations']
+            R = d.rasch_out['fac0coord']['coredata']
+            if solver is None:
+                t_plain, R_plain = t, R
+            rows.append([str(n), str(solver), str(its['Iterations']),
+                         str(its['Backtracks']), str(its['Converged']),
+                         '%.2f' % t, '%.1fx' % (t_plain / t),
+                         '%.2e' % np.max(np.abs(R - R_plain))])
+        del data, d
+
+    if printout:
+        print '\nrasch() solvers:', ncols, 'items,', len(cats), 'categories,', \
+              p_nan, 'missing, runspecs', runspecs
+        print tabulate([header] + rows, headers='firstrow')
+        print
+
+    return rows
+
+
+def bench_rasch_score(nrows=[100000, 1000000], ncols=60, cats=[0, 1, 2, 3],
+                      p_nan=0.10, nforms=4, seed=1, printout=True):
+    """Time tools.rasch_score(), the anchored person scoring of
+    Damon.rasch(), against banked item and step parameters.
+
+    Parameters
+    ----------
+    nrows : list of int
+        Numbers of persons (rows).
+    ncols : int
+        Number of items (columns).
+    cats : list of int
+        Response categories, e.g. [0, 1] or [0, 1, 2, 3].
+    p_nan : float
+        Proportion of cells made missing.
+    nforms : {None, int}
+        If given, persons are assigned to `nforms` fixed test forms
+        that share their missing items, rather than cells being made
+        missing at random.
+    seed : int
+        Random seed for the artificial data.
+    printout : bool
+        Print the results table.
+
+    Returns
+    -------
+    rows : list
+        [nrows, item sets, cases solved, seconds with empty tables,
+        seconds with the tables of the first run, max abs score
+        residual] for each entry in `nrows`.  The score residual,
+        the raw score less the sum of the expected values, is 0 at
+        the maximum likelihood measure; persons with zero and perfect
+        scores are left out.
+
+    """
+    rs = npr.RandomState(seed)
+    k = np.arange(len(cats), dtype=float)[:, np.newaxis, np.newaxis]
+    diffs = rs.randn(ncols)
+    diffs -= np.mean(diffs)
+    steps = np.zeros((ncols, len(cats)))
+    steps[:, 1:] = np.cumsum(np.sort(rs.randn(ncols, len(cats) - 1), axis=1)
+                             - 0.5, axis=1)
+    forms = None if nforms is None else rs.rand(nforms, ncols) < p_nan
+
+    def probs(theta, rows):
+        p = np.exp(k * (theta[rows][np.newaxis, :, np.newaxis]
+                        - diffs[np.newaxis, np.newaxis, :])
+                   - steps.T[:, np.newaxis, :])
+        return p / np.sum(p, axis=0)
+
+    header = ['nrows', 'Item sets', 'Solved', 'Time (s)', 'Cached (s)',
+              'Max residual']
+    rows = []
+
+    for n in nrows:
+        theta = rs.randn(n)
+        data = np.zeros((n, ncols))
+        for start in xrange(0, n, 100000):
+            at = slice(start, start + 100000)
+            cum = np.cumsum(probs(theta, at), axis=0)
+            data[at] = np.sum(rs.rand(len(theta[at]), ncols) > cum, axis=0)
+        if forms is None:
+            data[rs.rand(n, ncols) < p_nan] = -999.
+        else:
+            data[forms[rs.randint(0, nforms, n)]] = -999.
+
+        tables = {}
+        t0 = time.time()
+        out = tools.rasch_score(data, diffs, steps, tables=tables)
+        t = time.time() - t0
+        t0 = time.time()
+        tools.rasch_score(data, diffs, steps, tables=tables)
+        t_cached = time.time() - t0
+
+        # Score residuals of a sample of persons
+        at = rs.randint(0, n, min(n, 10000))
+        valid = data[at] != -999.
+        score = np.sum(np.where(valid, data[at], 0), axis=1)
+        E = np.sum(k * probs(out['Measures'][:, 0], at), axis=0)
+        inner = (score > 0) & (score < np.sum(valid, axis=1) * max(cats))
+        res = score - np.sum(np.where(valid, E, 0), axis=1)
+
+        rows.append([str(n), str(out['nPatterns']), str(out['nSolved']),
+                     '%.2f' % t, '%.2f' % t_cached,
+                     '%.1e' % np.max(np.abs(res[inner]))])
+        del data
+
+    if printout:
+        print '\nrasch_score():', ncols, 'items,', len(cats), 'categories,', \
+              p_nan, 'missing', \
+              'at random' if nforms is None else 'on %d forms' % nforms
+        print tabulate([header] + rows, headers='firstrow')
+        print
+
+    return rows
@@ -3617,7 +3617,11 @@ class Damon(object):
               minvar = 0.001,  # [<decimal> => minimum row/col variance allowed during iteration]
               maxchange = 10,  # [<+num> => maximum change allowed per iteration]
               labels = {'row_ents':'Person', 'col_ents':'Item'},   # [<None, {'row_ents':<None, 'person',...>, 'col_ents':<None, 'item',...>}> => to describe summarized entities]
-              extreme = [0.50, 0.50]  # [<[float,float]> => row, col max score adjustment]
+              extreme = [0.50, 0.50],  # [<[float,float]> => row, col max score adjustment]
+              monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per iteration]
+              collapse = None,  # [<None, 'Patterns', 'Scores'> => iterate on unique response patterns or (form, score) groups]
+              solver = None,    # [<None, 'PROX', 'Newton', ['PROX', 'Newton']> => starting values and update rule]
+              sparse = None     # [<None, True> => hold and compute only the observed cells while iterating]
               ):
         """Returns Rasch Joint Maximum Likelihood Estimate statistics for a given array.
 
@@ -3655,6 +3659,8 @@ class Damon(object):
                                         contains: {'row_ents',
                                                    'col_ents',
                                                    'reliability'}
+                    iterations      =>  not a datadict:  {'Solver', 'Iterations',
+                                        'Backtracks', 'Converged'}, see "solver"
                     }
 
             In addition, rasch() assigns Damon attributes:
@@ -3878,6 +3884,14 @@ class Damon(object):
             parameter so that extreme persons are not too far above or
             below the rest of the person distribution.
 
+            Each iteration works on whole arrays.  The category
+            probabilities of a group are held as one categories x
+            persons x items array, and the person and item sums of
+            variances and residuals are masked sums over the valid
+            cells, so there are no Python loops over persons, items
+            or categories.  Memory is a few persons x items arrays per
+            category of the largest group; see benchmarks.bench_rasch().
+
         Arguments
         ---------
             "groups" is used to group items according to their rating
@@ -3955,6 +3969,25 @@ class Damon(object):
             Entitities listed as anchors that do not exist in the
             current dataset are ignored.
 
+            Scoring against a bank
+            ----------------------
+            When every item in the current dataset is anchored, along
+            with the steps, and no persons are, there is nothing left
+            to estimate but the persons.  rasch() then scores them
+            directly, by Newton-Raphson, against the banked items and
+            steps (tools.rasch_score()).  Persons who took the same
+            items and got the same raw score get the same measure, so
+            measures are solved once per (item set, raw score) and
+            looked up for everyone else.  Fixed-form data of a million
+            persons are scored in about a second.  A single pass then
+            builds the estimates, standard errors and fit, and
+            my_obj.rasch_out['iterations'] reports whether the
+            scoring converged.  The person measures are the maximum
+            likelihood measures given the anchors.  Persons with zero
+            or perfect scores get the lowest or highest row logit
+            allowed by "extreme", as without anchors.  See
+            benchmarks.bench_rasch_score().
+
             -------------
             "runspecs" specifies the stopping conditions:
 
@@ -4028,7 +4061,126 @@ class Damon(object):
             they belong to the main person or item distribution.  The
             price of setting them too high is that persons (or items) with 
             different high scores will get the same score.
-            
+
+            ---------------
+            "monitor" receives a record of each iteration:  the iteration,
+            the change and maximum of the residual sums ('change',
+            'max_res'), the RMSR of the valid cells, the seconds taken,
+            the time elapsed, and the peak memory so far.  Row and column
+            measures are updated together, so 'facet' is None.  It can
+            be a function called with each record (a dict), the name of a
+            JSON-lines file to which each record is appended, a
+            helper.Event, or a list of these.  See tools.iter_monitor().
+
+            ---------------
+            "collapse" estimates from one row per group of persons,
+            weighted by the size of the group, rather than from every
+            row.  Under the Rasch model a person's raw score on a given
+            set of items is a sufficient statistic for their measure,
+            so on fixed-form tests a million persons can reduce to a
+            few thousand rows.  The iterations run on the collapsed
+            rows.  The final pass runs on all rows, with the measures
+            broadcast to them, so rasch_out has its usual shape and
+            person fit is computed from each person's own responses.
+            See tools.collapse_rows().
+
+                collapse = None     =>  Iterate on all rows.
+
+                collapse = 'Patterns'
+                                    =>  Group persons with identical
+                                        responses, including missing
+                                        cells.  This gives the same
+                                        results as collapse = None, up
+                                        to rounding.
+
+                collapse = 'Scores' =>  Group persons who answered the
+                                        same items (took the same form)
+                                        and got the same raw score.
+                                        Measures, standard errors and
+                                        fit are also the same as with
+                                        collapse = None, up to rounding,
+                                        and there are far fewer groups.
+                                        The 'rmsr' of monitor records is
+                                        that of the group representatives.
+
+            collapse is ignored when anchors are used.  When all the
+            items are anchored, persons are scored once per (item set,
+            raw score) group anyway; see "Scoring against a bank".
+
+            ---------------
+            "solver" chooses where the iterations start and how each
+            one updates the measures.  By default measures start at
+            zero and each person, item and step is moved by its own
+            residual over its own variance, with the others held
+            fixed.  That takes many iterations on long tests, where
+            measures are far from zero.
+
+                solver = None       =>  Start at zero, update each
+                                        measure separately.
+
+                solver = 'PROX'     =>  Start from the PROX (normal
+                                        approximation) measures of
+                                        tools.prox(), and steps from
+                                        the ratios of adjacent category
+                                        frequencies.
+
+                solver = 'Newton'   =>  Update persons, items and the
+                                        steps of polytomous groups
+                                        together by Newton-Raphson,
+                                        using their joint information
+                                        matrix.  The persons are
+                                        eliminated first, so each
+                                        iteration solves a system the
+                                        size of the items plus steps.
+                                        A step that lowers the
+                                        likelihood is halved, up to
+                                        six times (a line search).
+
+                solver = ['PROX', 'Newton']
+                                    =>  Both.
+
+            Newton-Raphson maximizes the likelihood with persons whose
+            scores hold them at an "extreme" limit fixed there.  Such
+            persons never fit their scores, so with 'Newton' they, and
+            the equal share of their residuals that each item is left
+            with, do not count against runspecs[0].  Without 'Newton',
+            they do, and runspecs[1] iterations are run.
+
+            The iterations taken, and the number of halved steps, are
+            reported in my_obj.rasch_out['iterations'] along with
+            whether runspecs[0] was met.  See
+            benchmarks.bench_rasch_solver().  solver is ignored when
+            anchors are used; see "Scoring against a bank".
+
+            ---------------
+            "sparse" is for data where most cells are missing, as from
+            adaptive tests or matrix sampling.  By default rasch()
+            holds estimates, variances, residuals and category
+            probabilities for every cell, rows x items, and computes
+            them for missing cells as well.  With sparse = True it
+            holds only the observed cells, as flat arrays of their
+            rows, columns and values, and computes only for those, so
+            the memory and time of each iteration scale with the number
+            of observations.  The cell outputs in rasch_out (estimates,
+            residuals, cell_var, cell_fit) are still rows x items.
+            They are built once, after the iterations, with estimates
+            for the missing cells.
+
+                sparse = None       =>  Compute on all cells.
+
+                sparse = True       =>  Compute on the observed cells.
+
+            Results are the same as with sparse = None, up to
+            rounding, with one exception.  Without 'Newton', the
+            default update of polytomous steps uses expected category
+            frequencies.  sparse = None counts the expected values of
+            missing cells in those frequencies, and sparse = True does
+            not.  Newton-Raphson counts only observed cells in either
+            mode.  collapse is ignored when sparse = True.  On 100,000
+            persons x 200 items with 92% missing, an iteration is over
+            10 times faster and peak memory less than half.  See
+            benchmarks.bench_rasch(sparse=True).
+
         Examples
         --------
 
@@ -4042,7 +4194,11 @@ class Damon(object):
                   minvar = 0.001,  # [<decimal> => minimum row/col variance allowed during iteration]
                   maxchange = 10,  # [<+num> => maximum change allowed per iteration]
                   labels = {'row_ents':'Person', 'col_ents':'Item'},   # [<None, {'row_ents':<None, 'person',...>, 'col_ents':<None, 'item',...>}> => to describe summarized entities]
-                  extreme = [0.50, 0.50]  # [<[float,float]> => row, col max score adjustment]
+                  extreme = [0.50, 0.50],  # [<[float,float]> => row, col max score adjustment]
+                  monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per iteration]
+                  collapse = None,  # [<None, 'Patterns', 'Scores'> => iterate on unique response patterns or (form, score) groups]
+                  solver = None,    # [<None, 'PROX', 'Newton', ['PROX', 'Newton']> => starting values and update rule]
+                  sparse = None     # [<None, True> => hold and compute only the observed cells while iterating]
                   )
         """
         if self.verbose is True:
@@ -4077,13 +4233,13 @@ class Damon(object):
 ##################################################################################################
 
     def coord(self,
-              ndim = None,      # [<None,[[dim list],'search','homogenize']> => set dimensionality or search range, possibly homogenized]
-              runspecs = [0.0001,10],  # [<[StopWhenChange,MaxIteration]>]
-              seed = 'Auto',  #[<None,int,'Auto',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]}}>]
+              ndim = None,      # [<None,[[dim list],'search','homogenize','Nested','Fast']> => set dimensionality or search range, possibly homogenized]
+              runspecs = [0.0001,10],  # [<[StopWhenChange,MaxIteration,<'Anderson','SOR',{'Anderson':5},{'SOR':1.5},'Freeze'>]>]
+              seed = 'Auto',  #[<None,int,'Auto','SVD',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]},'Halving':<None,True,int>}>]
               homogenize = None,    # [<None,{'ApplyAncs':<True,False>,'Facet':1,'Max':500,'Form':'Cov'} => homogenize params]
               anchors = None,    # [<None,{'Bank':<bank,pickle file>,'Facet':<0,1>,'Entities':<['All',list entities]>,'Refresh_All':<bool>}> ]
               quickancs = None,  # [<None,[<0,1>,ent x ndim array]> => facet, anchor array]
-              startercoord = None,    # [<None,[<0,1>,ent x ndim array]> => facet, starter array]
+              startercoord = None,    # [<None,[<0,1>,ent x ndim array],coord_out,bank,'bank.pkl'> => facet, starter array, or previous coordinates]
               pseudomiss = None,    # [<None,True> => make cells pseudo-missing for "official" run]
               miss_meth = 'IgnoreCells', # [<'ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells>]
               solve_meth = 'LstSq', # [<'LstSq','IRLS'> => method for solving equations]
@@ -4092,7 +4248,11 @@ class Damon(object):
               weightcoord = True,   # [<None,True> => downweight influential coordinates]
               jolt_ = None,  # [<None,[sigma,jolt_]> e.g., [20,1.5] => Apply 1.5 noise factor if sigma exceeds 20]
               feather = None,     # [<None,float> => add small amount of randomness to the data]
-              condcoord_ = None     # [<None, condcoord args> => deprecated, only for backward compatibility]
+              condcoord_ = None,     # [<None, condcoord args> => deprecated, only for backward compatibility]
+              workers = None,   # [<None,int> => number of worker processes for solving coordinates]
+              chunk = None,     # [<None,int> => stream coredata, e.g., a np.memmap, in blocks of this many rows]
+              monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per iteration]
+              cache = None      # [<None,'dirname',{'Path':'dirname','MaxMB':100,'MaxDays':<None,float>}> => reuse bestdim and seed search results saved on disk]
               ):
         """Calculate facet coordinates for the ndim dimension.
 
@@ -4117,6 +4277,14 @@ class Damon(object):
              'facs_per_ent' =>  Number of unanchored facets per entity
                                 [facet,n unanchored facets per entity]
                                 (See tools.obspercell() docs)
+             'accel'        =>  None, or if runspecs asks for convergence
+                                acceleration, a report on it:
+                                {'meth','param','iterations','accel_its',
+                                 'resets','time','its_saved','time_saved'}
+                                (See the "runspecs" docs)
+             'activelog'    =>  None, or if runspecs has a 'Freeze' flag,
+                                an array of [iteration, n rows solved,
+                                n cols solved] per iteration
              }
 
             In addition, new variables are assigned as attributes
@@ -4927,6 +5095,8 @@ class Damon(object):
                 ndim = [[int list of dimensionalities],
                          'search',
                          'homogenize',
+                         'Nested',
+                         'Fast',
                          <'Stab','Acc','Obj','Speed','Err','NonDegen'>
                              =>  Statistic to use for determining "best"
                                  dimensionality.  'Obj' is the default if blank.
@@ -5031,6 +5201,51 @@ class Damon(object):
                                         If there are few columns than rows, this is the
                                         fastest method.
 
+                ndim = [range(1,11),'Acc','Nested']
+                                    =>  Fit the dimensionalities from low to high,
+                                        warm-starting each from the coordinates of
+                                        the one below plus a new axis taken from
+                                        its residuals (see tools.nested_coords()),
+                                        rather than from random coordinates.  Only
+                                        the lowest dimensionality gets a seed
+                                        search; the others skip it and converge in
+                                        fewer iterations.  Works with 'search' and
+                                        'homogenize' as well.
+
+                                        Accuracy ('Acc', 'Err', 'NonDegen') is
+                                        scored on the warm-started fit, with the
+                                        same pseudo-missing cells, so it stays
+                                        comparable to a cold start.  Stability
+                                        ('Stab', 'Obj') still comes from cold
+                                        split-half runs at seed 1, so it saves
+                                        less.  Without them, 'Speed' measures the
+                                        warm-started fit.
+                                        'Nested' fits one dimensionality at a time
+                                        and so ignores "workers".
+
+                ndim = [range(1,31),'homogenize','Fast']
+                                    =>  Fit only the highest dimensionality
+                                        (30) in full, then score each lower
+                                        dimensionality by how well the
+                                        truncation of that fit to its first
+                                        d singular vectors predicts the
+                                        pseudo-missing cells.  Only the
+                                        three best-scoring dimensionalities
+                                        (and 0, if listed) are refitted to
+                                        get the statistics in objperdim
+                                        and pick the best dimensionality
+                                        (see tools.truncate_dims()).  So
+                                        the cost is about four fits,
+                                        however long the list.  'Fast'
+                                        replaces 'search' if both are
+                                        given, and works with 'homogenize'
+                                        and 'Nested'.  Truncations of an
+                                        overfitted high dimensionality
+                                        only approximate lower-dimensional
+                                        fits, so use it to narrow a wide
+                                        range rather than to split close
+                                        candidates.
+
 
             The "search" algorithm is a variation of the binary search algorithm
             and assumes a smooth U-shaped Dim (x-axis) x Objectivity (y-axis)
@@ -5102,6 +5317,52 @@ class Damon(object):
 
                 runspecs = [0.0001,25,'EstConverge']
 
+            When coord() needs many iterations, as on sparse data, you can
+            speed convergence by adding an acceleration flag to runspecs:
+
+                runspecs = [0.0001,25,'Anderson']   =>  Anderson mixing
+                runspecs = [0.0001,25,'SOR']        =>  over-relaxation
+
+            Each iteration then extrapolates the coordinates of the facet
+            computed last from their recent history instead of simply
+            using them.  'Anderson' is generally the faster of the two.
+            Their parameters can be set with a dict, e.g., {'Anderson':5}
+            for the number of past iterations to combine or {'SOR':1.5}
+            for the relaxation factor.  Both fall back to plain iterations
+            when the coordinates stop converging.  The estimates will not
+            be identical to an unaccelerated run because the iterations
+            stop at a different point within StopWhenChange.  Acceleration
+            is skipped for anchored runs and during the IRLS stage of
+            solve_meth = 'IRLS'.
+
+            coord_out['accel'] reports the number of iterations, how many
+            were extrapolated, how many times it fell back to plain
+            iterations, and the run time.  To also get the iterations and
+            time saved, add 'Compare':True to the dict, e.g.,
+
+                runspecs = [0.0001,25,{'Anderson':5,'Compare':True}]
+
+            coord() then repeats the run without acceleration, doubling
+            the run time, and reports the difference in coord_out['accel']
+            as 'its_saved' and 'time_saved'.  See tools.accel_init().
+
+            Often most entities stop changing after a few iterations
+            while a few keep moving.  Adding 'Freeze' to runspecs skips
+            the entities that have stopped changing:
+
+                runspecs = [0.0001,25,'Freeze']
+
+            An entity is then re-solved only if it changed by more than
+            StopWhenChange in its last solve.  Every fifth iteration
+            solves all entities, including frozen ones, and coord()
+            always stops on such a full sweep.  The tolerance and sweep
+            interval can be set with {'Freeze':[0.00001,10]}.  Freezing
+            applies only to miss_meth = 'IgnoreCells' and
+            solve_meth = 'LstSq' runs without anchors.  How much time it
+            saves depends on how unevenly the entities converge.
+            coord_out['activelog'] gives the number of row and column
+            entities solved in each iteration.  See tools.freeze_init().
+
             ---------------
             "seed" (see discussion above) controls the selection of random
             starter coordinates.  Numpy allows you to select a set of random
@@ -5128,6 +5389,19 @@ class Damon(object):
                                     that exceeds an objectivity correlation
                                     R > 0.80 (see comments above).
 
+                seed = 'SVD'    =>  Instead of random numbers, start from the
+                                    leading singular vectors of the data, each
+                                    column standardized and its missing cells
+                                    imputed with the column mean.  This is
+                                    reproducible, needs no seed search, and
+                                    usually starts close to the solution, so
+                                    coord() converges in fewer iterations.
+                                    The SVD is randomized and reads the data
+                                    in blocks a few times, so it scales to
+                                    large arrays and works with "chunk".  It
+                                    can also be used when finding the best
+                                    dimensionality.  See tools.svd_coords().
+
                 seed = {'MinR':0.90,    =>  minimum R correlation
                         'MaxIt':[3,10], =>  maximum number of seeds to try:
                                             [for finding best dimensionality, for running at best dimensionality]
@@ -5138,7 +5412,8 @@ class Damon(object):
                         'Facet':1,      =>  facet (0=rows,1=cols) to split into Group1 and Group2
                         'Stats':['Stab']=>  <'Stab','Acc','Obj','NonDegen','Err', or'Speed'>
                         'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[1,3,5,...]},
-                        'Group2':{'Get':'AllExcept','Labels':'index','Entities':[1,3,5,...]}
+                        'Group2':{'Get':'AllExcept','Labels':'index','Entities':[1,3,5,...]},
+                        'Halving':None  =>  <None,True,int> successive halving (below)
                         }
                                 =>  For the "best" dimensionality, find the first
                                     seed from 1 to 10 that yields a 'Stability'
@@ -5188,6 +5463,32 @@ class Damon(object):
                                     syntax.  However, for most purposes the 'Auto'
                                     option is quite sufficient.
 
+                seed = {'MaxIt':16,'Stats':['Obj'],'Halving':True}
+                                =>  Race the seeds by successive halving instead
+                                    of running each one to the end.  All 16 seeds
+                                    are run for 2 iterations (or 'Halving':int
+                                    iterations) and scored as usual on these
+                                    partial fits.  The better half go on, each
+                                    from where its fit stopped, to twice the
+                                    iterations, and so on.  The race ends when
+                                    one seed is left, which is the best seed
+                                    and is not run again, or when the iterations
+                                    reach the MaxIteration of runspecs, in which
+                                    case the best seed is picked from this last
+                                    round.
+
+                                    Each seed's score still costs the split-half
+                                    runs of stability(), so racing pays when the
+                                    seeds take many iterations to converge, e.g.,
+                                    large sparse data with a tight StopWhenChange,
+                                    where it can halve the search.  When they
+                                    converge in a few iterations, the extra
+                                    scoring rounds can cost more than they save.
+                                    MinR does not stop the race early.  StatsPerSeed reports each
+                                    seed's longest run, so the stats of all but
+                                    the seeds of a full-length last round come
+                                    from partial fits.
+
                 Important
                 ---------
                 Searching for the best seed can be computationally
@@ -5478,6 +5779,26 @@ class Damon(object):
                                         =>  Start off with the ents x ndim
                                             row coordinates array.
 
+                startercoord = my_obj.coord_out
+                startercoord = my_bank or 'my_bank.pkl'
+                                        =>  Warm start.  Start both facets
+                                            off with the coordinates of a
+                                            previous run, matched by row
+                                            and column key, and iterate
+                                            from there.
+
+            The warm start is for recalibrating data that have mostly been
+            analyzed before, e.g., last night's data plus a few new
+            persons.  The previous coordinates can come from its coord_out
+            or from a bank (see bank()), in which case its 'ent_coord'
+            coordinates are used for whichever of 'facet0' and 'facet1'
+            it contains.  Entities not found are new.  They are initialized
+            by least squares from the matched entities of the opposing
+            facet, so a few iterations usually suffice instead of a full
+            fit.  The dimensionality is that of the previous run (ndim can
+            be None), and the seed search is skipped.  Keys must be of the
+            same type as in the previous run.  See tools.warm_coords().
+
             ---------------
             "pseudomiss" <None, True>, when True, tells coord() to make
             missing cells indentified by the pseudomissing index (generated by
@@ -5528,7 +5849,11 @@ class Damon(object):
                      }
 
             See the documentation for dmnu.solve2() for information about needed
-            input specifications.
+            input specifications.  'runspecs' gives the stopping conditions
+            both of the IRLS stage of coord() and of the reweighting of each
+            entity.  With miss_meth = 'IgnoreCells', the entities of a facet
+            are reweighted together, each step being one stacked weighted
+            solve (see tools.irls_batch()).
 
             Currently, solve_meth and solve_meth_specs are not particularly
             useful.  They are there to provide Damon the necessary architecture
@@ -5766,6 +6091,87 @@ class Damon(object):
             actually improves the stability of the coordinate system.  It is
             also useful to prevent rows and columns with insufficient variation.
 
+            ---------------
+            "workers" is the number of worker processes used to solve
+            the coordinates of each facet ('IgnoreCells' only).  At each
+            half-step the entities are split into fixed ranges that are
+            solved in parallel.  The data and opposing coordinates sit
+            in shared memory rather than being pickled per task, and
+            the results are merged back in entity order, so outputs
+            and warnings are the same for any number of workers.
+            None or 1 means no worker processes.  Worth it for large
+            arrays on multi-core machines; for small ones the cost of
+            starting processes dominates.
+
+            When ndim asks for the best of several dimensionalities, the
+            workers fit the candidate dimensionalities instead, each
+            worker holding a copy of the data and its pseudo-missing
+            cells, and each coord() within them runs in one process.
+            Each dimensionality is fitted from the same starting state,
+            so objperdim and bestdim are the same for any number of
+            workers.  See tools.dimpool().
+
+            ---------------
+            "chunk" makes coord() read coredata in blocks of chunk rows
+            instead of loading it, for data too large for memory.
+            coredata can then be a memory-mapped array:
+
+                >>>  x = np.load('coredata.npy', mmap_mode = 'r')
+                >>>  dd = {'rowlabels':rl, 'collabels':cl, 'coredata':x,
+                           ...}
+                >>>  d = dmn.Damon(dd, 'datadict_link', verbose=None)
+                >>>  d.coord([[3]], chunk = 100000)
+
+            Each iteration is one pass over the data:  row coordinates
+            are solved block by block while the normal equations of the
+            column coordinates are summed across blocks, so memory is
+            bounded by the block size rather than the size of the data.
+            The results match chunk = None up to the sign of each
+            dimension.  Streaming supports miss_meth = 'IgnoreCells' and
+            solve_meth = 'LstSq' with random or column starter coordinates,
+            condcoord 'Fac0' of None or 'Orthonormal', and no anchors,
+            jolt_, feather, workers, or runspecs flags.  It applies to the
+            final coord() run only; searches for the best dimensionality
+            or seed still load the data.  See tools.stream_coord().
+
+            ---------------
+            "monitor" receives a record of each half-step of the final
+            coord() run:  the iteration, the facet solved, the change in
+            its coordinates, the RMSR of the valid cells, the seconds
+            taken, the time elapsed, and the peak memory so far.  It can
+            be a function called with each record (a dict), the name of a
+            JSON-lines file to which each record is appended, a
+            helper.Event, or a list of these:
+
+                >>>  log = []
+                >>>  d.coord([[3]], monitor = log.append)
+                >>>  d.coord([[3]], monitor = 'coord_log.jsonl')
+
+            The RMSR takes an extra pass over the valid cells, a fraction
+            of the cost of an iteration.  See tools.iter_monitor().
+
+            ---------------
+            "cache" saves the results of the searches for the best
+            dimensionality and seed (bestdim, objperdim, seed, etc.) in a
+            directory, so that rerunning coord() on the same data with the
+            same arguments returns them at once instead of refitting every
+            dimensionality and seed:
+
+                >>>  d.coord([range(1, 11)], seed = 'Auto', cache = 'my_cache')
+
+            Results are keyed by a hash of the coredata, its missing
+            cells, the pseudo-missing cells, and the coord() arguments
+            that affect the search, so any change to these starts a new
+            search.  The final coord() run is not cached.  Least recently
+            used results are dropped when the directory exceeds 'MaxMB'
+            megabytes (default 100), and results unused for 'MaxDays' days
+            expire.  To drop results explicitly, e.g., after editing a
+            custom condcoord function, which the key cannot see:
+
+                >>>  tools.cache_invalidate('my_cache')
+
+            See tools.search_cache().
+
             Benefits of Orthonormal
             -----------------------
             As mentioned, arrays converted to orthonormal are such
@@ -5845,13 +6251,13 @@ class Damon(object):
 
         Paste method
         ------------
-            coord(ndim = [[1]],      # [<None,[[dim list],'search','homogenize']> => set dimensionality or search range, possibly homogenized]
-                  runspecs = [0.0001,20],  # [<[StopWhenChange,MaxIteration]>]
-                  seed = 'Auto',  #[<None,int,'Auto',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]}}>]
+            coord(ndim = [[1]],      # [<None,[[dim list],'search','homogenize','Nested','Fast']> => set dimensionality or search range, possibly homogenized]
+                  runspecs = [0.0001,20],  # [<[StopWhenChange,MaxIteration,<'Anderson','SOR',{'Anderson':5},{'SOR':1.5},'Freeze'>]>]
+                  seed = 'Auto',  #[<None,int,'Auto','SVD',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]},'Halving':<None,True,int>}>]
                   homogenize = None,    # [<None,{'ApplyAncs':<True,False>,'Facet':1,'Max':500,'Form':'Cov'} => homogenize params]
                   anchors = None,    # [<None,{'Bank':<bank,pickle file>,'Facet':<0,1>,'Entities':<['All',list entities]>,'Refresh_All':<bool>}> ]
                   quickancs = None,  # [<None,[<0,1>,ent x ndim array]> => facet, anchor array]
-                  startercoord = None,    # [<None,[<0,1>,ent x ndim array]> => facet, starter array]
+                  startercoord = None,    # [<None,[<0,1>,ent x ndim array],coord_out,bank,'bank.pkl'> => facet, starter array, or previous coordinates]
                   pseudomiss = None,    # [<None,True> => make cells pseudo-missing for "official" run]
                   miss_meth = 'IgnoreCells', # [<'ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells>]
                   solve_meth = 'LstSq', # [<'LstSq','IRLS'> => method for solving equations]
@@ -5860,6 +6266,10 @@ class Damon(object):
                   weightcoord = True,   # [<None,True> => downweight influential coordinates]
                   jolt_ = None,  # [<None,[sigma,jolt_]> e.g., [20,1.5] => Apply 1.5 noise factor if sigma exceeds 20]
                   feather = None,     # [<None,float> => add small amount of randomness to the data]
+                  workers = None,   # [<None,int> => number of worker processes for solving coordinates]
+                  chunk = None,     # [<None,int> => stream coredata, e.g., a np.memmap, in blocks of this many rows]
+                  monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per iteration]
+                  cache = None      # [<None,'dirname',{'Path':'dirname','MaxMB':100,'MaxDays':<None,float>}> => reuse bestdim and seed search results saved on disk]
                   )
 
         """
@@ -5982,7 +6392,7 @@ class Damon(object):
 
             hd.coord([bestdim],runspecs,seed,None,None,None,None,None,
                      miss_meth,solve_meth,solve_meth_specs,
-                     condcoord,weightcoord,jolt_,feather
+                     condcoord,weightcoord,jolt_,feather,workers=workers
                      )
             hd_coord_out = hd.coord_out
 
@@ -5992,7 +6402,8 @@ class Damon(object):
                        'startercoord':None,'pseudomiss':None,
                        'miss_meth':miss_meth,'solve_meth':solve_meth,'solve_meth_specs':solve_meth_specs,
                        'condcoord':condcoord,'weightcoord':weightcoord,
-                       'jolt_':jolt_,'feather':feather
+                       'jolt_':jolt_,'feather':feather,'workers':workers,
+                       'chunk':chunk,'monitor':monitor
                        }
 
             if _locals['seed'] != 'Auto4BestDim':
@@ -6042,6 +6453,8 @@ class Damon(object):
                   share_if = {'targ_<':30, 'pred_>': 4},   # [<{'targ_<':int, 'pred_>':int}> => when to share info between subspaces]
                   min_rel = 0.02,   # [< 0 < min_rel < 1  > => minimum reliability to use in unique weighting formula]
                   rpt_optimal = None,    # [<None, True> => calculate and return optimal unique weight]
+                  monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per coord() iteration]
+                  workers = None    # [<None,int> => number of worker processes for the subspaces]
                   ):
         """Calculate coordinates and estimates for each specified subspace.
 
@@ -6544,6 +6957,31 @@ class Damon(object):
 
                 rpt_optimal = <None, True>
 
+            ------------
+            "monitor" is passed to each of the coord() runs made by
+            sub_coord() (see coord() docs).  Each record is also tagged
+            with the 'stage' of the run ('subspace', 'common', 'residuals',
+            'combined', 'composite', 'final'), its 'subspace' and, where
+            one subspace borrows from another, the 'predictor', so that
+            one log can cover the whole run.
+
+            ------------
+            "workers" is the number of worker processes among which to
+            divide the subspaces.  The coord_subs runs are done in
+            parallel, since each subspace is calibrated on its own, and
+            then the residual, unique weighting and composite runs for
+            each target subspace.  Run time is then about that of the
+            slowest subspace, plus the cost of starting the processes.
+            The unique weight itself is not searched for; it is computed
+            directly as sqrt(reliability * p_unique) (see
+            tools.get_unique_weight()).  Results match workers = None
+            apart from the tiny random "feather" added to the data.
+            With workers, a function passed as "monitor" is called
+            inside the worker processes, so use a 'log.jsonl' file to
+            collect the records.
+
+                workers = <None, int>
+
         Examples
         --------
             [under construction]
@@ -6558,6 +6996,8 @@ class Damon(object):
                       share_if = {'targ_<':30, 'pred_>': 4},   # [<{'targ_<':int, 'pred_>':int}> => when to share info between subspaces]
                       min_rel = 0.02,   # [< 0 < min_rel < 1  > => minimum reliability to use in unique weighting formula]
                       rpt_optimal = None,    # [<None, True> => calculate and return optimal unique weight]
+                      monitor = None,   # [<None, function, helper.Event, 'log.jsonl', list> => receives a record per coord() iteration]
+                      workers = None    # [<None,int> => number of worker processes for the subspaces]
                       )
 
         """
@@ -6588,11 +7028,12 @@ class Damon(object):
                   pred_ents = {'AllTargs':'AllExceptTarg'}, # [<{targ1:{'Get'...},...},{'AllTargs':{'Get'...}},{'AllTargs':'AllExceptTarg'},{'Subscales':{'Get'...[<sub1,'All'>]}]
                   ndim = 'Refer2Coord', # [<['Refer2Coord',[[dim list],'search','homogenize']> => n dim(s) for predicting targ_ents]
                   runspecs = [0.0001,10],   # [['StopWhenChange','MaxIteration'] => for calculating each targ_ent coordinate set]
-                  seed = 'Auto',  #[<'Refer2Coord',None,int,'Auto',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]}}>]
+                  seed = 'Auto',  #[<'Refer2Coord',None,int,'Auto','SVD',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]},'Halving':<None,True,int>}>]
                   starters = True,   # [<None,True> => for speed, calc starter coords and apply their dimensionality to all predictors]
                   summdim = None,      # [<None,[[dim list],'search','homogenize']> => dim to summarize all estimates in potentially higher space]
                   center = True,    # [<None,True> => center objectified estimates on observations per entity]
                   overwrite = True, # [<None,True> => overwrite coord_out and base_est_out]
+                  workers = None,   # [<None,int> => number of worker processes for the per-target fits]
                   ):
         """Objectify specified entities, return coordinates or estimates.
 
@@ -6762,7 +7203,10 @@ class Damon(object):
             100-item dataset is the computational equivalent of 100
             separate coord() runs.  That's the price.  Fortunately,
             most applications involve objectifying a small number of
-            entities.
+            entities.  Targets that share the same predictor entities
+            (e.g., with pred_ents = {'AllTargs':{'Get'...}} or 'Subscales')
+            share one coord() run, and the runs can be spread across
+            processes using the "workers" argument.
 
             There is an interesting side-effect of objectification.  The
             method works by calculating a new set of row coordinates for each
@@ -7102,6 +7546,12 @@ class Damon(object):
             parameter.  If base_est() sees that a base_est() output already exists,
             it won't recalculate it but just pass it through.
 
+            ---------------
+            "workers" is the number of worker processes among which to
+            divide the coord() runs for the predictor entities.  The
+            results are the same for any number of workers.  None or 1
+            means no worker processes.  See tools.coords_per_preds().
+
         Examples
         --------
 
@@ -7113,11 +7563,12 @@ class Damon(object):
                       pred_ents = {'AllTargs':'AllExceptTarg'}, # [<{targ1:{'Get'...},...},{'AllTargs':{'Get'...}},{'AllTargs':'AllExceptTarg'},{'Subscales':{'Get'...[<sub1,'All'>]}]
                       ndim = 'Refer2Coord', # [<['Refer2Coord',[[dim list],'search','homogenize']> => n dim(s) for predicting targ_ents]
                       runspecs = [0.0001,10],   # [['StopWhenChange','MaxIteration'] => for calculating each targ_ent coordinate set]
-                      seed = 'Auto',  #[<'Refer2Coord',None,int,'Auto',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]}}>]
+                      seed = 'Auto',  #[<'Refer2Coord',None,int,'Auto','SVD',{'MinR':0.90,'MaxIt':<10,[3,10]>,'Facet':<0,1>,'Stats':[<'Stab','Acc','Obj','PsMsResid','NonDegen'>],'Group1':{'Get':'NoneExcept','Labels':'index','Entities':[...]},'Group2':{'Get':'AllExcept','Labels':'index','Entities':[...]},'Halving':<None,True,int>}>]
                       starters = True,   # [<None,True> => for speed, calc starter coords and apply their dimensionality to all predictors]
                       summdim = None,      # [<None,[[dim list],'search','homogenize']> => dim to summarize all estimates in potentially higher space]
                       center = True,    # [<None,True> => center objectified estimates on observations per entity]
                       overwrite = True, # [<None,True> => overwrite coord_out and base_est_out]
+                      workers = None,   # [<None,int> => number of worker processes for the per-target fits]
                       )
 
         """
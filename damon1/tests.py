@@ -85,6 +85,34 @@ def setup_damon(create_args, meths=None, output='data'):
         return d
     else:
         return d[output]
+
+
+# 100 x 20 data with 20% missing, for the tests of coord() options
+COORD_DATA = ut.Setup('d', setup_damon,
+                      [{'nfac0':100, 'nfac1':20, 'p_nan':0.20,
+                        'validchars':['All', ['All']]},
+                       [('standardize', {})]])
+
+# 300 x 40 data of 6 dims with half missing.  coord() takes dozens of
+# iterations to fit it in 3 dims.
+SLOW_DATA = ut.Setup('d', setup_damon,
+                     [{'nfac0':300, 'nfac1':40, 'ndim':6, 'p_nan':0.50,
+                       'noise':0.50, 'validchars':['All', ['All']]},
+                      [('standardize', {})]])
+
+
+def coord_estimates(d):
+    "Estimates implied by a Damon object's coord_out, rows x cols."
+    return np.dot(d.coord_out['fac0coord']['coredata'],
+                  np.transpose(d.coord_out['fac1coord']['coredata']))
+
+
+def assert_close(obs, exp, atol, what):
+    "Raise AssertionError if obs and exp differ by more than atol."
+    diff = np.max(np.abs(np.asarray(obs) - np.asarray(exp)))
+    if not diff <= atol:
+        exc = '{0} differ by {1}, more than {2}.\n'.format(what, diff, atol)
+        raise AssertionError(exc)
     
           
 def test_create_data(check='run', asserts=np.array_equal, printout=True):
@@ -491,6 +519,270 @@ def test_rasch(check='run', asserts=np.array_equal, printout=True):
     return x
                            
                            
+def test_rasch_solver(check='run', asserts=np.array_equal, printout=True):
+    "Test that rasch(solver=...) reaches the measures of solver=None."
+
+    def setup(args):
+        d = setup_damon(args)
+
+        # No zero or perfect scores, which 'Newton' treats differently
+        x = d.data_out['coredata']
+        valid = x != d.data_out['nanval']
+        for axis in [1, 0, 1]:
+            scores = np.sum(np.where(valid, x, 0), axis=axis)
+            counts = np.sum(valid, axis=axis)
+            for i in np.where((scores == 0) | (scores == counts))[0]:
+                if axis == 1:
+                    j = np.where(valid[i])[0][0]
+                    x[i, j] = 1 - x[i, j]
+                else:
+                    j = np.where(valid[:, i])[0][0]
+                    x[j, i] = 1 - x[j, i]
+        return d
+
+    def rasch_solver(data, **kwargs):
+        d = data
+        solver = kwargs.pop('solver')
+        d.rasch(solver=None, **kwargs)
+        default = d.rasch_out
+
+        d.rasch(solver=solver, **kwargs)
+        solved = d.rasch_out
+
+        if not solved['iterations']['Converged']:
+            exc = 'rasch(solver={0}) did not converge.\n'.format(solver)
+            raise AssertionError(exc)
+
+        for key in ['fac0coord', 'fac1coord', 'estimates']:
+            if not np.allclose(solved[key]['coredata'], default[key]['coredata'],
+                               rtol=0, atol=1e-5):
+                diff = np.abs(solved[key]['coredata'] - default[key]['coredata'])
+                exc = ('rasch() {0} differ between solver={1} and '
+                       'solver=None by {2}.\n').format(key, solver, np.max(diff))
+                raise AssertionError(exc)
+        return solved['fac0coord']['coredata']
+
+    args = {'nfac0':40, 'nfac1':10, 'facmetric':[1, 0.001], 'noise':0.5,
+            'p_nan':0.20, 'nheaders4cols':2,
+            'extra_headers':{'0':0.50, '1':0.50},
+            'validchars':['All', [0, 1], 'Num']}
+    d = ut.Setup('d', setup, [args])
+
+    x = ut.test(rasch_solver,
+                {'data':[d],
+                 'groups':[None, {'row':1}],
+                 'runspecs':[[0.000001, 200]],
+                 'solver':['PROX', 'Newton', ['PROX', 'Newton']]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_rasch_collapse(check='run', asserts=np.array_equal, printout=True):
+    "Test that rasch(collapse=...) gives the results of collapse=None."
+
+    def setup(args):
+        d = setup_damon(args)
+        return d
+
+    def rasch_collapse(data, **kwargs):
+        d = data
+        collapse = kwargs.pop('collapse')
+        d.rasch(collapse=None, **kwargs)
+        full = d.rasch_out
+
+        d.rasch(collapse=collapse, **kwargs)
+        collapsed = d.rasch_out
+
+        for key in ['fac0coord', 'fac1coord', 'estimates', 'fac0_se',
+                    'fac0_infit', 'fac0_outfit']:
+            if not np.allclose(collapsed[key]['coredata'], full[key]['coredata'],
+                               rtol=0, atol=1e-10):
+                diff = np.abs(collapsed[key]['coredata'] - full[key]['coredata'])
+                exc = ("rasch() {0} differ between collapse={1} and "
+                       "collapse=None by {2}.\n").format(key, collapse,
+                                                         np.max(diff))
+                raise AssertionError(exc)
+        return collapsed['fac0coord']['coredata']
+
+    args = {'nfac0':40, 'nfac1':10, 'facmetric':[1, 0.001], 'noise':0.5,
+            'nheaders4cols':2, 'extra_headers':{'0':0.50, '1':0.50}}
+
+    args_0 = args.copy()
+    args_0['validchars'] = ['All', [0, 1], 'Num']
+    d_0 = ut.Setup('0', setup, [args_0])
+
+    args_1 = args.copy()
+    args_1['validchars'] = ['All', [0, 1, 2], 'Num']
+    d_1 = ut.Setup('1', setup, [args_1])
+
+    x = ut.test(rasch_collapse,
+                {'data':[d_0, d_1],
+                 'groups':[None, {'row':1}],
+                 'runspecs':[[0.001, 20]],
+                 'collapse':['Patterns', 'Scores']},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_rasch_anchored(check='run', asserts=np.array_equal, printout=True):
+    "Test that rasch() anchored to its own items gives its person measures."
+
+    def setup(args):
+        d = setup_damon(args)
+
+        # A perfect score and a zero score
+        x = d.data_out['coredata']
+        valid = x != d.data_out['nanval']
+        x[0] = np.where(valid[0], max(args['validchars'][1]), x[0])
+        x[1] = np.where(valid[1], 0, x[1])
+        return d
+
+    def rasch_anchored(data, **kwargs):
+        d = data
+        bankfile = TEMP_PATH + 'ibank.pkl'
+        try: os.remove(bankfile)
+        except: pass
+
+        d.rasch(anchors=None, **kwargs)
+        free = d.rasch_out['fac0coord']['coredata']
+        d.bank(bankfile)
+
+        d.rasch(anchors={'Bank':bankfile, 'row_ents':[None], 'col_ents':['All']},
+                **kwargs)
+        anchored = d.rasch_out['fac0coord']['coredata']
+
+        if not np.allclose(anchored, free, rtol=0, atol=0.0001):
+            exc = ('Anchored person measures differ from free measures by '
+                   '{0}.\n').format(np.max(np.abs(anchored - free)))
+            raise AssertionError(exc)
+        return anchored
+
+    args = {'nfac0':20, 'nfac1':10, 'facmetric':[1, 0.001], 'noise':0.5,
+            'nheaders4cols':2, 'extra_headers':{'0':0.50, '1':0.50}}
+
+    args_0 = args.copy()
+    args_0['validchars'] = ['All', [0, 1], 'Num']
+    d_0 = ut.Setup('0', setup, [args_0])
+
+    args_1 = args.copy()
+    args_1['validchars'] = ['All', [0, 1, 2], 'Num']
+    d_1 = ut.Setup('1', setup, [args_1])
+
+    x = ut.test(rasch_anchored,
+                {'data':[d_0, d_1],
+                 'groups':[None, {'row':1}],
+                 'runspecs':[[0.000001, 100]],
+                 'solver':[['PROX', 'Newton']],
+                 'sparse':[None, True]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_rasch_sparse(check='run', asserts=np.array_equal, printout=True):
+    "Test that rasch(sparse=True) gives the results of sparse=None."
+
+    def setup(args):
+        d = setup_damon(args)
+        return d
+
+    def rasch_sparse(data, **kwargs):
+        d = data
+        d.rasch(sparse=None, **kwargs)
+        dense = d.rasch_out
+
+        d.rasch(sparse=True, **kwargs)
+        sparse = d.rasch_out
+
+        for key in ['fac0coord', 'fac1coord', 'estimates']:
+            if not np.allclose(sparse[key]['coredata'], dense[key]['coredata'],
+                               rtol=0, atol=1e-10):
+                diff = np.abs(sparse[key]['coredata'] - dense[key]['coredata'])
+                exc = ('rasch() {0} differ between sparse=True and '
+                       'sparse=None by {1}.\n').format(key, np.max(diff))
+                raise AssertionError(exc)
+        return sparse['fac0coord']['coredata']
+
+    def rasch_sparse_steps(data, **kwargs):
+        d = data
+        d.rasch(sparse=None, **kwargs)
+        dense = d.rasch_out['fac0coord']['coredata']
+
+        d.rasch(sparse=True, **kwargs)
+        sparse = d.rasch_out['fac0coord']['coredata']
+
+        # The default step update leaves missing cells out of the
+        # expected frequencies only with sparse = True (see rasch() docs)
+        if np.allclose(sparse, dense, rtol=0, atol=1e-10):
+            exc = ('Expected sparse=True to differ from sparse=None with '
+                   'the default solver on polytomous data.\n')
+            raise AssertionError(exc)
+        if not np.allclose(sparse, dense, rtol=0, atol=0.2):
+            exc = ('rasch() measures differ between sparse=True and '
+                   'sparse=None by {0}.\n').format(np.max(np.abs(sparse - dense)))
+            raise AssertionError(exc)
+        return sparse
+
+    args = {'nfac0':40, 'nfac1':10, 'facmetric':[1, 0.001], 'noise':0.5,
+            'p_nan':0.20, 'nheaders4cols':2,
+            'extra_headers':{'0':0.50, '1':0.50}}
+
+    args_0 = args.copy()
+    args_0['validchars'] = ['All', [0, 1], 'Num']
+    d_0 = ut.Setup('0', setup, [args_0])
+
+    args_1 = args.copy()
+    args_1['validchars'] = ['All', [0, 1, 2], 'Num']
+    d_1 = ut.Setup('1', setup, [args_1])
+
+    args_2 = args.copy()
+    args_2['validchars'] = ['All', [0, 1, 2, 3], 'Num']
+    d_2 = ut.Setup('2', setup, [args_2])
+
+    # Dichotomous data, any solver
+    x_0 = ut.test(rasch_sparse,
+                  {'data':[d_0],
+                   'groups':[None, {'row':1}],
+                   'runspecs':[[0.001, 20]],
+                   'solver':[None, ['PROX', 'Newton']]},
+                  check=check,
+                  asserts=asserts,
+                  suffix='dichot',
+                  printout=printout)
+
+    # Polytomous data, Newton-Raphson steps
+    x_1 = ut.test(rasch_sparse,
+                  {'data':[d_1, d_2],
+                   'groups':[None, {'row':1}],
+                   'runspecs':[[0.001, 20]],
+                   'solver':[['PROX', 'Newton'], 'Newton']},
+                  check=check,
+                  asserts=asserts,
+                  suffix='poly',
+                  printout=printout)
+
+    # Polytomous data, default step update
+    x_2 = ut.test(rasch_sparse_steps,
+                  {'data':[d_1, d_2],
+                   'groups':[None, {'row':1}],
+                   'runspecs':[[0.001, 20]],
+                   'solver':[None]},
+                  check=check,
+                  asserts=asserts,
+                  suffix=None,
+                  printout=printout)
+
+    return {'dichot':x_0, 'poly':x_1, 'steps':x_2}
+
+
 def test_coord(check='run', asserts=ut.allclose, printout=True):
     "Test Damon's coord() method."
     
@@ -570,6 +862,281 @@ def test_coord(check='run', asserts=ut.allclose, printout=True):
     return x
 
 
+def test_coord_options(check='run', asserts=ut.allclose, printout=True):
+    "Test coord() options that change how, not what, it computes."
+
+    def coord_options(data, **kwargs):
+        d = data
+        plain = kwargs.copy()
+        plain['workers'] = None
+        plain['startercoord'] = None
+        d.coord(**plain)
+        ref = coord_estimates(d)
+        its = len(d.coord_out['changelog'])
+
+        # Warm-start from the plain run
+        warm = kwargs['startercoord'] == 'coord_out'
+        if warm:
+            kwargs['startercoord'] = d.coord_out
+
+        d.coord(**kwargs)
+        est = coord_estimates(d)
+
+        # Same coordinates for any number of workers.  A warm start
+        # moves a converged solution by about runspecs[0], no more.
+        if warm:
+            assert_close(est, ref, 0.002, 'coord() warm and cold estimates')
+            if len(d.coord_out['changelog']) > its:
+                exc = ('Warm start took {0} iterations, the cold start '
+                       '{1}.\n').format(len(d.coord_out['changelog']), its)
+                raise AssertionError(exc)
+        else:
+            assert_close(est, ref, 1e-10, 'coord() estimates with workers')
+        return est
+
+    x = ut.test(coord_options,
+                {'data':[COORD_DATA],
+                 'ndim':[[[2]]],
+                 'runspecs':[[0.0001, 20]],
+                 'seed':[1, 'SVD', {'MaxIt':4, 'Stats':['Obj'], 'Halving':True}],
+                 'startercoord':[None, 'coord_out'],
+                 'solve_meth':['LstSq', 'IRLS'],
+                 'solve_meth_specs':[{'runspecs':[0.0001, 10]}],
+                 'workers':[None, 2]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_accel(check='run', asserts=ut.allclose, printout=True):
+    "Test coord()'s convergence acceleration (runspecs flags)."
+
+    def coord_accel(data, **kwargs):
+        d = data
+        plain = kwargs.copy()
+        plain['runspecs'] = kwargs['runspecs'][:2]
+        d.coord(**plain)
+        ref = coord_estimates(d)
+
+        d.coord(**kwargs)
+        est = coord_estimates(d)
+
+        # Extrapolated iterations, toward the plain run's solution
+        if not d.coord_out['accel']['accel_its'] > 0:
+            exc = 'coord() did not accelerate any iteration.\n'
+            raise AssertionError(exc)
+        assert_close(est, ref, 0.05, 'coord() estimates with acceleration')
+        return est
+
+    x = ut.test(coord_accel,
+                {'data':[SLOW_DATA],
+                 'ndim':[[[3]]],
+                 'runspecs':[[0.00001, 200, 'Anderson'],
+                              [0.00001, 200, {'Anderson':3}],
+                              [0.00001, 200, 'SOR'],
+                              [0.00001, 200, {'SOR':1.8}]],
+                 'seed':[1]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_freeze(check='run', asserts=ut.allclose, printout=True):
+    "Test coord()'s per-entity freezing (runspecs 'Freeze' flag)."
+
+    def coord_freeze(data, **kwargs):
+        d = data
+        plain = kwargs.copy()
+        plain['runspecs'] = kwargs['runspecs'][:2]
+        d.coord(**plain)
+        ref = coord_estimates(d)
+
+        d.coord(**kwargs)
+        est = coord_estimates(d)
+
+        # Some iterations solve fewer rows, but the last is a full sweep
+        activelog = d.coord_out['activelog']
+        nrows, ncols = np.shape(d.coredata)
+        if not np.min(activelog[:, 1]) < nrows:
+            exc = 'coord() did not freeze any row entity.\n'
+            raise AssertionError(exc)
+        if list(activelog[-1, 1:]) != [nrows, ncols]:
+            exc = 'coord() did not stop on a full sweep.\n'
+            raise AssertionError(exc)
+        assert_close(est, ref, 0.05, 'coord() estimates with freezing')
+        return est
+
+    x = ut.test(coord_freeze,
+                {'data':[SLOW_DATA],
+                 'ndim':[[[3]]],
+                 'runspecs':[[0.00001, 200, 'Freeze'],
+                              [0.00001, 200, {'Freeze':[0.0001, 10]}]],
+                 'seed':[1]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_bestdim(check='run', asserts=ut.allclose, printout=True):
+    "Test coord()'s search for the best dimensionality."
+
+    def coord_bestdim(data, **kwargs):
+        d = data
+        plain = kwargs.copy()
+        plain['workers'] = None
+        np.random.seed(0)
+        d.coord(**plain)
+        ref = d.objperdim.coredata
+
+        np.random.seed(0)
+        d.coord(**kwargs)
+
+        # Same table for any number of workers
+        assert_close(d.objperdim.coredata, ref, 1e-10,
+                     'objperdim with and without workers')
+        return d.objperdim.coredata
+
+    x = ut.test(coord_bestdim,
+                {'data':[COORD_DATA],
+                 'ndim':[[range(1, 5), 'Acc'], [range(1, 5), 'search'],
+                         [range(1, 5), 'Stab', 'Err'],
+                         [range(1, 5), 'Acc', 'Nested'],
+                         [range(1, 5), 'search', 'homogenize', 'Nested'],
+                         [range(1, 5), 'Acc', 'Fast'],
+                         [range(1, 5), 'homogenize', 'Fast']],
+                 'runspecs':[[0.0001, 20]],
+                 'workers':[2]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_cache(check='run', asserts=ut.allclose, printout=True):
+    "Test reuse of coord()'s bestdim and seed searches (cache)."
+
+    # temp is emptied between tests
+    cache = TEMP_PATH
+
+    def coord_cache(data, **kwargs):
+        d = data
+        tools.cache_invalidate(cache)
+        plain = kwargs.copy()
+        plain['cache'] = None
+        d.coord(**plain)
+        ref = [d.objperdim.coredata, d.seed['BestSeed']]
+
+        # The second run reads the first run's searches.  Both give
+        # the same results as a run without a cache.
+        for run in range(2):
+            d.coord(**kwargs)
+            assert_close(d.objperdim.coredata, ref[0], 1e-10,
+                         'objperdim with and without cache')
+            if d.seed['BestSeed'] != ref[1]:
+                exc = ('BestSeed is {0} with cache, {1} without.\n'
+                       .format(d.seed['BestSeed'], ref[1]))
+                raise AssertionError(exc)
+
+        # Results are stored, but only the newest beyond MaxMB
+        if kwargs['cache'] is not None:
+            stored = [f for f in os.listdir(cache) if f.endswith('.pkl')]
+            if (len(stored) == 0
+                or isinstance(kwargs['cache'], dict) and len(stored) > 1):
+                exc = 'Cache holds {0} results.\n'.format(len(stored))
+                raise AssertionError(exc)
+        return [d.objperdim.coredata, d.seed['BestSeed']]
+
+    x = ut.test(coord_cache,
+                {'data':[COORD_DATA],
+                 'ndim':[[range(1, 4), 'Acc', 'Obj']],
+                 'runspecs':[[0.0001, 20]],
+                 'seed':[{'MaxIt':3, 'Stats':['Obj']}],
+                 'cache':[None, cache, {'Path':cache, 'MaxMB':0.001}]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_stream(check='run', asserts=ut.allclose, printout=True):
+    "Test coord() reading the data in blocks of rows (chunk)."
+
+    def coord_stream(data, **kwargs):
+        d = data
+        chunk = kwargs.pop('chunk')
+        d.coord(chunk=None, **kwargs)
+        ref = coord_estimates(d)
+        its = len(d.coord_out['changelog'])
+
+        d.coord(chunk=chunk, **kwargs)
+        est = coord_estimates(d)
+
+        # Dimensions can differ in sign from chunk = None; estimates cannot
+        assert_close(est, ref, 1e-10, 'coord() estimates with chunk')
+        if len(d.coord_out['changelog']) != its:
+            exc = 'coord() took a different number of iterations with chunk.\n'
+            raise AssertionError(exc)
+        return est
+
+    x = ut.test(coord_stream,
+                {'data':[COORD_DATA],
+                 'ndim':[[[2]]],
+                 'runspecs':[[0.0001, 20]],
+                 'seed':[1, 'SVD'],
+                 'weightcoord':[True, None],
+                 'chunk':[30, 64]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
+def test_coord_monitor(check='run', asserts=ut.allclose, printout=True):
+    "Test the per-iteration records passed to coord()'s monitor."
+
+    def coord_monitor(data, **kwargs):
+        d = data
+        logs = [[], []]
+        for log in logs:
+            d.coord(monitor=log.append, **kwargs)
+
+        # Timings vary from run to run; iterations, changes and RMSR do not
+        recs = [np.array([[r['iteration'], r['change'], r['rmsr']]
+                          for r in log], dtype=float) for log in logs]
+        if not np.array_equal(np.nan_to_num(recs[0]), np.nan_to_num(recs[1])):
+            exc = 'coord() monitor records differ between two runs.\n'
+            raise AssertionError(exc)
+
+        # At least one record per iteration
+        its = len(d.coord_out['changelog'])
+        if sorted(set(recs[1][:, 0])) != range(its):
+            exc = ('coord() monitor records do not cover its {0} '
+                   'iterations.\n').format(its)
+            raise AssertionError(exc)
+        return recs[1]
+
+    x = ut.test(coord_monitor,
+                {'data':[COORD_DATA],
+                 'ndim':[[[2]]],
+                 'runspecs':[[0.0001, 20]],
+                 'seed':[1],
+                 'chunk':[None, 30]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+    return x
+
+
 def test_sub_coord(check='run', asserts=ut.allclose, printout=True):
     "Test Damon's sub_coord() method."
 
@@ -604,7 +1171,90 @@ def test_sub_coord(check='run', asserts=ut.allclose, printout=True):
                 printout=printout)
 
     return x
-                
+
+
+def test_sub_coord_workers(check='run', asserts=ut.allclose, printout=True):
+    "Test that sub_coord(workers=2) gives the results of workers=None."
+
+    def sub_coord_workers(data, **kwargs):
+        d = data
+        d.sub_coord(workers=None, **kwargs)
+        serial = d.sub_coord_out
+
+        d.sub_coord(workers=2, **kwargs)
+        pooled = d.sub_coord_out
+
+        # The random feather varies estimates by about 0.001 from run to run
+        assert_close(pooled['estimates']['coredata'],
+                     serial['estimates']['coredata'], 0.01,
+                     'sub_coord() estimates with workers')
+        if pooled['ndim'] != serial['ndim']:
+            exc = ('sub_coord() ndim differs between workers=2 and '
+                   'workers=None.\n')
+            raise AssertionError(exc)
+        return pooled['estimates']['coredata']
+
+    cargs = {'nheaders4cols':2,
+             'extra_headers':{'0':0.50, '1':0.50}}
+    d = ut.Setup('d', setup_damon, [cargs, [('standardize', {})]])
+
+    x = ut.test(sub_coord_workers,
+                {'data':[d],
+                 'subspaces':[{'row':1},
+                              ['key', {'0':['1', '2', '3', '4'],
+                                       '1':['5', '6', '7', '8']}]],
+                 'coord_subs':[{'All':{'ndim':[[2]]}}],
+                 'coord_resids':[{'All':{'ndim':[[1]]}}],
+                 'unique_weights':[{'0':'Auto', '1':'Auto'}, {'All':0.50}],
+                 'share_if':[{'targ_<':30, 'pred_>': 4}],
+                 'min_rel':[0.02],
+                 'rpt_optimal':[None, True]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+
+    return x
+
+
+def test_objectify(check='run', asserts=ut.allclose, printout=True):
+    "Test Damon's objectify() method."
+
+    def objectify(data, **kwargs):
+        d = data
+        plain = kwargs.copy()
+        plain['workers'] = None
+        d.objectify(**plain)
+        ref = np.copy(d.objectify_out['obj_est']['coredata'])
+
+        d.objectify(**kwargs)
+        est = d.objectify_out['obj_est']['coredata']
+
+        # Same estimates for any number of workers
+        assert_close(est, ref, 1e-10, 'objectify() estimates with workers')
+        return est
+
+    d = ut.Setup('d', setup_damon,
+                 [{'nfac0':40, 'nfac1':12},
+                  [('standardize', {}),
+                   ('coord', {'ndim':[[2]], 'seed':1})]])
+
+    x = ut.test(objectify,
+                {'data':[d],
+                 'pred_ents':[{'AllTargs':'AllExceptTarg'},
+                              {'AllTargs':{'Get':'NoneExcept',
+                                           'Labels':'index',
+                                           'Cols':range(1, 7)}}],
+                 'seed':[1],
+                 'starters':[True, None],
+                 'workers':[2]},
+                check=check,
+                asserts=asserts,
+                suffix=None,
+                printout=printout)
+
+    return x
+
 
 def test_base_est(check='run', asserts=ut.allclose, printout=True):
     "test Damon's base_est() method."
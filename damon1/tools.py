@@ -11,12 +11,22 @@ import os
 import sys
 
 # Import numpy and other python modules
-#import cPickle
+import cPickle
+import hashlib
 import numpy as np
 import numpy.random as npr
 import numpy.linalg as npla
 import numpy.ma as npma
 import ast
+import json
+import time
+import multiprocessing as mp
+import multiprocessing.sharedctypes as mpsc
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 ##try:
 ##    import matplotlib.pyplot as plt
@@ -27,6 +37,7 @@ from tabulate import tabulate
 
 # Import Damon utilities
 import damon1 as dmn
+import damon1.helper as helper
 import tester as ut
 
 # Define exception classes
@@ -39,8 +50,24 @@ class invUTU_Error(Exception): pass
 class condcoord_Error(Exception): pass
 class solve1_Error(Exception): pass
 class solve2_Error(Exception): pass
+class solve_batch_Error(Exception): pass
+class irls_batch_Error(Exception): pass
+class miss_patterns_Error(Exception): pass
+class collapse_rows_Error(Exception): pass
+class csr_index_Error(Exception): pass
 class jolt_Error(Exception): pass
+class warm_coords_Error(Exception): pass
+class nested_coords_Error(Exception): pass
+class accelerate_Error(Exception): pass
+class freeze_Error(Exception): pass
 class faccoord_Error(Exception): pass
+class facpool_Error(Exception): pass
+class stream_coord_Error(Exception): pass
+class svd_coords_Error(Exception): pass
+class iter_monitor_Error(Exception): pass
+class dimpool_Error(Exception): pass
+class search_cache_Error(Exception): pass
+class truncate_dims_Error(Exception): pass
 class get_unique_weight_Error(Exception): pass
 class resp_prob_Error(Exception): pass
 class residuals_Error(Exception): pass
@@ -51,6 +78,7 @@ class metricprob_Error(Exception): pass
 class separation_Error(Exception): pass
 class reliability_Error(Exception): pass
 class stability_in_coord_Error(Exception): pass
+class homogenize_Error(Exception): pass
 class rmsr_Error(Exception): pass
 class ptbis_Error(Exception): pass
 class pytables_Error(Exception): pass
@@ -3471,12 +3499,13 @@ def solve2(R,   # [ents x dims array of row coordinates, no NaNVals]
             U = R
 
         # Apply irls()
+        Specs = _irls_specs(meth_specs)
         V = irls(U = U, # [2_D array of coordinates]
                  x = x, # [2-D array of observations, no NaNVals]
                  facet = 'R', # ['R' => U = rows x dims; 'C' => U = dims x cols]
-                 runspecs = meth_specs['RunSpecsDichot'],    # [[StopWhenChange,MaxIteration]]
-                 ecutmaxpos = meth_specs['ecutmaxpos'],    # [[ECut,MaxPos]]
-                 pcut = meth_specs['pcut'], # [pcut corresponding to ECut]
+                 runspecs = Specs['runspecs'],    # [[StopWhenChange,MaxIteration]]
+                 ecutmaxpos = Specs['ecutmaxpos'],    # [[ECut,MaxPos]]
+                 pcut = Specs['pcut'], # [pcut corresponding to ECut]
                  nanval = nanval,    # [Not-a-number value]
                  )
     else:
@@ -3486,6 +3515,22 @@ def solve2(R,   # [ents x dims array of row coordinates, no NaNVals]
     return V
 
 
+def _irls_specs(meth_specs):
+    "IRLS specs from solve_meth_specs, with irls() defaults for missing keys."
+
+    Specs = {'runspecs':[0.01,5], 'ecutmaxpos':[0.5,1.4], 'pcut':0.5}
+    if meth_specs is not None:
+        for key in Specs:
+            if key in meth_specs:
+                Specs[key] = meth_specs[key]
+
+        # Older name for 'runspecs'
+        if 'runspecs' not in meth_specs and 'RunSpecsDichot' in meth_specs:
+            Specs['runspecs'] = meth_specs['RunSpecsDichot']
+
+    return Specs
+
+
 ###########################################################################
 
 def irls(U, # [2_D array of coordinates]
@@ -3670,6 +3715,516 @@ def irls(U, # [2_D array of coordinates]
 
 
 
+###########################################################################
+
+class CSRIndex(object):
+    """Compressed index of the valid cells of each entity.
+
+    A CSRIndex replaces a list of np.where() arrays, one per row or
+    column, with two flat arrays:
+
+        indptr  =>  int64 array of len(entities) + 1 offsets
+        indices =>  int32 array of valid opposing-entity indices, so
+                    that entity i's valid cells are
+                    indices[indptr[i]:indptr[i + 1]]
+
+    It behaves like the list it replaces:  index[i] returns entity
+    i's array of valid cells, len(index) is the number of entities,
+    and index[start:stop] returns a CSRIndex for a range of entities.
+    axis = 0 means the entities are rows (a CSR index of the data);
+    axis = 1 means they are columns (a CSC index).
+
+    Build one with csr_index().
+    """
+
+    def __init__(self, indptr, indices, nopp, axis=0):
+        self.indptr = indptr
+        self.indices = indices
+        self.nopp = nopp
+        self.axis = axis
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                exc = 'CSRIndex only supports contiguous slices.\n'
+                raise csr_index_Error(exc)
+            stop = max(start, stop)
+            indptr = self.indptr[start:stop + 1]
+            return CSRIndex(indptr - indptr[0],
+                            self.indices[indptr[0]:indptr[-1]],
+                            self.nopp, self.axis)
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def counts(self):
+        "Number of valid cells per entity."
+        return np.diff(self.indptr)
+
+    def positions(self, ents):
+        "Positions in indices of the valid cells of ents, in order."
+        starts = self.indptr[ents]
+        lens = self.indptr[np.asarray(ents) + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lens) + lens, lens)
+        return offsets + np.arange(np.sum(lens)), lens
+
+    def mask(self, ents=None):
+        "Boolean len(ents) x nopp validity mask."
+        if ents is None:
+            ents = np.arange(len(self))
+        pos, lens = self.positions(ents)
+        mask = np.zeros((len(ents), self.nopp), dtype=bool)
+        mask[np.repeat(np.arange(len(ents)), lens), self.indices[pos]] = True
+        return mask
+
+    def sums(self, arr):
+        """Sum of a rows x cols array over each entity's valid cells,
+        as a 1-D array with one value per entity."""
+        ents = np.repeat(np.arange(len(self)), self.counts())
+        if self.axis == 0:
+            vals = arr[ents, self.indices]
+        else:
+            vals = arr[self.indices, ents]
+        return np.bincount(ents, weights=vals, minlength=len(self))
+
+
+def csr_index(data,     # [2-D data array or PyTable, or boolean array of valid cells]
+              nanval = None,    # [None, <float> => data value meaning a cell is missing]
+              axis = 0, # [<0,1> => 0 indexes the cells of each row; 1 of each column]
+              oppvalid = None,  # [None, 1-D boolean array of usable opposing entities]
+              chunk = 50000,    # [<int> => number of entities to index per block]
+              nopp = None,  # [None, <int> => number of opposing entities, when data is a list]
+              ):
+    """Builds a CSRIndex of the valid cells of each row or column.
+
+    Returns
+    -------
+        CSRIndex object.  See the CSRIndex docs.
+
+    Comments
+    --------
+        coord() used to index the valid cells of each row and column
+        with a Python loop building one np.where() array per entity,
+        more than a million small arrays for a 1M x 300 matrix.
+        csr_index() builds the same information as two flat arrays
+        with np.nonzero(), one block of entities at a time, so it is
+        fast to build and compact to store.  The resulting index is
+        shared by faccoord(), solve_batch(), miss_patterns() and
+        rasch().
+
+        --------------
+        "data" is a rows x cols data array or PyTable.  It is read
+        one block at a time, so a PyTable need not fit in memory.
+        If nanval is None, data is a boolean array, True where a
+        cell counts as valid.  A list of per-entity index arrays (the
+        old targdatindex format) is also accepted, in which case
+        "nopp" must be given.
+
+        --------------
+        "nanval" is the not-a-number value.  Cells equal to nanval
+        are invalid.
+
+        --------------
+        "axis" is 0 to index each row's valid columns, 1 to index
+        each column's valid rows.
+
+        --------------
+        "oppvalid" is an optional boolean array over the opposing
+        entities; cells of opposing entities that are False are
+        treated as invalid.
+
+        --------------
+        "chunk" bounds the temporary memory used per block.
+
+        --------------
+        "nopp" is the number of opposing entities.  It is needed only
+        when data is a list of index arrays, which does not say how
+        many there are.  Otherwise it is ignored.
+
+    Paste function
+    --------------
+        csr_index(data,     # [2-D data array or PyTable, or boolean array of valid cells]
+                  nanval = None,    # [None, <float> => data value meaning a cell is missing]
+                  axis = 0, # [<0,1> => 0 indexes the cells of each row; 1 of each column]
+                  oppvalid = None,  # [None, 1-D boolean array of usable opposing entities]
+                  chunk = 50000,    # [<int> => number of entities to index per block]
+                  nopp = None,  # [None, <int> => number of opposing entities, when data is a list]
+                  )
+
+    """
+    # Convert a list of index arrays
+    if isinstance(data, CSRIndex):
+        return data
+    elif isinstance(data, list):
+        lens = np.array([len(ix) for ix in data], dtype=np.int64)
+        indptr = np.zeros(len(data) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(lens)
+        if len(data) > 0 and indptr[-1] > 0:
+            indices = np.concatenate(data).astype(np.int32)
+        else:
+            indices = np.zeros(0, dtype=np.int32)
+        if nopp is None:
+            exc = 'csr_index() needs nopp when data is a list of index arrays.\n'
+            raise csr_index_Error(exc)
+        return CSRIndex(indptr, indices, int(nopp), axis)
+
+    nEnts = data.shape[axis]
+    nOpp = data.shape[1 - axis]
+
+    counts = np.zeros(nEnts, dtype=np.int64)
+    blocks = []
+    for start in xrange(0, nEnts, chunk):
+        if axis == 0:
+            block = data[start:start + chunk, :]
+        else:
+            block = np.transpose(data[:, start:start + chunk])
+        if nanval is not None:
+            block = block != nanval
+        if oppvalid is not None:
+            block = block & oppvalid
+        ents, opps = np.nonzero(block)
+        counts[start:start + len(block)] = np.bincount(ents, minlength=len(block))
+        blocks.append(opps.astype(np.int32))
+
+    indptr = np.zeros(nEnts + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(counts)
+    if len(blocks) > 0:
+        indices = np.concatenate(blocks)
+    else:
+        indices = np.zeros(0, dtype=np.int32)
+
+    return CSRIndex(indptr, indices, nOpp, axis)
+
+
+
+###########################################################################
+
+def _block_rows(data, rows):
+    """Rows of data (array or PyTable) as a float array.  rows is an
+    increasing index, read as one slice when it is contiguous."""
+
+    if rows[-1] - rows[0] + 1 == len(rows):
+        return np.asarray(data[rows[0]:rows[-1] + 1], dtype=float)
+    else:
+        return np.asarray(data[rows], dtype=float)
+
+
+def solve_batch(U,  # [ents x dims array of opposing facet coordinates]
+                targdatindex,   # [None, CSRIndex or list of arrays of valid U entities per target entity]
+                data,   # [2-D targ ents x U ents array of data]
+                weights = None, # [None, ents x 1 array of weights corresponding to U]
+                ents = None,    # [None, 1-D index of target entities to solve]
+                chunk = 20000,  # [<int> => number of target entities to solve per block]
+                nanval = -999., # [Not-a-number value, for invalid outputs]
+                ):
+    """Solves the weighted least squares problems of many entities at once.
+
+    Returns
+    -------
+        {'V':V,         =>  len(ents) x dims array of solutions
+         'Fail':Fail    =>  None, or index (into V) of entities whose
+                            solution was not finite and set to nanval
+         }
+
+    Comments
+    --------
+        solve_batch() is the stacked equivalent of calling invUTU()
+        and solve2(..., method = 'LstSq') for each target entity in
+        turn, as faccoord() does when engine = 'Loop'.  For target
+        entity i with validity mask m[i] (True where the cell has
+        data and the opposing entity is usable), it builds
+
+            A[i] = sum_j m[i,j] * w[j] * outer(U[j], U[j])
+            b[i] = sum_j m[i,j] * w[j] * U[j] * x[i,j]
+
+        for all entities with two matrix products over the mask --
+        one against the stacked outer products of U, one against
+        U itself -- and solves A[i] v[i] = b[i] with a single
+        stacked np.linalg.solve().
+
+        Results match the per-entity path:  entities whose A[i]
+        is exactly singular (e.g., no valid cells) get coordinates
+        of zero, as invUTU() returns zeros when inversion fails,
+        and entities whose solution is not finite are set to nanval
+        and reported in 'Fail'.
+
+        --------------
+        "U" is the opposing facet's ents x dims coordinates array.
+
+        --------------
+        "targdatindex" is the faccoord() index of valid opposing
+        entities for each target entity, a CSRIndex (see csr_index())
+        or a list of index arrays.  None means all cells are used.
+
+        --------------
+        "data" is the target ents x opposing ents data array (a
+        PyTable is fine, as it is read one block of rows at a time).
+        Cells outside targdatindex are ignored, whatever their value.
+
+        --------------
+        "weights" is the ents x 1 output of weight_coord() for U, or
+        None for unweighted least squares.
+
+        --------------
+        "ents" is an increasing index of the target entities (rows of
+        data) to solve.  None means all of them.  Each block of ents is
+        read from data as one slice when its rows are contiguous, else
+        by index.
+
+        --------------
+        "chunk" is the number of target entities processed per block,
+        which bounds the working memory at about chunk x (opposing
+        ents + dims^2) floats.
+
+        --------------
+        "nanval" is the Not-a-number value assigned to entities
+        whose solution is not finite.
+
+    Paste function
+    --------------
+        solve_batch(U,  # [ents x dims array of opposing facet coordinates]
+                    targdatindex,   # [None, CSRIndex or list of arrays of valid U entities per target entity]
+                    data,   # [2-D targ ents x U ents array of data]
+                    weights = None, # [None, ents x 1 array of weights corresponding to U]
+                    ents = None,    # [None, 1-D index of target entities to solve]
+                    chunk = 20000,  # [<int> => number of target entities to solve per block]
+                    nanval = -999., # [Not-a-number value, for invalid outputs]
+                    )
+
+    """
+    U = np.asarray(U, dtype=float)
+    nOpp, nDims = np.shape(U)
+    if targdatindex is not None:
+        targdatindex = csr_index(targdatindex, nopp=nOpp)
+
+    if ents is None:
+        ents = np.arange(np.size(data, axis=0))
+    ents = np.asarray(ents)
+    nEnts = len(ents)
+
+    if weights is None:
+        w = np.ones(nOpp)
+    else:
+        w = np.asarray(weights, dtype=float).reshape(nOpp)
+
+    # Stacked outer products of U, one row per opposing entity
+    UU = (U[:, :, np.newaxis] * U[:, np.newaxis, :]).reshape(nOpp, nDims * nDims)
+
+    V = np.zeros((nEnts, nDims))
+    Fail = []
+
+    for start in xrange(0, nEnts, chunk):
+        block = ents[start:start + chunk]
+        nBlock = len(block)
+
+        # Validity mask for the block
+        if targdatindex is None:
+            mask = np.ones((nBlock, nOpp), dtype=bool)
+        else:
+            mask = targdatindex.mask(block)
+
+        # Weighted normal equations for every entity in the block
+        x = _block_rows(data, block)
+        MW = mask * w
+        A = np.dot(MW, UU).reshape(nBlock, nDims, nDims)
+        b = np.dot(np.where(mask, x, 0.0) * w, U)
+
+        # Singular systems get zeros, as with invUTU()
+        sign = npla.slogdet(A)[0]
+        ok = sign != 0
+        v = np.zeros((nBlock, nDims))
+        if np.any(ok):
+            try:
+                v[ok] = npla.solve(A[ok], b[ok][:, :, np.newaxis])[:, :, 0]
+            except npla.LinAlgError:
+                for k in np.where(ok)[0]:
+                    try:
+                        v[k] = npla.solve(A[k], b[k])
+                    except npla.LinAlgError:
+                        pass
+
+        # Catch Inf and NaN
+        bad = ~np.all(np.isfinite(v), axis=1)
+        if np.any(bad):
+            v[bad] = nanval
+            Fail.append(start + np.where(bad)[0])
+
+        V[start:start + nBlock] = v
+
+    if len(Fail) > 0:
+        Fail = np.concatenate(Fail)
+    else:
+        Fail = None
+
+    return {'V':V, 'Fail':Fail}
+
+
+
+###########################################################################
+
+def irls_batch(U,   # [ents x dims array of opposing facet coordinates]
+               targdatindex,    # [None, CSRIndex or list of arrays of valid U entities per target entity]
+               data,    # [2-D targ ents x U ents array of data]
+               ents = None, # [None, 1-D index of target entities to solve]
+               runspecs = [0.001,10],   # [[StopWhenChange,MaxIteration]]
+               ecutmaxpos = [0.5,1.4],  # [[ECut,MaxPos]]
+               pcut = 0.5,  # [pcut corresponding to ECut]
+               chunk = 20000,   # [<int> => number of target entities to solve per block]
+               nanval = -999.,  # [Not-a-number value, for invalid outputs]
+               ):
+    """Applies Iteratively Reweighted Least Squares to many entities
+    at once.
+
+    Returns
+    -------
+        {'V':V,         =>  len(ents) x dims array of solutions
+         'Fail':Fail    =>  None, or index (into V) of entities whose
+                            equations were singular or whose solution
+                            was not finite, set to nanval
+         'nIter':nIter  =>  len(ents) array of reweighting iterations
+                            per entity
+         }
+
+    Comments
+    --------
+        irls_batch() is the stacked equivalent of calling irls() for
+        each target entity on its valid cells, as faccoord() does for
+        solve_meth = 'IRLS' when engine = 'Loop'.  It carries the
+        cell weights of a block of entities as one array and runs
+        each reweighting step for the whole block as a single
+        stacked weighted solve (see solve_batch()):
+
+            A[i] = sum_j m[i,j] * W[i,j] * outer(U[j], U[j])
+            b[i] = sum_j m[i,j] * W[i,j] * U[j] * x[i,j]
+
+        followed by the irls() update of the weights from the
+        estimates of the new solution.  Each entity stops on its own,
+        as with irls(), when its change relative to the standard
+        deviation of its data reaches StopWhenChange or after
+        MaxIteration steps; the remaining entities carry on.
+
+        Entities whose equations are singular, for which irls()
+        raises an error, and entities whose solution is not finite
+        are set to nanval and reported in 'Fail'.
+
+        "runspecs", "ecutmaxpos" and "pcut" are as in irls().  The
+        other arguments are as in solve_batch().
+
+    Paste function
+    --------------
+        irls_batch(U,   # [ents x dims array of opposing facet coordinates]
+                   targdatindex,    # [None, CSRIndex or list of arrays of valid U entities per target entity]
+                   data,    # [2-D targ ents x U ents array of data]
+                   ents = None, # [None, 1-D index of target entities to solve]
+                   runspecs = [0.001,10],   # [[StopWhenChange,MaxIteration]]
+                   ecutmaxpos = [0.5,1.4],  # [[ECut,MaxPos]]
+                   pcut = 0.5,  # [pcut corresponding to ECut]
+                   chunk = 20000,   # [<int> => number of target entities to solve per block]
+                   nanval = -999.,  # [Not-a-number value, for invalid outputs]
+                   )
+
+    """
+    U = np.asarray(U, dtype=float)
+    nOpp, nDims = np.shape(U)
+    if targdatindex is not None:
+        targdatindex = csr_index(targdatindex, nopp=nOpp)
+
+    if ents is None:
+        ents = np.arange(np.size(data, axis=0))
+    ents = np.asarray(ents)
+    nEnts = len(ents)
+
+    StopWhenChange = runspecs[0]
+    MaxIteration = runspecs[1]
+
+    # Estimate to probability conversion, as in irls()
+    ecut = ecutmaxpos[0]
+    Max = ecutmaxpos[1]
+    Slope = 1/Max - (Max*pcut - ecut) / (Max*(Max - ecut))
+    Inter = (Max*pcut - ecut) / (Max - ecut)
+
+    # Stacked outer products of U, one row per opposing entity
+    UU = (U[:, :, np.newaxis] * U[:, np.newaxis, :]).reshape(nOpp, nDims * nDims)
+
+    V = np.zeros((nEnts, nDims))
+    nIter = np.zeros(nEnts, dtype=int)
+    Fail = []
+
+    for start in xrange(0, nEnts, chunk):
+        block = ents[start:start + chunk]
+        nBlock = len(block)
+
+        if targdatindex is None:
+            mask = np.ones((nBlock, nOpp), dtype=bool)
+        else:
+            mask = targdatindex.mask(block)
+
+        x = _block_rows(data, block)
+        x = np.where(mask, x, 0.0)
+
+        # Standard deviation of each entity's valid data
+        n = np.sum(mask, axis=1).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Mean = np.sum(x, axis=1) / n
+            SD = np.sqrt(np.sum(np.where(mask, x - Mean[:, np.newaxis], 0.0)**2,
+                                axis=1) / n)
+
+        W = np.ones((nBlock, nOpp))
+        v = np.zeros((nBlock, nDims))
+        vPrev = np.zeros((nBlock, nDims))
+        Live = np.ones(nBlock, dtype=bool)
+        Bad = np.zeros(nBlock, dtype=bool)
+        it = 0
+
+        while it < MaxIteration and np.any(Live):
+            L = np.where(Live)[0]
+
+            # Weighted normal equations of the live entities
+            MW = mask[L] * W[L]
+            A = np.dot(MW, UU).reshape(len(L), nDims, nDims)
+            b = np.dot(MW * x[L], U)
+
+            # Singular systems fail, as irls() raises an error
+            ok = npla.slogdet(A)[0] != 0
+            vL = np.zeros((len(L), nDims))
+            if np.any(ok):
+                vL[ok] = npla.solve(A[ok], b[ok][:, :, np.newaxis])[:, :, 0]
+            ok &= np.all(np.isfinite(vL), axis=1)
+            Bad[L[~ok]] = True
+            Live[L[~ok]] = False
+            L = L[ok]
+            vL = vL[ok]
+            v[L] = vL
+            nIter[start + L] += 1
+
+            # New weights from the inverse expected cell variances
+            P = np.clip(np.dot(vL, np.transpose(U)) * Slope + Inter, 0.001, 0.999)
+            W[L] = 1 / (P * (1 - P))
+
+            # Entities stop when their change is small enough
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Change = np.sqrt(np.mean((vPrev[L] - vL)**2, axis=1)) / SD[L]
+            vPrev[L] = vL
+            Live[L] = Change > StopWhenChange
+            it += 1
+
+        if np.any(Bad):
+            v[Bad] = nanval
+            Fail.append(start + np.where(Bad)[0])
+
+        V[start:start + nBlock] = v
+
+    if len(Fail) > 0:
+        Fail = np.concatenate(Fail)
+    else:
+        Fail = None
+
+    return {'V':V, 'Fail':Fail, 'nIter':nIter}
+
+
+
 ###########################################################################
 
 def jolt(U,     # [ent x dims coordinates array]
@@ -3836,2690 +4391,5889 @@ def jolt(U,     # [ent x dims coordinates array]
 
 ###########################################################################
 
-def faccoord(targfac, # [ [FacetNum,FacetArray,Anchored], e.g., [0,FacetArray0,True] => existing facet array to recalculate] ]
-             targdatindex, # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
-             data,   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
-             oppfac, # [Ents x dims array of coordinates of opposite facet(s), or their product]
-             oppweights,  # [array of weights corresponding to opposite facet array]
-             solve_meth = 'LstSq', # [method for calculating coordinates <'LstSq','IRLS'>]
-             solve_meth_specs = None,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
-             condcoord_ = None,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
-             miss_meth = 'IgnoreCells', # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
-             nanval = -999., # [Not-a-Number value, to label non-numerical outputs]
-             ):
-    """Calculates coordinates for all entities in a specified facet.
+def warm_coords(prior,  # [coord_out dict, bank dict, or bank pickle file => previous coordinates]
+                rowkeys,    # [array of row keys of the data]
+                colkeys,    # [array of column keys of the data]
+                nanval = -999.,  # [Not-a-number value]
+                ):
+    """Look up warm-start coordinates for both facets from a previous run.
 
     Returns
     -------
-        Output dictionary:
-            {'Fac':FacNum           => facet integer (0,1)
-            'FacCoord':FacCoord,    => array of coordinates for target facet
-            'Warn1':Warn1,          => Warning if there was an error calculating an entity's coordinates
-            'Warn2':Warn2           => Warning if one of the facet coordinates is flagged as invalid (e.g., insufficient data or variation)
-            }
+        {'fac0coord'    =>  rows x ndim previous coordinates, nanval
+                            for new rows
+         'fac1coord'    =>  cols x ndim previous coordinates, nanval
+                            for new columns
+         'matched'      =>  {0:rows boolean array, 1:cols boolean array}
+                            of entities found in prior
+         'nmatched'     =>  [n matched rows, n matched cols]
+         'ndim'         =>  dimensionality of the previous run
+         'basis'        =>  <0,1>, the facet with the larger share of
+                            matched entities
+         }
 
     Comments
     --------
-        faccoord() calculates coordinates for each entity corresponding
-        to a specified facet based on parameters received from
-        the Damon.coord() method.
+        When most of a dataset was already analyzed, say in last
+        night's run, coord() need not start over from random
+        coordinates.  warm_coords() looks up each row and column key
+        in the previous coordinates, and warm_fill() initializes the
+        new entities from the matched ones.  coord() then resumes
+        iterating from there, which typically takes only a few
+        iterations.  See the coord() "startercoord" docs.
 
         --------------
-        "targfac" is the target facet, the facet whose elements
-        are to be computed.  It's number and array are entered
-        as a list along with a True/False "anchored" flag:
+        "prior" is one of:
 
-            [target facet number, target facet array, anchored]
-            [0, 0Array, False]  
-                        =>  The target facet is facet 0 (rows),
-                            its array is 0Array, and it is not
-                            anchored.
+            coord_out       =>  my_obj.coord_out from a previous run
+            bank            =>  a bank dictionary (see bank()), whose
+                                'ent_coord' coordinates are used for
+                                'facet0' (rows) and 'facet1' (columns),
+                                when present
+            'mybank.pkl'    =>  the name of a bank pickle file
 
-            The target array is always Ents x Dims, regardless
-            of facet.
-            
-            The anchored flag helps control how nanvals are
-            interpreted.  If anchored = False, whenever a coordinate
-            ends up being assigned a nanval due to a calculation
-            exception, that nanval is preserved and propagated
-            through subsequent iterations.  However, anchored
-            coordinates may be nanval simply because values
-            haven't been calculated for them yet.  anchored = True
-            allows the missing coordinates to be calculated
-            and not ignored.
-            
         --------------
-        "targdatindex" is an index telling which elements in
-        the opposing facet array are to go into the calculation.
-        It is based on the locations of the non-missing cells
-        for the target facet and on whether the opposing facet
-        elements are valid.  It is formatted as a list of
-        arrays containing the valid row or column indices for
-        each entity in the target facet.  Example:
+        "rowkeys", "colkeys" are the row and column keys of the data,
+        as returned by getkeys().  They must be of the same type
+        as the keys of prior.
 
-            targdatindex = [array([0, 1, 2, 3, 4, 5, 6, 7]),
-                            array([0, 1, 2, 3, 4, 5]),
-                            array([0, 1, 4, 5, 6, 7])]
+    Paste function
+    --------------
+        warm_coords(prior,  # [coord_out dict, bank dict, or bank pickle file => previous coordinates]
+                    rowkeys,    # [array of row keys of the data]
+                    colkeys,    # [array of column keys of the data]
+                    nanval = -999.,  # [Not-a-number value]
+                    )
 
-            If the target facet is FacNum = 0 (rows), this
-            index suggests there are three elements in the
-            target facet and 8 elements in the opposing facet
-            (columns), and that the second row element should
-            ignore columns 6 and 7 while the third row element
-            should ignore columns 2 and 3.
+    """
+    if isinstance(prior, str):
+        prior = np.load(prior)
+
+    # Look up previous coordinates by key
+    Lookup = {}
+    if 'fac0coord' in prior and 'fac1coord' in prior:
+        for Fac in [0, 1]:
+            dd = prior['fac%dcoord' % Fac]
+            keys = getkeys(dd, 'Row', 'Core', 'Auto', None)
+            coords = dd['coredata'][:,:]
+            Lookup[Fac] = dict(zip(keys, coords))
+    elif 'facet0' in prior or 'facet1' in prior:
+        for Fac in [0, 1]:
+            try:
+                Lookup[Fac] = prior['facet%d' % Fac]['ent_coord']
+            except KeyError:
+                Lookup[Fac] = {}
+    else:
+        exc = 'prior must be a coord_out dictionary or a bank.\n'
+        raise warm_coords_Error(exc)
 
-        --------------
-        "data" is the 2-D targfacet x OppFacet data array.  If
-        the target facet is rows, then data is entered as
-        rows x columns, matching the source data matrix.  If
-        the target facet is columns, then data must be transposed
-        so that the columns can be handled as rows.  coord()
-        handles all this in passing information to faccoord().
+    ndim = None
+    for Fac in [0, 1]:
+        for key in Lookup[Fac]:
+            ndim = np.size(Lookup[Fac][key])
+            break
+        if ndim is not None:
+            break
+    if ndim is None:
+        exc = 'prior contains no coordinates.\n'
+        raise warm_coords_Error(exc)
+
+    # Fill matched entities
+    Coords = {}
+    Matched = {}
+    for Fac, keys in [(0, rowkeys), (1, colkeys)]:
+        Coords[Fac] = np.zeros((len(keys), ndim)) + nanval
+        for i, key in enumerate(keys):
+            if key in Lookup[Fac]:
+                Coords[Fac][i] = np.ravel(Lookup[Fac][key])
+        Matched[Fac] = np.all(Coords[Fac] != nanval, axis=1)
+
+    nMatched = [int(np.sum(Matched[0])), int(np.sum(Matched[1]))]
+    if nMatched[0] + nMatched[1] == 0:
+        exc = ('Zero matches between data keys and prior keys.  Check key '
+               'types.\n')
+        raise warm_coords_Error(exc)
+
+    Share = [nMatched[0] / float(len(rowkeys)), nMatched[1] / float(len(colkeys))]
+
+    return {'fac0coord':Coords[0],
+            'fac1coord':Coords[1],
+            'matched':Matched,
+            'nmatched':nMatched,
+            'ndim':ndim,
+            'basis':0 if Share[0] > Share[1] else 1
+            }
 
-        data can be a PyTable; data rows and columns are
-        accessed with the same slice notation.
 
-        --------------
-        "oppfac" is an Ents x Dims array of coordinates for
-        the facet opposite the target facet.  When Damon evolves
-        to more than two facets, the opposing facet will be
-        a tensor product of multiple facet arrays.
 
-        --------------
-        "oppweights" is Ents x 1 array of weights corresponding to
-        the opposing facet, used to avoid degenerate solutions.
+###########################################################################
 
-        --------------
-        "solve_meth" is the method used for calculating coordinates
-        for an individual entities.  There are two options:
-        'LstSq' (ordinary least squares), 'IRLS' (iteratively reweighted
-        least squares).
+def warm_fill(warm,     # [output of warm_coords()]
+              data,     # [2-D rows x cols data array]
+              nanval = -999.,  # [Not-a-number value]
+              ):
+    """Initialize the new entities of warm-start coordinates.
 
-        --------------
-        "condcoord_" is a specification for conditioning the target
-        facet array after it has been calculated.  See condcoord()
-        docs.
+    Returns
+    -------
+        warm, with the coordinates of new entities filled in place.
 
-        --------------
-        "miss_meth" specifies whether to use the 'ImputeCells' method
-        for dealing with missing data or the 'IgnoreCells' method.
+    Comments
+    --------
+        New entities, those not found by warm_coords(), are
+        initialized by least squares from the opposing facet:  first
+        the new entities of the basis facet (the one with the larger
+        share of matches) from the matched entities of the other
+        facet, then the new entities of the other facet from all
+        basis entities.  Entities with too few valid cells to solve
+        are left for coord() to handle as usual.
 
         --------------
-        "nanval" is the Not-a-Number value to assign to non-numerical
-        outputs.
+        "warm" is the output of warm_coords().
 
+        --------------
+        "data" is the rows x cols data array to be analyzed.
 
     Paste function
     --------------
-        faccoord(targfac, # [ [FacetNum,FacetArray,Anchored], e.g., [0,FacetArray0,True] => existing facet array to recalculate] ]
-                 targdatindex, # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
-                 data,   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
-                 oppfac, # [Ents x dims array of coordinates of opposite facet(s), or their product]
-                 oppweights,  # [array of weights corresponding to opposite facet array]
-                 solve_meth = 'LstSq', # [method for calculating coordinates <'LstSq','IRLS'>]
-                 solve_meth_specs = None,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
-                 condcoord_ = None,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
-                 miss_meth = 'IgnoreCells', # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
-                 nanval = -999., # [Not-a-Number value, to label non-numerical outputs]
-                 )
+        warm_fill(warm,     # [output of warm_coords()]
+                  data,     # [2-D rows x cols data array]
+                  nanval = -999.,  # [Not-a-number value]
+                  )
 
     """
+    basis = warm['basis']
+    Coords = {0:warm['fac0coord'], 1:warm['fac1coord']}
+    DataDict = {0:data, 1:np.transpose(data)}
 
-    FacNum = targfac[0]
-    FacCoord = targfac[1]
-    anchored = targfac[2]
-    OppCoord = oppfac
-    nEnts = np.size(FacCoord,0)
-    Warn1 = None
-    Warn2 = None
+    for Fac, Opp in [(basis, 1 - basis), (1 - basis, basis)]:
+        New = np.where(~warm['matched'][Fac])[0]
+        OppValid = np.all(Coords[Opp] != nanval, axis=1)
+        if len(New) == 0 or not np.any(OppValid):
+            continue
+        index = csr_index(DataDict[Fac], nanval, axis=0, oppvalid=OppValid)
+        Coords[Fac][New] = solve_batch(Coords[Opp], index, DataDict[Fac],
+                                       ents=New, nanval=nanval)['V']
 
+    return warm
 
-    #####################
-    ##  'IgnoreCells'  ##
-    ##     method      ##
-    #####################
 
-    # 'IgnoreCells' method
-    if miss_meth == 'IgnoreCells':
 
-        # Prepare weights for 'LstSq'
-        if solve_meth == 'LstSq':
-            W_All = oppweights
-        else:
-            W_All = None
 
-        # For each entity
-        fsolve2 = solve2
-        for i in xrange(nEnts):
-            if (FacCoord[i][0] == nanval and not anchored
-                ):
-                FacCoord[i] = nanval
-                Warn2 = True
-            else:
-                DataV = data[i]
-                if targdatindex is not None:
-                    U = OppCoord[targdatindex[i]]
-                    x = DataV[targdatindex[i]][:,np.newaxis]
-                else:
-                    U = OppCoord
-                    x = DataV
+###########################################################################
 
-                if (solve_meth == 'LstSq'
-                    and targdatindex is not None
-                    and W_All is not None
-                    ):
-                    W = W_All[targdatindex[i]]
-                else:
-                    W = None
+def nested_coords(prior,  # [coord_out dict from a run at a lower dimensionality]
+                  data,     # [2-D rows x cols data array of prior's run]
+                  ndim,     # [int => dimensionality of the new run, > prior's]
+                  psmsindex = None, # [None, (rows, cols) index of pseudo-missing cells]
+                  nanval = -999.,  # [Not-a-number value]
+                  seed = None,  # [None, int => seed for the random start of the new axes]
+                  ):
+    """Add dimensions to previous coordinates to warm-start coord() at a
+    higher dimensionality.
 
-                invUTU_ = invUTU(U,'R',weights=W,nanval=nanval)
+    Returns
+    -------
+        A copy of prior's {'fac0coord','fac1coord'} whose coordinates
+        have ndim columns, ready to pass to coord() as startercoord.
 
-                # Solving as if for rows, regardless of target facet (facet is controlled outside the function)
-                try:
-                    v = fsolve2(R = None,   # [ents x dims array of row coordinates, no NaNVals]
-                                C = U,   # [ents x dims array of col coordinates, no NaNVals]
-                                x = x,   # [2-D vector or row or col coordinates, no NaNVals]
-                                targfacet = 'R',   # [<'R','C'>, type of coordinates to calculate]
-                                invUTU_ = invUTU_,  # [None, Output of invUTU(), U = opposing facet of 'targfacet': (UT * U)^-1]
-                                weights = W, # [None, array of weights corresponding to elements in U array]
-                                method = solve_meth,  # [<'LstSq','IRLS','Rasch'>]
-                                meth_specs = solve_meth_specs,   # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
-                                nanval = nanval,  # [Not-a-number value, for invalid outputs]
-                                )
-                    FacCoord[i] = np.transpose(v)
+    Comments
+    --------
+        When _bestdim() fits ndim = 1, 2, 3, ..., the solution at d
+        dimensions is a good start for d + 1, lacking only one axis.
+        nested_coords() keeps prior's coordinates and adds the
+        missing axes from the residuals of its valid cells (pseudo-
+        missing cells excluded), data - fac0coord * fac1coord^T:  the
+        new row and column axes are the leading singular vectors of the
+        residuals, each scaled by the square root of its singular
+        value.  These are found by a few subspace iterations from
+        random vectors, so the cost is a few passes over the data.
+
+        The residual axes are a start, not a solution.  coord()
+        resumes iterating from them, and usually converges in a
+        fraction of the iterations of a cold start.  Entities whose
+        prior coordinates are nanval are initialized by warm_fill()
+        as usual.
 
-                except:
-                    FacCoord[i] = nanval
-                    Warn1 = True
-                    pass
+        --------------
+        "prior" is the coord_out of the lower-dimensional run.
 
+        --------------
+        "data" is the data array analyzed in prior's run.
 
-        # Condition the target facet
-        if condcoord_ is not None:
-            if FacNum == 0:
-                Fac = 'Fac0'
-                fac0coord = FacCoord
-                fac1coord = None
-                FacOut = 'F0Std'
-            elif FacNum == 1:
-                Fac = 'Fac1'
-                fac0coord = None
-                fac1coord = FacCoord
-                FacOut = 'F1Std'
+        --------------
+        "ndim" is the new dimensionality.
 
-            CondOut = condcoord(fac0coord = fac0coord,  # [None, nRowEnts x nDims facet1 coordinates array]
-                                fac1coord = fac1coord,   # [None, nColEnts x nDims Facet2 coordinates array]
-                                cond_facet = Fac,    # [<'Fac0','Fac1'>]
-                                function = condcoord_[Fac],    # [<None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...} >]
-                                nanval = nanval   # [Not-a-number value]
-                                )
+        --------------
+        "psmsindex" is the index of cells made pseudo-missing in
+        prior's run, which are excluded from the residuals.
 
-            FacCoord = CondOut[FacOut]
+        --------------
+        "seed" seeds the random start of the subspace iterations.
 
-        return {'Fac':FacNum,
-                'FacCoord':FacCoord,
-                'Warn1':Warn1,
-                'Warn2':Warn2
-                }
+    Paste function
+    --------------
+        nested_coords(prior,  # [coord_out dict from a run at a lower dimensionality]
+                      data,     # [2-D rows x cols data array of prior's run]
+                      ndim,     # [int => dimensionality of the new run, > prior's]
+                      psmsindex = None, # [None, (rows, cols) index of pseudo-missing cells]
+                      nanval = -999.,  # [Not-a-number value]
+                      seed = None,  # [None, int => seed for the random start of the new axes]
+                      )
 
-    #####################
-    ##  'ImputeCells'  ##
-    ##     method      ##
-    #####################
+    """
+    R = np.array(prior['fac0coord']['coredata'][:,:], dtype=float)
+    C = np.array(prior['fac1coord']['coredata'][:,:], dtype=float)
+    nNew = ndim - np.size(R, axis=1)
+    if nNew < 1:
+        exc = 'ndim must be greater than the dimensionality of prior.\n'
+        raise nested_coords_Error(exc)
+
+    # Residuals of valid cells
+    X = np.array(data[:,:], dtype=float)
+    if psmsindex is not None:
+        X[psmsindex] = nanval
+    RValid = np.all(R != nanval, axis=1)
+    CValid = np.all(C != nanval, axis=1)
+    Valid = (X != nanval) & RValid[:,np.newaxis] & CValid[np.newaxis,:]
+    R[~RValid] = 0.0
+    C[~CValid] = 0.0
+    E = np.where(Valid, X - np.dot(R, C.T), 0.0)
+
+    # Leading singular vectors, by subspace iteration
+    rs = npr.RandomState(seed)
+    nNew = min(nNew, min(np.shape(E)))
+    Q = np.linalg.qr(np.dot(E, rs.randn(np.size(E, axis=1), nNew)))[0]
+    for i in xrange(3):
+        Q = np.linalg.qr(np.dot(E, np.dot(E.T, Q)))[0]
+    U, S, Vt = np.linalg.svd(np.dot(Q.T, E), full_matrices=False)
+    Scale = np.sqrt(S)
+    NewR = np.dot(Q, U) * Scale
+    NewC = np.transpose(Vt) * Scale
+
+    R = np.append(R, NewR, axis=1)
+    C = np.append(C, NewC, axis=1)
+    R[~RValid] = nanval
+    C[~CValid] = nanval
 
-    # 'ImputeCells' method
-    elif miss_meth == 'ImputeCells':
+    out = {}
+    for Fac, Coord in [(0, R), (1, C)]:
+        dd = dict(prior['fac%dcoord' % Fac])
+        dd['coredata'] = Coord
+        out['fac%dcoord' % Fac] = dd
 
-        # Prepare weights for 'LstSq'
-        if solve_meth == 'LstSq':
-            W = oppweights
-        else:
-            W = None
+    return out
 
-        # Invert OppCoord
-        U = OppCoord
-        invUTU_ = invUTU(U,'R',weights=W,nanval=nanval)
-        if not isinstance(invUTU_,np.ndarray):
-            exc = "Linear algebra error.\n"
-            raise faccoord_Error(exc)
 
-        # For each entity
-        fsolve2 = solve2
-        for i in xrange(nEnts):
-            x = data[i]
 
-            try:
-                # Solving as if for rows, regardless of target facet (facet is controlled outside the function)
-                v = fsolve2(R = None,   # [ents x dims array of row coordinates, no NaNVals]
-                           C = U,   # [ents x dims array of col coordinates, no NaNVals]
-                           x = x,   # [2-D vector or row or col coordinates, no NaNVals]
-                           targfacet = 'R',   # [<'R','C'>, type of coordinates to calculate]
-                           invUTU_ = invUTU_,  # [None, Output of invUTU(), U = opposing facet of 'targfacet': (UT * U)^-1]
-                           weights = W, # [None, array of weights corresponding to elements in U array]
-                           method = solve_meth,  # [<'LstSq','IRLS','Rasch'>]
-                           meth_specs = solve_meth_specs,   # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
-                           nanval = nanval,  # [Not-a-number value, for invalid outputs]
-                           )
+###########################################################################
 
-                FacCoord[i] = np.transpose(v)
+def accel_init(runspecs,    # [[StopWhenChange,MaxIteration,<flags>] => coord() runspecs, possibly with an acceleration flag]
+               warmup = 3,  # [<int> => number of plain iterations before extrapolating]
+               ):
+    """Read the coord() convergence acceleration flag from runspecs.
 
-            except:
-                FacCoord[i] = nanval
-                Warn1 = True
-                pass
+    Returns
+    -------
+        None if runspecs contains no acceleration flag.  Otherwise a
+        state dictionary to pass to accelerate() at each iteration:
+
+        {'Meth'         =>  'Anderson' or 'SOR'
+         'Param'        =>  Anderson memory (int) or SOR relaxation
+                            factor (float)
+         'Compare'      =>  True to time a plain run for comparison
+         'PlainSpecs'   =>  runspecs without the acceleration flag
+         'Warmup'       =>  number of plain iterations
+         'nCalls'       =>  number of calls to accelerate()
+         'nAccel'       =>  number of extrapolated iterations
+         'nReset'       =>  number of times the safeguard fell back
+                            to a plain iteration
+         ...            =>  history used internally
+         }
 
-        # Condition the target facet
-        if condcoord_ is not None:
-            if FacNum == 0:
-                Fac = 'Fac0'
-                fac0coord = FacCoord
-                fac1coord = None
-                FacOut = 'F0Std'
-            elif FacNum == 1:
-                Fac = 'Fac1'
-                fac0coord = None
-                fac1coord = FacCoord
-                FacOut = 'F1Std'
+    Comments
+    --------
+        coord() alternates between row and column coordinates until
+        their change falls below StopWhenChange.  This plain iteration
+        converges linearly and can be slow, especially on sparse data.
+        Two standard accelerations are available, turned on by adding
+        a flag to runspecs:
 
-            CondOut = condcoord(fac0coord = fac0coord,  # [None, nRowEnts x nDims facet1 coordinates array]
-                                       fac1coord = fac1coord,   # [None, nColEnts x nDims Facet2 coordinates array]
-                                       cond_facet = Fac,    # [<'Fac0','Fac1'>]
-                                       function = condcoord_[Fac],    # [<None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...} >]
-                                       nanval = nanval   # [Not-a-number value]
-                                       )
+            runspecs = [0.0001,25,'Anderson']
+            runspecs = [0.0001,25,{'Anderson':5}]
 
-            FacCoord = CondOut[FacOut]
+                =>  Anderson mixing.  The next coordinates are the
+                    combination of the last m iterates (default 5)
+                    that minimizes the residual G(x) - x, where G is
+                    one full row/column iteration.
 
-        return {'Fac':FacNum,
-                'FacCoord':FacCoord,
-                'Warn1':Warn1,
-                'Warn2':None
-                }
+            runspecs = [0.0001,25,'SOR']
+            runspecs = [0.0001,25,{'SOR':1.5}]
+
+                =>  Successive over-relaxation.  The next coordinates
+                    are x + omega*(G(x) - x), with 1 < omega < 2
+                    (default 1.5).
+
+        Both are safeguarded:  whenever the size of the residual
+        G(x) - x increases, or an Anderson extrapolation is not
+        finite or is far larger than the residual, accelerate()
+        discards its history and takes a plain step instead.  Each
+        such reset also halves SOR's over-relaxation, omega - 1.
+
+        Adding 'Compare':True to the dictionary form, e.g.,
+
+            runspecs = [0.0001,25,{'Anderson':5,'Compare':True}]
+
+        tells coord() to repeat the run without acceleration and
+        report the iterations and time saved.  This doubles the run
+        time, so use it only to decide whether acceleration pays off
+        for a given kind of data.
+
+        Anderson mixing stores 2*m copies of the extrapolated
+        coordinates array, which matters only for very large arrays.
+
+        --------------
+        "runspecs" is the coord() runspecs list.  Flags other than
+        'Anderson' and 'SOR' are ignored.
+
+        --------------
+        "warmup" is the number of plain iterations run before any
+        extrapolation, to get the iterates close enough to the
+        solution for extrapolation to help.
+
+    Paste function
+    --------------
+        accel_init(runspecs,    # [[StopWhenChange,MaxIteration,<flags>] => coord() runspecs, possibly with an acceleration flag]
+                   warmup = 3,  # [<int> => number of plain iterations before extrapolating]
+                   )
+
+    """
+    defaults = {'Anderson':5, 'SOR':1.5}
+
+    Meth = Param = None
+    Compare = False
+    PlainSpecs = list(runspecs[:2])
+    for spec in runspecs[2:]:
+        if isinstance(spec, dict) and any([key in spec for key in defaults]):
+            for key in defaults:
+                if key in spec:
+                    Meth, Param = key, spec[key]
+            Compare = spec.get('Compare', False) is True
+        elif isinstance(spec, str) and spec in defaults:
+            Meth, Param = spec, defaults[spec]
+        else:
+            PlainSpecs.append(spec)
+
+    if Meth is None:
+        return None
 
+    if Meth == 'Anderson' and (int(Param) != Param or Param < 1):
+        exc = 'Anderson memory must be a positive integer.\n'
+        raise accelerate_Error(exc)
+    elif Meth == 'SOR' and not 0 < Param < 2:
+        exc = 'SOR relaxation factor must be between 0 and 2.\n'
+        raise accelerate_Error(exc)
+
+    return {'Meth':Meth, 'Param':Param, 'Compare':Compare,
+            'PlainSpecs':PlainSpecs, 'Warmup':warmup, 'nCalls':0,
+            'nAccel':0, 'nReset':0, 'X':[], 'G':[], 'PrevRes':None,
+            'Valid':None, 'Omega':Param}
 
 
 
 ###########################################################################
 
-def get_unique_weight(targ, # [<target subspace label>]
-                      targ_obj, # [<target subspace Damon object>]
-                      res_obj,  # [<target subspace residuals Damon object>]
-                      unique_weights,   # [<unique_weights param>]
-                      min_rel = 0.02,   # [<minimum reliability>]
-                      rpt_optimal = None    # [<None, True> => report optimal weight]
-                      ):
-    """Estimate unique weight for sub_coord().
+def accelerate(x,   # [ent x dims coordinates array fed into an iteration]
+               gx,  # [ent x dims coordinates array the iteration produced from x]
+               state,   # [state dictionary from accel_init()]
+               nanval = -999.,  # [Not-a-number value]
+               ):
+    """Extrapolate the next coordinates of a fixed-point iteration.
 
     Returns
     -------
-        Output dictionary:
-            {'unique_weight':_, =>  weight actually used by sub_coord() for unique dimensions
-             'optimal_weight':_ =>  optimal weight, reported separately for simulations
-             }
+        ent x dims array of coordinates to feed into the next iteration.
+        state is updated in place.
 
     Comments
     --------
-        The get_unique_weight() function is used only to support
-        the Damon.sub_coord() method.  sub_coord() partitions the
-        variance in a target subspace into three categories:
+        accelerate() is called by coord() once per row/column
+        iteration on the coordinates of the facet computed last.
+        See accel_init() for the methods and their safeguards.
 
-            a)  p_comm: the target variance explained by the predictor
-                subspace, i.e., the variance in common between the
-                predictor and target data.
+        Entities whose coordinates are nanval in x or gx are not
+        extrapolated and keep their gx values.  When the set of such
+        entities changes, the Anderson history is discarded.
 
-            b)  p_unique: the target variance explained by those
-                dimensions that are unique to the target subspace.
+        --------------
+        "x" and "gx" are the coordinates before and after one
+        iteration, i.e., gx = G(x).
 
-            c)  noise: the remaining variance explained by random
-                noise.
+        --------------
+        "state" is the dictionary returned by accel_init().
 
-        sub_coord() calculates separate R coordinates for the
-        p_comm and p_unique dimensions.  In the absence of noise,
-        the two sets of R coordinates can simply be appended to
-        each other to model the target data.  However, as noise
-        is added, the unique R coordinates are progressively
-        degraded and should therefore be downweighted.  get_unique_weight()
-        is used to estimate the downweight.
+    Paste function
+    --------------
+        accelerate(x,   # [ent x dims coordinates array fed into an iteration]
+                   gx,  # [ent x dims coordinates array the iteration produced from x]
+                   state,   # [state dictionary from accel_init()]
+                   nanval = -999.,  # [Not-a-number value]
+                   )
 
-        (Note that p_comm always receives full weight.  Only p_unique
-        is downweighted.)
+    """
+    state['nCalls'] += 1
+    valid = (np.all(x != nanval, axis=1) & np.all(gx != nanval, axis=1)
+             & np.all(np.isfinite(gx), axis=1))
+
+    xv = x[valid].ravel()
+    gv = gx[valid].ravel()
+    res = np.sqrt(np.sum((gv - xv)**2))
+
+    # Discard the history if the valid entities change
+    if state['Valid'] is None or not np.array_equal(valid, state['Valid']):
+        state['X'], state['G'] = [], []
+    state['Valid'] = valid
+
+    # Safeguard:  fall back to a plain step if the residual grows
+    if state['PrevRes'] is not None and res > state['PrevRes']:
+        state['X'], state['G'] = [], []
+        state['PrevRes'] = res
+        state['nReset'] += 1
+        if state['Meth'] == 'SOR':
+            state['Omega'] = 1. + (state['Omega'] - 1.) / 2.
+        return gx
+    state['PrevRes'] = res
+
+    if state['Meth'] == 'Anderson':
+        m = state['Param']
+        state['X'].append(xv)
+        state['G'].append(gv)
+        if len(state['X']) > m + 1:
+            del state['X'][0], state['G'][0]
+
+    if state['nCalls'] <= state['Warmup'] or res == 0:
+        return gx
+
+    if state['Meth'] == 'SOR':
+        new = gv + (state['Omega'] - 1.) * (gv - xv)
+
+    elif state['Meth'] == 'Anderson':
+        if len(state['X']) < 2:
+            return gx
+        G = np.column_stack(state['G'])
+        F = G - np.column_stack(state['X'])
+        dF = np.diff(F, axis=1)
+        dG = np.diff(G, axis=1)
+        gamma = npla.lstsq(dF, F[:,-1], rcond=-1)[0]
+        new = gv - np.dot(dG, gamma)
+
+        if (not np.all(np.isfinite(new))
+            or np.sqrt(np.sum((new - gv)**2)) > 10 * res
+            ):
+            state['X'], state['G'] = [], []
+            state['nReset'] += 1
+            return gx
 
-        The downweighting formula is:
+    state['nAccel'] += 1
+    out = np.copy(gx)
+    out[valid] = np.reshape(new, (-1, np.size(gx, axis=1)))
 
-            p_uni_comm = p_unique / (p_unique + p_comm)
-            unique_weight = sqrt(reliability * p_uni_comm)
+    return out
 
-        Thus, the more reliable the analysis of the unique component
-        of the data, and the more pronounced the effect of the unique
-        component on the data, the higher the unique weight (maximum
-        of 1.0, minimum of 0.0).  As either reliability goes to zero,
-        or the role of p_unique goes to zero, the unique weight goes
-        to zero.
 
-        Reliability is based on Damon-analyzing the residuals array
-        obtained by subtracting out the estimates obtained by applying
-        the predictor R coordinates to the target data.  It is sensitive
-        to the count of data points and the amount of noise.
 
-    Arguments
-    ---------
-        "targ" is the target subspace label
 
-        -----------
-        "targ_obj" is the target portion of the dataset, formatted
-        as a Damon object and passed in by sub_coord()
+###########################################################################
 
-        -----------
-        "res_obj" is derived from the target residuals obtained by
-        subtracting the estimates computing using predictor R coordinates
-        from the observed data.  The target residuals arrays is
-        formatted as a Damon object and passed in by sub_coord()
+def freeze_init(runspecs,   # [[StopWhenChange,MaxIteration,<flags>] => coord() runspecs, possibly with a 'Freeze' flag]
+                ):
+    """Read the coord() per-entity freezing flag from runspecs.
 
-        -----------
-        "unique_weights" is the same as the unique_weights parameter
-        in the sub_coord() method.  Example:
+    Returns
+    -------
+        None if runspecs contains no 'Freeze' flag.  Otherwise a
+        state dictionary to pass to freeze_active() and
+        freeze_update():
+
+        {'Tol'      =>  change below which an entity is frozen
+         'Sweep'    =>  a full sweep is run every Sweep iterations
+         'Moved'    =>  {0:None or boolean array, 1:...}, entities
+                        whose last change exceeded Tol
+         }
 
-            unique_weights = {'sub0':'Auto', 'sub1':0.50}
+    Comments
+    --------
+        Most entities stop changing after a few coord() iterations,
+        yet each iteration solves them all again.  With freezing,
+        an entity is re-solved only if its own coordinates changed by
+        more than Tol in its last solve.  Otherwise its coordinates
+        are left as they are until the next full sweep.  An entity's
+        change is on the scale of the change coord() compares with
+        StopWhenChange (see freeze_update()).
+
+        Whether the opposing entities an entity shares data with
+        moved is not checked:  in connected data some of them nearly
+        always move, which would keep every entity active.  Instead,
+        every Sweep-th iteration solves all entities, which picks up
+        frozen entities that the others have pulled out of place, and
+        coord() does not stop on an iteration that was not a full
+        sweep, so the final coordinates always reflect a full pass.
+
+            runspecs = [0.0001,25,'Freeze']
+                =>  Tol = StopWhenChange, full sweep every 5 iterations
+
+            runspecs = [0.0001,25,{'Freeze':[0.00001,10]}]
+                =>  Tol = 0.00001, full sweep every 10 iterations
+
+        Freezing applies only to miss_meth = 'IgnoreCells',
+        solve_meth = 'LstSq' runs without anchors.  Its payoff depends
+        on the data:  it helps when entities converge unevenly, e.g.,
+        blocks of entities that are only weakly linked, and does
+        little when all entities converge at the same rate.  Frozen
+        entities miss the small changes that keep accumulating, so a
+        Tol much larger than StopWhenChange can move the final
+        estimates noticeably; the default Tol = StopWhenChange is
+        conservative.
 
-        -----------
-        "min_rel" is the same as the min_rel parameter in sub_coord().
-        It is the minimum below which the reliability will not go.
+    Paste function
+    --------------
+        freeze_init(runspecs,   # [[StopWhenChange,MaxIteration,<flags>] => coord() runspecs, possibly with a 'Freeze' flag]
+                    )
 
-        -----------
-        "rpt_optimal" is the same as the rpt_optimal parameter in
-        sub_coord() and specifies whether to report the optimal
-        parameter even when unique weights are manually specified.
+    """
+    Specs = None
+    for spec in runspecs[2:]:
+        if isinstance(spec, dict) and 'Freeze' in spec:
+            Specs = spec['Freeze']
+        elif isinstance(spec, str) and spec == 'Freeze':
+            Specs = [runspecs[0], 5]
+
+    if Specs is None:
+        return None
 
-    Examples
-    --------
+    if len(Specs) != 2 or Specs[1] < 1:
+        exc = "runspecs 'Freeze' must be [Tol, Sweep], with Sweep >= 1.\n"
+        raise freeze_Error(exc)
 
-        [under construction]
-        
-    Paste Function
-    --------------
-        get_unique_weight(targ, # [<target subspace label>]
-                          targ_obj, # [<target subspace Damon object>]
-                          res_obj,  # [<target subspace residuals Damon object>]
-                          unique_weights,   # [<unique_weights param>]
-                          min_rel = 0.02,   # [<minimum reliability>]
-                          rpt_optimal = None    # [<None, True> => report optimal weight]
-                          )
-    """
+    return {'Tol':Specs[0], 'Sweep':int(Specs[1]), 'Moved':{0:None, 1:None}}
 
-    out = {}
 
-    if (unique_weights[targ] != 'Auto' and rpt_optimal is not True):
-        out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
-        
-    else:
-        ndim = res_obj.coord_out['ndim']
-        nitem = np.size(res_obj.coredata, axis=1)
 
-        if nitem <= ndim:
+###########################################################################
 
-            if unique_weights[targ] == 'Auto':
-                exc = 'Too few items to estimate a unique weight for subspace'+targ+'. Specify a unique weight in sub_coord().\n'
-                raise get_unique_weight_Error(exc)
-            else:
-                out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
-                return out
-        
-        nanval = targ_obj.nanval
-        
-        # Get standard errors
-        res_obj.base_est()
-        res_obj.base_resid()
-        res_obj.base_ear()
+def freeze_active(state,    # [state dictionary from freeze_init()]
+                  facet,    # [<0,1> => target facet]
+                  ):
+    """Boolean array of target entities that still need solving.
 
-        try:
-            res_obj.base_se(obspercellmeth='PickMinFac')
-        except damon1.utils.base_se_Error:
-            out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
-            return out
-            
-        # Get reliability
-        rmse = rmsr(None, None, res_obj.base_se_out['coredata'], nanval)
-        rel = reliability(None,
-                          estimates = res_obj.base_est_out['coredata'],
-                          sterr = rmse,
-                          nanval = nanval
-                          )
-        
-        rel = max(min_rel, rel)
+    Returns
+    -------
+        None if all entities need solving (no change recorded yet for
+        the facet), else a boolean array over the target entities.
 
-        # Variance explained by common dimension
-        p_comm = correl(targ_obj.coredata,
-                        targ_obj.base_est_out['coredata'],
-                        nanval
-                        )**2
+    Comments
+    --------
+        An entity is active if it moved by more than Tol in its last
+        solve.  See freeze_init().
 
-        # Variance explained by unique dimension
-        p_unique = correl(targ_obj.coredata,
-                          res_obj.base_est_out['coredata'],
-                          nanval
-                          )**2
+    Paste function
+    --------------
+        freeze_active(state,    # [state dictionary from freeze_init()]
+                      facet,    # [<0,1> => target facet]
+                      )
 
-        # Unique variance as proportion of non-noise variance
-        p_uni_comm = p_unique / (p_unique + p_comm)
+    """
+    return state['Moved'][facet]
 
-        # Calculate optimal weight
-        unique_weight_ = np.sqrt(p_uni_comm * rel)
 
-        if unique_weights[targ] != 'Auto':
-            out['unique_weight'] =  unique_weights[targ]
-        else:
-            out['unique_weight'] = unique_weight_
 
-        out['optimal_weight'] = unique_weight_
+###########################################################################
 
-    return out
+def freeze_update(state,    # [state dictionary from freeze_init()]
+                  facet,    # [<0,1> => target facet]
+                  prev,     # [ents x dims coordinates before the solve]
+                  new,      # [ents x dims coordinates after the solve]
+                  facmetric = 1.,   # [<float> => scale of the change, coord()'s data standard deviation]
+                  nanval = -999.,   # [Not-a-number value]
+                  ):
+    """Record which entities of a facet moved more than the tolerance.
+
+    Returns
+    -------
+        Number of entities that moved.  state is updated in place.
+
+    Comments
+    --------
+        An entity's change is the root mean square change across its
+        dimensions divided by facmetric, the scale coord() applies to
+        the facet change it compares with StopWhenChange.  So the
+        facet change is the root mean square of the entity changes.
+        Entities that switch between valid and nanval coordinates
+        count as moved.  See freeze_init().
+
+    Paste function
+    --------------
+        freeze_update(state,    # [state dictionary from freeze_init()]
+                      facet,    # [<0,1> => target facet]
+                      prev,     # [ents x dims coordinates before the solve]
+                      new,      # [ents x dims coordinates after the solve]
+                      facmetric = 1.,   # [<float> => scale of the change, coord()'s data standard deviation]
+                      nanval = -999.,   # [Not-a-number value]
+                      )
+
+    """
+    PrevNaN = prev[:,0] == nanval
+    NewNaN = new[:,0] == nanval
+    Change = np.sqrt(np.mean((new - prev)**2, axis=1)) / float(facmetric)
+    Moved = (PrevNaN != NewNaN) | (~NewNaN & ~(Change <= state['Tol']))
+    state['Moved'][facet] = Moved
+
+    return int(np.sum(Moved))
 
 
 
 
 ###########################################################################
 
-def unbiascoord(V,   # [2-D single row or col coordinate vector to unbias, facet opposite from U]
-               invUTU_,   # [Output of invUTU_():  (UT * U)^-1]
-               U,   # [2-D U matrix]
-               h,   # [2-D array of h-statistics corresponding to U]
-               X,   # [2-D array of observations corresponding to U and B]
-               i,   # [Index of observation to be made missing]
-               facet,   # ['R' => U coordinates arranged as rows x dims; 'C' => U coordinates arranged as dims x cols]
-               ):
-    """Returns coordinates as if observation i were deleted.
+def miss_patterns(targdatindex,  # [CSRIndex or list of arrays of valid opposing entities per target entity]
+                  nopp,   # [int => number of opposing entities]
+                  chunk = 50000,  # [<int> => number of target entities to hash per block]
+                  ):
+    """Groups target entities that share the same pattern of valid data.
 
     Returns
     -------
-        Returns coordinates as if observation i were deleted.
+        {'Pattern':Pattern,     =>  1-D array giving the pattern number
+                                    of each target entity
+         'Index':Index,         =>  list of valid-entity index arrays,
+                                    one per pattern
+         'Ents':Ents,           =>  list of arrays of target entities
+                                    having each pattern
+         'nPatterns':nPatterns  =>  number of distinct patterns
+         }
 
     Comments
     --------
-        The formula for the change in the coordinate caused
-        by the deletion of a missing observation is:
+        In fixed-form designs, every person who took the same form
+        has the same set of valid items, and every item on a form
+        has the same set of valid persons.  The targdatindex built
+        by coord() then contains far fewer distinct arrays than
+        entities.  miss_patterns() finds them by packing each
+        entity's validity mask into bytes and hashing the rows with
+        np.unique(), so that faccoord() can invert UTU once per
+        pattern rather than once per entity.
 
-        V - V[unbiased] = (UTU)^-1 * UT_i * Res_i / (1 - h_i)
+        --------------
+        "targdatindex" is the faccoord() index:  a CSRIndex or a list
+        of arrays giving the valid opposing entities for each target
+        entity.
+
+        --------------
+        "nopp" is the number of opposing entities (the width of the
+        validity mask).
+
+        --------------
+        "chunk" is the number of target entities packed at a time,
+        bounding the size of the temporary boolean mask.
 
     Paste function
     --------------
-        unbiascoord(V,   # [2-D single row or col coordinate vector to unbias, facet opposite from U]
-                   invUTU_,   # [Output of invUTU_():  (UT * U)^-1]
-                   U,   # [2-D U matrix]
-                   h,   # [2-D array of h-statistics corresponding to U]
-                   X,   # [2-D array of observations corresponding to U and B]
-                   i,   # [Index of observation to be made missing]
-                   facet,   # ['R' => U coordinates arranged as rows x dims; 'C' => U coordinates arranged as dims x cols]
-                   )
+        miss_patterns(targdatindex,  # [CSRIndex or list of arrays of valid opposing entities per target entity]
+                      nopp,   # [int => number of opposing entities]
+                      chunk = 50000,  # [<int> => number of target entities to hash per block]
+                      )
 
     """
-    # Define variables
-    if facet == 'C':
-        V = np.transpose(V)
-        invUTU_ = np.transpose(invUTU_)
-        U = np.transpose(U)
-        h = np.transpose(h)
-        X = np.transpose(X)
+    targdatindex = csr_index(targdatindex, nopp=nopp)
+    nEnts = len(targdatindex)
+    nBytes = (nopp + 7) // 8
+    packed = np.zeros((nEnts, max(nBytes, 1)), dtype=np.uint8)
+
+    for start in xrange(0, nEnts, chunk):
+        block = np.arange(start, min(start + chunk, nEnts))
+        if nBytes > 0:
+            packed[block] = np.packbits(targdatindex.mask(block), axis=1)
+
+    # Hash each packed row as a single opaque value
+    keys = np.ascontiguousarray(packed).view(np.dtype((np.void, packed.shape[1]))).ravel()
+    first, Pattern = np.unique(keys, return_index=True, return_inverse=True)[1:]
+    nPatterns = len(first)
+
+    Index = [targdatindex[i] for i in first]
+    order = np.argsort(Pattern, kind='mergesort')
+    bounds = np.cumsum(np.bincount(Pattern, minlength=nPatterns))[:-1]
+    Ents = np.split(order, bounds)
+
+    return {'Pattern':Pattern,
+            'Index':Index,
+            'Ents':Ents,
+            'nPatterns':nPatterns
+            }
 
-    # Compute residuals
-    E = np.dot(U,V)
-    Res_i = (X - E)[i,:]
 
-    # Get U transpose element
-    UT_i = np.transpose(U)[:,i][:,np.newaxis]
 
-    # Get h element
-    h_i = h[i,:]
+def collapse_rows(data,  # [2-D rows x cols data array]
+                  nanval = -999.,   # [Not-a-number value]
+                  by = 'Patterns',  # [<'Patterns','Scores'> => rows grouped by response pattern or by (missing pattern, raw score)]
+                  chunk = 50000,  # [<int> => number of rows to key per block]
+                  ):
+    """Groups rows that share a response pattern or a raw score.
 
-    # Compute change in U resulting from deleting datum i
-    DeltaV = (np.dot(invUTU_,UT_i) * Res_i) / (1 - h_i)
-    V_Unbiased = V - DeltaV
+    Returns
+    -------
+        {'Rows':Rows,       =>  1-D array, the first row of each group,
+                                used to represent it
+         'Inverse':Inverse, =>  1-D array giving the group of each row
+         'Counts':Counts,   =>  1-D array, the number of rows per group
+         'nGroups':nGroups  =>  number of groups
+         }
 
-    # Orient solution vector
-    if facet == 'R':
-        V_Unbiased = V_Unbiased
-    elif facet == 'C':
-        V_Unbiased = np.transpose(V_Unbiased)
+        data[Rows][Inverse] rebuilds data when by = 'Patterns'.
 
-    return V_Unbiased
+    Comments
+    --------
+        Under the Rasch model a person's raw score is a sufficient
+        statistic for their measure:  persons who answered the same
+        items and got the same score get the same measure, whatever
+        their pattern of responses.  On fixed-form tests, a million
+        persons may fall into a few thousand such groups.
+        collapse_rows() finds them, so that rasch() can estimate
+        from one row per group, weighted by its count.
+
+        Rows are keyed as bytes, the packed validity mask plus the
+        raw score for 'Scores', or the row itself for 'Patterns', and
+        hashed with np.unique() as in miss_patterns().
+
+    Arguments
+    ---------
+        "data" is a rows x cols array of integer-like scores.
+
+        --------------
+        "nanval" is the not-a-number value.
+
+        --------------
+        "by" is the grouping:
+
+            by = 'Patterns' =>  rows with identical responses,
+                                including missing cells.  Every
+                                statistic of a row, including fit,
+                                is shared by its group.
+
+            by = 'Scores'   =>  rows with the same valid cells and
+                                the same raw score.  The rows of a
+                                group share their Rasch measure and
+                                its standard error, but not their fit.
+
+        --------------
+        "chunk" is the number of rows keyed at a time, bounding the
+        size of the temporary arrays.
+
+    Paste function
+    --------------
+        collapse_rows(data,  # [2-D rows x cols data array]
+                      nanval = -999.,   # [Not-a-number value]
+                      by = 'Patterns',  # [<'Patterns','Scores'> => rows grouped by response pattern or by (missing pattern, raw score)]
+                      chunk = 50000,  # [<int> => number of rows to key per block]
+                      )
 
+    """
+    if by not in ['Patterns', 'Scores']:
+        exc = "by must be 'Patterns' or 'Scores'.\n"
+        raise collapse_rows_Error(exc)
+
+    nrows, ncols = np.shape(data)
+    blocks = []
+
+    for start in xrange(0, nrows, chunk):
+        block = np.asarray(data[start:start + chunk], dtype=float)
+        if by == 'Patterns':
+            blocks.append(np.ascontiguousarray(block).view(np.uint8)
+                          .reshape(len(block), -1))
+        else:
+            valid = block != nanval
+            score = np.sum(np.where(valid, block, 0.0), axis=1)
+            blocks.append(np.append(np.packbits(valid, axis=1),
+                                    score[:, np.newaxis].view(np.uint8),
+                                    axis=1))
+
+    # Hash each keyed row as a single opaque value
+    keyed = np.ascontiguousarray(np.concatenate(blocks, axis=0))
+    keys = keyed.view(np.dtype((np.void, keyed.shape[1]))).ravel()
+    Rows, Inverse, Counts = np.unique(keys, return_index=True,
+                                      return_inverse=True,
+                                      return_counts=True)[1:]
+
+    return {'Rows':Rows,
+            'Inverse':Inverse,
+            'Counts':Counts,
+            'nGroups':len(Rows)
+            }
 
 
 
 ###########################################################################
-def estimate(fac0coord, # [N x D array of N row coordinates in D dimensions]
-             fac1coord, # [I x D array of I column coordinates in D dimensions]
-             nanval,    # [float Not-a-Number Value => marks missing coordinate values]
-             ):
-    """Returns cell estimates based on row and column coordinates.
+
+def prox(data,  # [2-D rows x cols array of integer-like scores, lowest category 0]
+         maxcat,    # [1-D array, the top category of each column]
+         nanval = -999.,   # [Not-a-number value]
+         extreme = [0.50, 0.50],  # [<[float,float]> => row, col max score adjustment]
+         chunk = 50000,  # [<int> => number of rows to sum per block]
+         ):
+    """Returns PROX (normal approximation) Rasch measures for rows and
+    columns.
 
     Returns
     -------
-        array of estimates corresponding to the dot product of
-        the coordinates for facet 1 (rows) and facet 2 (columns).
+        {'Rows':Rows,           =>  nrows x 1 array of row measures
+         'Cols':Cols,           =>  1 x ncols array of column measures,
+                                    with mean zero
+         'Expansion':[X, Y]     =>  row and column expansion factors
+         }
 
     Comments
     --------
-        These estimates are biased in the direction of the
-        observation for small datasets.  For estimates that
-        are "objective", i.e., equivalent to the estimate
-        achieved by making its observation missing, use
-        unbiasest() or objectify().  However, estimate()
-        is the official way to compute estimates from
-        coordinates.
+        PROX (Cohen, 1979; Wright and Stone, "Best Test Design")
+        assumes that row and column measures are roughly normally
+        distributed, which gives them in closed form from the raw
+        scores.  Row and column logits
+
+            b = ln(r / (M - r))         d = ln((N - s) / s)
+
+        where r and s are row and column raw scores and M and N their
+        maximum possible scores, are spread by expansion factors that
+        correct for the spread of the other facet:
+
+            X = sqrt((1 + U / 2.89) / (1 - U * V / 8.35))
+            Y = sqrt((1 + V / 2.89) / (1 - U * V / 8.35))
+
+        where U and V are the variances of the column and row logits.
+        Rows = X * b and Cols = Y * (d - mean(d)).  Where U * V is too
+        large for the approximation, the factors are 1.
+
+        The measures are close to the joint maximum likelihood
+        estimates when the data fit, so rasch() can start from them.
+        For polytomous data, r / M is the proportion of the maximum
+        score.
 
     Arguments
     ---------
-        "fac0coord" is an N row entities x D dimensions
-        array of coordinates.
+        "data" is a rows x cols array of scores, with the lowest
+        category scored 0.
 
-        ----------
-        "fac1coord" is an I column entities x D dimensions
-        array of coordinates.
+        --------------
+        "maxcat" is the top category of each column, e.g. 1 for
+        dichotomous items.
 
-        ----------
-        "nanval" is the Not-a-Number value.
+        --------------
+        "nanval" is the not-a-number value.
+
+        --------------
+        "extreme" is the number of score points by which perfect
+        and zero row and column scores are pulled in, as in rasch().
 
+        --------------
+        "chunk" is the number of rows summed at a time, bounding the
+        size of the temporary arrays.  Scores are integer-like, so
+        the sums do not depend on it.
 
     Paste function
     --------------
-        estimate(fac0coord, # [N x D array of N row coordinates in D dimensions]
-                 fac1coord, # [I x D array of I column coordinates in D dimensions]
-                 nanval,    # [float Not-a-Number Value => marks missing coordinate values]
-                 )
+        prox(data,  # [2-D rows x cols array of integer-like scores, lowest category 0]
+             maxcat,    # [1-D array, the top category of each column]
+             nanval = -999.,   # [Not-a-number value]
+             extreme = [0.50, 0.50],  # [<[float,float]> => row, col max score adjustment]
+             chunk = 50000,  # [<int> => number of rows to sum per block]
+             )
 
     """
-    # Calculate dot product (includes NaNVals in calculation)
-    Est = np.dot(fac0coord,np.transpose(fac1coord))
-
-    # Get locations of missing coordinates
-    F0NaN_Loc = np.where(fac0coord == nanval)[0]
-    F1NaN_Loc = np.where(fac1coord == nanval)[0]
-
-    # Apply NaNVals to rows with missing coordinates
-    Est[F0NaN_Loc] = nanval
-
-    # Apply NaNVals to cols with missing coordinates
-    EstT = np.transpose(Est)
-    EstT[F1NaN_Loc] = nanval
-    Est = np.transpose(EstT)
+    nrows, ncols = np.shape(data)
+    maxcat = np.asarray(maxcat, dtype=float)[np.newaxis, :]
+    j, k = float(extreme[0]), float(extreme[1])
+
+    # Raw and maximum scores of rows and columns
+    r, M = np.zeros(nrows), np.zeros(nrows)
+    s, N = np.zeros(ncols), np.zeros(ncols)
+    for start in xrange(0, nrows, chunk):
+        block = data[start:start + chunk]
+        valid = block != nanval
+        scores = np.where(valid, block, 0.0)
+        maxes = np.where(valid, maxcat, 0.0)
+        r[start:start + chunk] = np.sum(scores, axis=1)
+        M[start:start + chunk] = np.sum(maxes, axis=1)
+        s += np.sum(scores, axis=0)
+        N += np.sum(maxes, axis=0)
+
+    # Row logits.  Rows without valid cells get 0.
+    b = np.zeros(len(r))
+    rows = M > 2 * j
+    r = np.clip(r[rows], j, M[rows] - j)
+    b[rows] = np.log(r / (M[rows] - r))
+
+    # Column logits, centred
+    d = np.zeros(len(s))
+    cols = N > 2 * k
+    s = np.clip(s[cols], k, N[cols] - k)
+    d[cols] = np.log((N[cols] - s) / s)
+    d -= np.mean(d)
+
+    # Expansion factors
+    U = np.var(d[cols]) if np.any(cols) else 0.0
+    V = np.var(b[rows]) if np.any(rows) else 0.0
+    denom = 1 - U * V / 8.35
+    if denom > 0:
+        X = np.sqrt((1 + U / 2.89) / denom)
+        Y = np.sqrt((1 + V / 2.89) / denom)
+    else:
+        X = Y = 1.0
 
-    return Est
+    return {'Rows':X * b[:, np.newaxis],
+            'Cols':Y * d[np.newaxis, :],
+            'Expansion':[X, Y]
+            }
 
 
 
 ###########################################################################
 
-def estimate_error(err, # [<datadict> => abs residual, ratio errors]
-                   err_type, # [<'ear', 'se'> => type of coordinates to get]
-                   anchors # [coord() anchor parameters to use]
-                   ):
-    """Use 2-d Damon to estimate ratio EAR and SE statistics.
-    
+def rasch_score(data,  # [2-D rows x cols array of integer-like scores, lowest category 0]
+                diffs,  # [1-D array, the Rasch difficulty of each column]
+                steps,  # [2-D cols x cats array of cumulative step measures, np.inf for categories a column lacks]
+                nanval = -999.,   # [Not-a-number value]
+                extreme = 0.50,   # [<float> => row max score adjustment]
+                runspecs = [0.00001, 50],  # [<[stop_when_change, max_iteration]> => Newton stopping conditions]
+                chunk = 20000,  # [<int> => number of rows, or (item set, score) cases, to process per block]
+                limits = None,  # [<None, [min, max]> => measures given zero and perfect scores]
+                tables = None,  # [<None, dict> => raw-score-to-measure tables kept between calls]
+                ):
+    """Returns Rasch row (person) measures for data scored against
+    fixed column (item) and step parameters.
+
     Returns
     -------
-        estimate_error() returns a datadict of expected EAR
-        or SE statistics that also contains EAR or SE 2-d log
-        coordinates for use in anchored designs.
-    
+        {'Measures':Measures,       =>  nrows x 1 array of row measures
+         'nPatterns':nPatterns,     =>  number of item sets (patterns of
+                                        valid columns) in data
+         'nSolved':nSolved,         =>  number of (item set, raw score)
+                                        cases solved, i.e., not already
+                                        in the tables
+         'Iterations':Iterations,   =>  most Newton iterations taken by
+                                        a block of cases
+         'Converged':Converged      =>  True if every block met
+                                        runspecs[0]
+         }
+
     Comments
     --------
-        estimate_error() is used in base_ear() to convert
-        absolute residuals into expected absolute residuals (EAR),
-        with coordinates.  In base_se(), it is used to obtain
-        SE coordinates, which take into account the number of
-        observations associated with each cell, and slightly
-        refined SE cell estimates.
-        
-        The estimation itself is done by applying Damon.coord()
-        not to the array of observations but (for the EAR calculation) 
-        to the array of squared residuals: (observations - estimates)**2.
-        This in principle requires a 1-dimensional analysis of ratio
-        scale data (since squared residuals have a hard floor of zero).
-        However, Damon's ALS algorithm, which assumes interval data and
-        homoscedastic errors, has trouble with this type of data.  
-        
-        Therefore, estimate_error() first takes the log of the data, 
-        converting it to interval data with homescedastic errors. However,
-        if E = R * C, then log(E) = log(R) + log(C). Each cell datum
-        is now modeled as a SUM of coordinates rather than a product. To 
-        analyze with ALS we need to introduce a second dimension, imagining
-        for a given cell that:
-            
-            r = log(R), c = log(C)
-            R_ = [r, 1]
-            C_ = [1, c]
-            E_ = dot(R_, C_) = r*1 + 1*c = log(R) + log(C)
-           
-        Since the cells are now modeled as a sum of products across 
-        dimensions, Damon's ALS algorithm is now applicable.  And since
-        we aren't interested in the values of r and c, but just the
-        dot products, there is no need for any coordinates to be fixed at
-        a value of 1.  Any two dimensional solution that fits the data
-        will suffice.  Thus, we analyze the log(data) with a 2-dimensional
-        model, and in the absence of noise will model it exactly.
-        
-        To convert the estimates from the log metric back to the original
-        ratio metric, we take the exponent:
-            
-            E = exp(E_)
-        
-        However, as E will not fit optimally to the original residuals 
-        array, it is "refit" to the squared residuals array using numpy's
-        poly1fit() function, with degree 1 or 2.  Then the square root
-        is taken.
-         
-        What this means for Damon is that: 
-            
-            1)  observed residuals must first be converted to logs
-            2)  the resulting coordinates will be 2-dimensional
-            3)  in equate() and summstat(), after summing coordinates,
-                one takes the exponent of any dot products.
-        
-        So much for the theory.  In practice, when doing simulations,
-        the "optimal" dimensionality is often 1, depending on how
-        the noise is balanced across the two facets and how various
-        the expected noise is per facet.  When the expected noise
-        is equivalent per cell, the analysis is more or less equivalent
-        to analyzing an array of random numbers and objectivity is
-        very low, regardless of dimensionality.  When there is a
-        reasonable amount of noise and the noise varies across entities,
-        the 2-dimensional solution tends to be optimal.  If one of the 
-        facets dominates in variation of expected noise, the 1-dimensional 
-        solution tends to be optimal.
-        
-        For consistency of approach, Damon applies the 2-dimensional
-        solution in all cases.
-        
-    Parameters
-    ----------
-        "err" is a datadict of either absolute residuals, EARs, or
-        SEs -- any set of uniform ratio data with a theoretical 
-        minimum of zero.
-        
-        -------
-        "err_type" signifies the type of error we're estimating.
-        
-            err_type = 'ear'    =>  The "err" parameter is absolute
-                                    residuals and we are estimating
-                                    EAR statistics.
-            
-            err_type = 'se'     =>  The "err" parameter is standard
-                                    errors and we are calculating
-                                    SE coordinates and refining the
-                                    SE estimates further.
-         
-        -------
-        "anchors" is the dictionary of parameters to use for coord()'s
-        anchor parameter in anchored designs.  When the primary analysis
-        refers to an item bank to get anchored coordinates for one of
-        the facets, coord() assigns the anchor parameter to the Damon
-        object.  Otherwise it doesn't.  To obtain the anchors parameter,
-        use something like:
-            
-            try:
-                coord_anc = self.coord_out['anchors']
-            except AttributeError:
-                coord_anc = None
-        
-            out = tools.estimate_error(abs_resid, 'ear', coord_anc)
-    
-    Paste Function
-    --------------
-        estimate_error(err, # [<datadict> => abs residual, ratio errors]
-                       err_type, # [<'ear', 'se'> => type of coordinates to get]
-                       anchors # [coord() anchor parameters to use]
-                       )
-    
-    """
-    # square the err
-    nanval = err['nanval']
-    err2 = np.where(err['coredata'] == nanval, nanval, err['coredata']**2)
-    err['coredata'] = err2
-       
-    lab = {'ear':'ear_coord', 'se':'se_coord'}
-    err_type = lab[err_type]
+        With the item and step parameters fixed, a person's measure
+        depends only on which items they took and their raw score on
+        them.  rasch_score() groups rows by item set and keeps, for
+        each item set, a table of measures by raw score.  Only the
+        (item set, score) cases not yet in the tables are solved, all
+        at once, by Newton-Raphson:
 
-    if anchors is not None:
-        anc = {}
-        for key in anchors.keys():
-            anc[key] = anchors[key]
-        anc['Coord'] = err_type
-    else:
-        anc = None
-               
-    # Estimate cell variance
-    err_ = dmn.core.Damon(err, 'datadict', 'RCD', verbose=False)
-    
-    try:
-        err_.standardize('LogDat')
-    except:
-        pass
-        
-    err_.coord([[2]], seed=1000, anchors=anc)
-    err_.base_est()
-    
-    # Refit estimates
-    nanval = err_.base_est_out['nanval']
-    deg = 1  # deg = 2 can lead to neg values
-    res = err['coredata']
-    est = np.exp(err_.base_est_out['coredata'])
-    ix = (res != nanval) & (est != nanval)    
-    x = np.polyfit(est[ix], res[ix], deg)
-    refit = np.poly1d(x)
-    y = np.clip(refit(est), 0.0001, np.inf)**0.5
+            theta += (r - sum(E)) / sum(V)
 
-    y[(est == nanval)] = nanval
-    y[np.isnan(y) | np.isinf(y)] = nanval
+        where E and V are the expected values and variances of the
+        person's valid cells.  The item terms exp(-k*d - steps[k]) of
+        each category k are computed once, so an iteration costs one
+        exp() per case and category.
 
-    out = {}
-    for key in err_.base_est_out.keys():
-        out[key] = err_.base_est_out[key]
+        The tables last for the call unless a "tables" dictionary is
+        passed, so that successive batches of persons scored against a
+        banked form are mostly looked up.
 
-    out['coredata'] = np.where(y == nanval, nanval, y)      
-    out[err_type] = err_.coord_out
-    out['refit'] = refit
+        Zero and perfect scores are pulled in by extreme score points,
+        or given the limits measures.  Rows without valid cells get 0.
 
-    return out
+    Arguments
+    ---------
+        "data" is a rows x cols array of scores, with the lowest
+        category scored 0.
 
+        --------------
+        "diffs" is the difficulty of each column.
 
+        --------------
+        "steps" gives, for each column, the cumulative sum of its step
+        measures up to each category, starting with 0 for category 0.
+        Categories above a column's top category are np.inf.  For a
+        dichotomous column the row is [0, 0].
 
-###########################################################################
+        --------------
+        "nanval" is the not-a-number value.
 
-def resp_prob(entcore,    # [nrows x nRespCats-1 2D array of probabilities corresponding to a given column entity]
-              resp_cats,   # [list of valid response integers in increasing order less the minimum possible integer, or list of alpha responses]
-              return_ = ['Exp'],     # [<[None,'Extr','Exp','Pred','Probs','ExtrSD','ExpSD','PredSD','ProbsSD']> => list desired]
-              resp2extr = None,  # [<None, ['a','c'] => responses whose probability to extract>]
-              extr_est = None,    # [<None,True> => extract from entcore instead of probs]
-              pred_key = None,   # [<None,{'a':0,'b':1,...}> => dict relating string responses to ints]
-              pred_alpha = None, # [<None,True> => report predicted alpha character]
-              metric = 'nominal',   # [<'ordinal','nominal'>]
-              dropcol = None,  # [<None,True> => drop lead column of ordinal probabilities]
-              nanval = -999., # [float Not-a-Number value]
-              ):
-    """
-    Returns
-    -------
-        A dictionary of nRow x nResp arrays relating to
-        the probabilities of a set of responses for a
-        given entity under an ordinal and a nominal model:
+        --------------
+        "extreme" is the number of score points by which perfect
+        and zero row scores are pulled in.
 
-        {'Extr',     =>  Probability of resp2extr response
-        'Exp',      =>  Expected value
-        'Pred',     =>  Predicted value
-        'Probs',    =>  Probabilities of all responses
-        'ExpSD',    =>  Standard deviation of expected value
-        'pred_key'   =>  pred_key parameter {'a':0,'b':1,...}
-        'PredProb'  =>  Tuples with 'Pred' response and probability:
-                        [('a',0.52),('b',0.34),...]
-        }
+        --------------
+        "runspecs" is [stop_when_change, max_iteration], the largest
+        change in any measure at which Newton-Raphson stops, and the
+        most iterations allowed.
 
-        Note:  To get a list of just the responses in their
-        original format, or just the probabilities, use:
+        --------------
+        "chunk" is the number of rows keyed, or cases solved, at a
+        time, bounding the size of the temporary arrays.
 
-        Responses = [tup[0] for tup in Out['PredProb']]
-        RespProbs = [tup[1] for tup in Out['PredProb']]
+        --------------
+        "limits" is [min, max], the measures of rows with zero and
+        perfect scores.  rasch() passes its row logit limits, where
+        its iterations leave such rows.  If None, zero and perfect
+        scores are pulled in by extreme points and solved like any
+        other score.
 
-        where Out is the name given the resp_prob() outputs.
+        --------------
+        "tables" is None, or a dictionary, initially {}, in which the
+        tables are kept between calls that pass it.  They are stored
+        under a key for diffs, steps, extreme, runspecs and limits, so
+        calls with other parameters do not share them.
 
+    Paste function
+    --------------
+        rasch_score(data,  # [2-D rows x cols array of integer-like scores, lowest category 0]
+                    diffs,  # [1-D array, the Rasch difficulty of each column]
+                    steps,  # [2-D cols x cats array of cumulative step measures, np.inf for categories a column lacks]
+                    nanval = -999.,   # [Not-a-number value]
+                    extreme = 0.50,   # [<float> => row max score adjustment]
+                    runspecs = [0.00001, 50],  # [<[stop_when_change, max_iteration]> => Newton stopping conditions]
+                    chunk = 20000,  # [<int> => number of rows, or (item set, score) cases, to process per block]
+                    limits = None,  # [<None, [min, max]> => measures given zero and perfect scores]
+                    tables = None,  # [<None, dict> => raw-score-to-measure tables kept between calls]
+                    )
 
-    Comments
-    --------
-        resp_prob(), used by the fin_est() method,
-        calculates the probability of obtaining each possible
-        response for a given person and column entity
-        and, optionally, combines these to calculate an
-        expected value for that person and column entity
-        or to predict the most likely response.
+    """
+    nrows, ncols = np.shape(data)
+    diffs = np.asarray(diffs, dtype=float).ravel()
+    steps = np.asarray(steps, dtype=float)
+    cats = np.arange(np.shape(steps)[1], dtype=float)[:, np.newaxis, np.newaxis]
+    maxcat = np.sum(np.isfinite(steps), axis=1) - 1.0
+    j = float(extreme)
+
+    # Key each row by its item set, packed, and get its raw score
+    masks, scores = [], []
+    for start in xrange(0, nrows, chunk):
+        block = np.asarray(data[start:start + chunk], dtype=float)
+        valid = block != nanval
+        masks.append(np.packbits(valid, axis=1))
+        scores.append(np.sum(np.where(valid, block, 0.0), axis=1))
+
+    masks = np.ascontiguousarray(np.concatenate(masks, axis=0))
+    scores = np.rint(np.concatenate(scores)).astype(int)
+    keys = masks.view(np.dtype((np.void, masks.shape[1]))).ravel()
+    first, inverse = np.unique(keys, return_index=True, return_inverse=True)[1:]
+    nPatterns = len(first)
+
+    # Item sets, their maximum scores, and the (item set, score) cases
+    pat_valid = np.unpackbits(masks[first], axis=1)[:, :ncols].astype(bool)
+    M = np.dot(pat_valid, maxcat).astype(int)
+    cases, case_inv = np.unique(inverse * (np.max(M) + 1) + scores,
+                                return_inverse=True)
+    c_pats = cases // (np.max(M) + 1)
+    c_scores = cases % (np.max(M) + 1)
+
+    # Tables for these parameters
+    h = hashlib.sha1()
+    h.update(diffs.tostring())
+    h.update(steps.tostring())
+    h.update(repr((j, [float(x) for x in runspecs],
+                   None if limits is None else [float(x) for x in limits])))
+    ParamKey = h.hexdigest()
+
+    if tables is None:
+        tables = {}
+    tables = tables.setdefault(ParamKey, {})
+
+    # Look up cases, nan where unsolved.  Item sets taken by a single
+    # row are not worth a table.
+    pat_keys = [masks[i].tostring() for i in first]
+    tabled = np.bincount(inverse, minlength=nPatterns) > 1
+    Measures = np.zeros(len(cases)) + np.nan
+
+    # Cases are sorted by item set
+    bounds = np.searchsorted(c_pats, np.arange(nPatterns + 1))
+
+    for p in xrange(nPatterns):
+        table = tables.get(pat_keys[p])
+        if table is not None:
+            tabled[p] = True
+            at = slice(bounds[p], bounds[p + 1])
+            Measures[at] = table[c_scores[at]]
+
+    if limits is not None:
+        Measures[c_scores == 0] = limits[0]
+        Measures[c_scores == M[c_pats]] = limits[1]
+    Measures[M[c_pats] == 0] = 0.0
+    needed = np.where(np.isnan(Measures))[0]
+
+    # Item terms of each category, cats x 1 x cols
+    item_terms = np.exp(-cats * diffs[np.newaxis, np.newaxis, :]
+                        - steps.T[:, np.newaxis, :])
+
+    # Newton-Raphson on blocks of cases
+    Iterations = 0
+    Converged = True
+    for start in xrange(0, len(needed), chunk):
+        block = needed[start:start + chunk]
+        c_valid = pat_valid[c_pats[block]]
+        c_M = M[c_pats[block]].astype(float)
+        r = np.clip(c_scores[block], j, c_M - j)
+
+        # Start from the logit of the score, offset by the mean difficulty
+        theta = (np.log(r / (c_M - r))
+                 + np.sum(c_valid * diffs, axis=1) / np.sum(c_valid, axis=1))
+
+        for it in xrange(int(runspecs[1])):
+            probs = np.exp(cats * theta[np.newaxis, :, np.newaxis]) * item_terms
+            probs /= np.sum(probs, axis=0)
+            E = np.sum(cats * probs, axis=0)
+            V = np.sum(cats**2 * probs, axis=0) - E**2
+
+            grad = r - np.sum(np.where(c_valid, E, 0.0), axis=1)
+            info = np.sum(np.where(c_valid, V, 0.0), axis=1)
+            change = np.clip(grad / np.clip(info, 1e-10, np.inf), -1, 1)
+            theta += change
+
+            if np.max(np.abs(change)) < runspecs[0]:
+                break
+        else:
+            Converged = False
+
+        Iterations = max(Iterations, it + 1)
+        Measures[block] = theta
+
+    # Add the new measures to the tables
+    for p in np.unique(c_pats[needed]):
+        if tabled[p]:
+            table = tables.setdefault(pat_keys[p], np.zeros(M[p] + 1) + np.nan)
+            at = slice(bounds[p], bounds[p + 1])
+            table[c_scores[at]] = Measures[at]
+
+    return {'Measures':Measures[case_inv][:, np.newaxis],
+            'nPatterns':nPatterns,
+            'nSolved':len(needed),
+            'Iterations':Iterations,
+            'Converged':Converged
+            }
 
-        Note that resp_prob() is applied only to one column entity
-        at a time.
 
-        It is assumed that estimate() has been applied to
-        a dichotomous matrix formatted by parse() to reflect an
-        ordinal or nominal rating structure.  When data are ordinal
-        ratings (e.g., 0,1,2,3), parse() assigns each its own
-        column for a given entity and puts a 1 in each column that
-        corresponds to an integer that is less than or equal to
-        the actual observation.  Thus, a rating of 2 for an item
-        with four possible ratings (0,1,2,3) would be parsed into
-        four columns as follows (1,1,1,0).  Since the first column
-        is always 1 (all ratings are at least as large as 0), that
-        column is deleted before running through damon().
 
-        When data are nominal ('a','b','c'), parse() assign each
-        its own column and puts a 1 in only that column that
-        corresponds to the actual response.
+###########################################################################
 
-        The base_est() method converts the ones and zeros into
-        probabilities.  The problem (in the ordinal case) is these
-        are not the probability of obtaining a given rating but
-        the probability of meeting or EXCEEDING a given
-        rating.  To compute expected values, we need to convert
-        these "at or above" probabilities into just the probability
-        of obtaining the given rating.  That is what resp_prob()
-        does.  If the return_ argument is 'Exp', the new probabilities are
-        combined with the response integers to calculate an
-        expected response.
+def faccoord(targfac, # [ [FacetNum,FacetArray,Anchored], e.g., [0,FacetArray0,True] => existing facet array to recalculate] ]
+             targdatindex, # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
+             data,   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
+             oppfac, # [Ents x dims array of coordinates of opposite facet(s), or their product]
+             oppweights,  # [array of weights corresponding to opposite facet array]
+             solve_meth = 'LstSq', # [method for calculating coordinates <'LstSq','IRLS'>]
+             solve_meth_specs = None,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
+             condcoord_ = None,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
+             miss_meth = 'IgnoreCells', # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
+             nanval = -999., # [Not-a-Number value, to label non-numerical outputs]
+             engine = 'Batch',  # [<'Batch','Pattern','Loop'> => 'Batch' solves all 'LstSq' entities as one stack; 'Pattern' solves per missing-data pattern; 'Loop' solves one entity at a time]
+             targpatterns = None,   # [None, output of miss_patterns() for targdatindex, required for engine = 'Pattern']
+             pool = None,   # [None, output of facpool() => solve entity ranges in worker processes]
+             active = None, # [None, boolean array => solve only the True target entities; others keep their coordinates]
+             ):
+    """Calculates coordinates for all entities in a specified facet.
 
-        The formula is approximately as follows:
+    Returns
+    -------
+        Output dictionary:
+            {'Fac':FacNum           => facet integer (0,1)
+            'FacCoord':FacCoord,    => array of coordinates for target facet
+            'Warn1':Warn1,          => Warning if there was an error calculating an entity's coordinates
+            'Warn2':Warn2           => Warning if one of the facet coordinates is flagged as invalid (e.g., insufficient data or variation)
+            }
 
-            P[x = k] = P[x >= k] - P[x > k]
-                     = [base_est() output for k] - [base_est() output for k+1]
+    Comments
+    --------
+        faccoord() calculates coordinates for each entity corresponding
+        to a specified facet based on parameters received from
+        the Damon.coord() method.
 
-        where x is the response and k is an integer response value.
-        Because the estimated probabilities are calculated independently
-        of each other, the base_est() outputs are first normalized so that
-        they exceed 1.0 (though they are allowed to sum to less than 1.0).
-        In addition, it is possible that, due to measurement error, the
-        probability of exceeding k + 1 might be greater than the probability
-        of exceeding k, which would result in a negative response probability.
-        All negative probabilities are automatically set to 0.0, which is
-        equivalent to saying that the category was skipped over, not used.
+        --------------
+        "targfac" is the target facet, the facet whose elements
+        are to be computed.  It's number and array are entered
+        as a list along with a True/False "anchored" flag:
 
-        In this approach, the probability of getting a zero (the lowest
-        category) is one minus the sum of the remaining response
-        probabilities.  It is possible, even with normalization, for
-        the sum of the remaining response probabilities to be too high,
-        which will cause the probability of zero to be too low.  This is
-        an inescapable effect of ordinal binning, where it is not
-        possible to estimate the probability of the lowest category
-        except by inference.
+            [target facet number, target facet array, anchored]
+            [0, 0Array, False]  
+                        =>  The target facet is facet 0 (rows),
+                            its array is 0Array, and it is not
+                            anchored.
 
-        Also, simply forcing negative response probabilities to be
-        0.0 is almost certainly not the optimal way of dealing with
-        the effects of random fluctuations.  However, a better way
-        has not been worked out.  In general, the more accurate the
-        base_est() estimates, the less problematic these issues are.
+            The target array is always Ents x Dims, regardless
+            of facet.
+            
+            The anchored flag helps control how nanvals are
+            interpreted.  If anchored = False, whenever a coordinate
+            ends up being assigned a nanval due to a calculation
+            exception, that nanval is preserved and propagated
+            through subsequent iterations.  However, anchored
+            coordinates may be nanval simply because values
+            haven't been calculated for them yet.  anchored = True
+            allows the missing coordinates to be calculated
+            and not ignored.
+            
+        --------------
+        "targdatindex" is an index telling which elements in
+        the opposing facet array are to go into the calculation.
+        It is based on the locations of the non-missing cells
+        for the target facet and on whether the opposing facet
+        elements are valid.  It is formatted as a list of
+        arrays containing the valid row or column indices for
+        each entity in the target facet.  Example:
 
-        resp_prob() offers the option of computing standard deviations
-        for the various outputs.  The formula is based on the
-        binomial distribution:
+            targdatindex = [array([0, 1, 2, 3, 4, 5, 6, 7]),
+                            array([0, 1, 2, 3, 4, 5]),
+                            array([0, 1, 4, 5, 6, 7])]
 
-            SD = sqrt(sum[k -> K](k - Exp)^2 * p[k])
+            If the target facet is FacNum = 0 (rows), this
+            index suggests there are three elements in the
+            target facet and 8 elements in the opposing facet
+            (columns), and that the second row element should
+            ignore columns 6 and 7 while the third row element
+            should ignore columns 2 and 3.
 
-        where the expected value is the sum of the categories times
-        their probabilities:
+        coord() passes the same information as a CSRIndex (see
+        csr_index()), which is indexed exactly like the list but
+        stores all entities in two flat arrays.
 
-            Exp = sum[k -> K](k * p[K])
+        --------------
+        "data" is the 2-D targfacet x OppFacet data array.  If
+        the target facet is rows, then data is entered as
+        rows x columns, matching the source data matrix.  If
+        the target facet is columns, then data must be transposed
+        so that the columns can be handled as rows.  coord()
+        handles all this in passing information to faccoord().
 
+        data can be a PyTable; data rows and columns are
+        accessed with the same slice notation.
 
-    Arguments
-    ---------
-        "entcore" is a damon()-calculated 2D array of columns
-        of (usually) probabilities corresponding to a given entity, each
-        column corresponding to a possible response.  However, it
-        is possible for entcore to be standardized estimates in
-        another metric if return_ = ['Extr'], in which case the
-        appropriate estimates, along with an index, are returned.
+        --------------
+        "oppfac" is an Ents x Dims array of coordinates for
+        the facet opposite the target facet.  When Damon evolves
+        to more than two facets, the opposing facet will be
+        a tensor product of multiple facet arrays.
 
-        When metric = 'ordinal', the minimum possible response is
-        missing, as it is removed by the parse() function.  Thus, if Entity 1
-        has four possible ratings or response integers (0,1,2,3),
-        entcore will be the three columns of Entity 1 for the
-        1, 2, and 3 response integers, and the columns will consist
-        of person response probabilities obtained by running the parsed
-        dichotomous array through damon().
+        --------------
+        "oppweights" is Ents x 1 array of weights corresponding to
+        the opposing facet, used to avoid degenerate solutions.
 
-        When metric = 'nominal', all the responses and their respective
-        probabilities will be present.
+        --------------
+        "solve_meth" is the method used for calculating coordinates
+        for an individual entities.  There are two options:
+        'LstSq' (ordinary least squares), 'IRLS' (iteratively reweighted
+        least squares).
 
-        ---------------
-        "resp_cats" is a either a list of possible alpha responses (metric
-        = 'nominal) for a given column entity or it is a list of possible
-        integer esponses in increasing order, where the smallest
-        response integer is assumed to be missing and to be one unit
-        less than the minimum given in the list.  This is assumed
-        because, as mentioned, the smallest response integer column
-        is automatically deleted by the parse() function in order to
-        avoid feeding damon() a column consisting of all ones.  There
-        should be as many response integers as there are entity columns
-        in entcore.
+        --------------
+        "condcoord_" is a specification for conditioning the target
+        facet array after it has been calculated.  See condcoord()
+        docs.
 
-        ---------------
-        "return_" specifies a list of desired outputs:
+        --------------
+        "miss_meth" specifies whether to use the 'ImputeCells' method
+        for dealing with missing data or the 'IgnoreCells' method.
 
-            return_ = [
+        --------------
+        "nanval" is the Not-a-Number value to assign to non-numerical
+        outputs.
 
-                'Probs' =>  return_ the probability of each response.
+        --------------
+        "engine" controls how the 'IgnoreCells' case is computed:
+
+            'Batch'     =>  (default) Build every entity's masked
+                            UTWU matrix and UTWx vector in one pass
+                            over the validity mask and solve them
+                            all with one stacked np.linalg.solve.
+                            See solve_batch().
+
+            'Pattern'   =>  For each distinct pattern of valid
+                            data (see miss_patterns()), compute
+                            invUTU(U[pattern]) once and apply it to
+                            the whole block of entities having that
+                            pattern with one matrix multiply.  This
+                            turns per-entity work into per-form work
+                            in fixed-forms designs.  Requires
+                            targpatterns.
+
+            'Loop'      =>  Call invUTU() and solve2() separately
+                            for each entity.  This is the original
+                            algorithm and is kept as a reference.
+
+        All engines return the same coordinates and warnings.  With
+        solve_meth = 'IRLS', 'Batch' and 'Pattern' both reweight all
+        entities together with irls_batch(), since IRLS weights are
+        per cell and patterns share nothing.  miss_meth =
+        'ImputeCells' always uses 'Loop'.
 
-                'Extr'  =>  Extract the probability of the response
-                            specified in resp2extr.
+        --------------
+        "targpatterns" is the output of miss_patterns(targdatindex, ...),
+        computed once by coord() and reused across iterations since
+        targdatindex does not change.
 
-                'Exp'   =>  return_ the expected value.
+        --------------
+        "pool" is the output of facpool().  When given (with
+        'IgnoreCells'), the target entities are split into fixed
+        ranges that are solved in worker processes, which read the
+        data, targdatindex and targpatterns held by the pool and
+        ignore the corresponding faccoord() arguments.  Results are
+        merged in range order before conditioning, so they do not
+        depend on the number of workers.
 
-                'Pred'  =>  return_ the predicted value in the form
-                            of an integer corresponding to the response
-                            with the highest probability.  Separate
-                            outputs incude the actual response and
-                            its probability, as well as the response:
-                            integer pred_key dictionary.
+        --------------
+        "active" (with 'IgnoreCells') is a boolean array over the
+        target entities.  Only the True entities are solved; the
+        others keep their coordinates in targfac.  coord() uses it to
+        skip entities that have stopped changing (see freeze_init()).
+        Conditioning still applies to the whole facet.
 
-                'ProbsSD'=> return_ the standard deviation of the
-                            probabilities
 
-                'ExpSD' =>  return_ the standard deviation of the
-                            expected value.
+    Paste function
+    --------------
+        faccoord(targfac, # [ [FacetNum,FacetArray,Anchored], e.g., [0,FacetArray0,True] => existing facet array to recalculate] ]
+                 targdatindex, # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
+                 data,   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
+                 oppfac, # [Ents x dims array of coordinates of opposite facet(s), or their product]
+                 oppweights,  # [array of weights corresponding to opposite facet array]
+                 solve_meth = 'LstSq', # [method for calculating coordinates <'LstSq','IRLS'>]
+                 solve_meth_specs = None,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
+                 condcoord_ = None,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
+                 miss_meth = 'IgnoreCells', # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
+                 nanval = -999., # [Not-a-Number value, to label non-numerical outputs]
+                 engine = 'Batch',  # [<'Batch','Pattern','Loop'> => 'Batch' solves all 'LstSq' entities as one stack; 'Pattern' solves per missing-data pattern; 'Loop' solves one entity at a time]
+                 targpatterns = None,   # [None, output of miss_patterns() for targdatindex, required for engine = 'Pattern']
+                 pool = None,   # [None, output of facpool() => solve entity ranges in worker processes]
+                 active = None, # [None, boolean array => solve only the True target entities; others keep their coordinates]
+                 )
 
-                'ExtrSD'=>  return_ the standard deviation of the
-                            extracted value.
+    """
 
-                'PredSD'=>  return_ the standard deviation of the
-                            largest probability.
+    FacNum = targfac[0]
+    FacCoord = targfac[1]
+    anchored = targfac[2]
+    OppCoord = oppfac
+    nEnts = np.size(FacCoord,0)
+    Warn1 = None
+    Warn2 = None
 
-                        ]
 
-            return_ = ['Exp','Pred','ExpSD']
-                        =>  Returns a dictionary containing arrays
-                            for 'Exp' and 'Pred', as well as for the
-                            standard deviation of 'Exp', the remainder
-                            being None.
+    #####################
+    ##  'IgnoreCells'  ##
+    ##     method      ##
+    #####################
 
-        ---------------
-        "resp2extr" tells the function which response probabilities
-        to report if return_ = 'Extr'.
+    # 'IgnoreCells' method
+    if miss_meth == 'IgnoreCells':
 
-            resp2extr = None    =>  'Extr' not in return_
+        # Prepare weights for 'LstSq'
+        if solve_meth == 'LstSq':
+            W_All = oppweights
+        else:
+            W_All = None
 
-            resp2extr = ['a','b']
-                                =>  'Extr' probabilities for responses
-                                    'a' and 'b' for this entity.
+        # Solve entity ranges in worker processes
+        if pool is not None:
+            PoolOut = facpool_solve(pool = pool,   # [output of facpool()]
+                                    targfac = [FacNum, FacCoord, anchored],  # [[FacetNum,FacetArray,Anchored]]
+                                    oppfac = OppCoord,  # [Ents x dims array of opposing facet coordinates]
+                                    oppweights = W_All,   # [None, array of weights corresponding to oppfac]
+                                    solve_meth = solve_meth,  # [<'LstSq','IRLS'>]
+                                    solve_meth_specs = solve_meth_specs,  # [None, dictionary of specs specific to method]
+                                    nanval = nanval,  # [Not-a-Number value]
+                                    engine = engine,  # [<'Batch','Pattern','Loop'>]
+                                    active = active,  # [None, boolean array of target entities to solve]
+                                    )
+            FacCoord = PoolOut['FacCoord']
+            Warn1 = PoolOut['Warn1']
+            Warn2 = PoolOut['Warn2']
+
+        # Solve all entities at once
+        elif (engine in ['Batch', 'Pattern']
+            and solve_meth in ['LstSq', 'IRLS']
+            ):
+            if anchored:
+                skip = np.zeros(nEnts, dtype=bool)
+            else:
+                skip = FacCoord[:, 0] == nanval
+                if np.any(skip):
+                    FacCoord[skip] = nanval
+                    Warn2 = True
+
+            solve = ~skip if active is None else ~skip & active
+            get = np.where(solve)[0]
+
+            # Reweight all entities together.  IRLS weights are per
+            # cell, so missing-data patterns share nothing.
+            if solve_meth == 'IRLS':
+                if len(get) > 0:
+                    Specs = _irls_specs(solve_meth_specs)
+                    BatchOut = irls_batch(U = OppCoord,   # [ents x dims array of opposing facet coordinates]
+                                          targdatindex = targdatindex,  # [None, CSRIndex of valid opposing entities per target entity]
+                                          data = data,  # [2-D targfac x oppfac array of data]
+                                          ents = get,   # [None, index of target entities to solve]
+                                          runspecs = Specs['runspecs'], # [[StopWhenChange,MaxIteration]]
+                                          ecutmaxpos = Specs['ecutmaxpos'], # [[ECut,MaxPos]]
+                                          pcut = Specs['pcut'], # [pcut corresponding to ECut]
+                                          nanval = nanval,  # [Not-a-number value, for invalid outputs]
+                                          )
+                    FacCoord[get] = BatchOut['V']
+                    if BatchOut['Fail'] is not None:
+                        Warn1 = True
+
+            # One inversion per missing-data pattern
+            elif engine == 'Pattern':
+                if targpatterns is None:
+                    exc = "engine = 'Pattern' requires targpatterns.\n"
+                    raise faccoord_Error(exc)
+
+                for p in xrange(targpatterns['nPatterns']):
+                    ents = targpatterns['Ents'][p]
+                    ents = ents[solve[ents]]
+                    if len(ents) == 0:
+                        continue
+
+                    ix = targpatterns['Index'][p]
+                    U = OppCoord[ix]
+                    W = None if W_All is None else W_All[ix]
+                    invUTU_ = invUTU(U,'R',weights=W,nanval=nanval)
+
+                    # V = (UTW * U)^-1 * UTW * x for the whole block
+                    X = data[np.ix_(ents, ix)]
+                    UW = U if W is None else U * W
+                    V = np.dot(np.dot(X, UW), np.transpose(invUTU_))
+
+                    bad = np.any(np.isinf(V), axis=1) | np.any(np.isnan(V), axis=1)
+                    if np.any(bad):
+                        V[bad] = nanval
+                        Warn1 = True
+                    FacCoord[ents] = V
+
+            elif len(get) > 0:
+                BatchOut = solve_batch(U = OppCoord,   # [ents x dims array of opposing facet coordinates]
+                                       targdatindex = targdatindex,  # [None, list of valid opposing entities per target entity]
+                                       data = data,   # [2-D targfac x oppfac array of data]
+                                       weights = W_All,    # [None, ents x 1 array of weights corresponding to U]
+                                       ents = get,  # [None, index of target entities to solve]
+                                       nanval = nanval, # [Not-a-number value, for invalid outputs]
+                                       )
+                FacCoord[get] = BatchOut['V']
+                if BatchOut['Fail'] is not None:
+                    Warn1 = True
+                    
+        # For each entity
+        else:
+            fsolve2 = solve2
+            for i in xrange(nEnts):
+                if active is not None and not active[i]:
+                    continue
+                elif (FacCoord[i][0] == nanval and not anchored
+                    ):
+                    FacCoord[i] = nanval
+                    Warn2 = True
+                else:
+                    DataV = data[i]
+                    if targdatindex is not None:
+                        U = OppCoord[targdatindex[i]]
+                        x = DataV[targdatindex[i]][:,np.newaxis]
+                    else:
+                        U = OppCoord
+                        x = DataV
+
+                    if (solve_meth == 'LstSq'
+                        and targdatindex is not None
+                        and W_All is not None
+                        ):
+                        W = W_All[targdatindex[i]]
+                    else:
+                        W = None
 
-        ---------------
-        "extr_est" <None,True> tells the function to extract the
-        estimates directly from entcore rather than their
-        corresponding probabilities.  This option is only
-        allowed when the data are nominal.
+                    invUTU_ = invUTU(U,'R',weights=W,nanval=nanval)
 
-        ---------------
-        "pred_key" assigns each response to an integer, so that
-        when 'Pred' is specified and the responses are alpha
-        they can be treated as numbers and share an array with
-        other numerical outputs.  (Numpy requires all data to be
-        of one type.)  Options:
+                    # Solving as if for rows, regardless of target facet (facet is controlled outside the function)
+                    try:
+                        v = fsolve2(R = None,   # [ents x dims array of row coordinates, no NaNVals]
+                                    C = U,   # [ents x dims array of col coordinates, no NaNVals]
+                                    x = x,   # [2-D vector or row or col coordinates, no NaNVals]
+                                    targfacet = 'R',   # [<'R','C'>, type of coordinates to calculate]
+                                    invUTU_ = invUTU_,  # [None, Output of invUTU(), U = opposing facet of 'targfacet': (UT * U)^-1]
+                                    weights = W, # [None, array of weights corresponding to elements in U array]
+                                    method = solve_meth,  # [<'LstSq','IRLS','Rasch'>]
+                                    meth_specs = solve_meth_specs,   # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
+                                    nanval = nanval,  # [Not-a-number value, for invalid outputs]
+                                    )
+                        FacCoord[i] = np.transpose(v)
+
+                    except:
+                        FacCoord[i] = nanval
+                        Warn1 = True
+                        pass
 
-            pred_key = None  =>  'Pred' is not specified in return_.
 
-            pred_key = {'a':0,'b':1,'f':2}
-                            =>  Response 'a' will be coded as 0,
-                                'b' will be coded as 1, and 'f' will
-                                be coded as 2.
+        # Condition the target facet
+        if condcoord_ is not None:
+            if FacNum == 0:
+                Fac = 'Fac0'
+                fac0coord = FacCoord
+                fac1coord = None
+                FacOut = 'F0Std'
+            elif FacNum == 1:
+                Fac = 'Fac1'
+                fac0coord = None
+                fac1coord = FacCoord
+                FacOut = 'F1Std'
 
-        A pred_key dictionary has to be filled out if 'Pred' is
-        specified in Returns.  resp_cat() returns 'pred_key'.
+            CondOut = condcoord(fac0coord = fac0coord,  # [None, nRowEnts x nDims facet1 coordinates array]
+                                fac1coord = fac1coord,   # [None, nColEnts x nDims Facet2 coordinates array]
+                                cond_facet = Fac,    # [<'Fac0','Fac1'>]
+                                function = condcoord_[Fac],    # [<None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...} >]
+                                nanval = nanval   # [Not-a-number value]
+                                )
 
-        In additon, resp_prob() returns 'PredProb', a list of
-        (response,probability) tuples:  [('a',0.53),('b',0.34),...]
+            FacCoord = CondOut[FacOut]
 
-        ---------------
-        "metric" specifies whether the response categories are
-        ordinal, treated as increasing integers, or whether they
-        are to be treated as nominal -- as unorderable responses.
-        Integers can be treated as nominal if desired. Options:
+        return {'Fac':FacNum,
+                'FacCoord':FacCoord,
+                'Warn1':Warn1,
+                'Warn2':Warn2
+                }
 
-            'ordinal'
-            'nominal'
+    #####################
+    ##  'ImputeCells'  ##
+    ##     method      ##
+    #####################
 
-        Note:  'ordinal' assumes that the first (lowest) possible
-        category is missing from entcore and that they are sorted
-        from smallest to largest in entcore.  Both conditions are
-        met automatically by parse() outputs.
+    # 'ImputeCells' method
+    elif miss_meth == 'ImputeCells':
 
-        ---------------
-        "dropcol" <None,True>, if True, means do not report the
-        first column in a block of ordinal probabilities.  This
-        is to match the block of estimates produced with parsed
-        ordinal data, since parse() drops the lowest response
-        integer.
+        # Prepare weights for 'LstSq'
+        if solve_meth == 'LstSq':
+            W = oppweights
+        else:
+            W = None
 
-        ---------------
-        "nanval" is the value chosen to indicate "not a number".
+        # Invert OppCoord
+        U = OppCoord
+        invUTU_ = invUTU(U,'R',weights=W,nanval=nanval)
+        if not isinstance(invUTU_,np.ndarray):
+            exc = "Linear algebra error.\n"
+            raise faccoord_Error(exc)
 
+        # For each entity
+        fsolve2 = solve2
+        for i in xrange(nEnts):
+            x = data[i]
 
-    Examples
-    --------
+            try:
+                # Solving as if for rows, regardless of target facet (facet is controlled outside the function)
+                v = fsolve2(R = None,   # [ents x dims array of row coordinates, no NaNVals]
+                           C = U,   # [ents x dims array of col coordinates, no NaNVals]
+                           x = x,   # [2-D vector or row or col coordinates, no NaNVals]
+                           targfacet = 'R',   # [<'R','C'>, type of coordinates to calculate]
+                           invUTU_ = invUTU_,  # [None, Output of invUTU(), U = opposing facet of 'targfacet': (UT * U)^-1]
+                           weights = W, # [None, array of weights corresponding to elements in U array]
+                           method = solve_meth,  # [<'LstSq','IRLS','Rasch'>]
+                           meth_specs = solve_meth_specs,   # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
+                           nanval = nanval,  # [Not-a-number value, for invalid outputs]
+                           )
 
+                FacCoord[i] = np.transpose(v)
 
+            except:
+                FacCoord[i] = nanval
+                Warn1 = True
+                pass
 
-    Paste function
-    --------------
-        resp_prob(entcore,    # [nrows x nRespCats-1 2D array of probabilities corresponding to a given column entity]
-                  resp_cats,   # [list of valid response integers in increasing order less the minimum possible integer, or list of alpha responses]
-                  return_ = ['Exp']     # [<['Extr','Exp','Pred','Probs','ExpSD']> => list desired]
-                  resp2extr = None,  # [<None, ['a','c'] => responses whose probability to extract>]
-                  extr_est = None,    # [<None,True> => extract from entcore instead of probs]
-                  pred_key = None,   # [<None,{'a':0,'b':1,...}> => dict relating string responses to ints]
-                  metric = 'nominal',   # [<'ordinal','nominal'>]
-                  dropcol = None,  # [<None,True> => drop lead column of ordinal probabilities]
-                  nanval = -999., # [float Not-a-Number value]
-                  )
+        # Condition the target facet
+        if condcoord_ is not None:
+            if FacNum == 0:
+                Fac = 'Fac0'
+                fac0coord = FacCoord
+                fac1coord = None
+                FacOut = 'F0Std'
+            elif FacNum == 1:
+                Fac = 'Fac1'
+                fac0coord = None
+                fac1coord = FacCoord
+                FacOut = 'F1Std'
 
-    """
+            CondOut = condcoord(fac0coord = fac0coord,  # [None, nRowEnts x nDims facet1 coordinates array]
+                                       fac1coord = fac1coord,   # [None, nColEnts x nDims Facet2 coordinates array]
+                                       cond_facet = Fac,    # [<'Fac0','Fac1'>]
+                                       function = condcoord_[Fac],    # [<None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...} >]
+                                       nanval = nanval   # [Not-a-number value]
+                                       )
 
-    # Initialize Results dictionary
-    Results = {}
-    nrows = np.size(entcore,axis=0)
-    Results['pred_key'] = pred_key
-    Results['PredProb'] = None
-    NaNLoc = np.where(entcore == nanval)[0]
-    resp_cats = np.array(resp_cats)
-    entcore = np.where(np.logical_or(np.isnan(entcore),np.isinf(entcore)),nanval,entcore)
+            FacCoord = CondOut[FacOut]
 
-    # Cast resp_cats
-    try:
-        resp_cats = resp_cats.astype(float).astype(int)
-    except ValueError:
-        if metric == 'ordinal':
-            print "Warning: tools.resp_prob() unable to cast response categories to integers.  Treating metric as 'nominal' and returning predictions.\n"
-            metric = 'nominal'
-            return_ = ['Pred' if x == 'Exp' else x for x in return_]
-            return_ = ['PredSD' if x == 'ExpSD' else x for x in return_]
-        else:
-            pass
+        return {'Fac':FacNum,
+                'FacCoord':FacCoord,
+                'Warn1':Warn1,
+                'Warn2':None
+                }
 
-    # ordinal procedures
-    if metric == 'ordinal':
 
-        # Normalize entcore
-        RespCats_ = list(resp_cats)
-        ncols = len(resp_cats) + 1
-        LeadCol = np.ones((nrows,1))
-        TermCol = np.zeros((nrows,1))
-        FillEntCols = np.concatenate((LeadCol,entcore,TermCol),axis=1)
-        RespCats_.insert(0,RespCats_[0] - 1)
-        RespCatsArr = np.array(RespCats_,ndmin=2)
-        extr_est = None
 
-        # Calculate probabilities
-        Probx = np.zeros((nrows,ncols))
-        for i in xrange(1,ncols + 1):
-            Probx[:,-i] = FillEntCols[:,-i - 1] - FillEntCols[:,-i]
 
-        # Apply NaNVals
-        Probx = np.clip(Probx,0.0,1.0)
-        Probx[NaNLoc] = nanval
+###########################################################################
 
-    # nominal procedures
-    elif metric == 'nominal':
-        RespCatsArr = np.array(resp_cats,ndmin=2)
-        Probx = entcore
+# Arrays held by each facpool() worker process
+_FACPOOL = {}
+
+def _shared_array(arr):
+    "Copy arr into shared memory and return (RawArray, shape)."
+
+    arr = np.asarray(arr, dtype=float)
+    raw = mpsc.RawArray('d', max(arr.size, 1))
+    np.frombuffer(raw, dtype=float)[:arr.size] = arr.ravel()
+    return raw, np.shape(arr)
+
+
+def _shared_view(shared):
+    "Numpy view of a (RawArray, shape) pair, no copy."
+
+    raw, shape = shared
+    return np.frombuffer(raw, dtype=float)[:int(np.prod(shape))].reshape(shape)
+
+
+def _facpool_init(shared, datindex, patterns):
+    "Worker initializer:  attach the shared arrays."
+
+    _FACPOOL.clear()
+    _FACPOOL['Data'] = _shared_view(shared['Data'])
+    _FACPOOL['Coord'] = {0:_shared_view(shared['Coord'][0]),
+                         1:_shared_view(shared['Coord'][1])}
+    _FACPOOL['Weights'] = {0:_shared_view(shared['Weights'][0]),
+                           1:_shared_view(shared['Weights'][1])}
+    _FACPOOL['Index'] = datindex
+    _FACPOOL['Patterns'] = patterns
+
+
+def _facpool_task(task):
+    "Worker task:  solve target entities start:stop of one facet."
+
+    (FacNum, start, stop, anchored, weighted, solve_meth, solve_meth_specs,
+     nanval, engine, active) = task
+    OppNum = 1 - FacNum
+
+    data = _FACPOOL['Data'] if FacNum == 0 else np.transpose(_FACPOOL['Data'])
+    W = _FACPOOL['Weights'][OppNum] if weighted else None
+    index = _FACPOOL['Index'][FacNum]
+
+    # Restrict missing-data patterns to the range
+    P = _FACPOOL['Patterns'][FacNum]
+    if P is not None and engine == 'Pattern':
+        Index, Ents = [], []
+        for k in xrange(P['nPatterns']):
+            e = P['Ents'][k]
+            e = e[(e >= start) & (e < stop)]
+            if len(e) > 0:
+                Index.append(P['Index'][k])
+                Ents.append(e - start)
+        P = {'Pattern':P['Pattern'][start:stop], 'Index':Index, 'Ents':Ents,
+             'nPatterns':len(Ents)}
+    elif engine == 'Pattern':
+        engine = 'Batch'
+
+    Out = faccoord(targfac = [FacNum, np.copy(_FACPOOL['Coord'][FacNum][start:stop]), anchored],
+                   targdatindex = None if index is None else index[start:stop],
+                   data = data[start:stop],
+                   oppfac = _FACPOOL['Coord'][OppNum],
+                   oppweights = W,
+                   solve_meth = solve_meth,
+                   solve_meth_specs = solve_meth_specs,
+                   condcoord_ = None,
+                   miss_meth = 'IgnoreCells',
+                   nanval = nanval,
+                   engine = engine,
+                   targpatterns = P,
+                   active = active,
+                   )
 
-        # Force probs to sum to 1.0
-        Sums = np.sum(Probx,axis=1)[:,np.newaxis]
-        Probx = Probx / Sums
-        Probx[NaNLoc] = nanval
+    return Out['FacCoord'], Out['Warn1'], Out['Warn2']
 
-    # Get Probs
-    if 'Probs' in return_:
-        if dropcol is True:
-            Results['Probs'] = Probx[:,1:]
-        else:
-            Results['Probs'] = Probx
-    else:
-        Results['Probs'] = None
 
-    # Get Extr
-    if 'Extr' in return_:
-        RespLocs = []
-        for Resp in resp2extr:
-            if Resp not in resp_cats:
-                exc = 'Unable to find resp2extr value among response categories.\n'
-                raise resp_prob_Error(exc)
-            else:
-                Loc = np.where(RespCatsArr == Resp)[1][0]
-                RespLocs.append(Loc)
+def facpool(workers,    # [int => number of worker processes]
+            data,   # [2-D rows x cols data array]
+            fac0coord,  # [rows x dims array of row coordinates]
+            fac1coord,  # [cols x dims array of col coordinates]
+            datindex,   # [{0:row targdatindex, 1:col targdatindex}]
+            patterns = None,    # [None, {0:row miss_patterns(), 1:col miss_patterns()}]
+            nranges = None, # [None, int => number of entity ranges per facet]
+            ):
+    """Starts a process pool for solving facet coordinates in parallel.
 
-        if extr_est is True:
-            Results['Extr'] = entcore[:,RespLocs]
-        else:
-            Results['Extr'] = Probx[:,RespLocs]
+    Returns
+    -------
+        A pool dictionary to pass to faccoord(pool = ...) and finally to
+        facpool_close():
+
+            {'Pool':    =>  multiprocessing.Pool
+             'Shared':  =>  shared-memory arrays for data, coordinates
+                            and weights
+             'Ranges':  =>  {0:[(start,stop),...], 1:[(start,stop),...]}
+             'Index':   =>  datindex
+             }
 
-        Results['ExtrIndex'] = RespLocs
-    else:
-        Results['Extr'] = None
-        Results['ExtrIndex'] = None
+    Comments
+    --------
+        The two half-steps of coord() -- rows given columns, then columns
+        given rows -- are independent across entities.  facpool() copies
+        the data and both facets' coordinates into shared memory once,
+        then starts the workers.  Each faccoord(pool = ...) call writes
+        only the current coordinates and weights into the shared arrays
+        (ents x dims floats) and maps fixed entity ranges across the
+        workers, so the data matrix is never pickled.
+
+        The column half-step reads the transpose of the shared data
+        as a view.  datindex and patterns are handed to the workers
+        when they start (inherited, not pickled, where processes are
+        forked).
+
+        Range boundaries depend only on the number of entities, not on
+        the number of workers, and results are merged in range order,
+        so outputs are the same whatever the number of workers.
 
-    # Get Exp
-    if 'Exp' in return_:
-        if metric == 'nominal':
-            print 'Warning: Expected values cannot be calculated from nominal data. Reporting predicted value instead.\n'
-            Results['Exp'] = None
-        else:
-            Exp = np.sum(RespCatsArr * Probx,axis=1)[:,np.newaxis]
-            Exp[NaNLoc] = nanval
-            Results['Exp'] = Exp
+        --------------
+        "workers" is the number of worker processes.
 
-    else:
-        Results['Exp'] = None
+        --------------
+        "data" is the rows x cols data array being analyzed
+        ('IgnoreCells' method only; it must not change between calls).
 
-    # Get Pred
-    if ('Pred' in return_
-        or (metric == 'nominal'
-            and 'Exp' in return_
-            )
-        ):
-        PredIndex = [np.where(Row == np.amax(Row))
-                     for Row in Probx]
+        --------------
+        "fac0coord", "fac1coord" are the starting coordinates, used to
+        size the shared coordinate arrays.
 
-        Pred0 = [resp_cats[PredIndex[i]][0]
-                           for i in range(nrows)]
+        --------------
+        "datindex" is {0:RowDatIndex, 1:ColDatIndex}, the targdatindex
+        of each facet.
 
-        # Convert alpha resp to ints for reporting
-        if pred_key is None:
-                ints = range(len(resp_cats))
-                pred_key = dict(zip(resp_cats,ints))
+        --------------
+        "patterns" is {0:row patterns, 1:col patterns}, the output
+        of miss_patterns() for each facet, or None.
 
-        try:
-            Pred1 = np.array([pred_key[Pred0[i]] for i in range(len(Pred0))])[:,np.newaxis]
-        except KeyError:
-            Pred1 = np.array([pred_key[str(Pred0[i])] for i in range(len(Pred0))])[:,np.newaxis]
+        --------------
+        "nranges" is the number of entity ranges per facet.  The
+        default is 64 (fewer for small facets).
 
-        Pred1[NaNLoc] = nanval
-        Results['Pred'] = Pred1
+    Paste function
+    --------------
+        facpool(workers,    # [int => number of worker processes]
+                data,   # [2-D rows x cols data array]
+                fac0coord,  # [rows x dims array of row coordinates]
+                fac1coord,  # [cols x dims array of col coordinates]
+                datindex,   # [{0:row targdatindex, 1:col targdatindex}]
+                patterns = None,    # [None, {0:row miss_patterns(), 1:col miss_patterns()}]
+                nranges = None, # [None, int => number of entity ranges per facet]
+                )
 
-        # Get prediction probabilities and store in tuples
-        MaxProb = np.array([Probx[i][PredIndex[i]][0]
-                   for i in range(nrows)])[:,np.newaxis]
-        MaxProb[NaNLoc] = nanval
-        PredProb = [(Pred0[Row],MaxProb[Row][0]) for Row in range(nrows)]
-        Results['PredProb'] = PredProb
+    """
+    if workers < 2:
+        exc = 'facpool() requires at least 2 workers.\n'
+        raise facpool_Error(exc)
+
+    if patterns is None:
+        patterns = {0:None, 1:None}
+    if nranges is None:
+        nranges = 64
+
+    shared = {'Data':_shared_array(data),
+              'Coord':{0:_shared_array(fac0coord),
+                       1:_shared_array(fac1coord)},
+              'Weights':{0:_shared_array(np.zeros((len(fac0coord), 1))),
+                         1:_shared_array(np.zeros((len(fac1coord), 1)))}
+              }
+
+    # Fixed entity ranges, independent of the number of workers
+    Ranges = {}
+    for Fac, nEnts in [(0, len(fac0coord)), (1, len(fac1coord))]:
+        bounds = np.linspace(0, nEnts, min(nranges, nEnts) + 1).astype(int)
+        Ranges[Fac] = [(bounds[k], bounds[k + 1]) for k in xrange(len(bounds) - 1)
+                       if bounds[k + 1] > bounds[k]]
+
+    pool_ = mp.Pool(processes = workers,
+                    initializer = _facpool_init,
+                    initargs = (shared, datindex, patterns))
+
+    return {'Pool':pool_,
+            'Shared':shared,
+            'Ranges':Ranges,
+            'Index':datindex
+            }
 
-        for i in NaNLoc:
-            PredIndex[i] = nanval
 
-        Results['PredIndex'] = PredIndex
+def facpool_solve(pool,   # [output of facpool()]
+                  targfac,  # [[FacetNum,FacetArray,Anchored]]
+                  oppfac,   # [Ents x dims array of opposing facet coordinates]
+                  oppweights,   # [None, array of weights corresponding to oppfac]
+                  solve_meth = 'LstSq', # [<'LstSq','IRLS'>]
+                  solve_meth_specs = None,  # [None, dictionary of specs specific to method]
+                  nanval = -999.,   # [Not-a-Number value]
+                  engine = 'Batch', # [<'Batch','Pattern','Loop'>]
+                  active = None,    # [None, boolean array of target entities to solve]
+                  ):
+    """Solves one facet's coordinates across the facpool() workers.
 
-    else:
-        Results['Pred'] = None
-        Results['PredProb'] = None
+    Returns
+    -------
+        {'FacCoord','Warn1','Warn2'}, as from faccoord(), without
+        conditioning.
 
+    Comments
+    --------
+        Called by faccoord() when its pool argument is given; see
+        facpool().  The target and opposing coordinates and the
+        opposing weights are copied into shared memory, the facet's
+        entity ranges are mapped across the workers, and the solved
+        ranges are reassembled in order.
 
-    #####################
-    # Define function to get SD from probabilities
-    def getsd(p):
-        q = 1.0 - p
-        SD = np.sqrt(p * q)
-        SD[NaNLoc] = nanval
-        return SD
+    Paste function
+    --------------
+        facpool_solve(pool,   # [output of facpool()]
+                      targfac,  # [[FacetNum,FacetArray,Anchored]]
+                      oppfac,   # [Ents x dims array of opposing facet coordinates]
+                      oppweights,   # [None, array of weights corresponding to oppfac]
+                      solve_meth = 'LstSq', # [<'LstSq','IRLS'>]
+                      solve_meth_specs = None,  # [None, dictionary of specs specific to method]
+                      nanval = -999.,   # [Not-a-Number value]
+                      engine = 'Batch', # [<'Batch','Pattern','Loop'>]
+                      active = None,    # [None, boolean array of target entities to solve]
+                      )
 
-    # Get ProbsSD
-    if 'ProbsSD' in return_:
-        try:
-            p = Results['Probs']
-        except KeyError:
-            exc = "Must specify 'Probs' if specifying 'ProbsSD'.\n"
-            raise resp_prob_Error(exc)
+    """
+    FacNum, FacCoord, anchored = targfac
+    OppNum = 1 - FacNum
+    shared = pool['Shared']
 
-        ProbsSD = getsd(p)
+    # Publish the current coordinates and weights to the workers
+    _shared_view(shared['Coord'][FacNum])[:] = FacCoord
+    _shared_view(shared['Coord'][OppNum])[:] = oppfac
+    weighted = oppweights is not None
+    if weighted:
+        _shared_view(shared['Weights'][OppNum])[:] = np.reshape(oppweights, (-1, 1))
 
-        if dropcol is True:
-            Results['ProbsSD'] = ProbsSD[:,1:]
-        else:
-            Results['ProbsSD'] = ProbsSD
-    else:
-        Results['ProbsSD'] = None
+    tasks = [(FacNum, start, stop, anchored, weighted, solve_meth,
+              solve_meth_specs, nanval, engine,
+              None if active is None else active[start:stop])
+             for start, stop in pool['Ranges'][FacNum]]
+    results = pool['Pool'].map(_facpool_task, tasks)
 
-    # Get ExtrSD
-    if 'ExtrSD' in return_:
-        try:
-            p = Results['Extr']
-        except KeyError:
-            exc = "Must specify 'Extr' if specifying 'ExtrSD'.\n"
-            raise resp_prob_Error(exc)
+    Warn1 = Warn2 = None
+    for (start, stop), (coord, w1, w2) in zip(pool['Ranges'][FacNum], results):
+        FacCoord[start:stop] = coord
+        if w1 is True:
+            Warn1 = True
+        if w2 is True:
+            Warn2 = True
 
-        ExtrSD = getsd(p)
-        Results['ExtrSD'] = ExtrSD
-    else:
-        Results['ExtrSD'] = None
+    return {'FacCoord':FacCoord, 'Warn1':Warn1, 'Warn2':Warn2}
 
-    # Get ExpSD (formula is fancier)
-    if 'ExpSD' in return_:
-        try:
-            Exp = Results['Exp']
-        except KeyError:
-            exc = "Must specify 'Exp' if specifying 'ExpSD'.\n"
-            raise resp_prob_Error(exc)
-        ExpSD = np.sqrt(np.sum(Probx * (RespCatsArr - Exp)**2,axis=1))[:,np.newaxis]
-        Results['ExpSD'] = ExpSD
-    else:
-        Results['ExpSD'] = None
-
-    # Get PredSD
-    if 'PredSD' in return_:
-        try:
-            p = MaxProb
-        except KeyError:
-            exc = "Must specify 'Pred' if specifying 'PredSD'.\n"
-            raise resp_prob_Error(exc)
-
-        PredSD = getsd(p)
-        Results['PredSD'] = PredSD
-    else:
-        Results['PredSD'] = None
-
-    return Results
 
+def facpool_close(pool):
+    "Shuts down the worker processes started by facpool() or dimpool()."
 
+    if pool is not None:
+        pool['Pool'].close()
+        pool['Pool'].join()
 
 
 
 ###########################################################################
 
-def residuals(observed, # [2D array of observed values]
-              estimates,    # [2D array of cell estimates]
-              psmsindex = None, # [<None, where()-style index of cells made pseudo-missing>]
-              nearest_val = None,     # [<None,'Nearest','Match'> => first convert estimate to nearest valid observed value]
-              ecut = None,  # [<None, [['All',ECut], ['Cols',[ECut1,ECut2,'Med',...]]> ]
-              nanval = -999.,   # [Not-a-Number value for cells missing in observed]
-              ):
-    """Get residuals between observed values and cell estimates.
+def _read_rows(data, start, stop, nanval, psmsindex = None):
+    """Read rows start:stop of data as a float array, with NaN, Inf and
+    psmsindex cells as nanval."""
+
+    x = np.array(data[start:stop], dtype=float)
+    x[~np.isfinite(x)] = nanval
+    if psmsindex is not None:
+        get = (psmsindex[0] >= start) & (psmsindex[0] < stop)
+        x[psmsindex[0][get] - start, psmsindex[1][get]] = nanval
+    return x
+
+
+def svd_coords(data,  # [2-D rows x cols array, possibly a np.memmap]
+               ndim,  # [int => number of dimensions]
+               psmsindex = None,  # [None, (rows, cols) index of cells to treat as missing]
+               nanval = -999.,    # [Not-a-number value]
+               chunk = 50000, # [int => number of rows read per block]
+               power = 1,    # [int => number of power iterations]
+               oversample = 10,   # [int => extra dimensions for the random projection]
+               ):
+    """Starter coordinates from a truncated randomized SVD of the data.
 
     Returns
     -------
-        Numpy array of differences (observed - Estimated) between
-        an array of observations and a corresponding array of
-        cell estimates.  Missing values are assigned nanval.
+        {'fac0coord'    =>  rows x ndim starter row coordinates
+         'fac1coord'    =>  cols x ndim starter column coordinates
+         'S'            =>  the ndim largest singular values of the
+                            standardized data
+         }
 
-    Arguments
-    ---------
-        "observed" is a 2D RowEnt x ColEnt array of observations.
-        Missing values are marked by nanval.
+    Comments
+    --------
+        coord() normally starts from random coordinates, which is why
+        it may need several seeds (see _bestseed()) to find a good
+        solution.  svd_coords() supplies coord(seed = 'SVD') with a
+        deterministic start instead:  the leading ndim singular
+        vectors of the data after each column is standardized and
+        missing cells are imputed with the column mean (0 after
+        standardizing).  This is the least squares solution for the
+        complete, imputed array, and usually close to coord()'s.
+
+        The SVD is computed by randomized subspace iteration (Halko,
+        Martinsson and Tropp, 2011).  The data is read in blocks of
+        "chunk" rows, so it can be a memory-mapped array larger than
+        memory, and it is read 3 + 2 * power times:  once for the
+        column means and SDs, once per projection, and once to form
+        the small (ndim + oversample) x cols matrix whose SVD is
+        taken.  Besides the coordinates, memory holds rows x
+        (ndim + oversample) floats.  The random projection uses a
+        fixed seed, so the result is reproducible.
+
+        The row coordinates are U * sqrt(S), and the column
+        coordinates V * sqrt(S), multiplied by each column's SD to
+        put them in the units of the data.
 
-        ---------------
-        "estimates" is a 2D RowEnt x ColEnt array of cell estimates
-        corresponding to the observed values, generally the output
-        of running Damon's coord() and base_est methods.  Missing
-        values (which should be rare), are marked by nanval.
+        --------------
+        "psmsindex" is a (rows, cols) index of cells to treat as
+        missing, e.g., pseudo-missing cells.
 
-        ---------------
-        "psmsindex" is an index of cells made missing when
-        calculating estimates but for which there exist valid values
-        in the observed array.  The index is formatted like the output of
-        Numpy's where() function and is created using the
-        Damon.pseudomiss() method.
+        --------------
+        "power" is the number of power iterations, which sharpen the
+        singular vectors when the singular values decay slowly.
 
-        ---------------
-        "nearest_val" instructs the function to "round" or convert each
-        estimate to the nearest valid value in observed before
-        calculating differences.  When nearest_val = 'Nearest', the
-        function first checks whether the observed values are continuous or
-        discrete; if continuous, the column is left alone.  Options:
+        --------------
+        "oversample" is the number of extra random dimensions
+        projected, for accuracy.
 
-            nearest_val = None   =>  Do not adjust estimates; use
-                                    them as they are.  Treated as
-                                    None if ecut = None.
+    Paste function
+    --------------
+        svd_coords(data,  # [2-D rows x cols array, possibly a np.memmap]
+                   ndim,  # [int => number of dimensions]
+                   psmsindex = None,  # [None, (rows, cols) index of cells to treat as missing]
+                   nanval = -999.,    # [Not-a-number value]
+                   chunk = 50000, # [int => number of rows read per block]
+                   power = 1,    # [int => number of power iterations]
+                   oversample = 10,   # [int => extra dimensions for the random projection]
+                   )
 
-            nearest_val = 'Nearest'
-                                =>  Adjust all estimates to their
-                                    nearest observed value.
+    """
+    nRows, nCols = np.shape(data)
+    chunk = int(chunk)
+    k = min(ndim + oversample, nRows, nCols)
 
-            nearest_val = 'Match'
-                                =>  return_ 1 where observed and
-                                    estimates are identical, 0
-                                    otherwise.  Works on string
-                                    alpha arrays.
+    if ndim > min(nRows, nCols):
+        exc = 'ndim is larger than the number of rows or columns.\n'
+        raise svd_coords_Error(exc)
 
-        nearest_val can be used in place of the ecut argument, and
-        may be a better idea when much of the data is not dichotomous.
-        When the data are dichotomous, nearest_val is equivalent to
-        ecut = ['All',0.5].  However, nearest_val is also much slower
-        than ecut, and with large datasets ecut and nearest_val should,
-        when the residuals are used to compute EARs, yield similar results,
-        though this requires further investigation.
+    if psmsindex is not None:
+        psmsindex = (np.asarray(psmsindex[0]), np.asarray(psmsindex[1]))
+
+    Blocks = [(start, min(start + chunk, nRows))
+              for start in xrange(0, nRows, chunk)]
+
+    # Column means and SDs
+    n = np.zeros(nCols)
+    Sum = np.zeros(nCols)
+    SumSq = np.zeros(nCols)
+    for start, stop in Blocks:
+        x = _read_rows(data, start, stop, nanval, psmsindex)
+        valid = x != nanval
+        x = np.where(valid, x, 0.0)
+        n += np.sum(valid, axis=0)
+        Sum += np.sum(x, axis=0)
+        SumSq += np.sum(x**2, axis=0)
+
+    Mean = Sum / np.maximum(n, 1)
+    SD = np.sqrt(np.maximum(SumSq / np.maximum(n, 1) - Mean**2, 0))
+    SD[SD < 0.00000000001] = 1.0
+
+    # Standardized block, mean-imputed
+    def block(start, stop):
+        x = _read_rows(data, start, stop, nanval, psmsindex)
+        return np.where(x != nanval, (x - Mean) / SD, 0.0)
+
+    # Y = Z Omega, and Y = Z Z^T Q for each power iteration
+    Omega = npr.RandomState(seed=0).randn(nCols, k)
+    Y = np.zeros((nRows, k))
+    for start, stop in Blocks:
+        Y[start:stop] = np.dot(block(start, stop), Omega)
+    Q = npla.qr(Y)[0]
+
+    for i in xrange(power):
+        W = np.zeros((nCols, k))
+        for start, stop in Blocks:
+            W += np.dot(np.transpose(block(start, stop)), Q[start:stop])
+        W = npla.qr(W)[0]
+        for start, stop in Blocks:
+            Y[start:stop] = np.dot(block(start, stop), W)
+        Q = npla.qr(Y)[0]
+
+    # SVD of B = Q^T Z
+    B = np.zeros((k, nCols))
+    for start, stop in Blocks:
+        B += np.dot(np.transpose(Q[start:stop]), block(start, stop))
+    Ub, S, Vt = npla.svd(B, full_matrices=False)
+
+    Scale = np.sqrt(S[:ndim])
+    return {'fac0coord':np.dot(Q, Ub[:,:ndim]) * Scale,
+            'fac1coord':np.transpose(Vt[:ndim]) * Scale * SD[:,np.newaxis],
+            'S':S[:ndim]
+            }
 
-        ---------------
-        "ecut", used when converting estimates to probabilities or
-        logits, is the cut-point assigned to each column estimate (or the
-        whole array) to distinguish "success" from "failure".  If
-        an estimate is 3.6 and the ecut is 3.0, then the estimate
-        signifies "success".  When ecut is signified, residuals are
-        defined dichotomously regardless of the underlying metric.
-        If a cell observation and its estimate fall on the same side
-        of the cut-point, the residual is 0.  If they fall on opposite
-        sides, the residual is 1.  Thus, the resulting residuals are
-        only 0 and 1 -- no -1 -- and in this sense are not so much
-        residuals as absolute residuals.
 
-        Options:
+###########################################################################
 
-            ecut = None         =>  Do not compute dichotomous
-                                    residuals.  The nearest_val parameter
-                                    will be used instead.
+def stream_coord(data,  # [2-D rows x cols array, e.g., a np.memmap, read one block of rows at a time]
+                 ndim,  # [int => number of dimensions]
+                 runspecs = [0.0001,10],    # [[StopWhenChange,MaxIteration]]
+                 chunk = 50000, # [int => number of rows read and solved per block]
+                 seed = None,   # [None,int,'SVD' => seed for random starter coordinates, or svd_coords() starters]
+                 startercoord = None,   # [None, cols x ndim array of starter column coordinates]
+                 condcoord_ = {'Fac0':'Orthonormal','Fac1':None},  # [<None,{'Fac0':<None,'Orthonormal'>,'Fac1':<'a func',myfunc>}>]
+                 weightcoord = True,    # [<None,True> => downweight influential coordinates]
+                 psmsindex = None,  # [None, (rows, cols) index of cells to treat as missing]
+                 nanval = -999.,    # [Not-a-number value]
+                 verbose = None,    # [<None,True> => print the change per iteration]
+                 monitor = None,    # [None, output of iter_monitor() => receives one record per iteration]
+                 ):
+    """Calculates row and column coordinates without loading the
+    data array, reading it in blocks of rows.
 
-            ecut = ['All',0.50]
-                                =>  Assign the same ecut to all
-                                    columns.  That ecut is 0.50.
+    Returns
+    -------
+        {'fac0coord'    =>  rows x ndim row coordinates
+         'fac1coord'    =>  cols x ndim column coordinates
+         'changelog'    =>  [iteration, change, nan, nan] per iteration,
+                            as in coord_out['changelog']
+         'Warn1'        =>  True if some coordinates were not finite
+                            and set to nanval
+         }
 
-            ecut = ['All','Med']
-                                =>  Assign the same ecut to all
-                                    columns.  That ecut is the median
-                                    of the whole array
+    Comments
+    --------
+        stream_coord() is the out-of-core counterpart of the coord()
+        iteration for miss_meth = 'IgnoreCells' and solve_meth =
+        'LstSq'.  It never holds more than "chunk" rows of the data,
+        so a coredata array memory-mapped from disk, e.g.,
 
-            ecut = ['Cols',[0.50,2.5,'Med',...]]
-                                =>  Assign the estimates in the first
-                                    column an ecut of 0.50.  Assign
-                                    the second column a 2.5.  Assign the
-                                    third an ecut equal to the median
-                                    estimate for that column.
+            coredata = np.load('coredata.npy', mmap_mode = 'r')
 
-            ecut = ['Cols','Med']
-                                =>  Assign a different ecut to each
-                                    column, where ecut is the median
-                                    of that column.
+        can be much larger than RAM.  Peak memory is about
+        chunk x (cols + ndim^2) floats for the block being processed
+        plus the coordinates themselves.
 
-        ---------------
-        "nanval" is the float or integer value designated to mean
-        a missing cell, or Not-a-Number value.
+        Each iteration is one pass over the data.  For each block of
+        rows it:
 
+            1)  solves the block's row coordinates from the current
+                column coordinates (solve_batch());
 
+            2)  adds the block's rows to each column's normal equations,
 
-    Examples
-    --------
+                    A[j] += sum_i m[i,j] * w[i] * outer(r[i], r[i])
+                    b[j] += sum_i m[i,j] * w[i] * r[i] * x[i,j]
 
+                and to the Gram matrix of the row coordinates.
 
+        After the pass, the row coordinates are made orthonormal.
+        Instead of a QR decomposition, which needs all the rows at
+        once, they are multiplied by the inverse of the Cholesky
+        factor of the Gram matrix.  Because this is a linear
+        transformation T, the column normal equations are carried
+        over as T'A[j]T and T'b[j], so the column coordinates are
+        solved without a second pass.  The rows of an orthonormal
+        array have lengths of at most 1, so the weightcoord weights
+        of the row coordinates do not depend on T.
+
+        The results match coord() up to the sign of each dimension,
+        which the QR and Cholesky factorizations choose differently;
+        the estimates are the same.
+
+        A first pass collects the counts, the range of each row and
+        column, and the standard deviation of the data, which coord()
+        uses to set entities with too little data to nanval and to
+        scale the random starter coordinates.
+
+        Arguments are as in coord(), except:
+
+        "condcoord_" 'Fac0' can only be None or 'Orthonormal'.  'Fac1'
+        can be anything condcoord() supports, since the column
+        coordinates are held in memory.
+
+        "startercoord" is an array of starter column coordinates, or
+        None for random starters (or svd_coords() starters if seed is
+        'SVD', read in blocks like the rest).
+
+        "psmsindex" is a (rows, cols) index of cells to treat as
+        missing, e.g., the pseudo-missing cells of coord(pseudomiss =
+        True).
+
+        "monitor" receives one record per iteration, with 'facet'
+        None since both facets are solved in one pass, and 'rmsr'
+        None as it would take another pass.  See iter_monitor().
 
     Paste function
     --------------
-        residuals(observed, # [2D array of observed values]
-                  estimates,    # [2D array of cell estimates]
-                  psmsindex = None, # [<None, where()-style index of cells made pseudo-missing>]
-                  nearest_val = None,     # [<None,'Nearest','Match'> => first convert estimate to nearest valid observed value]
-                  ecut = None,  # [<None, [['All',ecut], ['Cols',[ECut1,ECut2,'Med',...]]> ]
-                  nanval = -999.,   # [Not-a-Number value for cells missing in observed]
-                  )
+        stream_coord(data,  # [2-D rows x cols array, e.g., a np.memmap, read one block of rows at a time]
+                     ndim,  # [int => number of dimensions]
+                     runspecs = [0.0001,10],    # [[StopWhenChange,MaxIteration]]
+                     chunk = 50000, # [int => number of rows read and solved per block]
+                     seed = None,   # [None,int,'SVD' => seed for random starter coordinates, or svd_coords() starters]
+                     startercoord = None,   # [None, cols x ndim array of starter column coordinates]
+                     condcoord_ = {'Fac0':'Orthonormal','Fac1':None},  # [<None,{'Fac0':<None,'Orthonormal'>,'Fac1':<'a func',myfunc>}>]
+                     weightcoord = True,    # [<None,True> => downweight influential coordinates]
+                     psmsindex = None,  # [None, (rows, cols) index of cells to treat as missing]
+                     nanval = -999.,    # [Not-a-number value]
+                     verbose = None,    # [<None,True> => print the change per iteration]
+                     monitor = None,    # [None, output of iter_monitor() => receives one record per iteration]
+                     )
 
     """
+    nRows, nCols = np.shape(data)
+    chunk = int(chunk)
+    StopWhenChange = runspecs[0]
+    MaxIteration = runspecs[1]
 
-    # Some variables
-    shape = np.shape(observed)
-    nrows = shape[0]
-    ncols = shape[1]
-    MsEst = np.where(estimates == nanval)
-    observed = observed[:,:]
-    estimates = estimates[:,:]
+    Cond0 = None if condcoord_ is None else condcoord_['Fac0']
+    Cond1 = None if condcoord_ is None else condcoord_['Fac1']
+    if Cond0 not in [None, 'Orthonormal']:
+        exc = "condcoord 'Fac0' must be None or 'Orthonormal'.\n"
+        raise stream_coord_Error(exc)
 
-    # Check type of data
-    try:
-        observed[0,0] - estimates[0,0]
-    except TypeError:
-        try:
-            observed = observed.astype(float)
-            estimates = observed.astype(float)
-        except ValueError:
-            if nearest_val == 'Match':
-                observed = observed.astype('S20')
-                estimates = observed.astype('S20')
-            else:
-                exc = "Unable to get observed and estimates data types to match.\n"
-                raise residuals_Error(exc)
+    if chunk < 1:
+        exc = 'chunk must be a positive integer.\n'
+        raise stream_coord_Error(exc)
 
-    if (isinstance(observed[0,0],str)
-        and isinstance(estimates[0,0],float)
-        ):
-        exc = 'type_ of data in observed and estimates does not match.\n'
-        raise residuals_Error(exc)
+    if psmsindex is not None:
+        psmsindex = (np.asarray(psmsindex[0]), np.asarray(psmsindex[1]))
+
+    # Read a block of rows, with NaN, Inf and pseudo-missing cells as nanval
+    def read(start, stop):
+        return _read_rows(data, start, stop, nanval, psmsindex)
+
+    Blocks = [(start, min(start + chunk, nRows))
+              for start in xrange(0, nRows, chunk)]
+
+    #################
+    ##  Data pass  ##
+    #################
+
+    # Counts and ranges of rows and columns, data mean and SD
+    RowCount = np.zeros(nRows, dtype=int)
+    RowFlat = np.zeros(nRows, dtype=bool)
+    ColCount = np.zeros(nCols, dtype=int)
+    ColCountV = np.zeros(nCols, dtype=int)
+    ColMin = np.zeros(nCols) + np.inf
+    ColMax = np.zeros(nCols) - np.inf
+    N = 0
+    Mean = 0.
+    M2 = 0.
+
+    for start, stop in Blocks:
+        x = read(start, stop)
+        valid = x != nanval
+        RowCount[start:stop] = np.sum(valid, axis=1)
+        Lo = np.where(valid, x, np.inf)
+        Hi = np.where(valid, x, -np.inf)
+        RowFlat[start:stop] = np.min(Lo, axis=1) == np.max(Hi, axis=1)
+        if nCols == 1:
+            RowFlat[start:stop] = False
+        ColCount += np.sum(valid, axis=0)
+        RowValid_ = ~(RowFlat[start:stop] | (RowCount[start:stop] < ndim))
+        ColCountV += np.sum(valid & RowValid_[:,np.newaxis], axis=0)
+        ColMin = np.minimum(ColMin, np.min(Lo, axis=0))
+        ColMax = np.maximum(ColMax, np.max(Hi, axis=0))
+
+        # Merge block mean and sum of squares (Chan et al.)
+        vals = x[valid]
+        n = len(vals)
+        if n > 0:
+            m = np.mean(vals)
+            Delta = m - Mean
+            M2 += np.sum((vals - m)**2) + Delta**2 * N * n / float(N + n)
+            Mean += Delta * n / float(N + n)
+            N += n
+
+    if N == 0:
+        exc = 'Found no valid data values.\n'
+        raise stream_coord_Error(exc)
+
+    DataSD = np.sqrt(M2 / N)
+    if DataSD < 0.00000000001:
+        exc = 'Insufficient variation in data array.\n'
+        raise stream_coord_Error(exc)
+
+    # Entities with insufficient counts or variation get nanval
+    ColFlat = (ColMin == ColMax) if nRows > 1 else np.zeros(nCols, dtype=bool)
+    RowValid = ~(RowFlat | (RowCount < ndim))
+    ColValid = ~(ColFlat | (ColCount < ndim))
+
+    ######################
+    ##  Starter coords  ##
+    ######################
+
+    facmetric = DataSD
+    if seed == 'SVD' and startercoord is None:
+        Svd = svd_coords(data, ndim, psmsindex, nanval, chunk)
+        R = Svd['fac0coord']
+        C = Svd['fac1coord']
+    elif seed is None or seed == 'SVD':
+        R = npr.rand(nRows, ndim) * facmetric
+        C = npr.rand(nCols, ndim) * facmetric
+    else:
+        R = npr.RandomState(seed=seed).rand(nRows, ndim) * facmetric
+        C = npr.RandomState(seed=seed+1).rand(nCols, ndim) * facmetric
 
-    if (isinstance(observed[0,0],str)
-        and isinstance(estimates[0,0],str)
-        and nearest_val != 'Match'
-        ):
-        #print "Warning in tools.residuals:  If data is string, nearest_val must be 'Match'.  Making that change.\n"
-        nearest_val = 'Match'
+    if startercoord is not None:
+        C = np.array(startercoord, dtype=float)
 
-    # Get dichotomous residuals
-    if ecut is not None:
-        if ecut[0] == 'All':
+    if Cond0 is not None:
+        R = condcoord(R, None, 'Fac0', Cond0, nanval)['F0Std']
+    if Cond1 is not None and startercoord is None:
+        C = condcoord(None, C, 'Fac1', Cond1, nanval)['F1Std']
 
-            # Define ecut as median
-            if ecut[1] == 'Med':
-                ValEst = estimates[np.where(estimates != nanval)]
-                ECut_ = np.median(ValEst)
-            else:
-                ECut_ = ecut[1]
+    R[~RowValid] = nanval
+    C[~ColValid] = nanval
 
-            # Get dichotomous residuals
-            Cond1 = observed == nanval
-            Cond2 = estimates == nanval
-            Cond3 = np.logical_and(observed < ECut_,estimates < ECut_)
-            Cond4 = np.logical_and(observed >= ECut_,estimates >= ECut_)
-            Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
-                             np.where(np.logical_or(Cond3,Cond4),0,1)
-                             )
+    # Log counts of cells with valid opposing entities, for weightcoord
+    ColLogN = np.where(ColCountV < 1, 0, np.log(ColCountV + 1.))[:,np.newaxis]
 
-        elif ecut[0] == 'Cols':
-            Resid = np.zeros((nrows,ncols))
-            for i in range(ncols):
+    #################
+    ##  Iterate    ##
+    #################
 
-                # Define ecut as median
-                if (ecut[1] == 'Med'
-                    or (type(ecut[1]) is type([])
-                        and ecut[1][i] == 'Med')
-                    ):
-                    ValEst = estimates[:,i][np.where(estimates[:,i] != nanval)]
-                    ECut_ = np.median(ValEst)
+    changelog = np.zeros((0,4))
+    Warn1 = None
+    Stop = 0
+    it = 0
+    StartTime = time.time()
+
+    while Stop == 0:
+        ItStart = time.time()
+
+        # Column weights for the row solve
+        ColOK = C[:,0] != nanval
+        W_C = None
+        if weightcoord is not None:
+            W_C = weight_coord(C, ColLogN, 'R', nanval)
+
+        PrevR = R
+        R = np.zeros((nRows, ndim)) + nanval
+        G = np.zeros((ndim, ndim))
+        A = np.zeros((nCols, ndim * ndim))
+        b = np.zeros((nCols, ndim))
+
+        for start, stop in Blocks:
+            x = read(start, stop)
+            valid = x != nanval
+            mask = valid & ColOK
+
+            # Solve the block's row coordinates
+            get = np.where(RowValid[start:stop])[0]
+            if len(get) > 0:
+                Out = solve_batch(U = C,
+                                  targdatindex = csr_index(mask),
+                                  data = x,
+                                  weights = W_C,
+                                  ents = get,
+                                  chunk = chunk,
+                                  nanval = nanval,
+                                  )
+                R[start + get] = Out['V']
+                if Out['Fail'] is not None:
+                    Warn1 = True
 
-                elif type(ecut[1]) is type([]):
-                    ECut_ = ecut[1][i]
+            # Add the block to the column normal equations
+            r = R[start:stop]
+            ok = r[:,0] != nanval
+            G += np.dot(np.transpose(r[ok]), r[ok])
+            mask &= ok[:,np.newaxis]
+
+            # Row weights.  Orthonormal rows have lengths of at most 1,
+            # so weight_coord() reduces to the log counts.
+            if weightcoord is None:
+                w = np.ones((stop - start, 1))
+            else:
+                n = np.sum(valid & ColValid, axis=1)
+                logn = np.where(n < 1, 0, np.log(n + 1.))[:,np.newaxis]
+                if Cond0 == 'Orthonormal':
+                    w = logn
                 else:
-                    ECut_ = ecut[1]
+                    w = weight_coord(r, logn, 'R', nanval)
+
+            rr = (r[:,:,np.newaxis] * r[:,np.newaxis,:]).reshape(-1, ndim * ndim)
+            rr[~ok] = 0
+            A += np.dot(np.transpose(mask * w), rr)
+            b += np.dot(np.transpose(np.where(mask, x, 0.0) * w),
+                        np.where(ok[:,np.newaxis], r, 0.0))
+
+        # Make the row coordinates orthonormal, carrying the column
+        # normal equations along
+        RowOK = R[:,0] != nanval
+        if Cond0 == 'Orthonormal':
+            if np.sum(RowOK) < ndim:
+                exc = 'Unable to orthonormalize row coordinates.  Check dimensionality.\n'
+                raise stream_coord_Error(exc)
+            try:
+                T = npla.inv(np.transpose(npla.cholesky(G)))
+            except npla.LinAlgError:
+                exc = 'Row coordinates are not linearly independent.\n'
+                raise stream_coord_Error(exc)
+
+            R[RowOK] = np.dot(R[RowOK], T)
+            A = np.dot(np.transpose(T),
+                       np.dot(A.reshape(-1, ndim), T).reshape(nCols, ndim, ndim)
+                       ).transpose(1, 0, 2)
+            b = np.dot(b, T)
+        else:
+            A = A.reshape(nCols, ndim, ndim)
+
+        # Solve the column coordinates
+        C = np.zeros((nCols, ndim)) + nanval
+        sign = npla.slogdet(A)[0]
+        solve = ColOK & ColValid
+        C[solve] = 0.0
+        fit = solve & (sign != 0)
+        if np.any(fit):
+            C[fit] = npla.solve(A[fit], b[fit][:,:,np.newaxis])[:,:,0]
+
+        bad = solve & ~np.all(np.isfinite(C), axis=1)
+        if np.any(bad):
+            C[bad] = nanval
+            Warn1 = True
+
+        if Cond1 is not None:
+            C = condcoord(None, C, 'Fac1', Cond1, nanval)['F1Std']
+
+        # Change in row coordinates, as in coord()
+        if StopWhenChange == 0:
+            Change = 1
+        else:
+            Change = np.sqrt(np.mean((R - PrevR)**2)) / float(facmetric)
+
+        if verbose is True:
+            print ndim, '\t', 0, '\t', it, '\t', round(Change, 5)
+
+        changelog = np.append(changelog,
+                              np.array([[it, Change, np.nan, np.nan]]),
+                              axis=0)
+
+        if monitor is not None:
+            monitor({'iteration':it,
+                     'facet':None,
+                     'change':Change,
+                     'rmsr':None,
+                     'seconds':time.time() - ItStart,
+                     'elapsed':time.time() - StartTime,
+                     'peak_mb':peak_memory()
+                     })
+        it += 1
 
-                # Get dichotomous residuals
-                Cond1 = observed[:,i] == nanval
-                Cond2 = estimates[:,i] == nanval
-                Cond3 = np.logical_and(observed[:,i] < ECut_,estimates[:,i] < ECut_)
-                Cond4 = np.logical_and(observed[:,i] >= ECut_,estimates[:,i] >= ECut_)
-                Resid[:,i] = np.where(np.logical_or(Cond1,Cond2),nanval,
-                                      np.where(np.logical_or(Cond3,Cond4),0,1)
-                                      )
+        if (it < MaxIteration
+            and Change > StopWhenChange
+            ):
+            Stop = 0
+        else:
+            Stop = 1
 
-    # Get residuals to "adjusted" estimates
-    elif nearest_val == 'Nearest':
+    return {'fac0coord':R,
+            'fac1coord':C,
+            'changelog':changelog,
+            'Warn1':Warn1
+            }
 
-        # Define nearest(Vals,Est)
-        def nearest(Vals,Est):
-            HiLoc = np.searchsorted(Vals,Est)
-            LoLoc = HiLoc - 1
-            if LoLoc < 0:
-                LoLoc = 0
 
-            try:
-                HiDiff = np.abs(Vals[HiLoc] - Est)
-            except IndexError:
-                HiDiff = np.inf
 
-            LoDiff = np.abs(Vals[LoLoc] - Est)
+###########################################################################
 
-            if HiDiff < LoDiff:
-                Nearest = Vals[HiLoc]
-            else:
-                Nearest = Vals[LoLoc]
+def iter_monitor(monitor,   # [<None, function, helper.Event, 'log.jsonl', list of these> => where to send iteration records]
+                 **tags     # [<key = value> => fields added to every record, e.g., subspace = 'Math']
+                 ):
+    """Returns a helper.Event fired once per iteration by coord(),
+    rasch() and sub_coord(), or None.
 
-            return Nearest
+    Returns
+    -------
+        None if monitor is None, else a helper.Event.  Calling it
+        with a record dictionary passes the record, with tags added,
+        to every handler.
 
-        # Draw random sample for testing discreteness
-        if nrows <= 20:
-            SampLoc = None
+    Comments
+    --------
+        The "monitor" argument of coord(), rasch() and sub_coord()
+        gives a structured view of convergence, without editing code
+        or parsing verbose printouts.  Each iteration (each half-step
+        in coord()) fires one record, a dictionary such as:
+
+            {'method'       =>  'coord' or 'rasch'
+             'iteration'    =>  iteration number, from 0
+             'facet'        =>  facet solved in the half-step (0 rows,
+                                1 columns), or None if both facets
+                                are updated together
+             'change'       =>  change in the facet's coordinates (or
+                                rasch()'s change in the maximum
+                                residual sum)
+             'rmsr'         =>  root mean squared residual of the
+                                valid cells after the iteration
+             'seconds'      =>  time taken by the half-step or iteration
+             'elapsed'      =>  time since the run started
+             'peak_mb'      =>  peak memory of the process so far
+                                (see peak_memory())
+             }
+
+        plus method-specific fields (e.g., 'ndim' for coord(),
+        'max_res' for rasch()) and any tags.
+
+        "monitor" can be:
+
+            function    =>  called with each record, e.g., to append
+                            it to a list or update a progress bar.
+
+            'log.jsonl' =>  a file name.  Each record is appended to
+                            the file as one line of JSON (see
+                            jsonl_log()).
+
+            helper.Event
+                        =>  an Event with handlers of its own.
+                            sub_coord() uses this to pass its monitor,
+                            tagged with the subspace, to its coord()
+                            runs.
+
+            list        =>  a list of the above.
+
+        "tags" are fields added to each record unless the record
+        already has them.
+
+    Examples
+    --------
+        >>>  log = []
+        >>>  d.coord([[3]], monitor = log.append)
+        >>>  d.coord([[3]], monitor = 'coord_log.jsonl')
+
+    Paste function
+    --------------
+        iter_monitor(monitor,   # [<None, function, helper.Event, 'log.jsonl', list of these> => where to send iteration records]
+                     **tags     # [<key = value> => fields added to every record, e.g., subspace = 'Math']
+                     )
+
+    """
+    if monitor is None:
+        return None
+
+    targets = []
+    for target in (monitor if isinstance(monitor, list) else [monitor]):
+        if isinstance(target, str):
+            targets.append(jsonl_log(target))
+        elif hasattr(target, '__call__'):
+            targets.append(target)
         else:
-            p = 20/float(nrows)
-            SampLoc = np.where(npr.rand(nrows) < p)
+            exc = 'monitor must be a function, helper.Event, or file name.\n'
+            raise iter_monitor_Error(exc)
 
-        # Find nearest valid observed value per estimate
-        Est1 = np.zeros((nrows,ncols))
-        for i in range(ncols):
-            if SampLoc is not None:
-                nSamp = len(SampLoc[0])
-                nVals = len(np.unique(observed[SampLoc][:,i][np.where(observed[SampLoc][:,i] != nanval)]))
-                pUnique = nVals / float(nSamp)
+    def send(record):
+        for key in tags:
+            record.setdefault(key, tags[key])
+        for target in targets:
+            target(record)
 
-                # Skip cols where more than 10% of data is unique
-                if pUnique > 0.10:
-                    Est1[:,i] = estimates[:,i]
-                else:
-                    Vals = np.unique(observed[:,i][np.where(observed[:,i] != nanval)])
-                    try:
-                        Est1[:,i] = [nearest(Vals,Est) for Est in estimates[:,i]]
-                    except IndexError:
-                        Est1[:,i] = nanval
+    event = helper.Event()
+    event += send
 
-            elif SampLoc is None:
-                Vals = np.unique(observed[:,i][np.where(observed[:,i] != nanval)])
-                try:
-                    Est1[:,i] = [nearest(Vals,Est) for Est in estimates[:,i]]
-                except IndexError:
-                    Est1[:,i] = nanval
+    return event
 
-        Est1[MsEst] = nanval
 
-        # Calculate residuals
-        Cond1 = observed == nanval
-        Cond2 = Est1 == nanval
-        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
-                         np.subtract(observed,Est1))
 
-    # Look for exact match
-    elif nearest_val == 'Match':
-        Cond1 = observed == nanval
-        Cond2 = estimates == nanval
-        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
-                         np.where(observed == estimates,0,1)).astype(float)
+###########################################################################
 
-    # Get residuals for unadjusted estimates
-    elif nearest_val is None:
-        Cond1 = observed == nanval
-        Cond2 = estimates == nanval
-        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
-                         np.subtract(observed,estimates)
-                         )
-    else:
-        exc = 'Unable to figure out nearest_val parameter.\n'
-        raise residuals_Error(exc)
+def jsonl_log(filename):
+    """Returns a function that appends records to a JSON-lines file.
 
-    ########
-    # Select only non-pseudo-missing residuals
-    # Pseudo-missing residuals
-    if psmsindex is not None:
-        Temp = np.zeros((nrows,ncols)) + nanval
-        Temp[psmsindex] = Resid[psmsindex]
-        Resid = Temp
+    Each call writes one dictionary as one line.  numpy values are
+    converted to Python values and nan to null, so the file can be
+    read with any JSON reader, e.g., pandas.read_json(filename,
+    lines = True).  The file is opened per record, so it can be
+    watched while a long run is going.  See iter_monitor().
 
-    return Resid
+    """
+    def write(record):
+        line = {}
+        for key in record:
+            value = record[key]
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            if isinstance(value, float) and not np.isfinite(value):
+                value = None
+            line[key] = value
+
+        with open(filename, 'a') as f:
+            f.write(json.dumps(line, sort_keys=True) + '\n')
+
+    return write
 
 
 
 ###########################################################################
 
-def obspercell(obs, # [<None, obs array> ]
-               by_rows = 'obs',   # [<'obs', ncols> => for obs counts by row]
-               by_cols = 'obs',  # [<'obs', nrows>] => for obs counts by col]
-               out_as = 'arr', # [<'arr', 'row', 'col', 'num'> => output shape]
-               ndim = 2,    # [<int> dimensionality of estimates]
-               facs_per_ent = [1, 2],    # [<[<0,1>,<1,2,[1,1,2,...]]> => facet and number of unanchored facets per entity]
-               count_chars = True,   # [<bool, int, [ints]> => count n unique characters per cell]
-               max_chars = 2, # [<int>, maximum chars per cell]
-               p_items = None, # [<None, float] => percent items independent]
-               meth = 'CombineFacs', # [<'PickMinFac','CombineFacs'>]
-               nanval = -999,   # [Not-a-Number value]
+def peak_memory():
+    """Peak resident memory of this process so far, in megabytes,
+    or None where the resource module is not available (Windows)."""
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / 1024.**2     # bytes
+    else:
+        return peak / 1024.        # kilobytes
+
+
+
+###########################################################################
+
+def rmsr_index(R,   # [rows x dims coordinates, may include nanval rows]
+               C,   # [cols x dims coordinates, may include nanval rows]
+               targdatindex,    # [CSRIndex of the valid cells of each row]
+               data,    # [2-D rows x cols data array]
+               nanval = -999.,  # [Not-a-number value]
+               chunk = 50000,   # [<int> => number of rows per block]
                ):
-    """Calculate obspercell_factor for standard errors.
+    """Root mean squared residual of the valid cells, using the
+    coordinates rather than a full array of estimates.
 
     Returns
     -------
-        2-D array (corresponding to "shape") with the obspercell_factor
-        calculated for each cell.  This is used in Damon's standard
-        error formula.
+        Scalar root mean squared residual between data and
+        R x transpose(C) over the cells in targdatindex whose row
+        and column coordinates are valid; nan if there are none.
 
     Comments
     --------
-        The core standard error formula in Damon is based on the
-        classic statistical formula:
+        The estimate of each valid cell is the dot product of its
+        row and column coordinates, so the cost is proportional to
+        the number of valid cells times dims and the working memory
+        to one block of rows.
 
-        Formula 1a (regular formula):
+    Paste function
+    --------------
+        rmsr_index(R,   # [rows x dims coordinates, may include nanval rows]
+                   C,   # [cols x dims coordinates, may include nanval rows]
+                   targdatindex,    # [CSRIndex of the valid cells of each row]
+                   data,    # [2-D rows x cols data array]
+                   nanval = -999.,  # [Not-a-number value]
+                   chunk = 50000,   # [<int> => number of rows per block]
+                   )
 
-            n = number of observations
-            SE = SD/sqrt(n)
+    """
+    RowOK = R[:,0] != nanval
+    ColOK = C[:,0] != nanval
+    SumSq = 0.
+    n = 0
 
-        In Damon the 1/sqrt(n) portion of the formula is refined to take 
-        into account the dimensionality of the estimates and the number of
-        facets.  The number of observations is by cell -- for each cell, how
-        many observations reside in its row and column.
+    for start in xrange(0, len(targdatindex), chunk):
+        index = targdatindex[start:start + chunk]
+        rows = np.repeat(np.arange(len(index)), index.counts())
+        cols = index.indices
+        ok = RowOK[start + rows] & ColOK[cols]
+        rows = rows[ok]
+        cols = cols[ok]
 
-        Formula 1b (Damon version):
+        x = np.asarray(data[start:start + len(index)], dtype=float)[rows, cols]
+        est = np.sum(R[start + rows] * C[cols], axis=1)
+        SumSq += np.sum((x - est)**2)
+        n += len(x)
 
-            Basic Idea:  SE[cell] = nfacs * SD / (n - ndims)/ndims
-                                  = nfacs * SD / (n/ndims - 1)
+    return np.sqrt(SumSq / n) if n > 0 else np.nan
 
-        This gets translated into one of two formulae (as expressed in 
-        the dichotomous case):
 
-        Formula 1b.1 ('PickMinFac' formula)
 
-            SE[cell] = (nfacs * EAR) / minimum(sqrt(nrows / ndims - 1),
-                                               sqrt(ncols / ndims - 1))
+###########################################################################
 
-        Formula 1b.2 ('CombineFacs' formula)
+def get_unique_weight(targ, # [<target subspace label>]
+                      targ_obj, # [<target subspace Damon object>]
+                      res_obj,  # [<target subspace residuals Damon object>]
+                      unique_weights,   # [<unique_weights param>]
+                      min_rel = 0.02,   # [<minimum reliability>]
+                      rpt_optimal = None    # [<None, True> => report optimal weight]
+                      ):
+    """Estimate unique weight for sub_coord().
 
-            SE[cell] = (nfacs * EAR) / sqrt(sqrt(nrows / ndims - 1) * 
-                                            sqrt(ncols / ndims - 1))
+    Returns
+    -------
+        Output dictionary:
+            {'unique_weight':_, =>  weight actually used by sub_coord() for unique dimensions
+             'optimal_weight':_ =>  optimal weight, reported separately for simulations
+             }
 
-        The obspercell() method calculates the factor that, when multiplied
-        by the EAR (or p * (1 - p) in the case of logits), returns the
-        standard error, e.g.:
-        
-            obspercell_factor = nfacs / sqrt(sqrt(nrows / ndims - 1) * 
-                                            sqrt(ncols / ndims - 1))
-            
-            SE = obspercell_factor * EAR
-        
-        With polytomous data, the nrows and ncols variables are replaced by 
-        variables that take into account the number of rating scale "steps" 
-        per cell (each additional step is like an additional observation):
+    Comments
+    --------
+        The get_unique_weight() function is used only to support
+        the Damon.sub_coord() method.  sub_coord() partitions the
+        variance in a target subspace into three categories:
+
+            a)  p_comm: the target variance explained by the predictor
+                subspace, i.e., the variance in common between the
+                predictor and target data.
+
+            b)  p_unique: the target variance explained by those
+                dimensions that are unique to the target subspace.
+
+            c)  noise: the remaining variance explained by random
+                noise.
+
+        sub_coord() calculates separate R coordinates for the
+        p_comm and p_unique dimensions.  In the absence of noise,
+        the two sets of R coordinates can simply be appended to
+        each other to model the target data.  However, as noise
+        is added, the unique R coordinates are progressively
+        degraded and should therefore be downweighted.  get_unique_weight()
+        is used to estimate the downweight.
+
+        (Note that p_comm always receives full weight.  Only p_unique
+        is downweighted.)
+
+        The downweighting formula is:
+
+            p_uni_comm = p_unique / (p_unique + p_comm)
+            unique_weight = sqrt(reliability * p_uni_comm)
+
+        Thus, the more reliable the analysis of the unique component
+        of the data, and the more pronounced the effect of the unique
+        component on the data, the higher the unique weight (maximum
+        of 1.0, minimum of 0.0).  As either reliability goes to zero,
+        or the role of p_unique goes to zero, the unique weight goes
+        to zero.
+
+        Reliability is based on Damon-analyzing the residuals array
+        obtained by subtracting out the estimates obtained by applying
+        the predictor R coordinates to the target data.  It is sensitive
+        to the count of data points and the amount of noise.
+
+    Arguments
+    ---------
+        "targ" is the target subspace label
+
+        -----------
+        "targ_obj" is the target portion of the dataset, formatted
+        as a Damon object and passed in by sub_coord()
+
+        -----------
+        "res_obj" is derived from the target residuals obtained by
+        subtracting the estimates computing using predictor R coordinates
+        from the observed data.  The target residuals arrays is
+        formatted as a Damon object and passed in by sub_coord()
+
+        -----------
+        "unique_weights" is the same as the unique_weights parameter
+        in the sub_coord() method.  Example:
+
+            unique_weights = {'sub0':'Auto', 'sub1':0.50}
+
+        -----------
+        "min_rel" is the same as the min_rel parameter in sub_coord().
+        It is the minimum below which the reliability will not go.
+
+        -----------
+        "rpt_optimal" is the same as the rpt_optimal parameter in
+        sub_coord() and specifies whether to report the optimal
+        parameter even when unique weights are manually specified.
+
+    Examples
+    --------
+
+        [under construction]
         
-            nrows becomes nrows * steps_per_cell across each column
-            ncols becomes ncols * steps_per_cell across each row
+    Paste Function
+    --------------
+        get_unique_weight(targ, # [<target subspace label>]
+                          targ_obj, # [<target subspace Damon object>]
+                          res_obj,  # [<target subspace residuals Damon object>]
+                          unique_weights,   # [<unique_weights param>]
+                          min_rel = 0.02,   # [<minimum reliability>]
+                          rpt_optimal = None    # [<None, True> => report optimal weight]
+                          )
+    """
+
+    out = {}
+
+    if (unique_weights[targ] != 'Auto' and rpt_optimal is not True):
+        out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
         
-        ncols has the additional complication that there may be multiple
-        possible steps per column if items have different rating scales.
-        
-        Counts for continuous scales are indeterminate.  In principle, they
-        contain an infinite number of steps; in practice, due to measurement
-        error, this number may be quite small and currently requires human 
-        judgement.  The max_chars character is used to set an upper bound 
-        reflecting the maximum number of "statistically distinct values" 
-        that a given response scale can support.
-        
-        Thus Damon replaces the familiar (1 / sqrt(n)) factor used in
-        traditional standard error formulas (multiplied by SD) with an 
-        elaborated factor that takes into account the number of facets, 
-        dimensions, rows, columns, and rating scale steps.  This
-        'obspercell_factor' is specific to NOUS.  
-        
-        'PickMinFac' or 'CombineFacs'
-        -----------------------------
-        'PickMinFac' tends to be more accurate than 'CombineFacs' with
-        smaller datasets where the ratio of observations to dimensions
-        is less than, say, 10.  However, with large datasets it will
-        tend to overestimate the standard error since it ignores
-        information contributed by one of the facets.
-
-        'CombineFacs' is more accurate with large data sets.  However, as the
-        ratio of observations to dimensions drops below, say, 10, it will tend
-        to a standard error that is too small.  The reason is that
-        in this situation (as the ratio of observations to dimensions
-        becomes small) Damon estimates become biased toward the
-        observations, resulting in an artificially low EAR and SE.
-        'CombineFacs' is probably the most mathematically correct, but
-        'PickMinFac' may be safer if you want to avoid false
-        positive significance tests with smaller datasets.
-        
-        Type of Output
-        --------------
-        If the observed data array contains missing values, the 
-        obspercell_factor and resulting standard error will vary across
-        cells.  In this case, the obspercell_factor is ideally an array
-        of values which gets multiplied elementwise by the EAR.  However, if
-        there are no missing values, obspercell_factor reduces to a single
-        number since each cell is associated with the same number of data
-        values.  Sometimes, it is convenient to calculate just the single
-        number, even if there are some missing values, e.g., when the relevant
-        observed array is not available.  This behavior is controlled by the
-        "out_as" parameter, which also supports scenarios where you know
-        the number of missing cells for one facet but need to assume a
-        complete array for the opposing facet.
-        
-        Parsed Data
-        -----------
-        When using Damon's parse() function (you probably shouldn't),
-        the "obs" parameter can refer to self.parse_out['coredata'].
-        Since, this (probably) causes the number of independent items to be 
-        overestimated, you may want to adjust the "p_items" parameter
-        downward to equal (ncols_orig_obs / ncols_parsed).  In general,
-        the statistical implications of parsing data are poorly understood,
-        so use parse() with caution.
-               
-    Arguments
-    ---------
-        "obs" <None, array>, is the pre-estimate data used to calculate counts 
-        of observations and to determine unique valid characters in each 
-        row and/or column, subject to the maximum given in max_chars.  It is
-        also used to determine which cells are missing and how many valid
-        data values are brought to bear on any given cell.
-        In anchored designs, it is the data array for the current Damon
-        object. The size of the historical data array used to calculate the 
-        anchors must also be taken into account, and this is handled through
-        the by_rows and by_cols parameters.  
-             
-            obs = observations      =>  An array of observations
-            
-            obs = None              =>  No observations are available. Specify
-                                        array dimensions in by_rows and by_cols.
-            
-        ----------
-        "by_rows" specifies how to get the number of columns per row and can
-        either be set explicitly (e.g., for anchored designs) or by referring
-        to the "obs" array (if it exists).
-        
-            by_rows = 'obs'         =>  Get the number of columns from the
-                                        observed array.
-            
-            by_rows = 100           =>  Each row is associated with 100
-                                        columns.
+    else:
+        ndim = res_obj.coord_out['ndim']
+        nitem = np.size(res_obj.coredata, axis=1)
 
-        ----------
-        "by_cols" specifies how to get the number of rows per column and can
-        either be set explicitly (e.g., for anchored designs) or by referring
-        to the "obs" array (if it exists).
-        
-            by_cols = 'obs'         =>  Get the number of rows from the
-                                        observed array.
-            
-            by_cols = 1000          =>  Each column is associated with 1000
-                                        rows.
+        if nitem <= ndim:
 
-        ----------
-        "out_as" specifies how to output the obspercell_factor, whether as
-        a single number or as a type of array.  The selection is based on
-        the availability of the observed data array and the prevalence of
-        missing data.
+            if unique_weights[targ] == 'Auto':
+                exc = 'Too few items to estimate a unique weight for subspace'+targ+'. Specify a unique weight in sub_coord().\n'
+                raise get_unique_weight_Error(exc)
+            else:
+                out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
+                return out
         
-            out_as = 'num'          =>  Return obspercell_factor as single
-                                        number (which can then be multiplied
-                                        by the EAR array to obtain the SE
-                                        array). This yields valid results to
-                                        the degree the observed array is
-                                        complete but can be calculated 
-                                        regardless.
+        nanval = targ_obj.nanval
         
-            out_as = 'arr'          =>  Return as a 2-D array whose shape is
-                                        controlled using by_rows and by_cols and
-                                        which presumably matches the shape of
-                                        the EAR array.
-            
-            out_as = 'row'          =>  Return a 1-D array whose length
-                                        corresponds to the row length (i.e.,
-                                        number of columns).  This assumes
-                                        variation in missing per column but
-                                        not by row.  This option is not likely
-                                        to be used much.
+        # Get standard errors
+        res_obj.base_est()
+        res_obj.base_resid()
+        res_obj.base_ear()
+
+        try:
+            res_obj.base_se(obspercellmeth='PickMinFac')
+        except damon1.utils.base_se_Error:
+            out = {'unique_weight':unique_weights[targ], 'optimal_weight':None}
+            return out
             
-            out_as = 'col'          =>  Return a 1-D array whose length 
-                                        corresponds to the column length (i.e,
-                                        number of rows). This assumes variation
-                                        in missing per row but not by column.
-                                        This is the default in equate()'s
-                                        construct measures.
+        # Get reliability
+        rmse = rmsr(None, None, res_obj.base_se_out['coredata'], nanval)
+        rel = reliability(None,
+                          estimates = res_obj.base_est_out['coredata'],
+                          sterr = rmse,
+                          nanval = nanval
+                          )
         
-        ----------
-        "ndim" is an integer describing the dimensionality used
-        to compute the Damon estimates.  It can be found at:
-
-            my_obj.coord_out['ndim']
+        rel = max(min_rel, rel)
 
-        ----------
-        "facs_per_ent" is used to specify the number of "unanchored"
-        facets used in the calculation of either row entities or column
-        entities, for use in the standard error formula.
+        # Variance explained by common and unique dimensions, one pass
+        ests = np.array([targ_obj.base_est_out['coredata'],
+                         res_obj.base_est_out['coredata']])
+        p_comm, p_unique = correl_slices(targ_obj.coredata, ests, nanval)**2
 
-        Syntax:  [facet, n unanchored facets per entity]
+        # Unique variance as proportion of non-noise variance
+        p_uni_comm = p_unique / (p_unique + p_comm)
 
-            facs_per_ent = [1,2]
-                            =>  For facet 1 (columns), all items
-                                were calculated with both the row
-                                and column entities unanchored.
+        # Calculate optimal weight
+        unique_weight_ = np.sqrt(p_uni_comm * rel)
 
-            facs_per_ent = [1,1]
-                            =>  For facet 1 (columns), all items
-                                were calculated with row coordinates
-                                anchored.  Only one set of coordinates
-                                (columns) was unanchored.
+        if unique_weights[targ] != 'Auto':
+            out['unique_weight'] =  unique_weights[targ]
+        else:
+            out['unique_weight'] = unique_weight_
 
-            facs_per_ent = [0,1]
-                            =>  For facet 0 (rows), all persons were
-                                calculated with column coordinates
-                                anchored.  Only one set of coordinates
-                                (rows) was unanchored.
+        out['optimal_weight'] = unique_weight_
 
-            facs_per_ent = [1,[2,2,2,1]]
-                            =>  For facet 1 (columns), there are four
-                                items.  The first three were calculated
-                                with two sets of unanchored coordinates
-                                (rows and columns).  The fourth item
-                                was calculated with only one set
-                                of unanchored coordinates (columns).
+    return out
 
 
-        ----------
-        "count_chars" <bool, int, [ints]> tells how to count the
-        number of observed values that are possible per cell, up to 
-        the number given by max_chars.
-        
-            count_chars = False     =>  The data are assumed dichotomous (two
-                                        characters per cell)
-            
-            count_chars = True      =>  Get the character counts by looking at 
-                                        a sample of rows (the first 100) in
-                                        the "obs" array.  This assumes obs
-                                        is an array.
-            
-            count_chars = 3         =>  All cells (for each column) have three
-                                        characters per cell.
-            
-            count_chars = [4, 2, 3] =>  In a three column array, the first 
-                                        column has four characters per cell,
-                                        the second two, the third three.
-                                        If data are continuous, specify a high
-                                        integer; "max_chars" will clip it down
-                                        to size.
-                                       
-        ----------
-        "max_chars" <int> is the maximum number of valid characters per
-        cell and sets an upper boundary on count_chars.  It was created
-        to deal with continuous data for which the number of valid characters 
-        is in principle infinite.  In practice, though, it seems like
-        max_chars = 2 is what works best for all data types.
-        
-            max_chars = 2           =>  The number of valid characters is 
-                                        capped at 2 for all item types.
-            
-        ----------
-        "p_items <None, float> makes it possible to override the
-        count of columns * steps in estimating the number of "independent 
-        items".  Damon's standard error statistic assumes that each item is 
-        statistically independent, but sometimes there are dependencies 
-        between items that violate this assumption, causing the standard 
-        errors to be too low. "p_items" offers a manual override.
-        
-            p_items = None (default)
-                            =>  Get the item count from the number of
-                                columns in "obs" * the number of steps
-            
-            p_items = 0.75
-                            =>  Force the item count to be 
-                                0.75 * n columns * n steps
-            
-        ----------
-        "meth" specifies which procedure to use, 'PickMinFac' or
-        'CombineFacs'.  See comments above.
 
-        ----------
-        "nanval" is the not-a-number value.
-        
-    Examples
-    --------
 
+###########################################################################
 
-    Paste function
-    --------------
-        obspercell(obs, # [<None, obs array> ]
-                   by_rows = 'obs',   # [<'obs', ncols> => for obs counts by row]
-                   by_cols = 'obs',  # [<'obs', nrows>] => for obs counts by col]
-                   out_as = 'arr', # [<'arr', 'row', 'col', 'num'> => output shape]
-                   ndim = 2,    # [<int> dimensionality of estimates]
-                   facs_per_ent = [1, 2],    # [<[<0,1>,<1,2,[1,1,2,...]]> => facet and number of unanchored facets per entity]
-                   count_chars = True,   # [<bool, int, [ints]> => count n unique characters per cell]
-                   max_chars = 2, # [<int>, maximum chars per cell]
-                   p_items = None, # [<None, float] => percent items independent]
-                   meth = 'CombineFacs', # [<'PickMinFac','CombineFacs'>]
-                   nanval = -999,   # [Not-a-Number value]
+def unbiascoord(V,   # [2-D single row or col coordinate vector to unbias, facet opposite from U]
+               invUTU_,   # [Output of invUTU_():  (UT * U)^-1]
+               U,   # [2-D U matrix]
+               h,   # [2-D array of h-statistics corresponding to U]
+               X,   # [2-D array of observations corresponding to U and B]
+               i,   # [Index of observation to be made missing]
+               facet,   # ['R' => U coordinates arranged as rows x dims; 'C' => U coordinates arranged as dims x cols]
+               ):
+    """Returns coordinates as if observation i were deleted.
+
+    Returns
+    -------
+        Returns coordinates as if observation i were deleted.
+
+    Comments
+    --------
+        The formula for the change in the coordinate caused
+        by the deletion of a missing observation is:
+
+        V - V[unbiased] = (UTU)^-1 * UT_i * Res_i / (1 - h_i)
+
+    Paste function
+    --------------
+        unbiascoord(V,   # [2-D single row or col coordinate vector to unbias, facet opposite from U]
+                   invUTU_,   # [Output of invUTU_():  (UT * U)^-1]
+                   U,   # [2-D U matrix]
+                   h,   # [2-D array of h-statistics corresponding to U]
+                   X,   # [2-D array of observations corresponding to U and B]
+                   i,   # [Index of observation to be made missing]
+                   facet,   # ['R' => U coordinates arranged as rows x dims; 'C' => U coordinates arranged as dims x cols]
                    )
 
     """
+    # Define variables
+    if facet == 'C':
+        V = np.transpose(V)
+        invUTU_ = np.transpose(invUTU_)
+        U = np.transpose(U)
+        h = np.transpose(h)
+        X = np.transpose(X)
 
-    def col_steps(obs, max_rows=100, nanval=-999):
-        "Get array of possible steps by col."
-        
-        samp_rows = min(np.size(obs, axis=0), max_rows)
-        samp = obs[:samp_rows, :]
-        ncols = np.size(obs, axis=1)
-        n_steps = []
-        
-        for i in range(ncols):
-            col = samp[:, i]
-            col = col[col != nanval]
-            n_unique = min(max(2, len(np.unique(col))), max_chars)
-            n_steps.append(n_unique - 1)
-        
-        return np.array(n_steps)
-    
-    nanvalf = float(nanval)
+    # Compute residuals
+    E = np.dot(U,V)
+    Res_i = (X - E)[i,:]
 
-    # Figure out if facets are anchored.  TODO: Not all cases thought through.
-    anc = None
-    if facs_per_ent == [0, 1]:
-        anc = 1
-    elif facs_per_ent == [1, 1]:
-        anc = 0
+    # Get U transpose element
+    UT_i = np.transpose(U)[:,i][:,np.newaxis]
+
+    # Get h element
+    h_i = h[i,:]
+
+    # Compute change in U resulting from deleting datum i
+    DeltaV = (np.dot(invUTU_,UT_i) * Res_i) / (1 - h_i)
+    V_Unbiased = V - DeltaV
+
+    # Orient solution vector
+    if facet == 'R':
+        V_Unbiased = V_Unbiased
+    elif facet == 'C':
+        V_Unbiased = np.transpose(V_Unbiased)
+
+    return V_Unbiased
+
+
+
+
+###########################################################################
+def estimate(fac0coord, # [N x D array of N row coordinates in D dimensions]
+             fac1coord, # [I x D array of I column coordinates in D dimensions]
+             nanval,    # [float Not-a-Number Value => marks missing coordinate values]
+             ):
+    """Returns cell estimates based on row and column coordinates.
+
+    Returns
+    -------
+        array of estimates corresponding to the dot product of
+        the coordinates for facet 1 (rows) and facet 2 (columns).
+
+    Comments
+    --------
+        These estimates are biased in the direction of the
+        observation for small datasets.  For estimates that
+        are "objective", i.e., equivalent to the estimate
+        achieved by making its observation missing, use
+        unbiasest() or objectify().  However, estimate()
+        is the official way to compute estimates from
+        coordinates.
+
+    Arguments
+    ---------
+        "fac0coord" is an N row entities x D dimensions
+        array of coordinates.
+
+        ----------
+        "fac1coord" is an I column entities x D dimensions
+        array of coordinates.
+
+        ----------
+        "nanval" is the Not-a-Number value.
+
+
+    Paste function
+    --------------
+        estimate(fac0coord, # [N x D array of N row coordinates in D dimensions]
+                 fac1coord, # [I x D array of I column coordinates in D dimensions]
+                 nanval,    # [float Not-a-Number Value => marks missing coordinate values]
+                 )
+
+    """
+    # Calculate dot product (includes NaNVals in calculation)
+    Est = np.dot(fac0coord,np.transpose(fac1coord))
+
+    # Get locations of missing coordinates
+    F0NaN_Loc = np.where(fac0coord == nanval)[0]
+    F1NaN_Loc = np.where(fac1coord == nanval)[0]
+
+    # Apply NaNVals to rows with missing coordinates
+    Est[F0NaN_Loc] = nanval
+
+    # Apply NaNVals to cols with missing coordinates
+    EstT = np.transpose(Est)
+    EstT[F1NaN_Loc] = nanval
+    Est = np.transpose(EstT)
+
+    return Est
+
+
+
+###########################################################################
+
+def estimate_error(err, # [<datadict> => abs residual, ratio errors]
+                   err_type, # [<'ear', 'se'> => type of coordinates to get]
+                   anchors # [coord() anchor parameters to use]
+                   ):
+    """Use 2-d Damon to estimate ratio EAR and SE statistics.
     
-    # Sort out number of cols
-    if by_rows == 'obs':
-        if obs is not None:
-            ncols = np.size(obs, axis=1)
-        else:
-            exc = 'obs cannot be None if by_rows is "obs".'
-            raise obspercell_Error(exc)
-    else:
-        ncols = by_rows
+    Returns
+    -------
+        estimate_error() returns a datadict of expected EAR
+        or SE statistics that also contains EAR or SE 2-d log
+        coordinates for use in anchored designs.
     
-    # Sort out number of rows
-    if by_cols == 'obs':
-        if obs is not None:
-            nrows = np.size(obs, axis=0)
-        else:
-            exc = 'obs cannot be None if by_cols is "obs".'
-            raise obspercell_Error(exc)
-    else:
-        nrows = by_cols
+    Comments
+    --------
+        estimate_error() is used in base_ear() to convert
+        absolute residuals into expected absolute residuals (EAR),
+        with coordinates.  In base_se(), it is used to obtain
+        SE coordinates, which take into account the number of
+        observations associated with each cell, and slightly
+        refined SE cell estimates.
         
-    # Percentage of item/steps to treat as independent
-    if p_items is None:
-        p_items = 1.0
-
-    # count_chars to array
-    if isinstance(count_chars, list):
-        count_chars = np.array(count_chars)
+        The estimation itself is done by applying Damon.coord()
+        not to the array of observations but (for the EAR calculation) 
+        to the array of squared residuals: (observations - estimates)**2.
+        This in principle requires a 1-dimensional analysis of ratio
+        scale data (since squared residuals have a hard floor of zero).
+        However, Damon's ALS algorithm, which assumes interval data and
+        homoscedastic errors, has trouble with this type of data.  
         
-    # Define facs_per_ent 
-    # TODO: the interaction of facets with error is still not clear, e.g.,
-    # should cells in an anchored design be 1 or 2, or something in between?
-    # sub_coord() seems to need entity level facets, but that's unclear.
-    # Here, if there is anchoring, nfacs is 1, otherwise 2.
-    
-    if isinstance(facs_per_ent[1], np.ndarray):
-        if 2 in facs_per_ent[1]:
-            nfacs = 2
-        else:
-            nfacs = 1
-    else:
-        nfacs = facs_per_ent[1]
+        Therefore, estimate_error() first takes the log of the data, 
+        converting it to interval data with homescedastic errors. However,
+        if E = R * C, then log(E) = log(R) + log(C). Each cell datum
+        is now modeled as a SUM of coordinates rather than a product. To 
+        analyze with ALS we need to introduce a second dimension, imagining
+        for a given cell that:
             
-    # Get row_count, col_count as integers, assumes common rating scale
-    # row_count => based on n rows; col_count => based on n cols
-    if out_as == 'num':
-        if count_chars is True:
-            if obs is not None:
-                c_steps = col_steps(obs, 500, nanval)
-                col_count = np.sum(c_steps)
-                row_count = np.mean(c_steps) * np.size(obs, axis=0)
-            else:
-                exc = 'obs cannot be None if count_chars is True.'
-                raise obspercell_Error(exc)
+            r = log(R), c = log(C)
+            R_ = [r, 1]
+            C_ = [1, c]
+            E_ = dot(R_, C_) = r*1 + 1*c = log(R) + log(C)
+           
+        Since the cells are now modeled as a sum of products across 
+        dimensions, Damon's ALS algorithm is now applicable.  And since
+        we aren't interested in the values of r and c, but just the
+        dot products, there is no need for any coordinates to be fixed at
+        a value of 1.  Any two dimensional solution that fits the data
+        will suffice.  Thus, we analyze the log(data) with a 2-dimensional
+        model, and in the absence of noise will model it exactly.
         
-        # Assume dichotomous -- one step
-        elif count_chars is False:
-            col_count = ncols  # * 1  
-            row_count = nrows # * 1
+        To convert the estimates from the log metric back to the original
+        ratio metric, we take the exponent:
+            
+            E = exp(E_)
         
-        # Use specified int character count
-        elif isinstance(count_chars, int):
-            col_count = ncols * min(count_chars - 1, max_chars - 1)
-            row_count = nrows * min(count_chars - 1, max_chars - 1)
-        
-        # Use specified array of character counts
-        elif isinstance(count_chars, np.ndarray):
-            col_count = np.sum(count_chars - 1)
-            row_count = nrows * np.mean(count_chars - 1)
-            
-    # Get row_count and col_count as arrays
-    elif out_as in ['row', 'col', 'arr']:
-        
-        # Build counts array assuming no missing
-        counts_ = np.zeros(np.shape(obs))
-        if count_chars is True:
-            c_steps = col_steps(obs, 500, nanval)
-            counts = counts_ + c_steps
-        elif count_chars is False:
-            counts = counts_ + 1
-        elif isinstance(count_chars, int):
-            counts = counts_ + min(count_chars, max_chars)
-        elif isinstance(count_chars, np.ndarray):
-            counts = counts_ + count_chars
-            counts = np.clip(counts, 0, max_chars)
-
-        # Deal with missing where desired
-        counts_no_nan = counts
-        counts_ma = npma.masked_array(counts, mask=(obs == nanval), 
-                                      fill_value=nanvalf)       
-        
-        if out_as == 'arr':
-            col_count = np.sum(counts_ma, axis=1).filled(nanvalf)
-            row_count = np.sum(counts_ma, axis=0).filled(nanvalf)            
-        elif out_as == 'col':
-            col_count = np.sum(counts_ma, axis=1).filled(nanvalf)
-            row_count = np.sum(counts_no_nan, axis=0)
-        elif out_as == 'row':
-            col_count = np.sum(counts_no_nan, axis=1)
-            row_count = np.sum(counts_ma, axis=0).filled(nanvalf)
-            
-    # Calculate obspercell_factor as int    
-    if out_as == 'num':
-        if meth == 'PickMinFac':
-            if nrows > ncols:
-                denom = np.sqrt(col_count * p_items / ndim - 1)
-            else:
-                denom = np.sqrt(row_count / ndim - 1) if anc != 1 else 1        
-            opc_fact = nfacs[0] / denom
-    
-        elif meth == 'CombineFacs':
-            dnm_0 = np.sqrt(row_count / ndim - 1) if anc != 1 else 1
-            dnm_1 = np.sqrt(col_count * p_items / ndim - 1) if anc != 0 else 1
-            opc_fact = nfacs[0] / np.sqrt(dnm_0 * dnm_1)
-
-    # Calculate obspercell_factor as array                  
-    elif out_as == 'arr':
-        one_0 = np.repeat(1.0, ncols)
-        dnm_0 = np.sqrt((row_count / ndim) - 1) if anc != 1 else one_0
-        one_1 = np.repeat(1.0, nrows)
-        dnm_1 = np.sqrt((col_count * p_items / ndim) - 1) if anc != 0 else one_1
+        However, as E will not fit optimally to the original residuals 
+        array, it is "refit" to the squared residuals array using numpy's
+        poly1fit() function, with degree 1 or 2.  Then the square root
+        is taken.
+         
+        What this means for Damon is that: 
             
-        row_fact = (1 / dnm_0)[np.newaxis, :]
-        col_fact = (1 / dnm_1)[:, np.newaxis]
-
-        if meth == 'CombineFacs':
-            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
-                
-        elif meth == 'PickMinFac':
-            if nrows > ncols:
-                row_fact = np.ones((1, ncols))
-                opc_fact = nfacs * (row_fact * col_fact)
-            else:
-                col_fact = np.ones((nrows, 1))
-                opc_fact = nfacs * (row_fact * col_fact)
-
-        # Clean up bad cells
-        opc_fact[:, row_count == nanvalf] = nanvalf
-        opc_fact[col_count == nanvalf, :] = nanvalf
-    
-    elif out_as == 'col':
-        one_1 = np.repeat(1.0, nrows)
-        col_fact = 1 / np.sqrt(col_count * p_items / ndim - 1) if anc != 0 else one_1
-        
-        row_count_mean = np.mean(row_count)
-        row_fact = 1 / np.sqrt(row_count_mean / ndim - 1) if anc != 1 else 1
+            1)  observed residuals must first be converted to logs
+            2)  the resulting coordinates will be 2-dimensional
+            3)  in equate() and summstat(), after summing coordinates,
+                one takes the exponent of any dot products.
         
-        # facet count:  index error triggers choice.  Hacky and wrong.
-        if meth == 'CombineFacs':
-            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
-        elif meth == 'PickMinFac':
-            if nrows > ncols:
-                try:
-                    opc_fact = nfacs * col_fact
-                except ValueError:
-                    opc_fact = nfacs[0] * col_fact
-            else:
-                try:
-                    opc_fact = nfacs * row_fact 
-                except ValueError:
-                    opc_fact = nfacs[0] * row_fact
+        So much for the theory.  In practice, when doing simulations,
+        the "optimal" dimensionality is often 1, depending on how
+        the noise is balanced across the two facets and how various
+        the expected noise is per facet.  When the expected noise
+        is equivalent per cell, the analysis is more or less equivalent
+        to analyzing an array of random numbers and objectivity is
+        very low, regardless of dimensionality.  When there is a
+        reasonable amount of noise and the noise varies across entities,
+        the 2-dimensional solution tends to be optimal.  If one of the 
+        facets dominates in variation of expected noise, the 1-dimensional 
+        solution tends to be optimal.
         
-        # Clean
-        opc_fact[col_count == nanvalf] = nanvalf
+        For consistency of approach, Damon applies the 2-dimensional
+        solution in all cases.
         
-    elif out_as == 'row':
-        one_0 = np.repeat(1.0, ncols)
-        row_fact = 1 / np.sqrt(row_count / ndim - 1) if anc != 1 else one_0
+    Parameters
+    ----------
+        "err" is a datadict of either absolute residuals, EARs, or
+        SEs -- any set of uniform ratio data with a theoretical 
+        minimum of zero.
         
-        col_count_mean = np.mean(col_count)
-        col_fact = 1 / np.sqrt(col_count_mean / ndim - 1) if anc != 0 else 1
+        -------
+        "err_type" signifies the type of error we're estimating.
         
-        if meth == 'CombineFacs':
-            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
-        elif meth == 'PickMinFac':
-            if nrows > ncols:
-                opc_fact = nfacs * col_fact
-            else:
-                opc_fact = nfacs * row_fact
+            err_type = 'ear'    =>  The "err" parameter is absolute
+                                    residuals and we are estimating
+                                    EAR statistics.
+            
+            err_type = 'se'     =>  The "err" parameter is standard
+                                    errors and we are calculating
+                                    SE coordinates and refining the
+                                    SE estimates further.
+         
+        -------
+        "anchors" is the dictionary of parameters to use for coord()'s
+        anchor parameter in anchored designs.  When the primary analysis
+        refers to an item bank to get anchored coordinates for one of
+        the facets, coord() assigns the anchor parameter to the Damon
+        object.  Otherwise it doesn't.  To obtain the anchors parameter,
+        use something like:
+            
+            try:
+                coord_anc = self.coord_out['anchors']
+            except AttributeError:
+                coord_anc = None
         
-        # Clean
-        opc_fact[row_count == nanvalf] = nanvalf
+            out = tools.estimate_error(abs_resid, 'ear', coord_anc)
     
-    # Final cleaning
-    opc_fact = np.where(np.isnan(opc_fact) | np.isinf(opc_fact),
-                        nanvalf,
-                        opc_fact)
+    Paste Function
+    --------------
+        estimate_error(err, # [<datadict> => abs residual, ratio errors]
+                       err_type, # [<'ear', 'se'> => type of coordinates to get]
+                       anchors # [coord() anchor parameters to use]
+                       )
     
-    return opc_fact
+    """
+    # square the err
+    nanval = err['nanval']
+    err2 = np.where(err['coredata'] == nanval, nanval, err['coredata']**2)
+    err['coredata'] = err2
+       
+    lab = {'ear':'ear_coord', 'se':'se_coord'}
+    err_type = lab[err_type]
+
+    if anchors is not None:
+        anc = {}
+        for key in anchors.keys():
+            anc[key] = anchors[key]
+        anc['Coord'] = err_type
+    else:
+        anc = None
+               
+    # Estimate cell variance
+    err_ = dmn.core.Damon(err, 'datadict', 'RCD', verbose=False)
+    
+    try:
+        err_.standardize('LogDat')
+    except:
+        pass
+        
+    err_.coord([[2]], seed=1000, anchors=anc)
+    err_.base_est()
     
+    # Refit estimates
+    nanval = err_.base_est_out['nanval']
+    deg = 1  # deg = 2 can lead to neg values
+    res = err['coredata']
+    est = np.exp(err_.base_est_out['coredata'])
+    ix = (res != nanval) & (est != nanval)    
+    x = np.polyfit(est[ix], res[ix], deg)
+    refit = np.poly1d(x)
+    y = np.clip(refit(est), 0.0001, np.inf)**0.5
+
+    y[(est == nanval)] = nanval
+    y[np.isnan(y) | np.isinf(y)] = nanval
+
+    out = {}
+    for key in err_.base_est_out.keys():
+        out[key] = err_.base_est_out[key]
+
+    out['coredata'] = np.where(y == nanval, nanval, y)      
+    out[err_type] = err_.coord_out
+    out['refit'] = refit
+
+    return out
 
 
 
 ###########################################################################
 
-def pq_resid(est,     # [array of prelogit-based estimates]
-             resid,   # [None, raw residuals]
-             colkeys = None,    # [<None, 1-D array of column keys>]
-             ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]
-             ear = None, #[<None, float, ear array]
-             new_logits = False, #[<True, False>]
-             validchars = ['All', [0, 1]],
-             nanval = -999. # [not-a-number value]
-             ):
+def resp_prob(entcore,    # [nrows x nRespCats-1 2D array of probabilities corresponding to a given column entity]
+              resp_cats,   # [list of valid response integers in increasing order less the minimum possible integer, or list of alpha responses]
+              return_ = ['Exp'],     # [<[None,'Extr','Exp','Pred','Probs','ExtrSD','ExpSD','PredSD','ProbsSD']> => list desired]
+              resp2extr = None,  # [<None, ['a','c'] => responses whose probability to extract>]
+              extr_est = None,    # [<None,True> => extract from entcore instead of probs]
+              pred_key = None,   # [<None,{'a':0,'b':1,...}> => dict relating string responses to ints]
+              pred_alpha = None, # [<None,True> => report predicted alpha character]
+              metric = 'nominal',   # [<'ordinal','nominal'>]
+              dropcol = None,  # [<None,True> => drop lead column of ordinal probabilities]
+              nanval = -999., # [float Not-a-Number value]
+              ):
     """
-    Adjust size of residuals/EARs for dichotomous or polytomous data.
-    
     Returns
     -------
-        A dict:
-            {'new_resid':__, 
-            'new_logit':__}
-            
-        where 'new_resid' is an array of residuals corrected for
-        distortions caused by dichotomous or polytomous responses
-        and 'new_logit' is an optional replacement of the prelogit-based
-        estimates with logits that are compatible with the specified
-        ear array.
-        
+        A dictionary of nRow x nResp arrays relating to
+        the probabilities of a set of responses for a
+        given entity under an ordinal and a nominal model:
+
+        {'Extr',     =>  Probability of resp2extr response
+        'Exp',      =>  Expected value
+        'Pred',     =>  Predicted value
+        'Probs',    =>  Probabilities of all responses
+        'ExpSD',    =>  Standard deviation of expected value
+        'pred_key'   =>  pred_key parameter {'a':0,'b':1,...}
+        'PredProb'  =>  Tuples with 'Pred' response and probability:
+                        [('a',0.52),('b',0.34),...]
+        }
+
+        Note:  To get a list of just the responses in their
+        original format, or just the probabilities, use:
+
+        Responses = [tup[0] for tup in Out['PredProb']]
+        RespProbs = [tup[1] for tup in Out['PredProb']]
+
+        where Out is the name given the resp_prob() outputs.
+
+
     Comments
     --------
-        When analyzing interval data, one expects the residuals between
-        observations and true values to be the same on average across 
-        the scale.  This assumption does not hold when the data are
-        dichotomous or polytomous (less of a problem).  This is because,
-        in the dichotomous case, when the "true" (eg "model") values are
-        near the center of the scale (say 0.50), their residuals relative
-        to the observed values (0 or 1) will be too large.  The reverse
-        is true when the "true" values are at the extremes.  Since the
-        estimates track the true values (more or less), the distortion
-        ripples through to the residuals, expected absolute residuals,
-        standard errors, and all derivative statistics.
-                
-        To correct the distortion, this function adjusts the residuals by 
-        dividing by their binomial variance:
-        
-            new_resid = resid / sqrt(pq)
-        
-        where p is calculated from the prelogit-based estimates and
-        q = (1 - p).
-        
-        pq_resid() is also applied in base_se() to complete the calculation
-        of standard errors in this situation, but here the numerator
-        is not the raw residuals but 1.0.  Optionally, the numerator can
-        be an array of ears or any constant, controlled by the ear parameter.
-        
-        While the formula is targeted at dichotomous data, it seems to work
-        acceptably for polytomous data as well.  A proper polytomous
-        formula still needs to be derived.
-        
-        Mixed data designs (a mix of ordinal, interval, ratio data) are
-        supported.  The binomial correction is only applied to columns
-        that are found to be ordinal, based on the validchars parameter.
-        All other residuals are passed through unchanged.
-    
+        resp_prob(), used by the fin_est() method,
+        calculates the probability of obtaining each possible
+        response for a given person and column entity
+        and, optionally, combines these to calculate an
+        expected value for that person and column entity
+        or to predict the most likely response.
+
+        Note that resp_prob() is applied only to one column entity
+        at a time.
+
+        It is assumed that estimate() has been applied to
+        a dichotomous matrix formatted by parse() to reflect an
+        ordinal or nominal rating structure.  When data are ordinal
+        ratings (e.g., 0,1,2,3), parse() assigns each its own
+        column for a given entity and puts a 1 in each column that
+        corresponds to an integer that is less than or equal to
+        the actual observation.  Thus, a rating of 2 for an item
+        with four possible ratings (0,1,2,3) would be parsed into
+        four columns as follows (1,1,1,0).  Since the first column
+        is always 1 (all ratings are at least as large as 0), that
+        column is deleted before running through damon().
+
+        When data are nominal ('a','b','c'), parse() assign each
+        its own column and puts a 1 in only that column that
+        corresponds to the actual response.
+
+        The base_est() method converts the ones and zeros into
+        probabilities.  The problem (in the ordinal case) is these
+        are not the probability of obtaining a given rating but
+        the probability of meeting or EXCEEDING a given
+        rating.  To compute expected values, we need to convert
+        these "at or above" probabilities into just the probability
+        of obtaining the given rating.  That is what resp_prob()
+        does.  If the return_ argument is 'Exp', the new probabilities are
+        combined with the response integers to calculate an
+        expected response.
+
+        The formula is approximately as follows:
+
+            P[x = k] = P[x >= k] - P[x > k]
+                     = [base_est() output for k] - [base_est() output for k+1]
+
+        where x is the response and k is an integer response value.
+        Because the estimated probabilities are calculated independently
+        of each other, the base_est() outputs are first normalized so that
+        they exceed 1.0 (though they are allowed to sum to less than 1.0).
+        In addition, it is possible that, due to measurement error, the
+        probability of exceeding k + 1 might be greater than the probability
+        of exceeding k, which would result in a negative response probability.
+        All negative probabilities are automatically set to 0.0, which is
+        equivalent to saying that the category was skipped over, not used.
+
+        In this approach, the probability of getting a zero (the lowest
+        category) is one minus the sum of the remaining response
+        probabilities.  It is possible, even with normalization, for
+        the sum of the remaining response probabilities to be too high,
+        which will cause the probability of zero to be too low.  This is
+        an inescapable effect of ordinal binning, where it is not
+        possible to estimate the probability of the lowest category
+        except by inference.
+
+        Also, simply forcing negative response probabilities to be
+        0.0 is almost certainly not the optimal way of dealing with
+        the effects of random fluctuations.  However, a better way
+        has not been worked out.  In general, the more accurate the
+        base_est() estimates, the less problematic these issues are.
+
+        resp_prob() offers the option of computing standard deviations
+        for the various outputs.  The formula is based on the
+        binomial distribution:
+
+            SD = sqrt(sum[k -> K](k - Exp)^2 * p[k])
+
+        where the expected value is the sum of the categories times
+        their probabilities:
+
+            Exp = sum[k -> K](k * p[K])
+
+
     Arguments
     ---------
-        "est" is a 2-d array of estimates.  They must be in some form of
-        logit metric, presumably "prelogits".
-        
-        --------------
-        "resid" is a 2-d array of residuals between raw prelogit values
-        and their corresponding cell estimates.
-            
-            resid = None    =>  Do not adjust residuals. The function will
-                                refer to the "ear" parameter.
+        "entcore" is a damon()-calculated 2D array of columns
+        of (usually) probabilities corresponding to a given entity, each
+        column corresponding to a possible response.  However, it
+        is possible for entcore to be standardized estimates in
+        another metric if return_ = ['Extr'], in which case the
+        appropriate estimates, along with an index, are returned.
+
+        When metric = 'ordinal', the minimum possible response is
+        missing, as it is removed by the parse() function.  Thus, if Entity 1
+        has four possible ratings or response integers (0,1,2,3),
+        entcore will be the three columns of Entity 1 for the
+        1, 2, and 3 response integers, and the columns will consist
+        of person response probabilities obtained by running the parsed
+        dichotomous array through damon().
+
+        When metric = 'nominal', all the responses and their respective
+        probabilities will be present.
+
+        ---------------
+        "resp_cats" is a either a list of possible alpha responses (metric
+        = 'nominal) for a given column entity or it is a list of possible
+        integer esponses in increasing order, where the smallest
+        response integer is assumed to be missing and to be one unit
+        less than the minimum given in the list.  This is assumed
+        because, as mentioned, the smallest response integer column
+        is automatically deleted by the parse() function in order to
+        avoid feeding damon() a column consisting of all ones.  There
+        should be as many response integers as there are entity columns
+        in entcore.
+
+        ---------------
+        "return_" specifies a list of desired outputs:
+
+            return_ = [
+
+                'Probs' =>  return_ the probability of each response.
+
+                'Extr'  =>  Extract the probability of the response
+                            specified in resp2extr.
+
+                'Exp'   =>  return_ the expected value.
+
+                'Pred'  =>  return_ the predicted value in the form
+                            of an integer corresponding to the response
+                            with the highest probability.  Separate
+                            outputs incude the actual response and
+                            its probability, as well as the response:
+                            integer pred_key dictionary.
+
+                'ProbsSD'=> return_ the standard deviation of the
+                            probabilities
+
+                'ExpSD' =>  return_ the standard deviation of the
+                            expected value.
+
+                'ExtrSD'=>  return_ the standard deviation of the
+                            extracted value.
+
+                'PredSD'=>  return_ the standard deviation of the
+                            largest probability.
+
+                        ]
+
+            return_ = ['Exp','Pred','ExpSD']
+                        =>  Returns a dictionary containing arrays
+                            for 'Exp' and 'Pred', as well as for the
+                            standard deviation of 'Exp', the remainder
+                            being None.
+
+        ---------------
+        "resp2extr" tells the function which response probabilities
+        to report if return_ = 'Extr'.
+
+            resp2extr = None    =>  'Extr' not in return_
+
+            resp2extr = ['a','b']
+                                =>  'Extr' probabilities for responses
+                                    'a' and 'b' for this entity.
+
+        ---------------
+        "extr_est" <None,True> tells the function to extract the
+        estimates directly from entcore rather than their
+        corresponding probabilities.  This option is only
+        allowed when the data are nominal.
+
+        ---------------
+        "pred_key" assigns each response to an integer, so that
+        when 'Pred' is specified and the responses are alpha
+        they can be treated as numbers and share an array with
+        other numerical outputs.  (Numpy requires all data to be
+        of one type.)  Options:
+
+            pred_key = None  =>  'Pred' is not specified in return_.
+
+            pred_key = {'a':0,'b':1,'f':2}
+                            =>  Response 'a' will be coded as 0,
+                                'b' will be coded as 1, and 'f' will
+                                be coded as 2.
+
+        A pred_key dictionary has to be filled out if 'Pred' is
+        specified in Returns.  resp_cat() returns 'pred_key'.
+
+        In additon, resp_prob() returns 'PredProb', a list of
+        (response,probability) tuples:  [('a',0.53),('b',0.34),...]
+
+        ---------------
+        "metric" specifies whether the response categories are
+        ordinal, treated as increasing integers, or whether they
+        are to be treated as nominal -- as unorderable responses.
+        Integers can be treated as nominal if desired. Options:
+
+            'ordinal'
+            'nominal'
+
+        Note:  'ordinal' assumes that the first (lowest) possible
+        category is missing from entcore and that they are sorted
+        from smallest to largest in entcore.  Both conditions are
+        met automatically by parse() outputs.
+
+        ---------------
+        "dropcol" <None,True>, if True, means do not report the
+        first column in a block of ordinal probabilities.  This
+        is to match the block of estimates produced with parsed
+        ordinal data, since parse() drops the lowest response
+        integer.
+
+        ---------------
+        "nanval" is the value chosen to indicate "not a number".
+
+
+    Examples
+    --------
+
+
+
+    Paste function
+    --------------
+        resp_prob(entcore,    # [nrows x nRespCats-1 2D array of probabilities corresponding to a given column entity]
+                  resp_cats,   # [list of valid response integers in increasing order less the minimum possible integer, or list of alpha responses]
+                  return_ = ['Exp']     # [<['Extr','Exp','Pred','Probs','ExpSD']> => list desired]
+                  resp2extr = None,  # [<None, ['a','c'] => responses whose probability to extract>]
+                  extr_est = None,    # [<None,True> => extract from entcore instead of probs]
+                  pred_key = None,   # [<None,{'a':0,'b':1,...}> => dict relating string responses to ints]
+                  metric = 'nominal',   # [<'ordinal','nominal'>]
+                  dropcol = None,  # [<None,True> => drop lead column of ordinal probabilities]
+                  nanval = -999., # [float Not-a-Number value]
+                  )
+
+    """
+
+    # Initialize Results dictionary
+    Results = {}
+    nrows = np.size(entcore,axis=0)
+    Results['pred_key'] = pred_key
+    Results['PredProb'] = None
+    NaNLoc = np.where(entcore == nanval)[0]
+    resp_cats = np.array(resp_cats)
+    entcore = np.where(np.logical_or(np.isnan(entcore),np.isinf(entcore)),nanval,entcore)
+
+    # Cast resp_cats
+    try:
+        resp_cats = resp_cats.astype(float).astype(int)
+    except ValueError:
+        if metric == 'ordinal':
+            print "Warning: tools.resp_prob() unable to cast response categories to integers.  Treating metric as 'nominal' and returning predictions.\n"
+            metric = 'nominal'
+            return_ = ['Pred' if x == 'Exp' else x for x in return_]
+            return_ = ['PredSD' if x == 'ExpSD' else x for x in return_]
+        else:
+            pass
+
+    # ordinal procedures
+    if metric == 'ordinal':
+
+        # Normalize entcore
+        RespCats_ = list(resp_cats)
+        ncols = len(resp_cats) + 1
+        LeadCol = np.ones((nrows,1))
+        TermCol = np.zeros((nrows,1))
+        FillEntCols = np.concatenate((LeadCol,entcore,TermCol),axis=1)
+        RespCats_.insert(0,RespCats_[0] - 1)
+        RespCatsArr = np.array(RespCats_,ndmin=2)
+        extr_est = None
+
+        # Calculate probabilities
+        Probx = np.zeros((nrows,ncols))
+        for i in xrange(1,ncols + 1):
+            Probx[:,-i] = FillEntCols[:,-i - 1] - FillEntCols[:,-i]
+
+        # Apply NaNVals
+        Probx = np.clip(Probx,0.0,1.0)
+        Probx[NaNLoc] = nanval
+
+    # nominal procedures
+    elif metric == 'nominal':
+        RespCatsArr = np.array(resp_cats,ndmin=2)
+        Probx = entcore
+
+        # Force probs to sum to 1.0
+        Sums = np.sum(Probx,axis=1)[:,np.newaxis]
+        Probx = Probx / Sums
+        Probx[NaNLoc] = nanval
+
+    # Get Probs
+    if 'Probs' in return_:
+        if dropcol is True:
+            Results['Probs'] = Probx[:,1:]
+        else:
+            Results['Probs'] = Probx
+    else:
+        Results['Probs'] = None
+
+    # Get Extr
+    if 'Extr' in return_:
+        RespLocs = []
+        for Resp in resp2extr:
+            if Resp not in resp_cats:
+                exc = 'Unable to find resp2extr value among response categories.\n'
+                raise resp_prob_Error(exc)
+            else:
+                Loc = np.where(RespCatsArr == Resp)[1][0]
+                RespLocs.append(Loc)
+
+        if extr_est is True:
+            Results['Extr'] = entcore[:,RespLocs]
+        else:
+            Results['Extr'] = Probx[:,RespLocs]
+
+        Results['ExtrIndex'] = RespLocs
+    else:
+        Results['Extr'] = None
+        Results['ExtrIndex'] = None
+
+    # Get Exp
+    if 'Exp' in return_:
+        if metric == 'nominal':
+            print 'Warning: Expected values cannot be calculated from nominal data. Reporting predicted value instead.\n'
+            Results['Exp'] = None
+        else:
+            Exp = np.sum(RespCatsArr * Probx,axis=1)[:,np.newaxis]
+            Exp[NaNLoc] = nanval
+            Results['Exp'] = Exp
+
+    else:
+        Results['Exp'] = None
+
+    # Get Pred
+    if ('Pred' in return_
+        or (metric == 'nominal'
+            and 'Exp' in return_
+            )
+        ):
+        PredIndex = [np.where(Row == np.amax(Row))
+                     for Row in Probx]
+
+        Pred0 = [resp_cats[PredIndex[i]][0]
+                           for i in range(nrows)]
+
+        # Convert alpha resp to ints for reporting
+        if pred_key is None:
+                ints = range(len(resp_cats))
+                pred_key = dict(zip(resp_cats,ints))
+
+        try:
+            Pred1 = np.array([pred_key[Pred0[i]] for i in range(len(Pred0))])[:,np.newaxis]
+        except KeyError:
+            Pred1 = np.array([pred_key[str(Pred0[i])] for i in range(len(Pred0))])[:,np.newaxis]
+
+        Pred1[NaNLoc] = nanval
+        Results['Pred'] = Pred1
+
+        # Get prediction probabilities and store in tuples
+        MaxProb = np.array([Probx[i][PredIndex[i]][0]
+                   for i in range(nrows)])[:,np.newaxis]
+        MaxProb[NaNLoc] = nanval
+        PredProb = [(Pred0[Row],MaxProb[Row][0]) for Row in range(nrows)]
+        Results['PredProb'] = PredProb
+
+        for i in NaNLoc:
+            PredIndex[i] = nanval
+
+        Results['PredIndex'] = PredIndex
+
+    else:
+        Results['Pred'] = None
+        Results['PredProb'] = None
+
+
+    #####################
+    # Define function to get SD from probabilities
+    def getsd(p):
+        q = 1.0 - p
+        SD = np.sqrt(p * q)
+        SD[NaNLoc] = nanval
+        return SD
+
+    # Get ProbsSD
+    if 'ProbsSD' in return_:
+        try:
+            p = Results['Probs']
+        except KeyError:
+            exc = "Must specify 'Probs' if specifying 'ProbsSD'.\n"
+            raise resp_prob_Error(exc)
+
+        ProbsSD = getsd(p)
+
+        if dropcol is True:
+            Results['ProbsSD'] = ProbsSD[:,1:]
+        else:
+            Results['ProbsSD'] = ProbsSD
+    else:
+        Results['ProbsSD'] = None
+
+    # Get ExtrSD
+    if 'ExtrSD' in return_:
+        try:
+            p = Results['Extr']
+        except KeyError:
+            exc = "Must specify 'Extr' if specifying 'ExtrSD'.\n"
+            raise resp_prob_Error(exc)
+
+        ExtrSD = getsd(p)
+        Results['ExtrSD'] = ExtrSD
+    else:
+        Results['ExtrSD'] = None
+
+    # Get ExpSD (formula is fancier)
+    if 'ExpSD' in return_:
+        try:
+            Exp = Results['Exp']
+        except KeyError:
+            exc = "Must specify 'Exp' if specifying 'ExpSD'.\n"
+            raise resp_prob_Error(exc)
+        ExpSD = np.sqrt(np.sum(Probx * (RespCatsArr - Exp)**2,axis=1))[:,np.newaxis]
+        Results['ExpSD'] = ExpSD
+    else:
+        Results['ExpSD'] = None
+
+    # Get PredSD
+    if 'PredSD' in return_:
+        try:
+            p = MaxProb
+        except KeyError:
+            exc = "Must specify 'Pred' if specifying 'PredSD'.\n"
+            raise resp_prob_Error(exc)
+
+        PredSD = getsd(p)
+        Results['PredSD'] = PredSD
+    else:
+        Results['PredSD'] = None
+
+    return Results
+
+
+
+
+
+###########################################################################
+
+def residuals(observed, # [2D array of observed values]
+              estimates,    # [2D array of cell estimates]
+              psmsindex = None, # [<None, where()-style index of cells made pseudo-missing>]
+              nearest_val = None,     # [<None,'Nearest','Match'> => first convert estimate to nearest valid observed value]
+              ecut = None,  # [<None, [['All',ECut], ['Cols',[ECut1,ECut2,'Med',...]]> ]
+              nanval = -999.,   # [Not-a-Number value for cells missing in observed]
+              ):
+    """Get residuals between observed values and cell estimates.
+
+    Returns
+    -------
+        Numpy array of differences (observed - Estimated) between
+        an array of observations and a corresponding array of
+        cell estimates.  Missing values are assigned nanval.
+
+    Arguments
+    ---------
+        "observed" is a 2D RowEnt x ColEnt array of observations.
+        Missing values are marked by nanval.
+
+        ---------------
+        "estimates" is a 2D RowEnt x ColEnt array of cell estimates
+        corresponding to the observed values, generally the output
+        of running Damon's coord() and base_est methods.  Missing
+        values (which should be rare), are marked by nanval.
+
+        ---------------
+        "psmsindex" is an index of cells made missing when
+        calculating estimates but for which there exist valid values
+        in the observed array.  The index is formatted like the output of
+        Numpy's where() function and is created using the
+        Damon.pseudomiss() method.
+
+        ---------------
+        "nearest_val" instructs the function to "round" or convert each
+        estimate to the nearest valid value in observed before
+        calculating differences.  When nearest_val = 'Nearest', the
+        function first checks whether the observed values are continuous or
+        discrete; if continuous, the column is left alone.  Options:
+
+            nearest_val = None   =>  Do not adjust estimates; use
+                                    them as they are.  Treated as
+                                    None if ecut = None.
+
+            nearest_val = 'Nearest'
+                                =>  Adjust all estimates to their
+                                    nearest observed value.
+
+            nearest_val = 'Match'
+                                =>  return_ 1 where observed and
+                                    estimates are identical, 0
+                                    otherwise.  Works on string
+                                    alpha arrays.
+
+        nearest_val can be used in place of the ecut argument, and
+        may be a better idea when much of the data is not dichotomous.
+        When the data are dichotomous, nearest_val is equivalent to
+        ecut = ['All',0.5].  However, nearest_val is also much slower
+        than ecut, and with large datasets ecut and nearest_val should,
+        when the residuals are used to compute EARs, yield similar results,
+        though this requires further investigation.
+
+        ---------------
+        "ecut", used when converting estimates to probabilities or
+        logits, is the cut-point assigned to each column estimate (or the
+        whole array) to distinguish "success" from "failure".  If
+        an estimate is 3.6 and the ecut is 3.0, then the estimate
+        signifies "success".  When ecut is signified, residuals are
+        defined dichotomously regardless of the underlying metric.
+        If a cell observation and its estimate fall on the same side
+        of the cut-point, the residual is 0.  If they fall on opposite
+        sides, the residual is 1.  Thus, the resulting residuals are
+        only 0 and 1 -- no -1 -- and in this sense are not so much
+        residuals as absolute residuals.
+
+        Options:
+
+            ecut = None         =>  Do not compute dichotomous
+                                    residuals.  The nearest_val parameter
+                                    will be used instead.
+
+            ecut = ['All',0.50]
+                                =>  Assign the same ecut to all
+                                    columns.  That ecut is 0.50.
+
+            ecut = ['All','Med']
+                                =>  Assign the same ecut to all
+                                    columns.  That ecut is the median
+                                    of the whole array
+
+            ecut = ['Cols',[0.50,2.5,'Med',...]]
+                                =>  Assign the estimates in the first
+                                    column an ecut of 0.50.  Assign
+                                    the second column a 2.5.  Assign the
+                                    third an ecut equal to the median
+                                    estimate for that column.
+
+            ecut = ['Cols','Med']
+                                =>  Assign a different ecut to each
+                                    column, where ecut is the median
+                                    of that column.
+
+        ---------------
+        "nanval" is the float or integer value designated to mean
+        a missing cell, or Not-a-Number value.
+
+
+
+    Examples
+    --------
+
+
+
+    Paste function
+    --------------
+        residuals(observed, # [2D array of observed values]
+                  estimates,    # [2D array of cell estimates]
+                  psmsindex = None, # [<None, where()-style index of cells made pseudo-missing>]
+                  nearest_val = None,     # [<None,'Nearest','Match'> => first convert estimate to nearest valid observed value]
+                  ecut = None,  # [<None, [['All',ecut], ['Cols',[ECut1,ECut2,'Med',...]]> ]
+                  nanval = -999.,   # [Not-a-Number value for cells missing in observed]
+                  )
+
+    """
+
+    # Some variables
+    shape = np.shape(observed)
+    nrows = shape[0]
+    ncols = shape[1]
+    MsEst = np.where(estimates == nanval)
+    observed = observed[:,:]
+    estimates = estimates[:,:]
+
+    # Check type of data
+    try:
+        observed[0,0] - estimates[0,0]
+    except TypeError:
+        try:
+            observed = observed.astype(float)
+            estimates = observed.astype(float)
+        except ValueError:
+            if nearest_val == 'Match':
+                observed = observed.astype('S20')
+                estimates = observed.astype('S20')
+            else:
+                exc = "Unable to get observed and estimates data types to match.\n"
+                raise residuals_Error(exc)
+
+    if (isinstance(observed[0,0],str)
+        and isinstance(estimates[0,0],float)
+        ):
+        exc = 'type_ of data in observed and estimates does not match.\n'
+        raise residuals_Error(exc)
+
+    if (isinstance(observed[0,0],str)
+        and isinstance(estimates[0,0],str)
+        and nearest_val != 'Match'
+        ):
+        #print "Warning in tools.residuals:  If data is string, nearest_val must be 'Match'.  Making that change.\n"
+        nearest_val = 'Match'
+
+    # Get dichotomous residuals
+    if ecut is not None:
+        if ecut[0] == 'All':
+
+            # Define ecut as median
+            if ecut[1] == 'Med':
+                ValEst = estimates[np.where(estimates != nanval)]
+                ECut_ = np.median(ValEst)
+            else:
+                ECut_ = ecut[1]
+
+            # Get dichotomous residuals
+            Cond1 = observed == nanval
+            Cond2 = estimates == nanval
+            Cond3 = np.logical_and(observed < ECut_,estimates < ECut_)
+            Cond4 = np.logical_and(observed >= ECut_,estimates >= ECut_)
+            Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
+                             np.where(np.logical_or(Cond3,Cond4),0,1)
+                             )
+
+        elif ecut[0] == 'Cols':
+            Resid = np.zeros((nrows,ncols))
+            for i in range(ncols):
+
+                # Define ecut as median
+                if (ecut[1] == 'Med'
+                    or (type(ecut[1]) is type([])
+                        and ecut[1][i] == 'Med')
+                    ):
+                    ValEst = estimates[:,i][np.where(estimates[:,i] != nanval)]
+                    ECut_ = np.median(ValEst)
+
+                elif type(ecut[1]) is type([]):
+                    ECut_ = ecut[1][i]
+                else:
+                    ECut_ = ecut[1]
+
+                # Get dichotomous residuals
+                Cond1 = observed[:,i] == nanval
+                Cond2 = estimates[:,i] == nanval
+                Cond3 = np.logical_and(observed[:,i] < ECut_,estimates[:,i] < ECut_)
+                Cond4 = np.logical_and(observed[:,i] >= ECut_,estimates[:,i] >= ECut_)
+                Resid[:,i] = np.where(np.logical_or(Cond1,Cond2),nanval,
+                                      np.where(np.logical_or(Cond3,Cond4),0,1)
+                                      )
+
+    # Get residuals to "adjusted" estimates
+    elif nearest_val == 'Nearest':
+
+        # Define nearest(Vals,Est)
+        def nearest(Vals,Est):
+            HiLoc = np.searchsorted(Vals,Est)
+            LoLoc = HiLoc - 1
+            if LoLoc < 0:
+                LoLoc = 0
+
+            try:
+                HiDiff = np.abs(Vals[HiLoc] - Est)
+            except IndexError:
+                HiDiff = np.inf
+
+            LoDiff = np.abs(Vals[LoLoc] - Est)
+
+            if HiDiff < LoDiff:
+                Nearest = Vals[HiLoc]
+            else:
+                Nearest = Vals[LoLoc]
+
+            return Nearest
+
+        # Draw random sample for testing discreteness
+        if nrows <= 20:
+            SampLoc = None
+        else:
+            p = 20/float(nrows)
+            SampLoc = np.where(npr.rand(nrows) < p)
+
+        # Find nearest valid observed value per estimate
+        Est1 = np.zeros((nrows,ncols))
+        for i in range(ncols):
+            if SampLoc is not None:
+                nSamp = len(SampLoc[0])
+                nVals = len(np.unique(observed[SampLoc][:,i][np.where(observed[SampLoc][:,i] != nanval)]))
+                pUnique = nVals / float(nSamp)
+
+                # Skip cols where more than 10% of data is unique
+                if pUnique > 0.10:
+                    Est1[:,i] = estimates[:,i]
+                else:
+                    Vals = np.unique(observed[:,i][np.where(observed[:,i] != nanval)])
+                    try:
+                        Est1[:,i] = [nearest(Vals,Est) for Est in estimates[:,i]]
+                    except IndexError:
+                        Est1[:,i] = nanval
+
+            elif SampLoc is None:
+                Vals = np.unique(observed[:,i][np.where(observed[:,i] != nanval)])
+                try:
+                    Est1[:,i] = [nearest(Vals,Est) for Est in estimates[:,i]]
+                except IndexError:
+                    Est1[:,i] = nanval
+
+        Est1[MsEst] = nanval
+
+        # Calculate residuals
+        Cond1 = observed == nanval
+        Cond2 = Est1 == nanval
+        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
+                         np.subtract(observed,Est1))
+
+    # Look for exact match
+    elif nearest_val == 'Match':
+        Cond1 = observed == nanval
+        Cond2 = estimates == nanval
+        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
+                         np.where(observed == estimates,0,1)).astype(float)
+
+    # Get residuals for unadjusted estimates
+    elif nearest_val is None:
+        Cond1 = observed == nanval
+        Cond2 = estimates == nanval
+        Resid = np.where(np.logical_or(Cond1,Cond2),nanval,
+                         np.subtract(observed,estimates)
+                         )
+    else:
+        exc = 'Unable to figure out nearest_val parameter.\n'
+        raise residuals_Error(exc)
+
+    ########
+    # Select only non-pseudo-missing residuals
+    # Pseudo-missing residuals
+    if psmsindex is not None:
+        Temp = np.zeros((nrows,ncols)) + nanval
+        Temp[psmsindex] = Resid[psmsindex]
+        Resid = Temp
+
+    return Resid
+
+
+
+###########################################################################
+
+def obspercell(obs, # [<None, obs array> ]
+               by_rows = 'obs',   # [<'obs', ncols> => for obs counts by row]
+               by_cols = 'obs',  # [<'obs', nrows>] => for obs counts by col]
+               out_as = 'arr', # [<'arr', 'row', 'col', 'num'> => output shape]
+               ndim = 2,    # [<int> dimensionality of estimates]
+               facs_per_ent = [1, 2],    # [<[<0,1>,<1,2,[1,1,2,...]]> => facet and number of unanchored facets per entity]
+               count_chars = True,   # [<bool, int, [ints]> => count n unique characters per cell]
+               max_chars = 2, # [<int>, maximum chars per cell]
+               p_items = None, # [<None, float] => percent items independent]
+               meth = 'CombineFacs', # [<'PickMinFac','CombineFacs'>]
+               nanval = -999,   # [Not-a-Number value]
+               ):
+    """Calculate obspercell_factor for standard errors.
+
+    Returns
+    -------
+        2-D array (corresponding to "shape") with the obspercell_factor
+        calculated for each cell.  This is used in Damon's standard
+        error formula.
+
+    Comments
+    --------
+        The core standard error formula in Damon is based on the
+        classic statistical formula:
+
+        Formula 1a (regular formula):
+
+            n = number of observations
+            SE = SD/sqrt(n)
+
+        In Damon the 1/sqrt(n) portion of the formula is refined to take 
+        into account the dimensionality of the estimates and the number of
+        facets.  The number of observations is by cell -- for each cell, how
+        many observations reside in its row and column.
+
+        Formula 1b (Damon version):
+
+            Basic Idea:  SE[cell] = nfacs * SD / (n - ndims)/ndims
+                                  = nfacs * SD / (n/ndims - 1)
+
+        This gets translated into one of two formulae (as expressed in 
+        the dichotomous case):
+
+        Formula 1b.1 ('PickMinFac' formula)
+
+            SE[cell] = (nfacs * EAR) / minimum(sqrt(nrows / ndims - 1),
+                                               sqrt(ncols / ndims - 1))
+
+        Formula 1b.2 ('CombineFacs' formula)
+
+            SE[cell] = (nfacs * EAR) / sqrt(sqrt(nrows / ndims - 1) * 
+                                            sqrt(ncols / ndims - 1))
+
+        The obspercell() method calculates the factor that, when multiplied
+        by the EAR (or p * (1 - p) in the case of logits), returns the
+        standard error, e.g.:
+        
+            obspercell_factor = nfacs / sqrt(sqrt(nrows / ndims - 1) * 
+                                            sqrt(ncols / ndims - 1))
+            
+            SE = obspercell_factor * EAR
+        
+        With polytomous data, the nrows and ncols variables are replaced by 
+        variables that take into account the number of rating scale "steps" 
+        per cell (each additional step is like an additional observation):
+        
+            nrows becomes nrows * steps_per_cell across each column
+            ncols becomes ncols * steps_per_cell across each row
+        
+        ncols has the additional complication that there may be multiple
+        possible steps per column if items have different rating scales.
+        
+        Counts for continuous scales are indeterminate.  In principle, they
+        contain an infinite number of steps; in practice, due to measurement
+        error, this number may be quite small and currently requires human 
+        judgement.  The max_chars character is used to set an upper bound 
+        reflecting the maximum number of "statistically distinct values" 
+        that a given response scale can support.
+        
+        Thus Damon replaces the familiar (1 / sqrt(n)) factor used in
+        traditional standard error formulas (multiplied by SD) with an 
+        elaborated factor that takes into account the number of facets, 
+        dimensions, rows, columns, and rating scale steps.  This
+        'obspercell_factor' is specific to NOUS.  
+        
+        'PickMinFac' or 'CombineFacs'
+        -----------------------------
+        'PickMinFac' tends to be more accurate than 'CombineFacs' with
+        smaller datasets where the ratio of observations to dimensions
+        is less than, say, 10.  However, with large datasets it will
+        tend to overestimate the standard error since it ignores
+        information contributed by one of the facets.
+
+        'CombineFacs' is more accurate with large data sets.  However, as the
+        ratio of observations to dimensions drops below, say, 10, it will tend
+        to a standard error that is too small.  The reason is that
+        in this situation (as the ratio of observations to dimensions
+        becomes small) Damon estimates become biased toward the
+        observations, resulting in an artificially low EAR and SE.
+        'CombineFacs' is probably the most mathematically correct, but
+        'PickMinFac' may be safer if you want to avoid false
+        positive significance tests with smaller datasets.
+        
+        Type of Output
+        --------------
+        If the observed data array contains missing values, the 
+        obspercell_factor and resulting standard error will vary across
+        cells.  In this case, the obspercell_factor is ideally an array
+        of values which gets multiplied elementwise by the EAR.  However, if
+        there are no missing values, obspercell_factor reduces to a single
+        number since each cell is associated with the same number of data
+        values.  Sometimes, it is convenient to calculate just the single
+        number, even if there are some missing values, e.g., when the relevant
+        observed array is not available.  This behavior is controlled by the
+        "out_as" parameter, which also supports scenarios where you know
+        the number of missing cells for one facet but need to assume a
+        complete array for the opposing facet.
+        
+        Parsed Data
+        -----------
+        When using Damon's parse() function (you probably shouldn't),
+        the "obs" parameter can refer to self.parse_out['coredata'].
+        Since, this (probably) causes the number of independent items to be 
+        overestimated, you may want to adjust the "p_items" parameter
+        downward to equal (ncols_orig_obs / ncols_parsed).  In general,
+        the statistical implications of parsing data are poorly understood,
+        so use parse() with caution.
+               
+    Arguments
+    ---------
+        "obs" <None, array>, is the pre-estimate data used to calculate counts 
+        of observations and to determine unique valid characters in each 
+        row and/or column, subject to the maximum given in max_chars.  It is
+        also used to determine which cells are missing and how many valid
+        data values are brought to bear on any given cell.
+        In anchored designs, it is the data array for the current Damon
+        object. The size of the historical data array used to calculate the 
+        anchors must also be taken into account, and this is handled through
+        the by_rows and by_cols parameters.  
+             
+            obs = observations      =>  An array of observations
+            
+            obs = None              =>  No observations are available. Specify
+                                        array dimensions in by_rows and by_cols.
+            
+        ----------
+        "by_rows" specifies how to get the number of columns per row and can
+        either be set explicitly (e.g., for anchored designs) or by referring
+        to the "obs" array (if it exists).
+        
+            by_rows = 'obs'         =>  Get the number of columns from the
+                                        observed array.
+            
+            by_rows = 100           =>  Each row is associated with 100
+                                        columns.
+
+        ----------
+        "by_cols" specifies how to get the number of rows per column and can
+        either be set explicitly (e.g., for anchored designs) or by referring
+        to the "obs" array (if it exists).
+        
+            by_cols = 'obs'         =>  Get the number of rows from the
+                                        observed array.
+            
+            by_cols = 1000          =>  Each column is associated with 1000
+                                        rows.
+
+        ----------
+        "out_as" specifies how to output the obspercell_factor, whether as
+        a single number or as a type of array.  The selection is based on
+        the availability of the observed data array and the prevalence of
+        missing data.
+        
+            out_as = 'num'          =>  Return obspercell_factor as single
+                                        number (which can then be multiplied
+                                        by the EAR array to obtain the SE
+                                        array). This yields valid results to
+                                        the degree the observed array is
+                                        complete but can be calculated 
+                                        regardless.
+        
+            out_as = 'arr'          =>  Return as a 2-D array whose shape is
+                                        controlled using by_rows and by_cols and
+                                        which presumably matches the shape of
+                                        the EAR array.
+            
+            out_as = 'row'          =>  Return a 1-D array whose length
+                                        corresponds to the row length (i.e.,
+                                        number of columns).  This assumes
+                                        variation in missing per column but
+                                        not by row.  This option is not likely
+                                        to be used much.
+            
+            out_as = 'col'          =>  Return a 1-D array whose length 
+                                        corresponds to the column length (i.e,
+                                        number of rows). This assumes variation
+                                        in missing per row but not by column.
+                                        This is the default in equate()'s
+                                        construct measures.
+        
+        ----------
+        "ndim" is an integer describing the dimensionality used
+        to compute the Damon estimates.  It can be found at:
+
+            my_obj.coord_out['ndim']
+
+        ----------
+        "facs_per_ent" is used to specify the number of "unanchored"
+        facets used in the calculation of either row entities or column
+        entities, for use in the standard error formula.
+
+        Syntax:  [facet, n unanchored facets per entity]
+
+            facs_per_ent = [1,2]
+                            =>  For facet 1 (columns), all items
+                                were calculated with both the row
+                                and column entities unanchored.
+
+            facs_per_ent = [1,1]
+                            =>  For facet 1 (columns), all items
+                                were calculated with row coordinates
+                                anchored.  Only one set of coordinates
+                                (columns) was unanchored.
+
+            facs_per_ent = [0,1]
+                            =>  For facet 0 (rows), all persons were
+                                calculated with column coordinates
+                                anchored.  Only one set of coordinates
+                                (rows) was unanchored.
+
+            facs_per_ent = [1,[2,2,2,1]]
+                            =>  For facet 1 (columns), there are four
+                                items.  The first three were calculated
+                                with two sets of unanchored coordinates
+                                (rows and columns).  The fourth item
+                                was calculated with only one set
+                                of unanchored coordinates (columns).
+
+
+        ----------
+        "count_chars" <bool, int, [ints]> tells how to count the
+        number of observed values that are possible per cell, up to 
+        the number given by max_chars.
+        
+            count_chars = False     =>  The data are assumed dichotomous (two
+                                        characters per cell)
+            
+            count_chars = True      =>  Get the character counts by looking at 
+                                        a sample of rows (the first 100) in
+                                        the "obs" array.  This assumes obs
+                                        is an array.
+            
+            count_chars = 3         =>  All cells (for each column) have three
+                                        characters per cell.
+            
+            count_chars = [4, 2, 3] =>  In a three column array, the first 
+                                        column has four characters per cell,
+                                        the second two, the third three.
+                                        If data are continuous, specify a high
+                                        integer; "max_chars" will clip it down
+                                        to size.
+                                       
+        ----------
+        "max_chars" <int> is the maximum number of valid characters per
+        cell and sets an upper boundary on count_chars.  It was created
+        to deal with continuous data for which the number of valid characters 
+        is in principle infinite.  In practice, though, it seems like
+        max_chars = 2 is what works best for all data types.
+        
+            max_chars = 2           =>  The number of valid characters is 
+                                        capped at 2 for all item types.
+            
+        ----------
+        "p_items <None, float> makes it possible to override the
+        count of columns * steps in estimating the number of "independent 
+        items".  Damon's standard error statistic assumes that each item is 
+        statistically independent, but sometimes there are dependencies 
+        between items that violate this assumption, causing the standard 
+        errors to be too low. "p_items" offers a manual override.
+        
+            p_items = None (default)
+                            =>  Get the item count from the number of
+                                columns in "obs" * the number of steps
+            
+            p_items = 0.75
+                            =>  Force the item count to be 
+                                0.75 * n columns * n steps
+            
+        ----------
+        "meth" specifies which procedure to use, 'PickMinFac' or
+        'CombineFacs'.  See comments above.
+
+        ----------
+        "nanval" is the not-a-number value.
+        
+    Examples
+    --------
+
+
+    Paste function
+    --------------
+        obspercell(obs, # [<None, obs array> ]
+                   by_rows = 'obs',   # [<'obs', ncols> => for obs counts by row]
+                   by_cols = 'obs',  # [<'obs', nrows>] => for obs counts by col]
+                   out_as = 'arr', # [<'arr', 'row', 'col', 'num'> => output shape]
+                   ndim = 2,    # [<int> dimensionality of estimates]
+                   facs_per_ent = [1, 2],    # [<[<0,1>,<1,2,[1,1,2,...]]> => facet and number of unanchored facets per entity]
+                   count_chars = True,   # [<bool, int, [ints]> => count n unique characters per cell]
+                   max_chars = 2, # [<int>, maximum chars per cell]
+                   p_items = None, # [<None, float] => percent items independent]
+                   meth = 'CombineFacs', # [<'PickMinFac','CombineFacs'>]
+                   nanval = -999,   # [Not-a-Number value]
+                   )
+
+    """
+
+    def col_steps(obs, max_rows=100, nanval=-999):
+        "Get array of possible steps by col."
+        
+        samp_rows = min(np.size(obs, axis=0), max_rows)
+        samp = obs[:samp_rows, :]
+        ncols = np.size(obs, axis=1)
+        n_steps = []
+        
+        for i in range(ncols):
+            col = samp[:, i]
+            col = col[col != nanval]
+            n_unique = min(max(2, len(np.unique(col))), max_chars)
+            n_steps.append(n_unique - 1)
+        
+        return np.array(n_steps)
+    
+    nanvalf = float(nanval)
+
+    # Figure out if facets are anchored.  TODO: Not all cases thought through.
+    anc = None
+    if facs_per_ent == [0, 1]:
+        anc = 1
+    elif facs_per_ent == [1, 1]:
+        anc = 0
+    
+    # Sort out number of cols
+    if by_rows == 'obs':
+        if obs is not None:
+            ncols = np.size(obs, axis=1)
+        else:
+            exc = 'obs cannot be None if by_rows is "obs".'
+            raise obspercell_Error(exc)
+    else:
+        ncols = by_rows
+    
+    # Sort out number of rows
+    if by_cols == 'obs':
+        if obs is not None:
+            nrows = np.size(obs, axis=0)
+        else:
+            exc = 'obs cannot be None if by_cols is "obs".'
+            raise obspercell_Error(exc)
+    else:
+        nrows = by_cols
+        
+    # Percentage of item/steps to treat as independent
+    if p_items is None:
+        p_items = 1.0
+
+    # count_chars to array
+    if isinstance(count_chars, list):
+        count_chars = np.array(count_chars)
+        
+    # Define facs_per_ent 
+    # TODO: the interaction of facets with error is still not clear, e.g.,
+    # should cells in an anchored design be 1 or 2, or something in between?
+    # sub_coord() seems to need entity level facets, but that's unclear.
+    # Here, if there is anchoring, nfacs is 1, otherwise 2.
+    
+    if isinstance(facs_per_ent[1], np.ndarray):
+        if 2 in facs_per_ent[1]:
+            nfacs = 2
+        else:
+            nfacs = 1
+    else:
+        nfacs = facs_per_ent[1]
+            
+    # Get row_count, col_count as integers, assumes common rating scale
+    # row_count => based on n rows; col_count => based on n cols
+    if out_as == 'num':
+        if count_chars is True:
+            if obs is not None:
+                c_steps = col_steps(obs, 500, nanval)
+                col_count = np.sum(c_steps)
+                row_count = np.mean(c_steps) * np.size(obs, axis=0)
+            else:
+                exc = 'obs cannot be None if count_chars is True.'
+                raise obspercell_Error(exc)
+        
+        # Assume dichotomous -- one step
+        elif count_chars is False:
+            col_count = ncols  # * 1  
+            row_count = nrows # * 1
+        
+        # Use specified int character count
+        elif isinstance(count_chars, int):
+            col_count = ncols * min(count_chars - 1, max_chars - 1)
+            row_count = nrows * min(count_chars - 1, max_chars - 1)
+        
+        # Use specified array of character counts
+        elif isinstance(count_chars, np.ndarray):
+            col_count = np.sum(count_chars - 1)
+            row_count = nrows * np.mean(count_chars - 1)
+            
+    # Get row_count and col_count as arrays
+    elif out_as in ['row', 'col', 'arr']:
+        
+        # Build counts array assuming no missing
+        counts_ = np.zeros(np.shape(obs))
+        if count_chars is True:
+            c_steps = col_steps(obs, 500, nanval)
+            counts = counts_ + c_steps
+        elif count_chars is False:
+            counts = counts_ + 1
+        elif isinstance(count_chars, int):
+            counts = counts_ + min(count_chars, max_chars)
+        elif isinstance(count_chars, np.ndarray):
+            counts = counts_ + count_chars
+            counts = np.clip(counts, 0, max_chars)
+
+        # Deal with missing where desired
+        counts_no_nan = counts
+        counts_ma = npma.masked_array(counts, mask=(obs == nanval), 
+                                      fill_value=nanvalf)       
+        
+        if out_as == 'arr':
+            col_count = np.sum(counts_ma, axis=1).filled(nanvalf)
+            row_count = np.sum(counts_ma, axis=0).filled(nanvalf)            
+        elif out_as == 'col':
+            col_count = np.sum(counts_ma, axis=1).filled(nanvalf)
+            row_count = np.sum(counts_no_nan, axis=0)
+        elif out_as == 'row':
+            col_count = np.sum(counts_no_nan, axis=1)
+            row_count = np.sum(counts_ma, axis=0).filled(nanvalf)
+            
+    # Calculate obspercell_factor as int    
+    if out_as == 'num':
+        if meth == 'PickMinFac':
+            if nrows > ncols:
+                denom = np.sqrt(col_count * p_items / ndim - 1)
+            else:
+                denom = np.sqrt(row_count / ndim - 1) if anc != 1 else 1        
+            opc_fact = nfacs[0] / denom
+    
+        elif meth == 'CombineFacs':
+            dnm_0 = np.sqrt(row_count / ndim - 1) if anc != 1 else 1
+            dnm_1 = np.sqrt(col_count * p_items / ndim - 1) if anc != 0 else 1
+            opc_fact = nfacs[0] / np.sqrt(dnm_0 * dnm_1)
+
+    # Calculate obspercell_factor as array                  
+    elif out_as == 'arr':
+        one_0 = np.repeat(1.0, ncols)
+        dnm_0 = np.sqrt((row_count / ndim) - 1) if anc != 1 else one_0
+        one_1 = np.repeat(1.0, nrows)
+        dnm_1 = np.sqrt((col_count * p_items / ndim) - 1) if anc != 0 else one_1
+            
+        row_fact = (1 / dnm_0)[np.newaxis, :]
+        col_fact = (1 / dnm_1)[:, np.newaxis]
+
+        if meth == 'CombineFacs':
+            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
+                
+        elif meth == 'PickMinFac':
+            if nrows > ncols:
+                row_fact = np.ones((1, ncols))
+                opc_fact = nfacs * (row_fact * col_fact)
+            else:
+                col_fact = np.ones((nrows, 1))
+                opc_fact = nfacs * (row_fact * col_fact)
+
+        # Clean up bad cells
+        opc_fact[:, row_count == nanvalf] = nanvalf
+        opc_fact[col_count == nanvalf, :] = nanvalf
+    
+    elif out_as == 'col':
+        one_1 = np.repeat(1.0, nrows)
+        col_fact = 1 / np.sqrt(col_count * p_items / ndim - 1) if anc != 0 else one_1
+        
+        row_count_mean = np.mean(row_count)
+        row_fact = 1 / np.sqrt(row_count_mean / ndim - 1) if anc != 1 else 1
+        
+        # facet count:  index error triggers choice.  Hacky and wrong.
+        if meth == 'CombineFacs':
+            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
+        elif meth == 'PickMinFac':
+            if nrows > ncols:
+                try:
+                    opc_fact = nfacs * col_fact
+                except ValueError:
+                    opc_fact = nfacs[0] * col_fact
+            else:
+                try:
+                    opc_fact = nfacs * row_fact 
+                except ValueError:
+                    opc_fact = nfacs[0] * row_fact
+        
+        # Clean
+        opc_fact[col_count == nanvalf] = nanvalf
+        
+    elif out_as == 'row':
+        one_0 = np.repeat(1.0, ncols)
+        row_fact = 1 / np.sqrt(row_count / ndim - 1) if anc != 1 else one_0
+        
+        col_count_mean = np.mean(col_count)
+        col_fact = 1 / np.sqrt(col_count_mean / ndim - 1) if anc != 0 else 1
+        
+        if meth == 'CombineFacs':
+            opc_fact = nfacs * np.sqrt(row_fact * col_fact)
+        elif meth == 'PickMinFac':
+            if nrows > ncols:
+                opc_fact = nfacs * col_fact
+            else:
+                opc_fact = nfacs * row_fact
+        
+        # Clean
+        opc_fact[row_count == nanvalf] = nanvalf
+    
+    # Final cleaning
+    opc_fact = np.where(np.isnan(opc_fact) | np.isinf(opc_fact),
+                        nanvalf,
+                        opc_fact)
+    
+    return opc_fact
+    
+
+
+
+###########################################################################
+
+def pq_resid(est,     # [array of prelogit-based estimates]
+             resid,   # [None, raw residuals]
+             colkeys = None,    # [<None, 1-D array of column keys>]
+             ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]
+             ear = None, #[<None, float, ear array]
+             new_logits = False, #[<True, False>]
+             validchars = ['All', [0, 1]],
+             nanval = -999. # [not-a-number value]
+             ):
+    """
+    Adjust size of residuals/EARs for dichotomous or polytomous data.
+    
+    Returns
+    -------
+        A dict:
+            {'new_resid':__, 
+            'new_logit':__}
+            
+        where 'new_resid' is an array of residuals corrected for
+        distortions caused by dichotomous or polytomous responses
+        and 'new_logit' is an optional replacement of the prelogit-based
+        estimates with logits that are compatible with the specified
+        ear array.
+        
+    Comments
+    --------
+        When analyzing interval data, one expects the residuals between
+        observations and true values to be the same on average across 
+        the scale.  This assumption does not hold when the data are
+        dichotomous or polytomous (less of a problem).  This is because,
+        in the dichotomous case, when the "true" (eg "model") values are
+        near the center of the scale (say 0.50), their residuals relative
+        to the observed values (0 or 1) will be too large.  The reverse
+        is true when the "true" values are at the extremes.  Since the
+        estimates track the true values (more or less), the distortion
+        ripples through to the residuals, expected absolute residuals,
+        standard errors, and all derivative statistics.
+                
+        To correct the distortion, this function adjusts the residuals by 
+        dividing by their binomial variance:
+        
+            new_resid = resid / sqrt(pq)
+        
+        where p is calculated from the prelogit-based estimates and
+        q = (1 - p).
+        
+        pq_resid() is also applied in base_se() to complete the calculation
+        of standard errors in this situation, but here the numerator
+        is not the raw residuals but 1.0.  Optionally, the numerator can
+        be an array of ears or any constant, controlled by the ear parameter.
+        
+        While the formula is targeted at dichotomous data, it seems to work
+        acceptably for polytomous data as well.  A proper polytomous
+        formula still needs to be derived.
+        
+        Mixed data designs (a mix of ordinal, interval, ratio data) are
+        supported.  The binomial correction is only applied to columns
+        that are found to be ordinal, based on the validchars parameter.
+        All other residuals are passed through unchanged.
+    
+    Arguments
+    ---------
+        "est" is a 2-d array of estimates.  They must be in some form of
+        logit metric, presumably "prelogits".
+        
+        --------------
+        "resid" is a 2-d array of residuals between raw prelogit values
+        and their corresponding cell estimates.
+            
+            resid = None    =>  Do not adjust residuals. The function will
+                                refer to the "ear" parameter.
+
+        --------------
+        "colkeys" is a 1-dimensional array of column keys, the unique
+        identifiers for each column in estimates and ear.  It only needs
+        to be specified when ecut contains a column dictionary.
+        
+        --------------        
+        "ecut" is specified in, and output as part of, the base_est()
+        method as part of the ecutmaxpos parameter.  (The "maxpos" half of
+        the parameter is not used.  Documentation on ecutmaxpos is available 
+        in the base_est() docs.)  In short, ecut is the estimates cut-point
+        above which an estimate is named a "success".
+
+        Here are the options:
+
+            ecut = ['All', ecut]
+
+        means that the values given for ecut apply to the whole array, 
+        across all columns.
+
+            ecut = ['All', 'Med']
+
+        means that ecut should be the median ('Med') of the whole array.
+
+            ecut = ['Cols', 'Med']
+
+        means that the ECut and MaxPos for each column should be the
+        median and maximum value of that column, calculated separately
+        for each column.
+
+            ecut = ['Cols',{'ID1':'Med','ID2':25, ...}]
+
+        means that for the 'ID1' column ecut should be the column median,
+        for the 'ID2' column, ecut should be 25, and so on, for all the 
+        columns.
+
+        -------------- 
+        "ear" is None, a float, or an array of expected absolute residuals.
+        
+            ear = None      =>  (default). Use "resid" in the numerator (see
+                                formula in comments).  This adjusts the
+                                residuals for the dichotomous distortion.
+            
+            ear = 1.0       =>  Use 1.0 in the numerator. This returns the
+                                logit binomial variance.
+            
+            ear = ear_array =>  Use the array of expected absolute residuals
+                                in the numerator.
+
+        -------------- 
+        "new_logits" (bool, default is False) controls how to calculate p 
+        in the formula above.
+        
+            new_logits = True
+                            =>  Calculate p and corresponding logits using
+                                the "ear" parameter. 
+                                
+                                Advantage: the resulting logits and 
+                                probabilities are rescaled from the
+                                somewhat arbitrary "prelogit" metric to take
+                                into account the noisiness of the data.  The
+                                new logits will have a linear relationship to
+                                the "prelogits".
+                                
+                                Disadvantage: the new logits, if used as cell
+                                estimates, will no longer be in sync with the 
+                                corresponding array coordinates, so will no
+                                longer support equating.
+            
+            new_logits = False
+                            =>  Preserve the prelogit metric.
+                            
+                                Since equating is of paramount importance and
+                                the logit metric less so, this is the default.
+
+        -------------- 
+        "validchars" is the validchars parameter of the Damon object,
+        presumably ['All', [0, 1], 'Num'] or something similar.  It
+        is used to determine whether the data are ordinal.
+        
+        -------------- 
+        "nanval" is the not-a-number value
+
+    Paste Function
+    --------------
+        pq_resid(est,     # [array of prelogit-based estimates]
+                 resid,   # [None, raw residuals]
+                 colkeys = None,    # [<None, 1-D array of column keys>]
+                 ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]
+                 ear = None, #[<None, float, ear array]
+                 new_logits = False, #[<True, False>]
+                 validchars = ['All', [0, 1]],
+                 nanval = -999. # [not-a-number value]
+                 )
+
+    """
+    # Calc probabilities
+    ear_ = ear if new_logits else None
+    cum = cumnormprob(est, ear_, None, ecut, False, nanval)
+    p = cum['Prob']
+    vc = valchars(validchars)['metric']
+    
+    # Standardize by whole array
+    if vc[0] == 'All':
+        if vc[1] != 'ordinal':
+            new_resid = resid
+        else:
+            if ear is None:
+                res = resid
+                if res is None:
+                    exc = 'resid and ear params cannot both be None.'
+                    raise ValueError(exc)
+            else:
+                res = ear
+            
+            if resid is not None:
+                ix = resid == nanval
+            elif isinstance(res, np.ndarray):
+                ix = res == nanval
+            else:
+                ix = None
+            new_resid = res / np.sqrt(p * (1 - p))
+            
+            if ix is not None:
+                new_resid[ix] = nanval
+    
+    # Standardize by col
+    elif vc[0] == 'Cols':
+        new_resid = np.zeros(np.shape(resid))
+        for i, col in enumerate(colkeys):
+            
+            # col not in vc[1] assumes parsed id and thus ordinal data
+            if col not in vc[1] or vc[1][col] != 'ordinal':
+                new_resid[:, i] = resid[:, i]
+            else:
+                if resid is not None:
+                    res_ = resid[:, i]
+                else:
+                    res_ = None
+                    
+                if ear is None:
+                    res = res_
+                    if res is None:
+                        exc = 'resid and ear params cannot both be None.'
+                        raise ValueError(exc)
+                else:
+                    if isinstance(ear, np.ndarray):
+                        res = ear[:, i]
+                    else:
+                        res = ear
+                
+                if resid is not None:
+                    ix = res_ == nanval
+                elif isinstance(res, np.ndarray):
+                    ix = res == nanval
+                else:
+                    ix = None
+            
+                p_ = p[:, i]
+                new_resid[:, i] = res / np.sqrt(p_ * (1 - p_))
+                
+                if ix is not None:
+                    new_resid[ix, i] = nanval            
+            
+    return {'new_resid':new_resid, 'new_logit':cum['Logit']}
+
+
+
+
+###########################################################################
+
+def cumnormprob(estimates,  # [array of estimates for which we want a cumulative probability]
+                ear,    # [<None, float, array of Expected Absolute residuals>]
+                colkeys = None,    # [<None, 1-D array of column keys>]
+                ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]> ]
+                logits = None,   # [<None, True> => return logits with probabilities]
+                nanval = -999., # [Not-a-Number Value]
+                ):
+    """Calculate a cell's cumulative normal probability.
+
+    Returns
+    -------
+        {'Prob':__,
+        'Logit':__
+        }
+
+        When ear is in fact the Expected Absolute Residual (EAR),
+        the function returns an array of probabilities that each cell
+        estimate will exceed a given value conditional on its EAR,
+        the "noise" or "residuals" associated with that row and column
+        regardless of the number of data points.  Each cell is the probability
+        that a cell observation will be greater than the specified cut-point
+        (ECut) given the cell estimate and its standard deviation.
+
+        If logits = True, logit equivalents are also returned.
+
+    Comments
+    --------
+        Note that we define the distribution in terms of the expected
+        standard deviation of the estimate (a function of the size of
+        the residuals in that cell's row and column), not its
+        standard error (a function of the standard deviation
+        and the number of observations that go into calculating the
+        estimate).  Thus, the resulting probability is not sensitive
+        to the size of the data set.  It is driven not by the precision
+        and reliability of the estimate, which can be high even if
+        it poorly predicts the observed values, but by the precision
+        and reliability of the observation -- the observation error.
+
+        One could, however, let EAR equal the cell standard error,
+        which gets smaller as the number of observations increases.
+        The resulting probability would reflect how certain we are
+        that the estimate is indeed accurate, which has its own uses.
+
+        There are other ways to define the probability.  The metricprob()
+        function does a simple linear transformation to force Damon
+        estimates to have the same sigmoid metric as probabilities.
+        This function is suitable when there is confidence in the
+        metric properties of the estimates and our goal is not
+        so much to calculate a cell probability as a stable, reproducible
+        set of measures.
+
+        The cumnormprob() probabilities are defined more in accordance
+        with statistical definitions of probability.  Probability is
+        a function of "how certain" we are of meeting some condition.
+        Thus, cumnormprob() is a function of the standard deviation (EAR)
+        of the estimates -- their noisiness or uncertainty.  This gives
+        a more accurate prediction of the probability of a response
+        (since it takes into account the effect of error on probability)
+        but at the expense of metric reproducibility.
+
+        To calculate the cumulative probability, it is useful to
+        consider that the cell estimate can be thought of as the mean
+        of a large number of observations for that cell.  In reality,
+        we only have one observation, but Damon leverages the data in
+        the remainder of the dataset so that its cell estimates are
+        mathematically comparable to taking the mean of a lot of
+        observations for a given cell.  Similarly, the Expected Absolute
+        Residual (EAR) is equivalent to its standard deviation.
+
+        We are after the probability that the observed value is higher
+        than the cut-point ("ecut") given the cell estimate and EAR, or one
+        less the probability that the observed value is lower than the
+        cut-point.  Consider a Gaussian distribution whose mean is
+        the estimate and whose standard deviation is the EAR.  The ecut
+        falls somewhere on this distribution.  The probability of
+        failure (the observation being below ecut) is the area of the
+        curve below ecut.  The probability of success is 1 - P[Failure].
+
+        To calculate the error of the curve below ecut, we need to
+        calculate the integral of the normal distribution curve, which
+        has no explicit closed form solution.  However, it can be
+        approximated by a number of methods.  One commonly used method,
+        and the one used here, comes from Abramowitz and Stegun (1964)
+        (see Wikipedia, Normal Distribution).
+
+    Arguments
+    ---------
+        "estimates" is an array of cell estimates for which we want a probability.
+        It will generally be the output of the base_est() method.
+
+        --------------
+        "ear" is the array of "expected absolute residuals" of the
+        estimate, found by running the coord() and base_est() methods on
+        an array of absolute residuals.  It can also be a single number,
+        such as a mean EAR.  If ear is None, the estimates (which should be
+        in a prelogit metric) will be returned unchanged, along with 
+        probabilities.
+
+        --------------
+        "colkeys" is a 1-dimensional array of column keys, the unique
+        identifiers for each column in estimates and ear.  It only needs
+        to be specified when ecut contains a column dictionary.
+
+        ---------------
+        "ecut" is specified in, and output as part of, the base_est()
+        method as part of the ecutmaxpos parameter.  (The "maxpos" half of
+        the parameter is not used.  Documentation on ecutmaxpos is available 
+        in the base_est() docs.)  In short, ecut is the estimates cut-point
+        above which an estimate is named a "success".
+
+        Here are the options:
+
+            ecut = ['All', ecut]
+
+        means that the values given for ecut apply to the whole array, 
+        across all columns.
+
+            ecut = ['All', 'Med']
+
+        means that ecut should be the median ('Med') of the whole array.
+
+            ecut = ['Cols', 'Med']
+
+        means that the ECut and MaxPos for each column should be the
+        median and maximum value of that column, calculated separately
+        for each column.
+
+            ecut = ['Cols',{'ID1':'Med','ID2':25, ...}]
+
+        means that for the 'ID1' column ecut should be the column median,
+        for the 'ID2' column, ecut should be 25, and so on, for all the 
+        columns.
+
+        --------------
+        "logits" = True instructs the function to return a logit
+        in addition to a probability, where
+
+            Logit = log( p / (1 - p) )
+
+        --------------
+        "nanval" is the Not-a-Number value used to signify an invalid
+        estimate.
+
+    Examples
+    --------
+
+
+
+    Paste function
+    --------------
+    cumnormprob(estimates,  # [array of estimates for which we want a cumulative probability]
+                ear,    # [<None, float, array of Expected Absolute residuals>]
+                colkeys = None,    # [<None, 1-D array of column keys>]
+                ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]> ]
+                logits = None,   # [<None, True> => return logits with probabilities]
+                nanval = -999., # [Not-a-Number Value]
+                )
+    """
+    if len(np.shape(estimates)) < 2:
+        Est = estimates[:, np.newaxis]
+    else:
+        Est = estimates
+
+    if isinstance(ear, np.ndarray):
+        if len(np.shape(ear)) < 2:
+            ear = ear[:, np.newaxis]
+    
+    if ear is None:
+        Log = Est
+        P = np.where(Log == nanval, nanval, np.exp(Log) / (1 + np.exp(Log)))
+        
+        return {'Prob':P,'Logit':Log}
+    
+    ncols = np.size(Est, axis=1)
+
+    # Define ECut_
+    Check = ['All','Cols']
+    if ('All' not in Check
+        or 'Cols' not in Check
+        ):
+        exc = 'Unable to figure out ecut.\n'
+        raise cumnormprob_Error(exc)
+
+    ECut = ecut
+    ECut_ = np.zeros((ncols))
+    if ECut[0] == 'All':
+        if ECut[1] == 'Med':
+            ValEst = Est[Est != nanval]
+            if np.sum(ValEst) == 0:
+                exc = 'Could find no valid data.\n'
+                raise cumnormprob_Error(exc)
+            else:
+                ECut_[:] = np.median(ValEst)
+        else:
+            ECut_[:] = ECut[1]
+
+    elif ECut[0] == 'Cols' and not isinstance(ECut[1], dict):
+        if ECut[1] == 'Med':
+            for i in xrange(ncols):
+                ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
+                if np.sum(ValEst) == 0:
+                    ECut_[i] = nanval
+                else:
+                    ECut_[i] = np.median(ValEst)
+        else:
+            for i in xrange(ncols):
+                ECut_[i] = ECut[1]
+
+    elif ECut[0] == 'Cols' and isinstance(ECut[1], dict):
+        col_dict = ECut[1]
+        
+        if colkeys is None:
+            colkeys = col_dict.keys()
+#            exc = ('column keys need to be specified if ecut contains a '
+#                   'column dictionary.')
+#            raise cumnormprob_Error(exc)
+
+#        for k in col_dict.keys():
+#            if col_dict[k] == 'Med':
+#                val_est = Est[:]
+            
+        for i, k in enumerate(colkeys):
+            if col_dict[k] == 'Med':
+                val_est = Est[:]
+                if np.sum(val_est) == 0:
+                    ECut_[i] = nanval
+                else:
+                    ECut_[i] = np.median(val_est)
+            else:
+                ECut_[i] = col_dict[k]
+            
+#        for i in xrange(ncols):
+#            if ECut[colkeys[i]][0] == 'Med':
+#                ValEst = Est[:,i][Est[:,i] != nanval]
+#                if np.sum(ValEst) == 0:
+#                    ECut_[i] = nanval
+#                else:
+#                    ECut_[i] = np.median(ValEst)
+#            else:
+#                ECut_[i] = ECut[colkeys[i]][0]
+
+    # Define z -- clip at z = -6.0 and 6.0
+    z = np.where(Est == nanval, nanval,
+                 np.clip((ECut_ - Est) / ear, -6.0, 6.0))
+#    PiSqrt3 = 1.81379936423422
+
+    # Magic constants
+    b1 = 0.31938153
+    b2 = -0.356563782
+    b3 = 1.781477937
+    b4 = -1.821255978
+    b5 = 1.330274429
+    p = 0.2316419
+    c2 = 0.3989423
+
+    # array Calculation
+    a = abs(z)
+    t = 1.0 / (1.0 + (a * p))
+    b = c2 * np.exp((-z) * (z / 2.0))
+    Q = ((((b5 * t + b4) * t + b3) * t + b2) * t + b1) * t
+    Q = 1.0 - (b * Q)
+
+    Q = np.where(z == nanval, nanval,
+                 np.where(z < 0.0, 1.0 - Q, Q))
+
+    # Probability of success
+    P = np.where(Q == nanval, nanval, 1 - Q)
+
+    # return_ prob or logit
+    if logits is True:
+        Log = np.where(P == nanval, nanval, np.log( P / (1.0 - P)))
+    else:
+        Log = None
+
+    return {'Prob':P,'Logit':Log}
+
+
+###########################################################################
+
+def log2prob(logits,    # [2-D array of logit values to convert to probabilities]
+             colkeys,   # [1-D array of column keys]
+             validchars,    # [Damon validchars specification]
+             sigma_thresh = 2,    # [Number of categories below which ordinal scale is treated as ordinal]
+             nanval = -999, # [Not-a-number value]
+             ):
+    """Convert logits to probabilities.
+
+    Returns
+    -------
+        2-D array of probabilities calculated from base_est()
+        outputs, where the inputs are PreLogits or PLogits.
+
+    Comments
+    --------
+        "log2prob" is used in fin_est() and est2Prob()
+        to convert logits into probabilities.  This is ordinarily
+        a simple conversion according to the cell formula:
+
+            Prob = exp(Logit) / (1 + exp(Logit))
+
+        However, when data are ordinal and have only two or three
+        categories, the logit formula produces distortions,
+        in which case it is better to do a simple linear conversion:
+
+            Prob = Logit * (Max_p - Min_p) / (MaxLog - MinLog)
+
+        where Max_p and Min_p are the target maximum and minimum
+        probabilities (calculated by the function) and MaxLog and
+        MinLog are the maximum and minimum logit estimates.
+
+        log2prob() handles these situations.
+
+    Arguments
+    ---------
+        "logits" is a 2-D array of logit values to convert
+        to probabilities
+
+        ---------------
+        "colkeys" is a 1-D array of column keys corresponding to
+        columns with analyzable data in them.
+
+        ---------------
+        "validchars" is the validchars attribute of the Damon object.
+        It's column IDs correspond to the original array, not to
+        parsed or standardized arrays.  validchars may be either
+        in 'All' or 'Cols' format.
+
+        ---------------
+        "sigma_thresh" is the integer number of response categories
+        below which it is assumed that an ordinal scale should be
+        treated as interval.  This is generally 2; dichotomous data
+        have too few categories to discern its underlying sigmoid
+        structure.
+
+        ---------------
+        "nanval" is the Not-a-Number value.
+
+    Examples
+    --------
+
+
+    Paste function
+    --------------
+        log2prob(logits,    # [2-D array of logit values to convert to probabilities]
+                 colkeys,   # [1-D array of column keys]
+                 validchars,    # [Damon validchars specification]
+                 sigma_thresh = 2,    # [Number of categories below which ordinal scale is treated as ordinal]
+                 nanval = -999, # [Not-a-number value]
+                 )
+
+    """
+
+    exc = 'Sorry, log2prob() is unavailable.\n'
+    raise log2prob_Error(exc)
+
+##    # Get metrics, min/max
+##    VCOut = tools.valchars(validchars,    # ['validchars' output of data() function]
+##                         dash = ' -- ', # [Expression used to denote a range]
+##                         defnone = 'interval',   # [How to interpret metric when validchars = None]
+##                         retcols = colkeys,    # [<None, [list of core col keys]>]
+##                         )
+##
+##    OrigMetric = VCOut['metric']
+##    minmax = VCOut['minmax']
+##
+##    # Get col ents
+##    Ents = colkeys
+##
+##    # Get
+##
+##
+##    # Case1:  convert to 0 - 1 without using the probability formula (for 2, 3 category data)
+##    if OrigMetric[1][Ent] == 'ordinal':
+##        Min = minmax[1][Ent][0]
+##        Max = minmax[1][Ent][1]
+##        nCats = Max - Min + 1
+##        SigThresh = 2   # Magic number of categories below which the ordinal scale is treated like an interval scale
+##
+##        if nCats <= SigThresh:
+##            MinEst = np.amin(AdjEntCore[np.where(AdjEntCore != nanval)])
+##            MaxEst = np.amax(AdjEntCore[np.where(AdjEntCore != nanval)])
+##
+##            # PLogits are forced to extend from 0.0 to 1.0 (otherwise, they tend to be too narrow)
+##            if stdmetric == 'PLogit':
+##                Min_p = 0.0
+##                Max_p = 1.0
+##
+##            # For other metrics, get min and max p from the estimates
+##            else:
+##                Min_p = np.exp(MinEst) / (1.0 + np.exp(MinEst))
+##                Max_p = np.exp(MaxEst) / (1.0 + np.exp(MaxEst))
+##
+##            p_ = np.where(AdjEntCore == nanval,nanval,(AdjEntCore - MinEst) / (MaxEst - MinEst))
+##            p_EntCore = np.where(p_ == nanval,nanval,p_ * (Max_p - Min_p) + Min_p)
+##
+##        else:
+##            # Same as Case2
+##            p_EntCore = np.where(AdjEntCore == nanval,nanval,np.exp(AdjEntCore) / (1.0 + np.exp(AdjEntCore)))
+##
+##            if GetSE is True:
+##                p_EntCoreSE = np.where(AdjEntCore == nanval,nanval,(np.exp(AdjEntCore) * AdjEntCoreSE) / ((1.0 + np.exp(AdjEntCore))**2))
+##
+##    # Case2: convert to 0 - 1 using the p = exp(x) / (1 + exp(x)) formula
+##    else:
+##        p_EntCore = np.where(AdjEntCore == nanval,nanval,np.exp(AdjEntCore) / (1.0 + np.exp(AdjEntCore)))
+##
+##        if GetSE is True:
+##            p_EntCoreSE = np.where(AdjEntCore == nanval,nanval,(np.exp(AdjEntCore) * AdjEntCoreSE) / ((1.0 + np.exp(AdjEntCore))**2))
+##
+##
+
+
+
+###########################################################################
+
+def metricprob(estimates,  # [array of estimates for which we want a cumulative probability]
+               colkeys,    # [1-D array of column keys]
+               ecutmaxpos, # [<['All',[ECut,MaxPos]], ['Cols',{'ID1':[ECut1,MaxPos1],...}]> ]
+               pcut = 0.50, # [Probability separating "success" from "failure"]
+               logits = True,    # [<None, True> => return logits instead of probabilities]
+               nanval = -999., # [Not-a-Number Value]
+               ):
+    """Calculate a cell's "metric" probability.
+
+    Returns
+    -------
+        An array of probabilities representing a one-to-one metric
+        conversion of Damon estimates to probabilities.  Each cell
+        is the probability that a cell observation will be greater
+        than the specified cut-point (ECut), assuming constant
+        cell variance.
+
+        cumnormprob() can output logits instead of probabilities.
+
+    Comments
+    --------
+        metricprob() is not so much a statistical probability as
+        a metric conversion from a fuzzy sigmoid estimates metric
+        to a stricter sigmoid metric that falls between 0 and 1.
+
+        The statistical probability is obtained used the cumnormprob()
+        function.  It is more accurate as a "probability" because it
+        takes into account the effect of differing cell errors on
+        probability.   However, it does so at the cost of sacrificing
+        any metric reproducibility across datasets.  Its measures
+        are unique to the testing occasion.
+
+        The metricprob() function, being a straightforward metric
+        transformation from estimates to probabilities, produces
+        probabilities and logits that are more likely to reproduce
+        across datasets.  However, this only holds when we can
+        have faith in the metric properties of the Damon estimates.
+        With dichotomous data, these metric properties can suffer
+        distortions at the extremes, in which case cumnormprob() is
+        better.
+
+        Why do a conversion at all?  Why not use Damon estimates as
+        they are?  The reason is that Damon's coord() function is
+        based on ordinary least squares, which assumes that the data
+        are continuous and unbounded.  When the data are sigmoid, or
+        polytomous, or dichotomous, some requirements of ordinary
+        least squares are violated.  Most commonly, these issues are
+        dealt with by not using least squares but some form of maximum
+        likelihood, as is done with logistic regression and Rasch
+        models.  However, in the context of Damon, maximum likelihood
+        is computationally prohibitive.  Therefore, Damon uses a variation
+        of what is called a Linear Probability model (LPM) -- basically,
+        linear least squares applied to dichotomous data.  This approach
+        is computationally less demanding and makes it possible to use the
+        same algorithm for dichotomous, polytomous, and continuous data.
+        The problem with LPM is that it applies a technique valid for
+        continuous interval data to discrete and ordinal data, where it
+        is not valid, and this can distort the estimates in several
+        ways.  One of those ways is to produce estimates that look
+        like probabilities (in the case of dichotomous data) but in
+        fact spill above 1 and below 0 (or above the maximum and below
+        the minimum of the ordinal range).  metricprob() forces the
+        data into the proper range and to behave metrically like
+        probabilities and logits.
+
+        When Damon inputs are ordinal or, in the most extreme case,
+        dichotomous (0,1), the resulting estimates, though continuous, are
+        nonlinear.  They are influenced by a somewhat fuzzy floor and
+        ceiling, spilling above the ceiling and below the floor.  They
+        are too fuzzy to be used as probabilities (though they are
+        nonlinear, like probabilities) and too nonlinear to be used as
+        measures.  metricprob() is the solution to the problem of estimates
+        that spill out of range.
+
+        metricprob() is built for the fuzzily bounded sigmoid output
+        produced by Damon when fed ordinal data.  It matches a fuzzy
+        estimates sigmoid function against an idealized probability
+        sigmoid function and converts one to the other.
+
+    Derivation
+    ----------
+        Probability/Bounding Formula:
+            m = theoretical max possible estimate
+            e = estimate cut-point for success (ECut)
+            p = target probability cut-point for success (pcut)
+            E = nonlinear estimate
+            P = target probability
+            x = coefficient
+            y = intersept
+
+        It has been determined that damon estimates have the
+        same sigmoid relationship to the underlying variable as
+        the probability of "success" in exceeding a given
+        threshold on the variable.  Because the estimates and
+        their associated probabilities have the same sigmoidal
+        relationship to a third variable, they have a linear
+        relationship to each other, which can be expressed as
+        follows:
+
+        1	P = Ex + y
+
+                Let:
+        2	mx + y = 1
+        3	ex + y = p
+
+                Then,
+        4	mx + y = 1
+        5	mx = (1 - y)
+        6	x = 1/m - y/m = (1 - y)/m
+
+                Solve for y:
+        7	ex + y = p
+        8	e(1 - y)/m + y = p
+        9	e/m - ye/m + y = p
+        10	e/m + y(1 - e/m) = p
+        11	y(1 - e/m) = p - e/m
+        12	y = (p - e/m) / (1 - e/m)
+        13	y = (mp - e) / (m - e)
+
+                Solve for x:
+        14	x = 1/m - y/m
+        15	x = 1/m - (mp - e)/m(m - e)
+
+        This formula does not work if m (theoretical max possible estimate)
+        is less than or equal e (estimate cut-point for success), and it
+        rarely makes sense for it to be less than 1.0.  Therefore, metricprob()
+        sets 1.0 as the smallest allowable maximum value.  It can get m
+        automatically by looking for maximum values in the array, or
+        separately for each column, or it can be entered manually at any
+        value.  These options are controlled with the 'MaxPos=' argument.
+
+        Technically, this formula could yield values above 1.0 and below 0.0
+        though only in a strictly linear way.  It could happen, for instance,
+        if an estimate exceeds the maximum possible value, or is smaller than
+        the smallest possible value as determined by the formula.  To avoid
+        these cases (which cause an error in the logit formula), metricprob()
+        clips probability values above 0.999999 or below 0.000001, forcing them to
+        fall within range.
+
+    Arguments
+    ---------
+        "estimates" is a 2-dimensional array of estimates which we want to
+        convert to probabilities.
+
+        ---------------
+        "colkeys" is a 1-dimensional array of column keys which label each
+        data column.
+
+        ---------------
+        "ecutmaxpos" is specified in and output as part of the base_est()
+        method.  It specifies the ECut and MaxPos parameters for each
+        item.  Documentation on ecutmaxpos is available in the base_est() docs.
+
+        Here are the options:
+
+            ecutmaxpos = ['All',[ECut,MaxPos]]
+
+        means that the values given for ECut and MaxPos apply to the
+        whole matrix, across all columns.
+
+            ecutmaxpos = ['All',['Med','Max']]
+
+        means that ECut should be the median ('Med') of the whole array
+        and MaxPos should be the maximum ('Max') of the whole array.
+
+            ecutmaxpos = ['Cols',['Med','Max']]
+
+        means that the ECut and MaxPos for each column should be the
+        median and maximum value of that column, calculated separately
+        for each column.
+
+            ecutmaxpos = ['Cols',{'ID1':['Med','Max'],'ID2':[10,25],...}]
+
+        means that for the 'ID1' column ECut should be the column median
+        and MaxPos should be the maximum value in the column.  For the
+        'ID2' column, ECut should be 10 and MaxPos should be 25.  And so
+        on, for all the columns.
+
+        ---------------
+        "pcut" is the probability value that corresponds to "ECut", almost
+        always set at 0.50 by convention.  Say the estimates range from
+        0 to 3 and the ECut is 2.0.  What this means is that an ECut of 2.0
+        is defined to imply a probability of 0.50.  But you could define
+        it to imply a probability of, say, 0.75.  pcut is how you do that.
+
+        ---------------
+        "logits" = True instructs the function to return a logit
+        in addition to a probability, where
+
+            logit = log( p / (1 - p) )
+
+        ---------------
+        "nanval" is the Not-a-Number value used to flag invalid values
+        in the estimates array, if they exist.
+
+    Examples
+    --------
+
+
+
+    Paste function
+    --------------
+        metricprob(estimates,  # [array of estimates for which we want a cumulative probability]
+                   colkeys,    # [1-D array of column keys]
+                   ecutmaxpos, # [<['All',[ECut,MaxPos]], ['Cols',{'ID1':[ECut1,MaxPos1],...}]> ]
+                   pcut = 0.50, # [Probability separating "success" from "failure"]
+                   logits = True,    # [<None, True> => return logits instead of probabilities]
+                   nanval = -999., # [Not-a-Number Value]
+                   )
+
+    """
+
+    # Get variables
+    Est = estimates
+    ncols = np.size(Est,axis=1)
+    pcut = float(pcut)
+
+    # Parse ecutmaxpos argument
+    ECut = np.zeros((ncols)).astype(float)
+    Max = np.zeros((ncols)).astype(float)
+
+    if ecutmaxpos is None:
+        print "Warning in metricprob(): ecutmaxpos = None.  Changing it to ['Cols',['Med','Max']].\n"
+        ecutmaxpos = ['Cols',['Med','Max']]
+
+    # Get ECut and MaxPos for whole array
+    elif ecutmaxpos[0] == 'All':
+        ValEst = Est[np.where(Est != nanval)]
+        if np.sum(ValEst) == 0:
+            exc = 'Could not find valid data.\n'
+            raise metricprob_Error(exc)
+
+        # Get ECut
+        if ecutmaxpos[1][0] == 'Med':
+            ECut[:] = np.median(ValEst)
+        else:
+            ECut[:] = ecutmaxpos[1][0]
+
+        # Get MaxPos
+        if ecutmaxpos[1][1] == 'Max':
+            Max[:] = np.max(ValEst)
+        else:
+            Max[:] = ecutmaxpos[1][1]
+
+    # Get ECut and MaxPos for individual columns
+    elif ecutmaxpos[0] == 'Cols':
+
+        # Get ECut
+        if type(ecutmaxpos[1]) is not type({}):
+            if ecutmaxpos[1][0] == 'Med':
+                for i in xrange(ncols):
+                    ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
+                    if np.sum(ValEst) == 0:
+                        ECut[i] = nanval
+                    else:
+                        ECut[i] = np.median(ValEst)
+            else:
+                for i in xrange(ncols):
+                    ECut[i] = ecutmaxpos[1][0]
+
+
+        elif type(ecutmaxpos[1]) is type({}):
+            for i in xrange(ncols):
+                ECut[i] = ecutmaxpos[1][colkeys[i]][0]
+
+        # Get MaxPos
+        if type(ecutmaxpos[1]) is not type({}):
+            if ecutmaxpos[1][1] == 'Max':
+                for i in xrange(ncols):
+                    ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
+                    if np.sum(ValEst) == 0:
+                        Max[i] = nanval
+                    else:
+                        Max[i] = np.amax(ValEst)
+            else:
+                for i in xrange(ncols):
+                    Max[i] = ecutmaxpos[1][1]
+
+        elif isinstance(ecutmaxpos[1],dict):
+            for i in xrange(ncols):
+                Max[i] = ecutmaxpos[1][colkeys[i]][1]
+
+    # Clip Max so that it is at least 1.0
+    Max = np.clip(Max,1.0,max(np.max(Max),1.0))
+
+    # Define x and y for each column
+    x = np.zeros((ncols)).astype(float)
+    y = np.zeros((ncols)).astype(float)
+    for i in xrange(ncols):
+        x[i] = 1.0/Max[i] - (Max[i]*pcut - ECut[i]) / (Max[i]*(Max[i] - ECut[i]))
+        y[i] = (Max[i]*pcut - ECut[i]) / (Max[i] - ECut[i])
+
+    # Multiply estimates in each column by their corresponding x, add y
+    CellProb = Est * x
+    CellProb = CellProb + y
+    CellProb = np.clip(CellProb,0.000001,0.999999)
+    CellProb = np.where(Est == nanval, nanval, CellProb)
+
+    # Convert to logits
+    if logits is True:
+        Log = np.where(CellProb == nanval, 
+                       nanval, 
+                       np.log(CellProb / (1. - CellProb)))
+    else:
+        Log = None
+
+    return {'Prob':CellProb,'Logit':Log}
+
+
+
+
+###########################################################################
+
+def unbiasest(E,    # [Estimate array to be adjusted]
+              Res,  # [Residual array corresponding to E and to U coordinates]
+              h,    # [h-statistics calculated using same U as Res, E]
+              nanval,   # [float Not-a-Number Value]
+              ):
+    """Returns estimates as if corresponding observations were deleted.
 
-        --------------
-        "colkeys" is a 1-dimensional array of column keys, the unique
-        identifiers for each column in estimates and ear.  It only needs
-        to be specified when ecut contains a column dictionary.
-        
-        --------------        
-        "ecut" is specified in, and output as part of, the base_est()
-        method as part of the ecutmaxpos parameter.  (The "maxpos" half of
-        the parameter is not used.  Documentation on ecutmaxpos is available 
-        in the base_est() docs.)  In short, ecut is the estimates cut-point
-        above which an estimate is named a "success".
+    Returns
+    -------
+        estimates as if corresponding observations were deleted
 
-        Here are the options:
+    Comments
+    --------
+        'Res' (residual) and 'h' (leverage statistic) need to
+        be computed from the same U coordinate system (R or C).
+        The formula is:
 
-            ecut = ['All', ecut]
+            E1 - E[missing] = Res * h / (1 - h)
+            E[missing] = E1 - (E1 - E[missing])
 
-        means that the values given for ecut apply to the whole array, 
-        across all columns.
+    Paste function
+    --------------
+        unbiasest(E,    # [Estimate array to be adjusted]
+                  Res,  # [Residual array corresponding to E and to U coordinates]
+                  h,    # [h-statistics calculated using same U as Res, E]
+                  nanval,   # [float Not-a-Number Value]
+                  )
 
-            ecut = ['All', 'Med']
 
-        means that ecut should be the median ('Med') of the whole array.
+    """
+    UnbiasedEst = E - Res * h / (1 - h)
+    UnbiasedEst = np.where(Res == nanval,E,UnbiasedEst)
 
-            ecut = ['Cols', 'Med']
+    return UnbiasedEst
 
-        means that the ECut and MaxPos for each column should be the
-        median and maximum value of that column, calculated separately
-        for each column.
 
-            ecut = ['Cols',{'ID1':'Med','ID2':25, ...}]
+###########################################################################
 
-        means that for the 'ID1' column ecut should be the column median,
-        for the 'ID2' column, ecut should be 25, and so on, for all the 
-        columns.
+def sterrpbc(st_err,  # [vector or array of cell standard errors]
+             rmse_reg = 1,   # [None, Compute regular root mean square error (row_ptbis and col_ptbis = None)]
+             row_ptbis = None,     # [None, Vector of row point biserials, data row by row of col means]
+             col_ptbis = None,     # [None, Vector of col point biserials, data col by col or row means]
+             nanval = -999.
+             ):
+    """Aggregates standard errors weighted by point biserial correlations.
 
-        -------------- 
-        "ear" is None, a float, or an array of expected absolute residuals.
-        
-            ear = None      =>  (default). Use "resid" in the numerator (see
-                                formula in comments).  This adjusts the
-                                residuals for the dichotomous distortion.
-            
-            ear = 1.0       =>  Use 1.0 in the numerator. This returns the
-                                logit binomial variance.
-            
-            ear = ear_array =>  Use the array of expected absolute residuals
-                                in the numerator.
+    Returns
+    -------
+        Scalar representing the aggregated standard error
+        taking into account the correlations between
+        entities.
 
-        -------------- 
-        "new_logits" (bool, default is False) controls how to calculate p 
-        in the formula above.
-        
-            new_logits = True
-                            =>  Calculate p and corresponding logits using
-                                the "ear" parameter. 
-                                
-                                Advantage: the resulting logits and 
-                                probabilities are rescaled from the
-                                somewhat arbitrary "prelogit" metric to take
-                                into account the noisiness of the data.  The
-                                new logits will have a linear relationship to
-                                the "prelogits".
-                                
-                                Disadvantage: the new logits, if used as cell
-                                estimates, will no longer be in sync with the 
-                                corresponding array coordinates, so will no
-                                longer support equating.
-            
-            new_logits = False
-                            =>  Preserve the prelogit metric.
-                            
-                                Since equating is of paramount importance and
-                                the logit metric less so, this is the default.
+    Comments
+    --------
+        This is a method of aggregating cell standard errors
+        that is specific to Damon and has not been studied
+        in depth.  It is based on the premise that while an
+        ordinary root mean squared error is sufficient for
+        unidimensional arrays where the model correlations
+        between entities is 1.0, it may understate the aggregated
+        standard error for multidimensional arrays whose
+        model correlations between entities may be less
+        than 1.0.
 
-        -------------- 
-        "validchars" is the validchars parameter of the Damon object,
-        presumably ['All', [0, 1], 'Num'] or something similar.  It
-        is used to determine whether the data are ordinal.
-        
-        -------------- 
-        "nanval" is the not-a-number value
+        The method is currently not in use due to the
+        formula not having been sufficiently studied and
+        the computational complexity of implementing it.
+        It requires calculating what is called the Root Point-
+        Biserial Weighted Mean Square Error, which was calculated
+        in the summstat() function but is no longer.  Perhaps it
+        will be reintroduced.  Anyway, here is how it works.
 
-    Paste Function
-    --------------
-        pq_resid(est,     # [array of prelogit-based estimates]
-                 resid,   # [None, raw residuals]
-                 colkeys = None,    # [<None, 1-D array of column keys>]
-                 ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]
-                 ear = None, #[<None, float, ear array]
-                 new_logits = False, #[<True, False>]
-                 validchars = ['All', [0, 1]],
-                 nanval = -999. # [not-a-number value]
-                 )
+        When aggregating a range of cells, the rows and columns are
+        done separately, then combined.  The resulting formula for
+        the RPBWMSE (Root Point-Biserial "Weighted" Mean Squared Error)
+        is:
 
-    """
-    # Calc probabilities
-    ear_ = ear if new_logits else None
-    cum = cumnormprob(est, ear_, None, ecut, False, nanval)
-    p = cum['Prob']
-    vc = valchars(validchars)['metric']
-    
-    # Standardize by whole array
-    if vc[0] == 'All':
-        if vc[1] != 'ordinal':
-            new_resid = resid
-        else:
-            if ear is None:
-                res = resid
-                if res is None:
-                    exc = 'resid and ear params cannot both be None.'
-                    raise ValueError(exc)
-            else:
-                res = ear
-            
-            if resid is not None:
-                ix = resid == nanval
-            elif isinstance(res, np.ndarray):
-                ix = res == nanval
-            else:
-                ix = None
-            new_resid = res / np.sqrt(p * (1 - p))
-            
-            if ix is not None:
-                new_resid[ix] = nanval
-    
-    # Standardize by col
-    elif vc[0] == 'Cols':
-        new_resid = np.zeros(np.shape(resid))
-        for i, col in enumerate(colkeys):
-            
-            # col not in vc[1] assumes parsed id and thus ordinal data
-            if col not in vc[1] or vc[1][col] != 'ordinal':
-                new_resid[:, i] = resid[:, i]
-            else:
-                if resid is not None:
-                    res_ = resid[:, i]
-                else:
-                    res_ = None
-                    
-                if ear is None:
-                    res = res_
-                    if res is None:
-                        exc = 'resid and ear params cannot both be None.'
-                        raise ValueError(exc)
-                else:
-                    if isinstance(ear, np.ndarray):
-                        res = ear[:, i]
-                    else:
-                        res = ear
-                
-                if resid is not None:
-                    ix = res_ == nanval
-                elif isinstance(res, np.ndarray):
-                    ix = res == nanval
-                else:
-                    ix = None
-            
-                p_ = p[:, i]
-                new_resid[:, i] = res / np.sqrt(p_ * (1 - p_))
-                
-                if ix is not None:
-                    new_resid[ix, i] = nanval            
-            
-    return {'new_resid':new_resid, 'new_logit':cum['Logit']}
+        RPBWMSE^2 = sum(s[ij]^2) / ( sum(R[iI]^2) * sum(R[jJ]^2) )
+        RPBWMSE = sqrt(RPBWMSE^2)
+
+        where s[ij] is the standard error of the estimate in the cell
+        for row i and column j, and R[iI] is the pt.bis. correlation
+        between row i and the row of column means I, and R[jJ] is
+        the pt.bis. correlation between column j and the column
+        of row means J.  When the data are 1-dimensional, all rows and
+        columns are perfectly correlated with each other, causing
+        the correlations to be 1.0, at which point RPBWMSE = RMSE across
+        the range.
+
+        "Weighted" is in quotes since the formula is not a true
+        weighting; the numerator does not include multiplication
+        by point biserials.  However, simulation studies suggest
+        that this is the formula that properly bounds the situation
+        where all the items are perfectly correlated (divided by
+        sum of items) and the situation where the items are perfectly
+        uncorrelated with themselves and partially correlated with
+        the mean, in which case the denominator will tend toward 1.0
+        and the variance of the mean will be the sum of its component
+        variances.
+
+    Arguments
+    ---------
+        "st_err" is an array of standard errors (SE).  The cell SE
+        statistic is not to be confused with the cell EAR (expected
+        absolute residuals) statistic.
+
+        --------------
+        "rmse_reg" specifies that a regular root mean squared
+        error should be calculated, in which case set the
+        next two parameters -- row_ptbis and col_ptbis --
+        to None.  rmse_reg will yield a smaller standard error,
+        but the proper conditions for using one statistic or
+        the other are not fully understood.  RMSE is the industry
+        standard.
+
+        ---------------
+        "row_ptbis" and "row_ptbis" are vectors
+        of point-biserial correlations calculated outside
+        the function.  (It used to be calculated internally
+        by summstat(), but is no longer.)
+
+        When the error vector is a "row" of cell errors,
+        you should have calculated the col_ptbis, and
+        row_ptbis should be set at 1.0.  When the error
+        vector is a "column" of cell errors, you should have
+        calculated the row_ptbis, and the col_ptbis
+        should be set at 1.0.  When the error vector is a
+        "range" of cell errors, you should have calculated
+        both a row_ptbis and col_ptbis and entered
+        them.
 
+    Paste function
+    --------------
+        sterrpbc(st_err,  # [vector or array of cell standard errors]
+                 rmse_reg = 1,   # [None, Compute regular root mean square error (row_ptbis and col_ptbis = None)]
+                 row_ptbis = None,     # [None, Vector of row point biserials, data row by row of col means]
+                 col_ptbis = None,     # [None, Vector of col point biserials, data col by col or row means]
+                 nanval = -999.
+                 )
 
+    """
+    #Mark_sterrpbc
 
+    # Calculate standard error
+    ValErr = st_err[np.where(st_err != nanval)]
 
-###########################################################################
+    if (rmse_reg == 1
+        or (row_ptbis is None
+            and col_ptbis is None)
+        ):
+        sterr = np.sqrt(np.sum(ValErr**2) / np.size(ValErr))
 
-def cumnormprob(estimates,  # [array of estimates for which we want a cumulative probability]
-                ear,    # [<None, float, array of Expected Absolute residuals>]
-                colkeys = None,    # [<None, 1-D array of column keys>]
-                ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]> ]
-                logits = None,   # [<None, True> => return logits with probabilities]
-                nanval = -999., # [Not-a-Number Value]
-                ):
-    """Calculate a cell's cumulative normal probability.
+    elif row_ptbis is not None and col_ptbis is not None:
+        sterr = np.sqrt(np.sum(ValErr**2) / (row_ptbis * col_ptbis) )
 
-    Returns
-    -------
-        {'Prob':__,
-        'Logit':__
-        }
+    else:
+        print 'Error in sterrpbc():  Unable to reconcile input parameters.\n'
 
-        When ear is in fact the Expected Absolute Residual (EAR),
-        the function returns an array of probabilities that each cell
-        estimate will exceed a given value conditional on its EAR,
-        the "noise" or "residuals" associated with that row and column
-        regardless of the number of data points.  Each cell is the probability
-        that a cell observation will be greater than the specified cut-point
-        (ECut) given the cell estimate and its standard deviation.
+    return sterr
 
-        If logits = True, logit equivalents are also returned.
 
-    Comments
-    --------
-        Note that we define the distribution in terms of the expected
-        standard deviation of the estimate (a function of the size of
-        the residuals in that cell's row and column), not its
-        standard error (a function of the standard deviation
-        and the number of observations that go into calculating the
-        estimate).  Thus, the resulting probability is not sensitive
-        to the size of the data set.  It is driven not by the precision
-        and reliability of the estimate, which can be high even if
-        it poorly predicts the observed values, but by the precision
-        and reliability of the observation -- the observation error.
 
-        One could, however, let EAR equal the cell standard error,
-        which gets smaller as the number of observations increases.
-        The resulting probability would reflect how certain we are
-        that the estimate is indeed accurate, which has its own uses.
 
-        There are other ways to define the probability.  The metricprob()
-        function does a simple linear transformation to force Damon
-        estimates to have the same sigmoid metric as probabilities.
-        This function is suitable when there is confidence in the
-        metric properties of the estimates and our goal is not
-        so much to calculate a cell probability as a stable, reproducible
-        set of measures.
 
-        The cumnormprob() probabilities are defined more in accordance
-        with statistical definitions of probability.  Probability is
-        a function of "how certain" we are of meeting some condition.
-        Thus, cumnormprob() is a function of the standard deviation (EAR)
-        of the estimates -- their noisiness or uncertainty.  This gives
-        a more accurate prediction of the probability of a response
-        (since it takes into account the effect of error on probability)
-        but at the expense of metric reproducibility.
 
-        To calculate the cumulative probability, it is useful to
-        consider that the cell estimate can be thought of as the mean
-        of a large number of observations for that cell.  In reality,
-        we only have one observation, but Damon leverages the data in
-        the remainder of the dataset so that its cell estimates are
-        mathematically comparable to taking the mean of a lot of
-        observations for a given cell.  Similarly, the Expected Absolute
-        Residual (EAR) is equivalent to its standard deviation.
 
-        We are after the probability that the observed value is higher
-        than the cut-point ("ecut") given the cell estimate and EAR, or one
-        less the probability that the observed value is lower than the
-        cut-point.  Consider a Gaussian distribution whose mean is
-        the estimate and whose standard deviation is the EAR.  The ecut
-        falls somewhere on this distribution.  The probability of
-        failure (the observation being below ecut) is the area of the
-        curve below ecut.  The probability of success is 1 - P[Failure].
 
-        To calculate the error of the curve below ecut, we need to
-        calculate the integral of the normal distribution curve, which
-        has no explicit closed form solution.  However, it can be
-        approximated by a number of methods.  One commonly used method,
-        and the one used here, comes from Abramowitz and Stegun (1964)
-        (see Wikipedia, Normal Distribution).
+
+
+###########################################################################
+
+def separation(stdev,   # [<None, standard deviation of the cell values>]
+               sterr,   # [<standard error, output of rmsr() or sterrpbc()>]
+               estimates = None, # [<None, array of estimates>]
+               nanval = -999 # [<not-a-number value]
+               ):
+    """Returns the "separation" of a set of measurements, their
+    spread relative to their noise.
+
+    Returns
+    -------
+        Scalar representing the ratio of the spread of a
+        set of measures relative to their average error of
+        measurement.  It is also described as the ratio of
+        true to observed variance.  Converted to a 0.0 - 1.0
+        metric with reliability(), it is equivalent to a
+        Cronbach-alpha statistic.
+
+    Comments
+    --------
+        "separation" provides some flexibility in the
+        the range of input parameters.  If you have already
+        aggregated standard errors and have a standard
+        deviation, it is only necessary to enter values
+        for stdev and sterr.
+
+        If these statistics are not available, separation()
+        will calculate them based on estimates and st_err.
+
+        If you want to take into account correlations between
+        entities in aggregating standard errors, you can enter
+        non-1.0 point-biserial correlation vectors.  (This can
+        also be done by entering the output of sterrpbc()
+        for sterr.)
+
+        Aggregating Standard Errors
+        ---------------------------
+        Ordinarily, standard errors are aggregated by taking
+        the root of their mean squares.  Damon currently
+        employs this method of aggregation.  However, it
+        has been surmised that in multidimensional measurement
+        account should be taken of the degree to which each
+        contributing variable is correlated with the measure
+        of interest.  This statistic can be obtained
+        using Damon's sterrpbc() function.  However, it is
+        not known yet whether it is worth the computational
+        effort.        
 
     Arguments
     ---------
-        "estimates" is an array of cell estimates for which we want a probability.
-        It will generally be the output of the base_est() method.
+        "stdev" is the standard deviation of the cell estimates.
+        If None, it will be calculated from estimates.  stdev can
+        also be an array when calculating a separation statistic
+        for each column.
 
         --------------
-        "ear" is the array of "expected absolute residuals" of the
-        estimate, found by running the coord() and base_est() methods on
-        an array of absolute residuals.  It can also be a single number,
-        such as a mean EAR.  If ear is None, the estimates (which should be
-        in a prelogit metric) will be returned unchanged, along with 
-        probabilities.
+        "sterr" is the aggregated standard error, either the
+        root mean squared error (which can be obtained using rmsr())
+        or the point biserial correlation weighted standard error
+        (obtained using sterrpbc()).  sterr can also be an array
+        when calculating a separation statistic for each column.
 
         --------------
-        "colkeys" is a 1-dimensional array of column keys, the unique
-        identifiers for each column in estimates and ear.  It only needs
-        to be specified when ecut contains a column dictionary.
+        "estimates" is an array of estimates, set to None if
+        the stdev and sterr paramters are not None. 
 
-        ---------------
-        "ecut" is specified in, and output as part of, the base_est()
-        method as part of the ecutmaxpos parameter.  (The "maxpos" half of
-        the parameter is not used.  Documentation on ecutmaxpos is available 
-        in the base_est() docs.)  In short, ecut is the estimates cut-point
-        above which an estimate is named a "success".
+        --------------
+        "nanval" is the not-a-number value.
 
-        Here are the options:
+        NOTE: separation() supports array calculation when
+        stdev and sterr are arrays.
 
-            ecut = ['All', ecut]
+    Paste function
+    --------------
+        separation(stdev,   # [<None, standard deviation of the cell values>]
+                   sterr,   # [<standard error, output of rmsr() or sterrpbc()>]
+                   estimates = None, # [<None, array of estimates>]
+                   nanval = -999 # [<not-a-number value]
+                   )
+    """    
+    if isinstance(stdev, np.ndarray) and isinstance(sterr, np.ndarray):
+        diff = np.clip(stdev**2 - sterr**2, 0, np.inf)
+        sep = np.sqrt(diff) / sterr
+#        sep[np.isnan(sep)] = 0.0
+        nix = (stdev == nanval) | (sterr == nanval)
+        sep[nix] = nanval
+        return sep
+    else:
+        if stdev is None:
+            try:
+                stdev = np.std(estimates[estimates != nanval])
+            except TypeError:
+                exc = "If stdev is None, estimates cannot be None"
+                raise separation_Error(exc)
+    
+        # Calculate separation
+        if (stdev**2 - sterr**2) <= 0.:
+            sep = 0.
+        else:
+            sep = np.sqrt(stdev**2 - sterr**2) / sterr
+    
+        return sep
 
-        means that the values given for ecut apply to the whole array, 
-        across all columns.
 
-            ecut = ['All', 'Med']
+###########################################################################
 
-        means that ecut should be the median ('Med') of the whole array.
+def reliability(sepstat,   # [None, output of separation()]
+                estimates = None, # [None, array of estimates]
+                stdev = None, # [<None, stdev of estimates]
+                sterr = None,   # [None, root mean square error, output of rmsr() or sterrpbc()]
+                nanval = -999,
+                ):
+    """Returns the "reliability" of a set of measurements as a Cronbach-alpha.
 
-            ecut = ['Cols', 'Med']
+    Returns
+    -------
+        Scalar between zero and 1.0 representing the
+        reliability of a set of measures, the degree
+        to which they are disentangled from error.
 
-        means that the ECut and MaxPos for each column should be the
-        median and maximum value of that column, calculated separately
-        for each column.
+    Comments
+    --------
+        reliability is a conversion of the Separation
+        ratio into a number between zero and one.  It answers
+        the question, "How orderly are these measures?"  If
+        the measures are representative of what can be expected
+        of these entities in other testing situations, the
+        number indicates the overall likelihood of obtaining
+        the same measures from different data.
 
-            ecut = ['Cols',{'ID1':'Med','ID2':25, ...}]
+        It is equivalent to the Cronbach-alpha statistic.
 
-        means that for the 'ID1' column ecut should be the column median,
-        for the 'ID2' column, ecut should be 25, and so on, for all the 
-        columns.
+    Arguments
+    ---------
+        "sepstat" is the Separation statistic output by
+        separation().  If this is available, all the remaining
+        parameters may be set to None
 
         --------------
-        "logits" = True instructs the function to return a logit
-        in addition to a probability, where
-
-            Logit = log( p / (1 - p) )
+        "estimates" is an array of estimates, set to None if
+        the stdev and sterr paramters are not None. Set to None 
+        if sepstat is not None.
 
         --------------
-        "nanval" is the Not-a-Number value used to signify an invalid
-        estimate.
+        "stdev" is the standard deviation of the cell estimates.
+        They cannot contain NaNVals.  Set to None if sepstat
+        is not None.
 
-    Examples
-    --------
+        --------------
+        "sterr" is the aggregated standard error, either the
+        root mean squared error (which can be obtained using rmsr())
+        or the point biserial correlation weighted standard error
+        (obtained using sterrpbc()).  Set to None if sepstat
+        is not None.
 
+        --------------
+        "nanval" is the not-a-number value.
 
+        NOTE:  reliability() supports array calculation if sepstat
+        is an array.
 
     Paste function
     --------------
-    cumnormprob(estimates,  # [array of estimates for which we want a cumulative probability]
-                ear,    # [<None, float, array of Expected Absolute residuals>]
-                colkeys = None,    # [<None, 1-D array of column keys>]
-                ecut = ['All', 0.0], # [<['All', ecut], ['Cols',{'ID1':ecut, ...}]> ]
-                logits = None,   # [<None, True> => return logits with probabilities]
-                nanval = -999., # [Not-a-Number Value]
-                )
+        reliability(sepstat,   # [None, output of separation()]
+                    estimates = None, # [None, array of estimates]
+                    stdev = None, # [<None, stdev of estimates]
+                    sterr = None,   # [None, root mean square error, output of rmsr() or sterrpbc()]
+                    nanval = -999,
+                    )
     """
-    if len(np.shape(estimates)) < 2:
-        Est = estimates[:, np.newaxis]
+    if isinstance(sepstat, np.ndarray):
+        rel = sepstat**2 / (1 + sepstat**2)
+        rel[sepstat == nanval] = nanval
+        return rel
     else:
-        Est = estimates
-
-    if isinstance(ear, np.ndarray):
-        if len(np.shape(ear)) < 2:
-            ear = ear[:, np.newaxis]
+        if sepstat is None:
+            if stdev is not None and sterr is not None:
+                sepstat = separation(stdev, sterr)
+            elif estimates is not None and sterr is not None:
+                stdev = np.std(estimates[estimates != nanval])
+                sepstat = separation(stdev, sterr)
+            else:
+                exc = "If sepstat is None, estimates and sterr cannot be None."
+                raise reliability_Error(exc)
     
-    if ear is None:
-        Log = Est
-        P = np.where(Log == nanval, nanval, np.exp(Log) / (1 + np.exp(Log)))
-        
-        return {'Prob':P,'Logit':Log}
+        # Calculate reliability
+        rel = sepstat**2 / (1 + sepstat**2)
     
-    ncols = np.size(Est, axis=1)
+        return rel
 
-    # Define ECut_
-    Check = ['All','Cols']
-    if ('All' not in Check
-        or 'Cols' not in Check
-        ):
-        exc = 'Unable to figure out ecut.\n'
-        raise cumnormprob_Error(exc)
 
-    ECut = ecut
-    ECut_ = np.zeros((ncols))
-    if ECut[0] == 'All':
-        if ECut[1] == 'Med':
-            ValEst = Est[Est != nanval]
-            if np.sum(ValEst) == 0:
-                exc = 'Could find no valid data.\n'
-                raise cumnormprob_Error(exc)
-            else:
-                ECut_[:] = np.median(ValEst)
-        else:
-            ECut_[:] = ECut[1]
 
-    elif ECut[0] == 'Cols' and not isinstance(ECut[1], dict):
-        if ECut[1] == 'Med':
-            for i in xrange(ncols):
-                ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
-                if np.sum(ValEst) == 0:
-                    ECut_[i] = nanval
-                else:
-                    ECut_[i] = np.median(ValEst)
-        else:
-            for i in xrange(ncols):
-                ECut_[i] = ECut[1]
+###########################################################################
 
-    elif ECut[0] == 'Cols' and isinstance(ECut[1], dict):
-        col_dict = ECut[1]
-        
-        if colkeys is None:
-            colkeys = col_dict.keys()
-#            exc = ('column keys need to be specified if ecut contains a '
-#                   'column dictionary.')
-#            raise cumnormprob_Error(exc)
+def rmsear(ear,     # [array of cell Expected Absolute residuals (EAR), same size as estimates]
+           nanval = -999.    # [Not-a-Number value]
+           ):
+    """Returns root mean expected absolute residual.
 
-#        for k in col_dict.keys():
-#            if col_dict[k] == 'Med':
-#                val_est = Est[:]
-            
-        for i, k in enumerate(colkeys):
-            if col_dict[k] == 'Med':
-                val_est = Est[:]
-                if np.sum(val_est) == 0:
-                    ECut_[i] = nanval
-                else:
-                    ECut_[i] = np.median(val_est)
-            else:
-                ECut_[i] = col_dict[k]
-            
-#        for i in xrange(ncols):
-#            if ECut[colkeys[i]][0] == 'Med':
-#                ValEst = Est[:,i][Est[:,i] != nanval]
-#                if np.sum(ValEst) == 0:
-#                    ECut_[i] = nanval
-#                else:
-#                    ECut_[i] = np.median(ValEst)
-#            else:
-#                ECut_[i] = ECut[colkeys[i]][0]
+    Returns
+    ------
+        The square root of the mean of the squared expected absolute residuals
+        (EAR) across the range of the array.  When aggregated, these
+        are very similar to the root mean squared residuals (RMSR).
 
-    # Define z -- clip at z = -6.0 and 6.0
-    z = np.where(Est == nanval, nanval,
-                 np.clip((ECut_ - Est) / ear, -6.0, 6.0))
-#    PiSqrt3 = 1.81379936423422
+    Comments
+    --------
+        rmsear() is a way to measure fit between observations and estimates
+        in an absolute sense (as opposed to a relational sense, as with
+        correlations).  It may be thought of in the same way as the
+        root mean squared residual, but the root mean square expected absolute
+        residual differs in two important respects:
 
-    # Magic constants
-    b1 = 0.31938153
-    b2 = -0.356563782
-    b3 = 1.781477937
-    b4 = -1.821255978
-    b5 = 1.330274429
-    p = 0.2316419
-    c2 = 0.3989423
+            1) the RMSEAR is based on the EAR which is an expected residual
+               rather than an observed residual;
 
-    # array Calculation
-    a = abs(z)
-    t = 1.0 / (1.0 + (a * p))
-    b = c2 * np.exp((-z) * (z / 2.0))
-    Q = ((((b5 * t + b4) * t + b3) * t + b2) * t + b1) * t
-    Q = 1.0 - (b * Q)
+            2) the EAR is calculated for every cell in the matrix, including
+               missing cells, so the RMSEAR is based on the whole range;
 
-    Q = np.where(z == nanval, nanval,
-                 np.where(z < 0.0, 1.0 - Q, Q))
+            3) the individual EAR's for each cell are more precise and
+               reliable than their raw counterparts, since they draw information
+               from the rest of the array.
 
-    # Probability of success
-    P = np.where(Q == nanval, nanval, 1 - Q)
+        While missing values are not expected in the ear, a nanval argument
+        is included in case one pops up.
+
+
+    Paste function
+    --------------
+        rmsear(ear,     # [array of cell Expected Absolute residuals (EAR), same size as estimates]
+               nanval = -999.    # [Not-a-Number value]
+               )
+
+    """
+    # Compute RMSEAR
+    ValEAR = ear[np.where(ear != nanval)]
+    nEAR = float(np.size(ValEAR))
+    RMSEAR = np.sqrt(np.sum(ValEAR**2) / nEAR)
+
+    return RMSEAR
 
-    # return_ prob or logit
-    if logits is True:
-        Log = np.where(P == nanval, nanval, np.log( P / (1.0 - P)))
-    else:
-        Log = None
 
-    return {'Prob':P,'Logit':Log}
 
 
 ###########################################################################
 
-def log2prob(logits,    # [2-D array of logit values to convert to probabilities]
-             colkeys,   # [1-D array of column keys]
-             validchars,    # [Damon validchars specification]
-             sigma_thresh = 2,    # [Number of categories below which ordinal scale is treated as ordinal]
-             nanval = -999, # [Not-a-number value]
-             ):
-    """Convert logits to probabilities.
+def correl(observed,    # [2-D array of "observed" responses, may include NaNVals]
+           estimates,   # [2-D array of estimates, same size as observed, may include NaNVals]
+           nanval = -999.,       # [Not-a-Number value]
+           form = 'Corr',   # [<'Corr','Cov',,'SumProd','MeanProd'> => formula to apply]
+           count = None,   # [<None,True> => report count of valid pairs]
+           ):
+    """Correlates observations to estimates.
 
     Returns
     -------
-        2-D array of probabilities calculated from base_est()
-        outputs, where the inputs are PreLogits or PLogits.
+        When form = 'Corr', correl() returns a scalar between -1.0
+        and 1.0 representing the correlation between an array of
+        observations and an array of estimates.  It can also return
+        covariance and mean product.
+
+        When Counts is True, correl() returns a two-element list
+        instead of a scalar, where the second element is the count
+        of valid pairs that went into the statistic reported as
+        the first element:
+
+            [Stat,count]
 
     Comments
     --------
-        "log2prob" is used in fin_est() and est2Prob()
-        to convert logits into probabilities.  This is ordinarily
-        a simple conversion according to the cell formula:
+        correl() is an alternative way to measure fit between observations
+        and estimates.  It does not look at how closely they match but
+        whether they tend to move up or down similarly.  It is possible
+        to have a high correlation even if the observations and estimates
+        are very different from each other in absolute terms.
 
-            Prob = exp(Logit) / (1 + exp(Logit))
+        correl() handles missing data by doing pair-wise deletion of
+        corresponding values in the two matrices.  When the percentage
+        of missing data is not "a lot", this is reasonable for most
+        purposes.  But it is worth noting that correlations computed
+        with missing values may not be positive semi-definite, a feature
+        of correlation matrices with complete data.  This can cause
+        errors with Generalized Least Squares eigenvalue decomposition,
+        and other methodologies.  However a Damon decomposition,
+        like Singular Value Decomposition, does not require its data
+        matrices to be positive semi-definite matrices; it just calculates
+        the best-fitting estimates matrix for a given dimensionality.
+        This makes it possible for the _bestdim() function to quickly
+        determine the dimensionality of a rectangular matrix by analyzing
+        its (smaller) square correlation/covariance matrix for a specified
+        range of dimensionalities.
+
+        Incidentally, although the correlation matrix of an observed
+        array may not (due to missing data) be positive semi-definite,
+        the correlation matrix of an estimates array will be.  So Damon
+        is a simple way to find the "nearest" positive semi-definite
+        matrix to a given non-positive semi-definite matrix.
 
-        However, when data are ordinal and have only two or three
-        categories, the logit formula produces distortions,
-        in which case it is better to do a simple linear conversion:
+        Although, correl() calls for "observed" values and "estimates",
+        it can be used generically to compute the correlation between
+        any two same-sized arrays.
 
-            Prob = Logit * (Max_p - Min_p) / (MaxLog - MinLog)
+        correl() allows NaNVals in either the observed or estimates arrays.
 
-        where Max_p and Min_p are the target maximum and minimum
-        probabilities (calculated by the function) and MaxLog and
-        MinLog are the maximum and minimum logit estimates.
+        correl() uses Numpy's corrcoef(), which is a Pearson correlation,
+        or if form = 'Cov' the cov() function.  Covariance is similar to
+        correlation, except that it is not standardized.  'MeanProd' is
+        an average of products and isn't mean-referenced like covariance
+        and correlation.
 
-        log2prob() handles these situations.
+        To calculate the standard error of a correlation, use
+        tools.correl_se().
 
     Arguments
     ---------
-        "logits" is a 2-D array of logit values to convert
-        to probabilities
+        "observed" is a 2-dimensional array of observed responses (or
+        any generic array), and may include NaNVals.
 
-        ---------------
-        "colkeys" is a 1-D array of column keys corresponding to
-        columns with analyzable data in them.
+        ------------
+        "estimates" is a 2-dimensional array of estimates (or any
+        generic array) that is the same size as observed.  It also
+        may include NaNVals.
 
-        ---------------
-        "validchars" is the validchars attribute of the Damon object.
-        It's column IDs correspond to the original array, not to
-        parsed or standardized arrays.  validchars may be either
-        in 'All' or 'Cols' format.
+        ------------
+        "nanval" is the Not-a-Number value, castable to int.
 
-        ---------------
-        "sigma_thresh" is the integer number of response categories
-        below which it is assumed that an ordinal scale should be
-        treated as interval.  This is generally 2; dichotomous data
-        have too few categories to discern its underlying sigmoid
-        structure.
+        ------------
+        "form" is the formula to apply:
+            form = 'Corr'       =>  Pearson correlation
+            form = 'Cov'        =>  Covariance
+            form = 'SumProd'    =>  Sum of products, like
+                                    covariance but not norm
+                                    centered.
+            form = 'MeanProd'   =>  Mean of the products.
 
-        ---------------
-        "nanval" is the Not-a-Number value.
+
+        ------------
+        "count" <None,True>, when True, tells the function to report
+        the count of valid pairs used to calculate the statistic
+        specified by "form".  (Correlations, covariances, and mean
+        products all involve sums of products between pairs of data
+        values.  However, if either value in a pair is missing (nanval),
+        that product is made missing from the summation.)
+
+        When count = True, correl() returns a two-element list, where
+        the first element is the statistic and the second is the count.
 
     Examples
     --------
@@ -6527,1298 +10281,1233 @@ def log2prob(logits,    # [2-D array of logit values to convert to probabilities
 
     Paste function
     --------------
-        log2prob(logits,    # [2-D array of logit values to convert to probabilities]
-                 colkeys,   # [1-D array of column keys]
-                 validchars,    # [Damon validchars specification]
-                 sigma_thresh = 2,    # [Number of categories below which ordinal scale is treated as ordinal]
-                 nanval = -999, # [Not-a-number value]
-                 )
+        correl(observed,    # [2-D array of "observed" responses, may include NaNVals]
+               estimates,   # [2-D array of estimates, same size as observed, may include NaNVals]
+               nanval = -999.,       # [Not-a-Number value]
+               form = 'Corr',   # [<'Corr','Cov','SumProd','MeanProd'> => formula to apply]
+               count = None,   # [<None,True> => report count of valid pairs]
+               )
 
     """
+    # Convert into 1-dimensional arrays
+    obs = np.ravel(observed)
+    est = np.ravel(estimates)
 
-    exc = 'Sorry, log2prob() is unavailable.\n'
-    raise log2prob_Error(exc)
-
-##    # Get metrics, min/max
-##    VCOut = tools.valchars(validchars,    # ['validchars' output of data() function]
-##                         dash = ' -- ', # [Expression used to denote a range]
-##                         defnone = 'interval',   # [How to interpret metric when validchars = None]
-##                         retcols = colkeys,    # [<None, [list of core col keys]>]
-##                         )
-##
-##    OrigMetric = VCOut['metric']
-##    minmax = VCOut['minmax']
-##
-##    # Get col ents
-##    Ents = colkeys
-##
-##    # Get
-##
-##
-##    # Case1:  convert to 0 - 1 without using the probability formula (for 2, 3 category data)
-##    if OrigMetric[1][Ent] == 'ordinal':
-##        Min = minmax[1][Ent][0]
-##        Max = minmax[1][Ent][1]
-##        nCats = Max - Min + 1
-##        SigThresh = 2   # Magic number of categories below which the ordinal scale is treated like an interval scale
-##
-##        if nCats <= SigThresh:
-##            MinEst = np.amin(AdjEntCore[np.where(AdjEntCore != nanval)])
-##            MaxEst = np.amax(AdjEntCore[np.where(AdjEntCore != nanval)])
-##
-##            # PLogits are forced to extend from 0.0 to 1.0 (otherwise, they tend to be too narrow)
-##            if stdmetric == 'PLogit':
-##                Min_p = 0.0
-##                Max_p = 1.0
-##
-##            # For other metrics, get min and max p from the estimates
-##            else:
-##                Min_p = np.exp(MinEst) / (1.0 + np.exp(MinEst))
-##                Max_p = np.exp(MaxEst) / (1.0 + np.exp(MaxEst))
-##
-##            p_ = np.where(AdjEntCore == nanval,nanval,(AdjEntCore - MinEst) / (MaxEst - MinEst))
-##            p_EntCore = np.where(p_ == nanval,nanval,p_ * (Max_p - Min_p) + Min_p)
-##
-##        else:
-##            # Same as Case2
-##            p_EntCore = np.where(AdjEntCore == nanval,nanval,np.exp(AdjEntCore) / (1.0 + np.exp(AdjEntCore)))
-##
-##            if GetSE is True:
-##                p_EntCoreSE = np.where(AdjEntCore == nanval,nanval,(np.exp(AdjEntCore) * AdjEntCoreSE) / ((1.0 + np.exp(AdjEntCore))**2))
-##
-##    # Case2: convert to 0 - 1 using the p = exp(x) / (1 + exp(x)) formula
-##    else:
-##        p_EntCore = np.where(AdjEntCore == nanval,nanval,np.exp(AdjEntCore) / (1.0 + np.exp(AdjEntCore)))
-##
-##        if GetSE is True:
-##            p_EntCoreSE = np.where(AdjEntCore == nanval,nanval,(np.exp(AdjEntCore) * AdjEntCoreSE) / ((1.0 + np.exp(AdjEntCore))**2))
-##
-##
-
-
-
-###########################################################################
-
-def metricprob(estimates,  # [array of estimates for which we want a cumulative probability]
-               colkeys,    # [1-D array of column keys]
-               ecutmaxpos, # [<['All',[ECut,MaxPos]], ['Cols',{'ID1':[ECut1,MaxPos1],...}]> ]
-               pcut = 0.50, # [Probability separating "success" from "failure"]
-               logits = True,    # [<None, True> => return logits instead of probabilities]
-               nanval = -999., # [Not-a-Number Value]
-               ):
-    """Calculate a cell's "metric" probability.
-
-    Returns
-    -------
-        An array of probabilities representing a one-to-one metric
-        conversion of Damon estimates to probabilities.  Each cell
-        is the probability that a cell observation will be greater
-        than the specified cut-point (ECut), assuming constant
-        cell variance.
-
-        cumnormprob() can output logits instead of probabilities.
-
-    Comments
-    --------
-        metricprob() is not so much a statistical probability as
-        a metric conversion from a fuzzy sigmoid estimates metric
-        to a stricter sigmoid metric that falls between 0 and 1.
-
-        The statistical probability is obtained used the cumnormprob()
-        function.  It is more accurate as a "probability" because it
-        takes into account the effect of differing cell errors on
-        probability.   However, it does so at the cost of sacrificing
-        any metric reproducibility across datasets.  Its measures
-        are unique to the testing occasion.
-
-        The metricprob() function, being a straightforward metric
-        transformation from estimates to probabilities, produces
-        probabilities and logits that are more likely to reproduce
-        across datasets.  However, this only holds when we can
-        have faith in the metric properties of the Damon estimates.
-        With dichotomous data, these metric properties can suffer
-        distortions at the extremes, in which case cumnormprob() is
-        better.
+    # Filter out cases where either array has a nanval
+    nix_obs, nix_est = index_val(obs, nanval), index_val(est, nanval)
+    nix = nix_obs | nix_est
+    ValObs, ValEst = obs[~nix], est[~nix]
 
-        Why do a conversion at all?  Why not use Damon estimates as
-        they are?  The reason is that Damon's coord() function is
-        based on ordinary least squares, which assumes that the data
-        are continuous and unbounded.  When the data are sigmoid, or
-        polytomous, or dichotomous, some requirements of ordinary
-        least squares are violated.  Most commonly, these issues are
-        dealt with by not using least squares but some form of maximum
-        likelihood, as is done with logistic regression and Rasch
-        models.  However, in the context of Damon, maximum likelihood
-        is computationally prohibitive.  Therefore, Damon uses a variation
-        of what is called a Linear Probability model (LPM) -- basically,
-        linear least squares applied to dichotomous data.  This approach
-        is computationally less demanding and makes it possible to use the
-        same algorithm for dichotomous, polytomous, and continuous data.
-        The problem with LPM is that it applies a technique valid for
-        continuous interval data to discrete and ordinal data, where it
-        is not valid, and this can distort the estimates in several
-        ways.  One of those ways is to produce estimates that look
-        like probabilities (in the case of dichotomous data) but in
-        fact spill above 1 and below 0 (or above the maximum and below
-        the minimum of the ordinal range).  metricprob() forces the
-        data into the proper range and to behave metrically like
-        probabilities and logits.
+    # Check for div/0 errors
+    calc = True
+    ValObs_SD = np.std(ValObs)
+    ValEst_SD = np.std(ValEst)
 
-        When Damon inputs are ordinal or, in the most extreme case,
-        dichotomous (0,1), the resulting estimates, though continuous, are
-        nonlinear.  They are influenced by a somewhat fuzzy floor and
-        ceiling, spilling above the ceiling and below the floor.  They
-        are too fuzzy to be used as probabilities (though they are
-        nonlinear, like probabilities) and too nonlinear to be used as
-        measures.  metricprob() is the solution to the problem of estimates
-        that spill out of range.
+    if (ValObs_SD == 0
+        or ValEst_SD == 0
+        ):
+        ObsEst = nanval
+        calc = False
 
-        metricprob() is built for the fuzzily bounded sigmoid output
-        produced by Damon when fed ordinal data.  It matches a fuzzy
-        estimates sigmoid function against an idealized probability
-        sigmoid function and converts one to the other.
+    if count is True:
+        N = np.size(ValObs)
 
-    Derivation
-    ----------
-        Probability/Bounding Formula:
-            m = theoretical max possible estimate
-            e = estimate cut-point for success (ECut)
-            p = target probability cut-point for success (pcut)
-            E = nonlinear estimate
-            P = target probability
-            x = coefficient
-            y = intersept
+    # Calc relationship
+    if calc is True:
+        try:
+            if form == 'Corr':
+                ObsEst = np.corrcoef(ValObs,ValEst)[0,1]
 
-        It has been determined that damon estimates have the
-        same sigmoid relationship to the underlying variable as
-        the probability of "success" in exceeding a given
-        threshold on the variable.  Because the estimates and
-        their associated probabilities have the same sigmoidal
-        relationship to a third variable, they have a linear
-        relationship to each other, which can be expressed as
-        follows:
+            if form == 'Cov':
+                ObsEst = np.cov(ValObs,ValEst)[0,1]
 
-        1	P = Ex + y
+            if form == 'SumProd':
+                ObsEst = np.sum(np.multiply(ValObs,ValEst))
 
-                Let:
-        2	mx + y = 1
-        3	ex + y = p
+            if form == 'MeanProd':
+                ObsEst = np.mean(np.multiply(ValObs,ValEst))
 
-                Then,
-        4	mx + y = 1
-        5	mx = (1 - y)
-        6	x = 1/m - y/m = (1 - y)/m
+            if np.isnan(ObsEst):
+                ObsEst = nanval
 
-                Solve for y:
-        7	ex + y = p
-        8	e(1 - y)/m + y = p
-        9	e/m - ye/m + y = p
-        10	e/m + y(1 - e/m) = p
-        11	y(1 - e/m) = p - e/m
-        12	y = (p - e/m) / (1 - e/m)
-        13	y = (mp - e) / (m - e)
+        except IndexError:
+            ObsEst = nanval
 
-                Solve for x:
-        14	x = 1/m - y/m
-        15	x = 1/m - (mp - e)/m(m - e)
+    # return_ list if counting
+    if count is True:
+        return [ObsEst,N]
+    else:
+        return ObsEst
 
-        This formula does not work if m (theoretical max possible estimate)
-        is less than or equal e (estimate cut-point for success), and it
-        rarely makes sense for it to be less than 1.0.  Therefore, metricprob()
-        sets 1.0 as the smallest allowable maximum value.  It can get m
-        automatically by looking for maximum values in the array, or
-        separately for each column, or it can be entered manually at any
-        value.  These options are controlled with the 'MaxPos=' argument.
 
-        Technically, this formula could yield values above 1.0 and below 0.0
-        though only in a strictly linear way.  It could happen, for instance,
-        if an estimate exceeds the maximum possible value, or is smaller than
-        the smallest possible value as determined by the formula.  To avoid
-        these cases (which cause an error in the logit formula), metricprob()
-        clips probability values above 0.999999 or below 0.000001, forcing them to
-        fall within range.
 
-    Arguments
-    ---------
-        "estimates" is a 2-dimensional array of estimates which we want to
-        convert to probabilities.
 
-        ---------------
-        "colkeys" is a 1-dimensional array of column keys which label each
-        data column.
+###########################################################################
 
-        ---------------
-        "ecutmaxpos" is specified in and output as part of the base_est()
-        method.  It specifies the ECut and MaxPos parameters for each
-        item.  Documentation on ecutmaxpos is available in the base_est() docs.
+def correl_slices(observed,    # [2-D array of "observed" responses, may include NaNVals]
+                  estimates,   # [3-D array of estimates, slices x rows x cols, may include NaNVals]
+                  nanval = -999.,   # [Not-a-Number value]
+                  chunk = 50000     # [<int> => rows per block]
+                  ):
+    """Correlates observations to each slice of a stack of estimates.
 
-        Here are the options:
+    Returns
+    -------
+        correl_slices() returns a 1-D array with one Pearson
+        correlation per slice of "estimates", each equal to
+        correl(observed, estimates[i], nanval).  Slices for which
+        either array has no variation get nanval.
 
-            ecutmaxpos = ['All',[ECut,MaxPos]]
+    Comments
+    --------
+        correl_slices() is used where several candidate estimate
+        arrays are compared with the same observations, as in
+        get_unique_weight().  Rather than filtering and copying the
+        observations once per candidate, it walks the rows in blocks
+        of "chunk" rows and accumulates the sums needed for every
+        slice at once, so memory stays at slices x chunk x cols.
 
-        means that the values given for ECut and MaxPos apply to the
-        whole matrix, across all columns.
+        Missing values are handled by pair-wise deletion, separately
+        for each slice, as in correl().
 
-            ecutmaxpos = ['All',['Med','Max']]
+    Arguments
+    ---------
+        "observed" is a 2-dimensional array of observed responses,
+        and may include NaNVals.
 
-        means that ECut should be the median ('Med') of the whole array
-        and MaxPos should be the maximum ('Max') of the whole array.
+        ------------
+        "estimates" is a 3-dimensional array of estimates, with
+        one slice per candidate, each the same size as observed.
+        It may include NaNVals.
 
-            ecutmaxpos = ['Cols',['Med','Max']]
+        ------------
+        "nanval" is the Not-a-Number value.
 
-        means that the ECut and MaxPos for each column should be the
-        median and maximum value of that column, calculated separately
-        for each column.
+        ------------
+        "chunk" is the number of rows per block.
 
-            ecutmaxpos = ['Cols',{'ID1':['Med','Max'],'ID2':[10,25],...}]
+    Paste function
+    --------------
+        correl_slices(observed,    # [2-D array of "observed" responses, may include NaNVals]
+                      estimates,   # [3-D array of estimates, slices x rows x cols, may include NaNVals]
+                      nanval = -999.,   # [Not-a-Number value]
+                      chunk = 50000     # [<int> => rows per block]
+                      )
 
-        means that for the 'ID1' column ECut should be the column median
-        and MaxPos should be the maximum value in the column.  For the
-        'ID2' column, ECut should be 10 and MaxPos should be 25.  And so
-        on, for all the columns.
+    """
+    nslices, nrows = np.shape(estimates)[:2]
+    sums = np.zeros((6, nslices))
 
-        ---------------
-        "pcut" is the probability value that corresponds to "ECut", almost
-        always set at 0.50 by convention.  Say the estimates range from
-        0 to 3 and the ECut is 2.0.  What this means is that an ECut of 2.0
-        is defined to imply a probability of 0.50.  But you could define
-        it to imply a probability of, say, 0.75.  pcut is how you do that.
+    # Accumulate n, sx, sy, sxx, syy, sxy per slice
+    for i in xrange(0, nrows, chunk):
+        x = np.asarray(observed[i:i + chunk], dtype=float)
+        y = np.asarray(estimates[:, i:i + chunk], dtype=float)
+        valid = (y != nanval) & (x != nanval)
+        x = np.where(valid, x, 0.0)
+        y = np.where(valid, y, 0.0)
+        sums += [np.sum(valid, axis=(1, 2)), np.sum(x, axis=(1, 2)),
+                 np.sum(y, axis=(1, 2)), np.sum(x * x, axis=(1, 2)),
+                 np.sum(y * y, axis=(1, 2)), np.sum(x * y, axis=(1, 2))]
 
-        ---------------
-        "logits" = True instructs the function to return a logit
-        in addition to a probability, where
+    n, sx, sy, sxx, syy, sxy = sums
+    n_ = np.where(n > 0, n, 1)
+    cov = sxy - sx * sy / n_
+    varx = np.clip(sxx - sx**2 / n_, 0.0, np.inf)
+    vary = np.clip(syy - sy**2 / n_, 0.0, np.inf)
+    calc = (varx > 0) & (vary > 0)
+    r = np.zeros(nslices) + nanval
+    r[calc] = cov[calc] / np.sqrt(varx[calc] * vary[calc])
+    r[calc] = np.clip(r[calc], -1.0, 1.0)
 
-            logit = log( p / (1 - p) )
+    return r
 
-        ---------------
-        "nanval" is the Not-a-Number value used to flag invalid values
-        in the estimates array, if they exist.
 
-    Examples
-    --------
 
 
+###########################################################################
 
-    Paste function
-    --------------
-        metricprob(estimates,  # [array of estimates for which we want a cumulative probability]
-                   colkeys,    # [1-D array of column keys]
-                   ecutmaxpos, # [<['All',[ECut,MaxPos]], ['Cols',{'ID1':[ECut1,MaxPos1],...}]> ]
-                   pcut = 0.50, # [Probability separating "success" from "failure"]
-                   logits = True,    # [<None, True> => return logits instead of probabilities]
-                   nanval = -999., # [Not-a-Number Value]
-                   )
+def correl_se(correl,   # [Correlation coefficient]
+              count    # [Count of observations]
+              ):
+    """Compute the standard error of a correlation.
 
-    """
+    Returns
+    -------
+        correl_se() returns a scale equal to the standard error
+        of the correlation.
 
-    # Get variables
-    Est = estimates
-    ncols = np.size(Est,axis=1)
-    pcut = float(pcut)
+    Comments
+    --------
+        The (approximate) formula for the standard error of correlation r
+        given sample size n is:
 
-    # Parse ecutmaxpos argument
-    ECut = np.zeros((ncols)).astype(float)
-    Max = np.zeros((ncols)).astype(float)
+            SE[r] = sqrt( (1-r^2)/(n-2) )
 
-    if ecutmaxpos is None:
-        print "Warning in metricprob(): ecutmaxpos = None.  Changing it to ['Cols',['Med','Max']].\n"
-        ecutmaxpos = ['Cols',['Med','Max']]
+        Hotelling, H. (1953). New light on the correlation coefficient and its
+        transforms. Journal of the Royal Statistical Society, Series B, 15(2),
+        193-232.
 
-    # Get ECut and MaxPos for whole array
-    elif ecutmaxpos[0] == 'All':
-        ValEst = Est[np.where(Est != nanval)]
-        if np.sum(ValEst) == 0:
-            exc = 'Could not find valid data.\n'
-            raise metricprob_Error(exc)
+        Ghosh, B. K. (1966). Asymptotic expansions for the moments of the
+        distribution of correlation coefficient. Biometrika, 53(1/2), 258-262.
 
-        # Get ECut
-        if ecutmaxpos[1][0] == 'Med':
-            ECut[:] = np.median(ValEst)
-        else:
-            ECut[:] = ecutmaxpos[1][0]
+    Arguments
+    ---------
+        "correl" is the correlation coefficient for which the
+        standard error is desired.
 
-        # Get MaxPos
-        if ecutmaxpos[1][1] == 'Max':
-            Max[:] = np.max(ValEst)
-        else:
-            Max[:] = ecutmaxpos[1][1]
+        "count" is the number of valid data points used to calculate
+        the correlation.
 
-    # Get ECut and MaxPos for individual columns
-    elif ecutmaxpos[0] == 'Cols':
+    Examples
+    --------
 
-        # Get ECut
-        if type(ecutmaxpos[1]) is not type({}):
-            if ecutmaxpos[1][0] == 'Med':
-                for i in xrange(ncols):
-                    ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
-                    if np.sum(ValEst) == 0:
-                        ECut[i] = nanval
-                    else:
-                        ECut[i] = np.median(ValEst)
-            else:
-                for i in xrange(ncols):
-                    ECut[i] = ecutmaxpos[1][0]
+        [under construction]
 
+    Paste Function
+    --------------
+        correl_se(correl,   # [Correlation coefficient]
+                  count    # [Count of observations]
+                  )
 
-        elif type(ecutmaxpos[1]) is type({}):
-            for i in xrange(ncols):
-                ECut[i] = ecutmaxpos[1][colkeys[i]][0]
+    """
+    se = np.sqrt((1 - correl**2) / float(count - 2))
 
-        # Get MaxPos
-        if type(ecutmaxpos[1]) is not type({}):
-            if ecutmaxpos[1][1] == 'Max':
-                for i in xrange(ncols):
-                    ValEst = Est[:,i][np.where(Est[:,i] != nanval)]
-                    if np.sum(ValEst) == 0:
-                        Max[i] = nanval
-                    else:
-                        Max[i] = np.amax(ValEst)
-            else:
-                for i in xrange(ncols):
-                    Max[i] = ecutmaxpos[1][1]
+    return se
 
-        elif isinstance(ecutmaxpos[1],dict):
-            for i in xrange(ncols):
-                Max[i] = ecutmaxpos[1][colkeys[i]][1]
 
-    # Clip Max so that it is at least 1.0
-    Max = np.clip(Max,1.0,max(np.max(Max),1.0))
 
-    # Define x and y for each column
-    x = np.zeros((ncols)).astype(float)
-    y = np.zeros((ncols)).astype(float)
-    for i in xrange(ncols):
-        x[i] = 1.0/Max[i] - (Max[i]*pcut - ECut[i]) / (Max[i]*(Max[i] - ECut[i]))
-        y[i] = (Max[i]*pcut - ECut[i]) / (Max[i] - ECut[i])
 
-    # Multiply estimates in each column by their corresponding x, add y
-    CellProb = Est * x
-    CellProb = CellProb + y
-    CellProb = np.clip(CellProb,0.000001,0.999999)
-    CellProb = np.where(Est == nanval, nanval, CellProb)
+###########################################################################
 
-    # Convert to logits
-    if logits is True:
-        Log = np.where(CellProb == nanval, 
-                       nanval, 
-                       np.log(CellProb / (1. - CellProb)))
-    else:
-        Log = None
+def stats_per_dim(obj,  # [Damon object]
+                  stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+                  dim,  # [int dimensionality, overwrites coord_args['ndim']]
+                  coord_args,   # [dict of coord() arguments for internal use]
+                  seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+                  nanval = -999,    # [not-a-number value]
+                  fitted = None,    # [<None,True> => obj.coord_out already holds the fit at dim]
+                  ):
+    """Calculate specified stats per dimension for _bestdim()
 
-    return {'Prob':CellProb,'Logit':Log}
+    Returns
+    -------
+        stats_per_dim returns the following statistics as
+        a dictionary:
+
+            {'Acc',
+            'Err',
+            'Stab',
+            'Speed',
+            'NonDegen',
+            'Obj'
+            }
+
+        If the function is unable for some reason to compute
+        a statistic, it reports it as numpy's nan value.
 
+    Comments
+    --------
+        stats_per_dim() is primarily a private function used by the
+        _bestdim() function within the coord() method.  It calculates
+        statistics useful for assessing the "objectivity" of the solution
+        for a given dimensionality.
 
+        "Acc" (accuracy), ranging from 0.0 to 1.0, refers to Damon's accuracy in
+        predicting pseudo-missing observation at the specified dimensionality.
+        (See tools.accuracy() docs.)
 
+        "Err" (psmsresid), ranging from 0.0 to +inf, is similar to accuracy except
+        that it averages the residuals between the estimates and pseudo-missing
+        observations.
 
-###########################################################################
+        "Stab" (stability), ranging from 0.0 to 1.0, refers to the stability of
+        Damon's coordinate structure at the specified dimensionality.
+        (See tools.stability() docs.)
 
-def unbiasest(E,    # [Estimate array to be adjusted]
-              Res,  # [Residual array corresponding to E and to U coordinates]
-              h,    # [h-statistics calculated using same U as Res, E]
-              nanval,   # [float Not-a-Number Value]
-              ):
-    """Returns estimates as if corresponding observations were deleted.
+        "Speed", ranging from 0.0 to 1.0, refers to how quickly Damon converges.
+        This is sometimes a useful indicator of correct dimensionality.
 
-    Returns
-    -------
-        estimates as if corresponding observations were deleted
+        "NonDegen" (nondegeneracy), ranging from 0.0 to +inf, is used to flag
+        "degenerate" solutions where pseudo-missing estimates tend to be
+        significantly different from the observed values in the remainder
+        of the observations.
 
-    Comments
-    --------
-        'Res' (residual) and 'h' (leverage statistic) need to
-        be computed from the same U coordinate system (R or C).
-        The formula is:
+        "Obj" (objectivity) combines accuracy and stability in one statistic.
 
-            E1 - E[missing] = Res * h / (1 - h)
-            E[missing] = E1 - (E1 - E[missing])
+        stats_per_dim() looks first in the _bestseed() outputs for each statistic,
+        and calculates it from scratch if it doesn't find it.  Statistics
+        calculated from scratch share one set of split-half fits (see the
+        stability() "fits" argument), so asking for more of them does not
+        add coord() runs.
 
-    Paste function
-    --------------
-        unbiasest(E,    # [Estimate array to be adjusted]
-                  Res,  # [Residual array corresponding to E and to U coordinates]
-                  h,    # [h-statistics calculated using same U as Res, E]
-                  nanval,   # [float Not-a-Number Value]
-                  )
+    Arguments
+    ---------
 
+        "obj" is a Damon object.  This will include an ndim parameter which
+        is automatically overwritten by the "dim" parameter below.
 
-    """
-    UnbiasedEst = E - Res * h / (1 - h)
-    UnbiasedEst = np.where(Res == nanval,E,UnbiasedEst)
+        ------------
+        "stats" is the desired list of stats, where the options are:
 
-    return UnbiasedEst
+            ['Acc','Err','Stab','Speed','NonDegen']
 
+            stats = ['Acc','Obj']
+                            =>  Calculate and report statistics only
+                                for Accuracy and Objectivity.
 
-###########################################################################
+        ------------
+        "dim" (an int) is the dimensionality at which to run coord() internally.
+        It overwrites the ndim parameter in coord_args.
 
-def sterrpbc(st_err,  # [vector or array of cell standard errors]
-             rmse_reg = 1,   # [None, Compute regular root mean square error (row_ptbis and col_ptbis = None)]
-             row_ptbis = None,     # [None, Vector of row point biserials, data row by row of col means]
-             col_ptbis = None,     # [None, Vector of col point biserials, data col by col or row means]
-             nanval = -999.
-             ):
-    """Aggregates standard errors weighted by point biserial correlations.
+        ------------
+        "coord_args" are the arguments needed to run the coord() function
+        within stats_per_dim() in the event that coord() has not yet been run.
 
-    Returns
-    -------
-        Scalar representing the aggregated standard error
-        taking into account the correlations between
-        entities.
+            coord_args = None
+                            =>  coord() has already been run for the
+                                Damon object and there's no need to run
+                                it again.
 
-    Comments
-    --------
-        This is a method of aggregating cell standard errors
-        that is specific to Damon and has not been studied
-        in depth.  It is based on the premise that while an
-        ordinary root mean squared error is sufficient for
-        unidimensional arrays where the model correlations
-        between entities is 1.0, it may understate the aggregated
-        standard error for multidimensional arrays whose
-        model correlations between entities may be less
-        than 1.0.
+            coord_args = {'ndim':[[3]],'runspecs'=[0.0001,10],'seed'=1}
+                            =>  coord() will be run at dimensionality 3
+                                and seed 1 with the specified runspecs.
 
-        The method is currently not in use due to the
-        formula not having been sufficiently studied and
-        the computational complexity of implementing it.
-        It requires calculating what is called the Root Point-
-        Biserial Weighted Mean Square Error, which was calculated
-        in the summstat() function but is no longer.  Perhaps it
-        will be reintroduced.  Anyway, here is how it works.
+                                All other args will be the coord() defaults.
 
-        When aggregating a range of cells, the rows and columns are
-        done separately, then combined.  The resulting formula for
-        the RPBWMSE (Root Point-Biserial "Weighted" Mean Squared Error)
-        is:
+        ------------
+        "seed_stat" is the statistic used to decide the best seed while finding
+        best dimensionality and is assigned by the _bestdim() function.  It is
+        not essential but saves _bestdim() the trouble of recalculating
+        accuracy or stability if they were already calculated in _bestseed().
 
-        RPBWMSE^2 = sum(s[ij]^2) / ( sum(R[iI]^2) * sum(R[jJ]^2) )
-        RPBWMSE = sqrt(RPBWMSE^2)
+        The options are:
 
-        where s[ij] is the standard error of the estimate in the cell
-        for row i and column j, and R[iI] is the pt.bis. correlation
-        between row i and the row of column means I, and R[jJ] is
-        the pt.bis. correlation between column j and the column
-        of row means J.  When the data are 1-dimensional, all rows and
-        columns are perfectly correlated with each other, causing
-        the correlations to be 1.0, at which point RPBWMSE = RMSE across
-        the range.
+            seed_stat = <None,'Stab','Acc','Obj'>
 
-        "Weighted" is in quotes since the formula is not a true
-        weighting; the numerator does not include multiplication
-        by point biserials.  However, simulation studies suggest
-        that this is the formula that properly bounds the situation
-        where all the items are perfectly correlated (divided by
-        sum of items) and the situation where the items are perfectly
-        uncorrelated with themselves and partially correlated with
-        the mean, in which case the denominator will tend toward 1.0
-        and the variance of the mean will be the sum of its component
-        variances.
+        ------------
+        "nanval" is the not-a-number value.  This will generally be the
+        same as obj.nanval, but if the data was string it may need to be
+        converted to int or float.
 
-    Arguments
-    ---------
-        "st_err" is an array of standard errors (SE).  The cell SE
-        statistic is not to be confused with the cell EAR (expected
-        absolute residuals) statistic.
+        ------------
+        "fitted" <None,True> says that obj.coord_out already holds the
+        coord() run at "dim", e.g., a warm-started one (see
+        stats_per_dims()).  accuracy() then scores it instead of
+        re-running coord() with coord_args.  stability() still runs
+        its own split-half coord() runs from coord_args.
 
-        --------------
-        "rmse_reg" specifies that a regular root mean squared
-        error should be calculated, in which case set the
-        next two parameters -- row_ptbis and col_ptbis --
-        to None.  rmse_reg will yield a smaller standard error,
-        but the proper conditions for using one statistic or
-        the other are not fully understood.  RMSE is the industry
-        standard.
+    Examples
+    --------
 
-        ---------------
-        "row_ptbis" and "row_ptbis" are vectors
-        of point-biserial correlations calculated outside
-        the function.  (It used to be calculated internally
-        by summstat(), but is no longer.)
+        [Under construction]
 
-        When the error vector is a "row" of cell errors,
-        you should have calculated the col_ptbis, and
-        row_ptbis should be set at 1.0.  When the error
-        vector is a "column" of cell errors, you should have
-        calculated the row_ptbis, and the col_ptbis
-        should be set at 1.0.  When the error vector is a
-        "range" of cell errors, you should have calculated
-        both a row_ptbis and col_ptbis and entered
-        them.
 
-    Paste function
+    Paste Function
     --------------
-        sterrpbc(st_err,  # [vector or array of cell standard errors]
-                 rmse_reg = 1,   # [None, Compute regular root mean square error (row_ptbis and col_ptbis = None)]
-                 row_ptbis = None,     # [None, Vector of row point biserials, data row by row of col means]
-                 col_ptbis = None,     # [None, Vector of col point biserials, data col by col or row means]
-                 nanval = -999.
-                 )
+        stats_per_dim(obj,  # [Damon object]
+                      stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+                      dim,  # [int dimensionality, overwrites coord_args['ndim']]
+                      coord_args,   # [dict of coord() arguments for internal use]
+                      seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+                      nanval = -999,    # [not-a-number value]
+                      fitted = None,    # [<None,True> => obj.coord_out already holds the fit at dim]
+                      )
 
     """
-    #Mark_sterrpbc
+#    floor = 0.0000001
+#    ceiling = 0.9999999
+    coord_args = coord_args.copy()
+    coord_args['ndim'] = [[dim]]
 
-    # Calculate standard error
-    ValErr = st_err[np.where(st_err != nanval)]
+    # Score the existing fit rather than re-running coord()
+    acc_args = None if fitted is True else coord_args
 
-    if (rmse_reg == 1
-        or (row_ptbis is None
-            and col_ptbis is None)
-        ):
-        sterr = np.sqrt(np.sum(ValErr**2) / np.size(ValErr))
+    # The stats share one set of fits
+    fits = {}
 
-    elif row_ptbis is not None and col_ptbis is not None:
-        sterr = np.sqrt(np.sum(ValErr**2) / (row_ptbis * col_ptbis) )
+    # Decide whether to calc accuracy in stability()
+    if ('Obj' in stats
+        or ('Stab' in stats
+            and ('Acc' in stats
+                 or 'Err' in stats
+                 or 'PsMsResid' in stats
+                 or 'NonDegen' in stats
+                 or 'Speed' in stats
+                 )
+             )
+        ):
+        acc_in_stab = ['Accuracy','Err','Speed']
 
+        if 'NonDegen' in stats:
+            acc_in_stab.append('NonDegen')
     else:
-        print 'Error in sterrpbc():  Unable to reconcile input parameters.\n'
-
-    return sterr
-
+        acc_in_stab = None
 
+    # Try to get stats from _bestseed() outputs
+    try:
+        bestseed = obj.seed['BestSeed']
+        stats_per_seed = obj.seed['StatsPerSeed']
+        loc = np.where(stats_per_seed.core_col['Seed'] == bestseed)[0][0]
+    except AttributeError:
+        stats_per_seed = None
 
+    # Get or calculate stability
+    if 'Stab' in stats or 'Obj' in stats:
+        try:
+            stability_ = stats_per_seed.core_col['Stab'][loc]
+            stab_out = None
+        except (AttributeError,KeyError):
+            try:
+                stab_out = stability(obj,coord_args,acc_in_stab,1,'Auto','Auto',nanval,True,
+                                     fits)
 
+                try:
+                    stability_ = stab_out['Stability']
+                except TypeError:
+                    stability_ = np.nan
 
+            except stability_in_coord_Error:
+                stability_ = np.nan
 
+    else:
+        stab_out = None
+        stability_ = np.nan
 
+    # Get or calculate accuracy and related stats
+    if ('Acc' in stats
+        or 'Obj' in stats
+        or 'Err' in stats
+        or 'NonDegen' in stats
+        ):
 
+        # Accuracy
+        if 'Acc' in stats:
+            try:
+                accuracy_ = stats_per_seed.core_col['Acc'][loc]
+            except (AttributeError,KeyError):
+                try:
+                    accuracy_ = stab_out['Accuracy']
+                except (TypeError, UnboundLocalError):
+                    nondegen = True if 'NonDegen' in stats else None
+                    acc_out = accuracy(obj,acc_args,nondegen,nanval,fits)
+                    accuracy_ = acc_out['Accuracy']
+        else:
+            nondegen = True if 'NonDegen' in stats else None
+            acc_out = accuracy(obj,acc_args,nondegen,nanval,fits)
+            accuracy_ = np.nan
 
+        # Err (pseudo-missing root mean squared resid)
+        if 'Err' in stats:
+            try:
+                psmsresid = stats_per_seed.core_col['Err'][loc]
+            except (AttributeError,KeyError):
+                try:
+                    psmsresid = stab_out['Err']
+                except (TypeError,KeyError,UnboundLocalError):
+                    try:
+                        psmsresid = acc_out['Err']
+                    except UnboundLocalError:
+                        acc_out = accuracy(obj,acc_args,nondegen,nanval,fits)
+                        psmsresid = acc_out['Err']
+        else:
+            psmsresid = np.nan
 
-###########################################################################
+        # Nondegeneracy
+        if 'NonDegen' in stats:
+            try:
+                nondegen_ = stats_per_seed.core_col['NonDegen'][loc]
+            except (AttributeError,KeyError):
+                try:
+                    nondegen_ = stab_out['NonDegen']
+                except (TypeError,UnboundLocalError):
+                    try:
+                        nondegen_ = acc_out['NonDegen']
+                    except (UnboundLocalError,KeyError):
+                        acc_out = accuracy(obj,acc_args,nondegen,nanval,fits)
+                        nondegen_ = acc_out['NonDegen']
 
-def separation(stdev,   # [<None, standard deviation of the cell values>]
-               sterr,   # [<standard error, output of rmsr() or sterrpbc()>]
-               estimates = None, # [<None, array of estimates>]
-               nanval = -999 # [<not-a-number value]
-               ):
-    """Returns the "separation" of a set of measurements, their
-    spread relative to their noise.
+        else:
+            nondegen_ = np.nan
 
-    Returns
-    -------
-        Scalar representing the ratio of the spread of a
-        set of measures relative to their average error of
-        measurement.  It is also described as the ratio of
-        true to observed variance.  Converted to a 0.0 - 1.0
-        metric with reliability(), it is equivalent to a
-        Cronbach-alpha statistic.
+    # Calc convergence speed
+    if 'Speed' in stats:
+        try:
+            speed = stats_per_seed.core_col['Speed'][loc]
+        except (AttributeError,TypeError):
+            try:
+                speed = stab_out['Speed']
+            except (TypeError,KeyError,UnboundLocalError):
+                try:
+                    changelog = obj.coord_out['changelog']
+                    speed = 1.0 - np.sum(changelog[3:,1]) / np.sum(changelog[:,1])
+                except AttributeError:
+                    speed = np.nan
+    else:
+        speed = np.nan
 
-    Comments
-    --------
-        "separation" provides some flexibility in the
-        the range of input parameters.  If you have already
-        aggregated standard errors and have a standard
-        deviation, it is only necessary to enter values
-        for stdev and sterr.
+    # Calc objectivity
+    if 'Obj' in stats:
+        if (accuracy_ is not np.nan
+            and stability_ is not np.nan
+            ):
+            acc_stab = np.array([np.log(accuracy_),np.log(stability_)])
+            objectivity = round(np.exp(np.average(acc_stab)), 3)
+        else:
+            if accuracy_ is not np.nan:
+                objectivity = accuracy_
+            else:
+                objectivity = np.nan
+    else:
+        objectivity = np.nan
 
-        If these statistics are not available, separation()
-        will calculate them based on estimates and st_err.
+    return {'Acc':accuracy_,
+            'Err':psmsresid,
+            'Stab':stability_,
+            'Speed':speed,
+            'NonDegen':nondegen_,
+            'Obj':objectivity
+            }
 
-        If you want to take into account correlations between
-        entities in aggregating standard errors, you can enter
-        non-1.0 point-biserial correlation vectors.  (This can
-        also be done by entering the output of sterrpbc()
-        for sterr.)
 
-        Aggregating Standard Errors
-        ---------------------------
-        Ordinarily, standard errors are aggregated by taking
-        the root of their mean squares.  Damon currently
-        employs this method of aggregation.  However, it
-        has been surmised that in multidimensional measurement
-        account should be taken of the degree to which each
-        contributing variable is correlated with the measure
-        of interest.  This statistic can be obtained
-        using Damon's sterrpbc() function.  However, it is
-        not known yet whether it is worth the computational
-        effort.        
 
-    Arguments
-    ---------
-        "stdev" is the standard deviation of the cell estimates.
-        If None, it will be calculated from estimates.  stdev can
-        also be an array when calculating a separation statistic
-        for each column.
+_DIMPOOL = {}
 
-        --------------
-        "sterr" is the aggregated standard error, either the
-        root mean squared error (which can be obtained using rmsr())
-        or the point biserial correlation weighted standard error
-        (obtained using sterrpbc()).  sterr can also be an array
-        when calculating a separation statistic for each column.
+def _fit_dim(obj, dim, stats, coord_args, seed_stat, nanval, refit,
+             nested = None):
+    "Run coord() at one dimensionality, if needed, and get its stats."
 
-        --------------
-        "estimates" is an array of estimates, set to None if
-        the stdev and sterr paramters are not None. 
+    # Lower dims already fitted, for a nested warm start (dim 0 has
+    # no axes of its own)
+    lower = [] if nested is None else [d for d in nested if 0 < d < dim]
+    fitted = None
 
-        --------------
-        "nanval" is the not-a-number value.
+    if refit is True or nested is not None:
+        fit_args = coord_args.copy()
+        fit_args['ndim'] = [[dim]]
 
-        NOTE: separation() supports array calculation when
-        stdev and sterr are arrays.
+        # Clear obj.seed for this dimensionality
+        try:
+            del obj.seed
+        except AttributeError:
+            pass
 
-    Paste function
-    --------------
-        separation(stdev,   # [<None, standard deviation of the cell values>]
-                   sterr,   # [<standard error, output of rmsr() or sterrpbc()>]
-                   estimates = None, # [<None, array of estimates>]
-                   nanval = -999 # [<not-a-number value]
-                   )
-    """    
-    if isinstance(stdev, np.ndarray) and isinstance(sterr, np.ndarray):
-        diff = np.clip(stdev**2 - sterr**2, 0, np.inf)
-        sep = np.sqrt(diff) / sterr
-#        sep[np.isnan(sep)] = 0.0
-        nix = (stdev == nanval) | (sterr == nanval)
-        sep[nix] = nanval
-        return sep
-    else:
-        if stdev is None:
+        if len(lower) > 0:
             try:
-                stdev = np.std(estimates[estimates != nanval])
-            except TypeError:
-                exc = "If stdev is None, estimates cannot be None"
-                raise separation_Error(exc)
-    
-        # Calculate separation
-        if (stdev**2 - sterr**2) <= 0.:
-            sep = 0.
-        else:
-            sep = np.sqrt(stdev**2 - sterr**2) / sterr
-    
-        return sep
-
-
-###########################################################################
-
-def reliability(sepstat,   # [None, output of separation()]
-                estimates = None, # [None, array of estimates]
-                stdev = None, # [<None, stdev of estimates]
-                sterr = None,   # [None, root mean square error, output of rmsr() or sterrpbc()]
-                nanval = -999,
-                ):
-    """Returns the "reliability" of a set of measurements as a Cronbach-alpha.
+                psmsindex = obj.pseudomiss_out['parsed_psmsindex']
+                if psmsindex is None:
+                    psmsindex = obj.pseudomiss_out['psmsindex']
+            except AttributeError:
+                psmsindex = None
+            fit_args['startercoord'] = nested_coords(nested[max(lower)],
+                                                     obj.coredata, dim,
+                                                     psmsindex, nanval, dim)
+            fitted = True
+
+            # coord() and stability() need an int seed, as accuracy()
+            # assumes
+            if not (isinstance(coord_args['seed'], int)
+                    or coord_args['seed'] == 'SVD'):
+                coord_args = coord_args.copy()
+                coord_args['seed'] = fit_args['seed'] = 1
+
+        obj.coord(**fit_args)
+
+        # A seed search returns no coordinates; fit with the best seed
+        if (nested is not None
+            and not (isinstance(fit_args['seed'], int)
+                     or fit_args['seed'] == 'SVD')):
+            fit_args['seed'] = obj.seed['BestSeed']
+            obj.coord(**fit_args)
+
+        if nested is not None:
+            nested[dim] = {'fac0coord':obj.coord_out['fac0coord'],
+                           'fac1coord':obj.coord_out['fac1coord']}
+
+    return stats_per_dim(obj, stats, dim, coord_args, seed_stat, nanval,
+                         fitted)
+
+
+def _dimpool_init(specs):
+    "Worker initializer:  keep the Damon object and fitting specs."
+
+    _DIMPOOL.clear()
+    _DIMPOOL.update(specs)
+
+
+def _dimpool_task(task):
+    "Worker task:  fit one dimensionality from the given random state."
+
+    dim, state = task
+    npr.set_state(state)
+    s = _DIMPOOL
+    return _fit_dim(s['Obj'], dim, s['Stats'], s['CoordArgs'], s['SeedStat'],
+                    s['NanVal'], s['Refit'])
+
+
+def stats_per_dims(obj,  # [Damon object, with pseudomiss_out]
+                   stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+                   dims, # [list of int dimensionalities]
+                   coord_args,   # [dict of coord() arguments for internal use]
+                   seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+                   nanval = -999,    # [not-a-number value]
+                   refit = True,  # [<True, None> => run coord() at each dim before getting its stats]
+                   pool = None,   # [None, output of dimpool() => fit dims in worker processes]
+                   nested = None, # [<None, {}> => dict of fits per dim; warm-start each dim from the highest lower dim in it]
+                   ):
+    """Calculate stats_per_dim() for a list of dimensionalities,
+    optionally in parallel, for _bestdim().
 
     Returns
     -------
-        Scalar between zero and 1.0 representing the
-        reliability of a set of measures, the degree
-        to which they are disentangled from error.
+        A list of stats_per_dim() output dictionaries, one per dim
+        in the order of "dims".
 
     Comments
     --------
-        reliability is a conversion of the Separation
-        ratio into a number between zero and one.  It answers
-        the question, "How orderly are these measures?"  If
-        the measures are representative of what can be expected
-        of these entities in other testing situations, the
-        number indicates the overall likelihood of obtaining
-        the same measures from different data.
-
-        It is equivalent to the Cronbach-alpha statistic.
+        Each dimensionality is fitted independently of the others:
+        obj.seed is cleared, coord() is run at that dimensionality
+        (if refit is True), and stats_per_dim() is called.  So the
+        dims can be fitted in any order, or at the same time.
+
+        Given a pool from dimpool(), the dims are mapped across its
+        worker processes, each holding its own copy of obj and its
+        pseudo-missing cells, and the results are returned in the
+        order of "dims".  Every fit starts from the same state,
+        including the state of numpy's random number generator (used
+        by 'Stab' and seed searches), which is left as it was on
+        return.  So outputs are the same for any number of workers.
+
+        Given a "nested" dictionary instead, the dims are fitted in
+        turn, each warm-started from the highest lower dim already in
+        the dictionary (see nested_coords()), and added to it.  This
+        skips the seed search and most of the iterations of the
+        higher dims.  The pool is then not used.
 
     Arguments
     ---------
-        "sepstat" is the Separation statistic output by
-        separation().  If this is available, all the remaining
-        parameters may be set to None
-
-        --------------
-        "estimates" is an array of estimates, set to None if
-        the stdev and sterr paramters are not None. Set to None 
-        if sepstat is not None.
+        "obj", "stats", "coord_args", "seed_stat", "nanval" are as in
+        stats_per_dim().  A pool uses the copies passed to dimpool(),
+        so they should be the same.
 
         --------------
-        "stdev" is the standard deviation of the cell estimates.
-        They cannot contain NaNVals.  Set to None if sepstat
-        is not None.
+        "dims" is the list of dimensionalities to fit.
 
         --------------
-        "sterr" is the aggregated standard error, either the
-        root mean squared error (which can be obtained using rmsr())
-        or the point biserial correlation weighted standard error
-        (obtained using sterrpbc()).  Set to None if sepstat
-        is not None.
+        "refit" <True, None> specifies whether to run coord() at each
+        dimensionality first.  It is None when coord_args['seed'] is
+        an int, in which case stats_per_dim() runs coord() itself.
 
         --------------
-        "nanval" is the not-a-number value.
-
-        NOTE:  reliability() supports array calculation if sepstat
-        is an array.
-
-    Paste function
-    --------------
-        reliability(sepstat,   # [None, output of separation()]
-                    estimates = None, # [None, array of estimates]
-                    stdev = None, # [<None, stdev of estimates]
-                    sterr = None,   # [None, root mean square error, output of rmsr() or sterrpbc()]
-                    nanval = -999,
-                    )
-    """
-    if isinstance(sepstat, np.ndarray):
-        rel = sepstat**2 / (1 + sepstat**2)
-        rel[sepstat == nanval] = nanval
-        return rel
-    else:
-        if sepstat is None:
-            if stdev is not None and sterr is not None:
-                sepstat = separation(stdev, sterr)
-            elif estimates is not None and sterr is not None:
-                stdev = np.std(estimates[estimates != nanval])
-                sepstat = separation(stdev, sterr)
-            else:
-                exc = "If sepstat is None, estimates and sterr cannot be None."
-                raise reliability_Error(exc)
-    
-        # Calculate reliability
-        rel = sepstat**2 / (1 + sepstat**2)
-    
-        return rel
-
-
-
-###########################################################################
-
-def rmsear(ear,     # [array of cell Expected Absolute residuals (EAR), same size as estimates]
-           nanval = -999.    # [Not-a-Number value]
-           ):
-    """Returns root mean expected absolute residual.
-
-    Returns
-    ------
-        The square root of the mean of the squared expected absolute residuals
-        (EAR) across the range of the array.  When aggregated, these
-        are very similar to the root mean squared residuals (RMSR).
+        "pool" is None, or the output of dimpool().
 
-    Comments
-    --------
-        rmsear() is a way to measure fit between observations and estimates
-        in an absolute sense (as opposed to a relational sense, as with
-        correlations).  It may be thought of in the same way as the
-        root mean squared residual, but the root mean square expected absolute
-        residual differs in two important respects:
+        --------------
+        "nested" is None, or a dictionary of fits per dim that
+        persists across calls, initially {}.  Each fit holds the
+        'fac0coord' and 'fac1coord' outputs of coord() and the
+        'stats', which are reused if a dim is asked for again.
 
-            1) the RMSEAR is based on the EAR which is an expected residual
-               rather than an observed residual;
+    Paste Function
+    --------------
+        stats_per_dims(obj,  # [Damon object, with pseudomiss_out]
+                       stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+                       dims, # [list of int dimensionalities]
+                       coord_args,   # [dict of coord() arguments for internal use]
+                       seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+                       nanval = -999,    # [not-a-number value]
+                       refit = True,  # [<True, None> => run coord() at each dim before getting its stats]
+                       pool = None,   # [None, output of dimpool() => fit dims in worker processes]
+                       nested = None, # [<None, {}> => dict of fits per dim; warm-start each dim from the highest lower dim in it]
+                       )
 
-            2) the EAR is calculated for every cell in the matrix, including
-               missing cells, so the RMSEAR is based on the whole range;
+    """
+    dims = [int(dim) for dim in dims]
+
+    # Nested fits go from low to high dims, each dim fitted once
+    if nested is not None:
+        for dim in sorted(set(dims)):
+            if dim not in nested:
+                stats_out = _fit_dim(obj, dim, stats, coord_args, seed_stat,
+                                     nanval, refit, nested)
+                nested[dim]['stats'] = stats_out
+        return [nested[dim]['stats'] for dim in dims]
+
+    state = npr.get_state()
+    if pool is None or len(dims) < 2:
+        out = []
+        for dim in dims:
+            npr.set_state(state)
+            out.append(_fit_dim(obj, dim, stats, coord_args, seed_stat,
+                                nanval, refit))
+        npr.set_state(state)
+        return out
+
+    return pool['Pool'].map(_dimpool_task, [(dim, state) for dim in dims],
+                            chunksize = 1)
+
+
+def dimpool(workers,    # [int => number of worker processes]
+            obj,  # [Damon object, with pseudomiss_out]
+            stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+            coord_args,   # [dict of coord() arguments for internal use]
+            seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+            nanval = -999,    # [not-a-number value]
+            refit = True,  # [<True, None> => run coord() at each dim before getting its stats]
+            ):
+    """Starts a process pool for fitting dimensionalities in parallel.
 
-            3) the individual EAR's for each cell are more precise and
-               reliable than their raw counterparts, since they draw information
-               from the rest of the array.
+    Returns
+    -------
+        A pool dictionary to pass to stats_per_dims(pool = ...) and
+        finally to facpool_close():
 
-        While missing values are not expected in the ear, a nanval argument
-        is included in case one pops up.
+            {'Pool':    =>  multiprocessing.Pool
+             'Specs':   =>  the fitting specifications held by each
+                            worker
+             }
+
+    Comments
+    --------
+        The workers are handed obj and the fitting specifications when
+        they start.  Where processes are forked, they inherit them
+        without pickling, so the data and its pseudo-missing cells are
+        shared rather than copied per dimensionality.  Only each dim
+        and its stats pass between processes.
 
+        Arguments are as in stats_per_dims().  coord_args is not
+        given "workers", so the coord() runs inside the workers do
+        not start pools of their own.
 
-    Paste function
+    Paste Function
     --------------
-        rmsear(ear,     # [array of cell Expected Absolute residuals (EAR), same size as estimates]
-               nanval = -999.    # [Not-a-Number value]
-               )
+        dimpool(workers,    # [int => number of worker processes]
+                obj,  # [Damon object, with pseudomiss_out]
+                stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
+                coord_args,   # [dict of coord() arguments for internal use]
+                seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
+                nanval = -999,    # [not-a-number value]
+                refit = True,  # [<True, None> => run coord() at each dim before getting its stats]
+                )
 
     """
-    # Compute RMSEAR
-    ValEAR = ear[np.where(ear != nanval)]
-    nEAR = float(np.size(ValEAR))
-    RMSEAR = np.sqrt(np.sum(ValEAR**2) / nEAR)
+    if workers < 2:
+        exc = 'dimpool() requires at least 2 workers.\n'
+        raise dimpool_Error(exc)
 
-    return RMSEAR
+    coord_args = coord_args.copy()
+    coord_args.pop('workers', None)
+    specs = {'Obj':obj,
+             'Stats':stats,
+             'CoordArgs':coord_args,
+             'SeedStat':seed_stat,
+             'NanVal':nanval,
+             'Refit':refit
+             }
 
+    pool_ = mp.Pool(processes = workers,
+                    initializer = _dimpool_init,
+                    initargs = (specs,))
 
+    return {'Pool':pool_,
+            'Specs':specs
+            }
 
 
-###########################################################################
 
-def correl(observed,    # [2-D array of "observed" responses, may include NaNVals]
-           estimates,   # [2-D array of estimates, same size as observed, may include NaNVals]
-           nanval = -999.,       # [Not-a-Number value]
-           form = 'Corr',   # [<'Corr','Cov',,'SumProd','MeanProd'> => formula to apply]
-           count = None,   # [<None,True> => report count of valid pairs]
-           ):
-    """Correlates observations to estimates.
+def truncate_dims(obj,  # [Damon object, with pseudomiss_out]
+                  dims, # [list of int dimensionalities]
+                  coord_args,   # [dict of coord() arguments for internal use]
+                  nanval = -999,    # [not-a-number value]
+                  nrefit = 3,   # [int => number of best-scoring dims to return for refitting]
+                  ):
+    """Rank dimensionalities from truncations of a single coord()
+    run at the highest one, for _bestdim()'s 'Fast' option.
 
     Returns
     -------
-        When form = 'Corr', correl() returns a scalar between -1.0
-        and 1.0 representing the correlation between an array of
-        observations and an array of estimates.  It can also return
-        covariance and mean product.
-
-        When Counts is True, correl() returns a two-element list
-        instead of a scalar, where the second element is the count
-        of valid pairs that went into the statistic reported as
-        the first element:
-
-            [Stat,count]
+        {'Refit':   =>  sorted list of the "nrefit" dims with the
+                        lowest truncated pseudo-missing error, plus
+                        dim 0 if it is in "dims"
+         'Err':     =>  {dim:error} for each non-zero dim
+         }
 
     Comments
     --------
-        correl() is an alternative way to measure fit between observations
-        and estimates.  It does not look at how closely they match but
-        whether they tend to move up or down similarly.  It is possible
-        to have a high correlation even if the observations and estimates
-        are very different from each other in absolute terms.
+        coord() is run once, at the highest of "dims", holding out
+        the pseudo-missing cells of obj.  Its estimates R * C.T are
+        rotated to their singular vectors (through the QR factors of
+        R and C, so the rows x cols estimates are never formed), and
+        the estimates at each lower dimensionality d are taken as the
+        truncation to the first d singular vectors, which is the
+        closest rank-d array to the high-dimensional fit.
+
+        Each truncation is scored like the 'Err' statistic of
+        accuracy(), as the root mean squared residual of the
+        pseudo-missing cells.  All truncations are scored in one pass
+        by accumulating the singular components cell by cell.
+
+        Truncations are not refits, so their errors only rank the
+        dims.  _bestdim() refits the "nrefit" best of them, and dim
+        0, to get the statistics it reports.  If there are no more
+        than "nrefit" dims, nothing is fitted and all are returned.
+
+        When coord_args['seed'] is not an int or 'SVD', the single
+        run uses seed 1 rather than searching for a seed.
 
-        correl() handles missing data by doing pair-wise deletion of
-        corresponding values in the two matrices.  When the percentage
-        of missing data is not "a lot", this is reasonable for most
-        purposes.  But it is worth noting that correlations computed
-        with missing values may not be positive semi-definite, a feature
-        of correlation matrices with complete data.  This can cause
-        errors with Generalized Least Squares eigenvalue decomposition,
-        and other methodologies.  However a Damon decomposition,
-        like Singular Value Decomposition, does not require its data
-        matrices to be positive semi-definite matrices; it just calculates
-        the best-fitting estimates matrix for a given dimensionality.
-        This makes it possible for the _bestdim() function to quickly
-        determine the dimensionality of a rectangular matrix by analyzing
-        its (smaller) square correlation/covariance matrix for a specified
-        range of dimensionalities.
+    Arguments
+    ---------
+        "obj", "coord_args", and "nanval" are as in stats_per_dims().
 
-        Incidentally, although the correlation matrix of an observed
-        array may not (due to missing data) be positive semi-definite,
-        the correlation matrix of an estimates array will be.  So Damon
-        is a simple way to find the "nearest" positive semi-definite
-        matrix to a given non-positive semi-definite matrix.
+        --------------
+        "dims" is the list of dimensionalities to rank.
 
-        Although, correl() calls for "observed" values and "estimates",
-        it can be used generically to compute the correlation between
-        any two same-sized arrays.
+        --------------
+        "nrefit" is the number of dims to return for refitting.
 
-        correl() allows NaNVals in either the observed or estimates arrays.
+    Paste Function
+    --------------
+        truncate_dims(obj,  # [Damon object, with pseudomiss_out]
+                      dims, # [list of int dimensionalities]
+                      coord_args,   # [dict of coord() arguments for internal use]
+                      nanval = -999,    # [not-a-number value]
+                      nrefit = 3,   # [int => number of best-scoring dims to return for refitting]
+                      )
 
-        correl() uses Numpy's corrcoef(), which is a Pearson correlation,
-        or if form = 'Cov' the cov() function.  Covariance is similar to
-        correlation, except that it is not standardized.  'MeanProd' is
-        an average of products and isn't mean-referenced like covariance
-        and correlation.
+    """
+    dims = sorted(set([int(dim) for dim in dims]))
+    pos_dims = [dim for dim in dims if dim > 0]
 
-        To calculate the standard error of a correlation, use
-        tools.correl_se().
+    if nrefit < 1:
+        exc = 'nrefit must be at least 1.\n'
+        raise truncate_dims_Error(exc)
 
-    Arguments
-    ---------
-        "observed" is a 2-dimensional array of observed responses (or
-        any generic array), and may include NaNVals.
+    if len(pos_dims) <= nrefit:
+        return {'Refit':dims, 'Err':{}}
 
-        ------------
-        "estimates" is a 2-dimensional array of estimates (or any
-        generic array) that is the same size as observed.  It also
-        may include NaNVals.
+    # Fit the highest dimensionality once
+    top = max(pos_dims)
+    fit_args = coord_args.copy()
+    fit_args['ndim'] = [[top]]
+    if not (isinstance(fit_args['seed'], int) or fit_args['seed'] == 'SVD'):
+        fit_args['seed'] = 1
 
-        ------------
-        "nanval" is the Not-a-Number value, castable to int.
+    try:
+        del obj.seed
+    except AttributeError:
+        pass
 
-        ------------
-        "form" is the formula to apply:
-            form = 'Corr'       =>  Pearson correlation
-            form = 'Cov'        =>  Covariance
-            form = 'SumProd'    =>  Sum of products, like
-                                    covariance but not norm
-                                    centered.
-            form = 'MeanProd'   =>  Mean of the products.
+    obj.coord(**fit_args)
+    R = obj.coord_out['fac0coord']['coredata']
+    C = obj.coord_out['fac1coord']['coredata']
 
+    # Rotate R * C.T to its singular vectors, via the QR factors
+    r_ok = R[:, 0] != nanval
+    c_ok = C[:, 0] != nanval
+    Qr, Tr = np.linalg.qr(np.where(r_ok[:, np.newaxis], R, 0.0))
+    Qc, Tc = np.linalg.qr(np.where(c_ok[:, np.newaxis], C, 0.0))
+    U, s, Vt = np.linalg.svd(np.dot(Tr, Tc.T))
+    A = np.dot(Qr, U) * s
+    B = np.dot(Qc, Vt.T)
 
-        ------------
-        "count" <None,True>, when True, tells the function to report
-        the count of valid pairs used to calculate the statistic
-        specified by "form".  (Correlations, covariances, and mean
-        products all involve sums of products between pairs of data
-        values.  However, if either value in a pair is missing (nanval),
-        that product is made missing from the summation.)
+    # Score every truncation on the pseudo-missing cells at once
+    psmsindex = obj.pseudomiss_out['parsed_psmsindex']
+    if psmsindex is None:
+        psmsindex = obj.pseudomiss_out['psmsindex']
 
-        When count = True, correl() returns a two-element list, where
-        the first element is the statistic and the second is the count.
+    rows, cols = np.asarray(psmsindex[0]), np.asarray(psmsindex[1])
+    obs = np.asarray(obj.coredata[psmsindex], dtype=float)
+    ok = (obs != nanval) & r_ok[rows] & c_ok[cols]
+    est = np.cumsum(A[rows[ok]] * B[cols[ok]], axis=1)
+    err = np.sqrt(np.mean((obs[ok][:, np.newaxis] - est)**2, axis=0))
 
-    Examples
-    --------
+    Err = {}
+    for dim in pos_dims:
+        Err[dim] = err[dim - 1]
 
+    best = sorted(pos_dims, key=lambda dim: Err[dim])[:nrefit]
+    Refit = sorted(best + [dim for dim in dims if dim == 0])
 
-    Paste function
-    --------------
-        correl(observed,    # [2-D array of "observed" responses, may include NaNVals]
-               estimates,   # [2-D array of estimates, same size as observed, may include NaNVals]
-               nanval = -999.,       # [Not-a-Number value]
-               form = 'Corr',   # [<'Corr','Cov','SumProd','MeanProd'> => formula to apply]
-               count = None,   # [<None,True> => report count of valid pairs]
-               )
+    return {'Refit':Refit, 'Err':Err}
 
-    """
-    # Convert into 1-dimensional arrays
-    obs = np.ravel(observed)
-    est = np.ravel(estimates)
 
-    # Filter out cases where either array has a nanval
-    nix_obs, nix_est = index_val(obs, nanval), index_val(est, nanval)
-    nix = nix_obs | nix_est
-    ValObs, ValEst = obs[~nix], est[~nix]
 
-    # Check for div/0 errors
-    calc = True
-    ValObs_SD = np.std(ValObs)
-    ValEst_SD = np.std(ValEst)
+###########################################################################
 
-    if (ValObs_SD == 0
-        or ValEst_SD == 0
-        ):
-        ObsEst = nanval
-        calc = False
+_PREDPOOL = {}
 
-    if count is True:
-        N = np.size(ValObs)
+def _fit_preds(d, preds, starters, coord_args):
+    "Row coordinates of d from its predictor columns preds alone."
 
-    # Calc relationship
-    if calc is True:
-        try:
-            if form == 'Corr':
-                ObsEst = np.corrcoef(ValObs,ValEst)[0,1]
+    pred_data = d.extract(d,
+                          getrows = {'Get':'AllExcept','Labels':'key','Rows':[None]},
+                          getcols = {'Get':'NoneExcept','Labels':'key','Cols':preds},
+                          labels_only = None,
+                          )
 
-            if form == 'Cov':
-                ObsEst = np.cov(ValObs,ValEst)[0,1]
+    if starters is not None:
+        pred_coords = d.extract(starters,
+                                getrows = {'Get':'NoneExcept','Labels':'key','Rows':preds},
+                                getcols = {'Get':'AllExcept','Labels':'key','Cols':[None]},
+                                labels_only = None
+                                )
+        starter = [1,pred_coords['coredata']]
+        condcoord_ = None
+    else:
+        starter = None
+        condcoord_ = {'Fac0':'Orthonormal','Fac1':None}
 
-            if form == 'SumProd':
-                ObsEst = np.sum(np.multiply(ValObs,ValEst))
+    pred_obj = dmn.core.Damon(pred_data,'datadict_link',verbose=None)
+    pred_obj.coord(coord_args['ndim'],coord_args['runspecs'],coord_args['seed'],
+                   startercoord=starter,condcoord_=condcoord_)
 
-            if form == 'MeanProd':
-                ObsEst = np.mean(np.multiply(ValObs,ValEst))
+    return np.copy(pred_obj.coord_out['fac0coord']['coredata'])
 
-            if np.isnan(ObsEst):
-                ObsEst = nanval
 
-        except IndexError:
-            ObsEst = nanval
+def _predpool_init(specs):
+    "Worker initializer:  keep the Damon object and fitting specs."
 
-    # return_ list if counting
-    if count is True:
-        return [ObsEst,N]
-    else:
-        return ObsEst
+    _PREDPOOL.clear()
+    _PREDPOOL.update(specs)
 
 
+def _predpool_task(preds):
+    "Worker task:  fit one set of predictor entities."
 
+    s = _PREDPOOL
+    return _fit_preds(s['Damon'], preds, s['Starters'], s['CoordArgs'])
 
-###########################################################################
 
-def correl_se(correl,   # [Correlation coefficient]
-              count    # [Count of observations]
-              ):
-    """Compute the standard error of a correlation.
+def coords_per_preds(d,  # [Damon object holding targets and predictors]
+                     pred_sets,    # [list of lists of predictor column keys]
+                     coord_args,   # [{'ndim':[[3]],'runspecs':[0.0001,10],'seed':1} => coord() args for each set]
+                     starters = None,  # [<None, fac1coord datadict> => start each set from its predictors' coordinates]
+                     workers = None,   # [<None,int> => number of worker processes]
+                     ):
+    """Fit row coordinates from each distinct set of predictor
+    entities, optionally in parallel, for objectify().
 
     Returns
     -------
-        correl_se() returns a scale equal to the standard error
-        of the correlation.
+        A dictionary of row coordinate arrays (rows x ndim), keyed
+        by each set's sorted tuple of predictor keys:
+
+            R = out[tuple(sorted(preds))]
 
     Comments
     --------
-        The (approximate) formula for the standard error of correlation r
-        given sample size n is:
-
-            SE[r] = sqrt( (1-r^2)/(n-2) )
-
-        Hotelling, H. (1953). New light on the correlation coefficient and its
-        transforms. Journal of the Royal Statistical Society, Series B, 15(2),
-        193-232.
-
-        Ghosh, B. K. (1966). Asymptotic expansions for the moments of the
-        distribution of correlation coefficient. Biometrika, 53(1/2), 258-262.
+        objectify() fits a coordinate system for the predictors of each
+        target entity.  Targets often share the same predictors, e.g.,
+        with pred_ents = {'AllTargs':{'Get'...}} or 'Subscales', so sets
+        that contain the same keys are fitted once.  The fit does not
+        depend on the order of the keys, since columns are extracted in
+        data order.
+
+        With workers > 1, the distinct sets are mapped across a pool of
+        worker processes.  Each worker is handed d, starters and
+        coord_args when it starts (inherited, not pickled, where
+        processes are forked), so only the predictor keys and the
+        resulting coordinates pass between processes.  Each set is
+        fitted from the same state in any process, so the coordinates
+        are the same for any number of workers.
 
     Arguments
     ---------
-        "correl" is the correlation coefficient for which the
-        standard error is desired.
+        "d" is the Damon object (e.g., in 'datadict_link' format)
+        whose columns include the predictors.
 
-        "count" is the number of valid data points used to calculate
-        the correlation.
+        --------------
+        "pred_sets" is a list of lists of predictor column keys.
+        Duplicates are fitted once.
 
-    Examples
-    --------
+        --------------
+        "coord_args" gives the 'ndim', 'runspecs' and 'seed' passed to
+        coord() for each set.
 
-        [under construction]
+        --------------
+        "starters" is None, in which case each set gets orthonormal
+        row coordinates from random starters, or the fac1coord datadict
+        of an earlier coord() run, whose rows for the set's predictors
+        are used as starter column coordinates.
+
+        --------------
+        "workers" is None or 1 for no worker processes, or the number
+        of processes to start.
 
     Paste Function
     --------------
-        correl_se(correl,   # [Correlation coefficient]
-                  count    # [Count of observations]
-                  )
+        coords_per_preds(d,  # [Damon object holding targets and predictors]
+                         pred_sets,    # [list of lists of predictor column keys]
+                         coord_args,   # [{'ndim':[[3]],'runspecs':[0.0001,10],'seed':1} => coord() args for each set]
+                         starters = None,  # [<None, fac1coord datadict> => start each set from its predictors' coordinates]
+                         workers = None,   # [<None,int> => number of worker processes]
+                         )
 
     """
-    se = np.sqrt((1 - correl**2) / float(count - 2))
-
-    return se
-
-
-
-
-###########################################################################
-
-def stats_per_dim(obj,  # [Damon object]
-                  stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
-                  dim,  # [int dimensionality, overwrites coord_args['ndim']]
-                  coord_args,   # [dict of coord() arguments for internal use]
-                  seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
-                  nanval = -999,    # [not-a-number value]
-                  ):
-    """Calculate specified stats per dimension for _bestdim()
-
-    Returns
-    -------
-        stats_per_dim returns the following statistics as
-        a dictionary:
-
-            {'Acc',
-            'Err',
-            'Stab',
-            'Speed',
-            'NonDegen',
-            'Obj'
-            }
+    # Distinct sets, in a fixed order
+    unique = {}
+    for preds in pred_sets:
+        unique.setdefault(tuple(sorted(preds)), list(preds))
+    keys = sorted(unique)
+
+    if (workers is not None
+        and workers > 1
+        and len(keys) > 1
+        ):
+        specs = {'Damon':d,
+                 'Starters':starters,
+                 'CoordArgs':coord_args
+                 }
+        pool_ = mp.Pool(processes = min(workers, len(keys)),
+                        initializer = _predpool_init,
+                        initargs = (specs,))
+        try:
+            Rs = pool_.map(_predpool_task, [unique[key] for key in keys])
+        finally:
+            facpool_close({'Pool':pool_})
+    else:
+        Rs = [_fit_preds(d, unique[key], starters, coord_args)
+              for key in keys]
 
-        If the function is unable for some reason to compute
-        a statistic, it reports it as numpy's nan value.
+    return dict(zip(keys, Rs))
 
-    Comments
-    --------
-        stats_per_dim() is primarily a private function used by the
-        _bestdim() function within the coord() method.  It calculates
-        statistics useful for assessing the "objectivity" of the solution
-        for a given dimensionality.
 
-        "Acc" (accuracy), ranging from 0.0 to 1.0, refers to Damon's accuracy in
-        predicting pseudo-missing observation at the specified dimensionality.
-        (See tools.accuracy() docs.)
 
-        "Err" (psmsresid), ranging from 0.0 to +inf, is similar to accuracy except
-        that it averages the residuals between the estimates and pseudo-missing
-        observations.
+###########################################################################
 
-        "Stab" (stability), ranging from 0.0 to 1.0, refers to the stability of
-        Damon's coordinate structure at the specified dimensionality.
-        (See tools.stability() docs.)
+def _canon(x):
+    "Stable text for an argument value, for cache keys."
+
+    if isinstance(x, dict):
+        return '{' + ','.join([repr(k) + ':' + _canon(x[k])
+                               for k in sorted(x)]) + '}'
+    elif isinstance(x, (list, tuple)):
+        return '[' + ','.join([_canon(v) for v in x]) + ']'
+    elif isinstance(x, np.ndarray):
+        return hashlib.sha1(np.ascontiguousarray(x).tostring()).hexdigest()
+    elif callable(x):
+        return (getattr(x, '__module__', '') + '.'
+                + getattr(x, '__name__', repr(type(x))))
+    else:
+        return repr(x)
 
-        "Speed", ranging from 0.0 to 1.0, refers to how quickly Damon converges.
-        This is sometimes a useful indicator of correct dimensionality.
 
-        "NonDegen" (nondegeneracy), ranging from 0.0 to +inf, is used to flag
-        "degenerate" solutions where pseudo-missing estimates tend to be
-        significantly different from the observed values in the remainder
-        of the observations.
+def _cache_specs(cache):
+    "Parse the coord() cache arg into {'Path','MaxMB','MaxDays'}."
 
-        "Obj" (objectivity) combines accuracy and stability in one statistic.
+    specs = {'Path':None, 'MaxMB':100, 'MaxDays':None}
+    if isinstance(cache, basestring):
+        specs['Path'] = cache
+    elif isinstance(cache, dict):
+        for key in cache:
+            if key not in specs:
+                exc = 'Unable to figure out cache key: ' + str(key) + '\n'
+                raise search_cache_Error(exc)
+            specs[key] = cache[key]
+    if specs['Path'] is None:
+        exc = "cache needs a directory name, or a dict with a 'Path' key.\n"
+        raise search_cache_Error(exc)
 
-        stats_per_dim() looks first in the _bestseed() outputs for each statistic,
-        and calculates it from scratch if it doesn't find it.
+    return specs
 
-    Arguments
-    ---------
 
-        "obj" is a Damon object.  This will include an ndim parameter which
-        is automatically overwritten by the "dim" parameter below.
 
-        ------------
-        "stats" is the desired list of stats, where the options are:
+###########################################################################
 
-            ['Acc','Err','Stab','Speed','NonDegen']
+def search_key(data,   # [2-D rows x cols array, possibly a np.memmap]
+               nanval = -999.,    # [not-a-number value]
+               psmsindex = None,  # [<None, pseudomiss_out['psmsindex']> => pseudo-missing cells]
+               args = None,   # [<None, dict> => the search settings, e.g., coord() args]
+               chunk = 50000,  # [int => rows of data hashed at a time]
+               ):
+    """Returns a fingerprint of data and settings for search_cache().
 
-            stats = ['Acc','Obj']
-                            =>  Calculate and report statistics only
-                                for Accuracy and Objectivity.
+    Returns
+    -------
+        A hex string, the SHA-1 hash of:
 
-        ------------
-        "dim" (an int) is the dimensionality at which to run coord() internally.
-        It overwrites the ndim parameter in coord_args.
+            *   the data values, read in blocks of chunk rows so that
+                a np.memmap is not loaded whole;
+            *   the shape of the data and its validity mask (cells
+                not equal to nanval);
+            *   the pseudo-missing cell indices, if any;
+            *   the repr() of args, with dict keys sorted and functions
+                represented by module and name.
 
-        ------------
-        "coord_args" are the arguments needed to run the coord() function
-        within stats_per_dim() in the event that coord() has not yet been run.
+        Any change to these produces a different key.
 
-            coord_args = None
-                            =>  coord() has already been run for the
-                                Damon object and there's no need to run
-                                it again.
+    Paste Function
+    --------------
+        search_key(data,   # [2-D rows x cols array, possibly a np.memmap]
+                   nanval = -999.,    # [not-a-number value]
+                   psmsindex = None,  # [<None, pseudomiss_out['psmsindex']> => pseudo-missing cells]
+                   args = None,   # [<None, dict> => the search settings, e.g., coord() args]
+                   chunk = 50000,  # [int => rows of data hashed at a time]
+                   )
 
-            coord_args = {'ndim':[[3]],'runspecs'=[0.0001,10],'seed'=1}
-                            =>  coord() will be run at dimensionality 3
-                                and seed 1 with the specified runspecs.
+    """
+    h = hashlib.sha1()
+    h.update(repr((np.shape(data), str(np.asarray(data[:0]).dtype),
+                   float(nanval))))
 
-                                All other args will be the coord() defaults.
+    nrows = np.shape(data)[0]
+    for start in xrange(0, nrows, chunk):
+        block = np.ascontiguousarray(data[start:start + chunk])
+        h.update(block.tostring())
+        h.update(np.packbits(block != nanval).tostring())
 
-        ------------
-        "seed_stat" is the statistic used to decide the best seed while finding
-        best dimensionality and is assigned by the _bestdim() function.  It is
-        not essential but saves _bestdim() the trouble of recalculating
-        accuracy or stability if they were already calculated in _bestseed().
+    if psmsindex is not None:
+        for index in psmsindex:
+            h.update(np.ascontiguousarray(index).tostring())
+    h.update(_canon(args))
 
-        The options are:
+    return h.hexdigest()
 
-            seed_stat = <None,'Stab','Acc','Obj'>
 
-        ------------
-        "nanval" is the not-a-number value.  This will generally be the
-        same as obj.nanval, but if the data was string it may need to be
-        converted to int or float.
 
-    Examples
+###########################################################################
+
+def search_cache(cache,   # [<'dirname', {'Path':'dirname','MaxMB':<None,100>,'MaxDays':<None,float>}> => cache directory and limits]
+                 key,  # [str => from search_key()]
+                 value = None,  # [<None, picklable object> => None to look up key, else value to store]
+                 ):
+    """Looks up or stores search results in an on-disk cache.
+
+    Returns
+    -------
+        With value = None, the object stored under key, or None if
+        there is none (or it has expired).  Otherwise value is stored
+        and None is returned.
+
+    Comments
     --------
+        coord() uses search_cache() so that reruns of its bestdim and
+        bestseed searches on unchanged data return their earlier
+        results instead of refitting every dimensionality and seed.
+        Each result is a pickle file named after its key in the
+        directory "Path", which is created if needed.
 
-        [Under construction]
+        Eviction:
+
+            'MaxMB'     =>  After each store, the least recently used
+                            files are removed until the directory holds
+                            no more than MaxMB megabytes.  None means
+                            no size limit.  Default is 100.
 
+            'MaxDays'   =>  Files not used for more than MaxDays days
+                            are treated as missing and removed.  None
+                            (the default) means they do not expire.
+
+        A file that cannot be read, e.g., one written by another
+        version, is treated as missing.  To drop results explicitly,
+        see cache_invalidate().
 
     Paste Function
     --------------
-        stats_per_dim(obj,  # [Damon object]
-                      stats,    # [<'Acc','Err','Stab','Speed','NonDegen'>] => stats to calculate]
-                      dim,  # [int dimensionality, overwrites coord_args['ndim']]
-                      coord_args,   # [dict of coord() arguments for internal use]
-                      seed_stat = None,    # [<None,'Acc','Stab','Obj'> => stat used by _bestseed() to decide best seed]
-                      nanval = -999,    # [not-a-number value]
-                      )
+        search_cache(cache,   # [<'dirname', {'Path':'dirname','MaxMB':<None,100>,'MaxDays':<None,float>}> => cache directory and limits]
+                     key,  # [str => from search_key()]
+                     value = None,  # [<None, picklable object> => None to look up key, else value to store]
+                     )
 
     """
-#    floor = 0.0000001
-#    ceiling = 0.9999999
-    coord_args = coord_args.copy()
-    coord_args['ndim'] = [[dim]]
-
-    # Decide whether to calc accuracy in stability()
-    if ('Obj' in stats
-        or ('Stab' in stats
-            and ('Acc' in stats
-                 or 'PsMsResid' in stats
-                 or 'NonDegen' in stats
-                 or 'Speed' in stats
-                 )
-             )
-        ):
-        acc_in_stab = ['Accuracy','Err','Speed']
+    specs = _cache_specs(cache)
+    path = specs['Path']
+    file_ = os.path.join(path, key + '.pkl')
 
-        if 'NonDegen' in stats:
-            acc_in_stab.append('NonDegen')
-    else:
-        acc_in_stab = None
+    # Look up
+    if value is None:
+        if not os.path.isfile(file_):
+            return None
+        if (specs['MaxDays'] is not None
+            and time.time() - os.path.getmtime(file_)
+                > specs['MaxDays'] * 86400.
+            ):
+            cache_invalidate(cache, key)
+            return None
+        try:
+            with open(file_, 'rb') as f:
+                value = cPickle.load(f)
+        except Exception:
+            cache_invalidate(cache, key)
+            return None
+        os.utime(file_, None)    # mark as recently used
+        return value
+
+    # Store, writing to a temporary file first so readers never see
+    # half a pickle
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    temp = file_ + '.' + str(os.getpid()) + '.tmp'
+    with open(temp, 'wb') as f:
+        cPickle.dump(value, f, cPickle.HIGHEST_PROTOCOL)
+    if os.path.exists(file_):
+        os.remove(file_)
+    os.rename(temp, file_)
+
+    # Evict
+    files = [os.path.join(path, name) for name in os.listdir(path)
+             if name.endswith('.pkl')]
+    files = sorted(files, key=os.path.getmtime)
+    now = time.time()
+    if specs['MaxDays'] is not None:
+        for f in files[:]:
+            if now - os.path.getmtime(f) > specs['MaxDays'] * 86400.:
+                os.remove(f)
+                files.remove(f)
+    if specs['MaxMB'] is not None:
+        total = sum([os.path.getsize(f) for f in files])
+        for f in files:
+            if total <= specs['MaxMB'] * 1024.**2 or f == file_:
+                break
+            total -= os.path.getsize(f)
+            os.remove(f)
 
-    # Try to get stats from _bestseed() outputs
-    try:
-        bestseed = obj.seed['BestSeed']
-        stats_per_seed = obj.seed['StatsPerSeed']
-        loc = np.where(stats_per_seed.core_col['Seed'] == bestseed)[0][0]
-    except AttributeError:
-        stats_per_seed = None
+    return None
 
-    # Get or calculate stability
-    if 'Stab' in stats or 'Obj' in stats:
-        try:
-            stability_ = stats_per_seed.core_col['Stab'][loc]
-            stab_out = None
-        except (AttributeError,KeyError):
-            try:
-                stab_out = stability(obj,coord_args,acc_in_stab,1,'Auto','Auto',nanval,True)
 
-                try:
-                    stability_ = stab_out['Stability']
-                except TypeError:
-                    stability_ = np.nan
 
-            except stability_in_coord_Error:
-                stability_ = np.nan
+###########################################################################
 
-    else:
-        stab_out = None
-        stability_ = np.nan
+def cache_invalidate(cache,   # [<'dirname', {'Path':'dirname',...}> => cache directory, as in search_cache()]
+                     key = None,   # [<None, str> => None to drop every result, else the key to drop]
+                     ):
+    """Removes results from a search_cache() directory.
 
-    # Get or calculate accuracy and related stats
-    if ('Acc' in stats
-        or 'Obj' in stats
-        or 'Err' in stats
-        or 'NonDegen' in stats
-        ):
+    Returns
+    -------
+        The number of results removed.
 
-        # Accuracy
-        if 'Acc' in stats:
-            try:
-                accuracy_ = stats_per_seed.core_col['Acc'][loc]
-            except (AttributeError,KeyError):
-                try:
-                    accuracy_ = stab_out['Accuracy']
-                except (TypeError, UnboundLocalError):
-                    nondegen = True if 'NonDegen' in stats else None
-                    acc_out = accuracy(obj,coord_args,nondegen,nanval)
-                    accuracy_ = acc_out['Accuracy']
-        else:
-            nondegen = True if 'NonDegen' in stats else None
-            acc_out = accuracy(obj,coord_args,nondegen,nanval)
-            accuracy_ = np.nan
+    Comments
+    --------
+        Use it when something the cache key does not see has changed,
+        e.g., the code of a custom condcoord function, or to free the
+        space:
 
-        # Err (pseudo-missing root mean squared resid)
-        if 'Err' in stats:
-            try:
-                psmsresid = stats_per_seed.core_col['Err'][loc]
-            except (AttributeError,KeyError):
-                try:
-                    psmsresid = stab_out['Err']
-                except (TypeError,KeyError,UnboundLocalError):
-                    try:
-                        psmsresid = acc_out['Err']
-                    except UnboundLocalError:
-                        acc_out = accuracy(obj,coord_args,nondegen,nanval)
-                        psmsresid = acc_out['Err']
-        else:
-            psmsresid = np.nan
+        >>>  tools.cache_invalidate('my_cache')
 
-        # Nondegeneracy
-        if 'NonDegen' in stats:
-            try:
-                nondegen_ = stats_per_seed.core_col['NonDegen'][loc]
-            except (AttributeError,KeyError):
-                try:
-                    nondegen_ = stab_out['NonDegen']
-                except (TypeError,UnboundLocalError):
-                    try:
-                        nondegen_ = acc_out['NonDegen']
-                    except (UnboundLocalError,KeyError):
-                        acc_out = accuracy(obj,coord_args,nondegen,nanval)
-                        nondegen_ = acc_out['NonDegen']
+    Paste Function
+    --------------
+        cache_invalidate(cache,   # [<'dirname', {'Path':'dirname',...}> => cache directory, as in search_cache()]
+                         key = None,   # [<None, str> => None to drop every result, else the key to drop]
+                         )
 
-        else:
-            nondegen_ = np.nan
+    """
+    path = _cache_specs(cache)['Path']
+    if not os.path.isdir(path):
+        return 0
 
-    # Calc convergence speed
-    if 'Speed' in stats:
-        try:
-            speed = stats_per_seed.core_col['Speed'][loc]
-        except (AttributeError,TypeError):
-            try:
-                speed = stab_out['Speed']
-            except (TypeError,KeyError,UnboundLocalError):
-                try:
-                    changelog = obj.coord_out['changelog']
-                    speed = 1.0 - np.sum(changelog[3:,1]) / np.sum(changelog[:,1])
-                except AttributeError:
-                    speed = np.nan
+    if key is None:
+        names = [name for name in os.listdir(path) if name.endswith('.pkl')]
     else:
-        speed = np.nan
+        names = [key + '.pkl']
 
-    # Calc objectivity
-    if 'Obj' in stats:
-        if (accuracy_ is not np.nan
-            and stability_ is not np.nan
-            ):
-            acc_stab = np.array([np.log(accuracy_),np.log(stability_)])
-            objectivity = round(np.exp(np.average(acc_stab)), 3)
-        else:
-            if accuracy_ is not np.nan:
-                objectivity = accuracy_
-            else:
-                objectivity = np.nan
-    else:
-        objectivity = np.nan
+    n = 0
+    for name in names:
+        try:
+            os.remove(os.path.join(path, name))
+            n += 1
+        except OSError:
+            pass
 
-    return {'Acc':accuracy_,
-            'Err':psmsresid,
-            'Stab':stability_,
-            'Speed':speed,
-            'NonDegen':nondegen_,
-            'Obj':objectivity
-            }
+    return n
 
 
 
@@ -7828,6 +11517,7 @@ def accuracy(obj,   # [Damon object]
              coord_args,   # [<None,{'ndim':[[3]],'seed':1,'...}> => coord() args dict for calibrating groups]
              nondegen,  # [<True,None> => calculate non-degeneracy statistic]
              nanval,    # [not-a-number value]
+             fits = None,   # [<None, dict> => fit cache shared with stability(), see stability()]
              ):
     """Calculate pseudo-missing predictive accuracy for _bestseed() and _bestdim().
 
@@ -7841,6 +11531,8 @@ def accuracy(obj,   # [Damon object]
          'NonDegen'     =>  (est_missing - est_nonmissing) / sd_nonmissing,
                              in 0-1 metric
          'Speed'        =>  convergence speed in 0-1 metric
+         'Fit'          =>  coord_out of the run the statistics
+                            come from
          }
 
     Comments
@@ -7891,6 +11583,14 @@ def accuracy(obj,   # [Damon object]
         same as obj.nanval, but if the data was string it may need to be
         converted to int or float.
 
+        ------------
+        "fits" is a dictionary shared with stability() for the same
+        obj.  If stability() has already fitted the split-half groups
+        for the same coord_args, accuracy() returns the statistics it
+        computed from them rather than running coord() on the whole of
+        obj again.  Otherwise it runs coord() and saves its statistics
+        in fits for later calls.  Ignored when coord_args is None.
+
     Examples
     --------
 
@@ -7902,9 +11602,23 @@ def accuracy(obj,   # [Damon object]
                  coord_args,   # [<None,{'ndim':[[3]],'seed':1,'...}> => coord() args dict for calibrating groups]
                  nondegen,  # [<True,None> => calculate non-degeneracy statistic]
                  nanval,    # [not-a-number value]
+                 fits = None,   # [<None, dict> => fit cache shared with stability(), see stability()]
                  )
 
     """
+    # Reuse the statistics of an earlier fit with the same arguments
+    if fits is None or coord_args is None:
+        FitKey = None
+    else:
+        key_args = coord_args.copy()
+        if key_args['seed'] == 'Auto4BestDim':
+            key_args['seed'] = 1
+        FitKey = ('Acc', _canon(key_args))
+        acc_out = fits.get(FitKey)
+        if (acc_out is not None
+            and (nondegen is not True or acc_out['NonDegen'] is not None)
+            ):
+            return acc_out
 
     # Control verbosity
     if obj.verbose is True:
@@ -8003,7 +11717,12 @@ def accuracy(obj,   # [Damon object]
     except AttributeError:
         speed = None
 
-    return {'Accuracy':accuracy,'Err':psms_resid,'NonDegen':nondegeneracy,'Speed':speed}
+    acc_out = {'Accuracy':accuracy,'Err':psms_resid,'NonDegen':nondegeneracy,'Speed':speed,
+               'Fit':obj.coord_out}
+    if FitKey is not None:
+        fits[FitKey] = acc_out
+
+    return acc_out
 
 
 
@@ -8020,6 +11739,7 @@ def stability(obj,  # [Damon object]
               group2 = 'Auto', # [<'Auto',{'Get':'AllExcept','Labels':'index','Entities':cols[obj.nheaders4rows::2]}> => complement extract statement for 'Entities' ('AllExcept')]
               nanval = -999,     # [not-a-number value]
               verbose = True,   # [<True,None> => print error message]
+              fits = None,  # [<None, dict> => fit cache shared across calls and with accuracy()]
               ):
     """Calculate coordinate stability for _bestseed() and _bestdim().
 
@@ -8035,7 +11755,11 @@ def stability(obj,  # [Damon object]
             {'Stability',
             'Accuracy',
             'Err',
-            'NonDegen'
+            'NonDegen',
+            'Speed',
+            'Fit'       =>  coord_out of the half-data run (Step 2
+                            below), e.g., to warm-start a longer run
+                            of the same seed
             }
 
 
@@ -8206,6 +11930,27 @@ def stability(obj,  # [Damon object]
         same as obj.nanval, but if the data was string it may need to be
         converted to int or float.
 
+        ------------
+        "fits" is a dictionary, initially empty, that lets the statistic
+        routines share one set of split-half fits per dimensionality and
+        seed.  Each search candidate should get its fits dict (or one
+        dict can serve a whole search, as keys include the coord_args):
+
+            fits = None     =>  Fit the groups on every call.
+
+            fits = {}       =>  The first call for a given coord_args,
+                                facet, and groups fits them and saves the
+                                result in fits; later calls return it
+                                without refitting.  The Accuracy, Err,
+                                NonDegen, and Speed statistics of group0
+                                are also saved for accuracy(obj,
+                                coord_args, ..., fits = fits), which then
+                                returns them instead of running coord()
+                                on the whole of obj.
+
+        _bestseed() and stats_per_dim() use one fits dict per candidate,
+        so asking for several statistics costs one set of fits.
+
     Examples
     --------
 
@@ -8221,11 +11966,28 @@ def stability(obj,  # [Damon object]
                   group2 = 'Auto', # [<'Auto',{'Get':'AllExcept','Labels':'index','Entities':cols[obj.nheaders4rows::2]}> => complement extract statement for 'Entities' ('AllExcept')]
                   nanval = -999,     # [not-a-number value]
                   verbose = True,   # [<True,None> => print error message]
+                  fits = None,  # [<None, dict> => fit cache shared across calls and with accuracy()]
                   )
 
 
     """
-    
+    # Reuse the group fits of an earlier call with the same arguments
+    if fits is None:
+        FitKey = None
+    else:
+        FitKey = ('Stab', facet, _canon(group1), _canon(group2),
+                  _canon(coord_args))
+        if FitKey in fits:
+            stab_out = fits[FitKey]
+            if (stab_out is None
+                or stats is None
+                or (stab_out['Accuracy'] is not None
+                    and ('NonDegen' not in stats
+                         or stab_out['NonDegen'] is not None))
+                ):
+                return stab_out
+
+
     warn1 = "Warning in coord()/seed(): Dataset is too small relative to the number of dimensions to calculate a seed stability stat.  Setting seed = 1.\n"
     nrows = np.size(obj.coredata,axis=0) + obj.nheaders4cols
     ncols = np.size(obj.coredata,axis=1) + obj.nheaders4rows
@@ -8240,9 +12002,11 @@ def stability(obj,  # [Damon object]
         dim = coord_args['ndim'][0][0]
 
     # Test seed
-    if not isinstance(coord_args['seed'],int):
+    if (not isinstance(coord_args['seed'],int)
+        and coord_args['seed'] != 'SVD'
+        ):
         #print "Error: coord_args['seed'] = ",coord_args['seed']
-        exc = 'Unable to use the coord_args seed parameter.  Must be a single integer.'
+        exc = "Unable to use the coord_args seed parameter.  Must be a single integer or 'SVD'."
         raise stability_in_coord_Error(exc)
 
     # Interpret groups
@@ -8336,6 +12100,17 @@ def stability(obj,  # [Damon object]
     except AttributeError:
         speed = None
 
+    # Share the group0 statistics with accuracy()
+    if FitKey is not None:
+        fits[FitKey] = None
+        if stats is not None:
+            fits[('Acc', _canon(coord_args))] = {'Accuracy':acc_,
+                                                 'Err':psms_resid,
+                                                 'NonDegen':nondegen,
+                                                 'Speed':speed,
+                                                 'Fit':group0.coord_out
+                                                 }
+
 
     ############################################################
 
@@ -8509,12 +12284,17 @@ def stability(obj,  # [Damon object]
     except AttributeError:
         pass
 
-    return {'Stability':corr,
-            'Accuracy':acc_,
-            'Err':psms_resid,
-            'NonDegen':nondegen,
-            'Speed':speed
-            }
+    stab_out = {'Stability':corr,
+                'Accuracy':acc_,
+                'Err':psms_resid,
+                'NonDegen':nondegen,
+                'Speed':speed,
+                'Fit':group0.coord_out
+                }
+    if FitKey is not None:
+        fits[FitKey] = stab_out
+
+    return stab_out
 
 
 
@@ -8551,6 +12331,12 @@ def homogenize(arr, # [2-D array to homogenize]
         amount of data involved in each vector multiplication using
         the max_ option.
 
+        All pairs are computed at once from matrix products over
+        blocks of rows, with the same pair-wise deletion of missing
+        values as correl(), whose output each cell matches.  The
+        cost is therefore a few BLAS products rather than one
+        correl() call per pair.
+
     Arguments
     ---------
         "arr" is a 2-dimensional data array.
@@ -8615,17 +12401,52 @@ def homogenize(arr, # [2-D array to homogenize]
     nrows = np.size(arr,axis=0)
     if max_ is not None:
         if nrows > max_:
-            step = nrows / float(max_)
+            step = int(np.ceil(nrows / float(max_)))
             arr = arr[0:nrows:step,:]
 
-    # Cross-multiply columns
-    f_prod = correl
-    ncols = np.size(arr,axis=1)
-    ran = range(ncols)
-    sumprod = [f_prod(arr[:,i],arr[:,j],nanval,form,None)
-               for i in ran for j in ran]
+    # Accumulate pair-wise sums for all column pairs at once, by blocks
+    # of rows:  n, sum x, sum x**2, sum x*y over rows valid in both
+    nrows, ncols = np.shape(arr)
+    n = np.zeros((ncols,ncols))
+    sx = np.zeros((ncols,ncols))
+    sxx = np.zeros((ncols,ncols))
+    sxy = np.zeros((ncols,ncols))
+    chunk = 50000
+
+    for i in xrange(0,nrows,chunk):
+        x = np.asarray(arr[i:i + chunk],dtype=float)
+        valid = (x != nanval).astype(float)
+        x = np.where(valid > 0,x,0.0)
+        n += np.dot(valid.T,valid)
+        sx += np.dot(x.T,valid)
+        sxx += np.dot((x**2).T,valid)
+        sxy += np.dot(x.T,x)
+
+    # Same formulas and missing cases as correl(), pair by pair
+    sy, syy = sx.T, sxx.T
+    n_ = np.where(n > 0,n,1)
+    varx = np.clip(sxx - sx**2 / n_,0.0,np.inf)
+    vary = np.clip(syy - sy**2 / n_,0.0,np.inf)
+    cov = sxy - sx * sy / n_
+    tiny = 1e-12
+    calc = (varx > tiny * sxx) & (vary > tiny * syy)
+
+    if form == 'Corr':
+        homodata = cov / np.sqrt(varx * vary)
+    elif form == 'Cov':
+        homodata = cov / (n - 1)
+    elif form == 'SumProd':
+        homodata = sxy
+    elif form == 'MeanProd':
+        homodata = sxy / n
+    else:
+        exc = 'Unable to figure out form.\n'
+        raise homogenize_Error(exc)
 
-    homodata = np.resize(sumprod,(ncols,ncols))
+    homodata = np.where(calc & ~np.isnan(homodata) & ~np.isinf(homodata),
+                        homodata,nanval)
+    if form == 'SumProd':
+        homodata[n == 0] = 0.0
 
     return homodata
 
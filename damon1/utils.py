@@ -14,6 +14,8 @@ import sys
 import cPickle
 import csv
 import ast
+import time
+import multiprocessing as mp
 
 import numpy as np
 import numpy.random as npr
@@ -5088,6 +5090,11 @@ def _rasch(_locals):
     maxchange = _locals['maxchange']
     labels = _locals['labels']
     extreme = _locals['extreme']
+    collapse = _locals['collapse']
+    solver = _locals['solver']
+    sparse = _locals['sparse']
+    Monitor = tools.iter_monitor(_locals['monitor'], method='rasch')
+    StartTime = time.time()
 
     # Get data
     try:
@@ -5208,6 +5215,19 @@ def _rasch(_locals):
     stop_when_change = runspecs[0]
     max_iteration = runspecs[1]
 
+    # Starting values and update rule
+    if solver is None:
+        solver = []
+    elif isinstance(solver, str):
+        solver = [solver]
+
+    for flag in solver:
+        if flag not in ['PROX', 'Newton']:
+            exc = "solver flags must be 'PROX' or 'Newton'.\n"
+            raise rasch_Error(exc)
+
+    newton = 'Newton' in solver and anchors is None
+
     # List of entities
     R_ents = tools.getkeys(data, 'Row', 'Core', 'Auto', None)
     C_ents = all_items
@@ -5216,11 +5236,44 @@ def _rasch(_locals):
     obs = data['coredata']
     nrows, ncols = np.shape(obs)
 
-    # Estimates, variance, fit
-    est = np.zeros((nrows, ncols))
-    est_fin = np.zeros((nrows, ncols))
-    var = np.zeros((nrows, ncols))
-    var_fin = np.zeros((nrows, ncols))
+    # Observed cells, for sparse:  flat arrays of their rows, columns
+    # and values, in group order so that each group's cells are a slice.
+    # Columns in no group go last.
+    if sparse is not None:
+        index = tools.csr_index(obs, nanval)
+        col_group = np.zeros(ncols, dtype=int) + len(groups_list)
+        for i, group in enumerate(groups_list):
+            col_group[groups[group]['index']] = i
+
+        order = np.argsort(col_group[index.indices], kind='mergesort')
+        cell_rows = np.repeat(np.arange(nrows), index.counts())[order]
+        cell_cols = index.indices[order]
+        cell_obs = obs[cell_rows, cell_cols].astype(float)
+
+        # Cells in row order, for Newton-Raphson
+        if newton:
+            cell_byrow = np.argsort(cell_rows, kind='mergesort')
+            row_bounds = index.indptr
+        del index, order
+
+        bounds = np.searchsorted(col_group[cell_cols],
+                                 np.arange(len(groups_list) + 1))
+        g_ind = {}
+        for i, group in enumerate(groups_list):
+            g_ind[group] = slice(bounds[i], bounds[i + 1])
+
+        if self.verbose is True:
+            print 'rasch() holds', len(cell_obs), 'observed cells of', nrows * ncols, '\n'
+
+    # Estimates, variance, fit.  For sparse, est and var hold the
+    # observed cells, and est_fin is built after the iterations.
+    if sparse is None:
+        est = np.zeros((nrows, ncols))
+        est_fin = np.zeros((nrows, ncols))
+        var = np.zeros((nrows, ncols))
+    else:
+        est = np.zeros(len(cell_obs))
+        var = np.zeros(len(cell_obs))
     R_var = np.zeros((nrows, 1))
     R_res = np.zeros((nrows, 1))
     R_infit = np.zeros((nrows, 1))
@@ -5248,36 +5301,49 @@ def _rasch(_locals):
     for group in groups_list:
         g_cats = cats[group]
         obs_cat_freq[group] = np.zeros((len(g_cats)))
+        if sparse is None:
+            g_obs = obs[:, groups[group]['index']]
+        else:
+            g_obs = cell_obs[g_ind[group]]
 
         # Count cats in observations
         for cat in g_cats:
             try:
-                obs_cat_freq[group][cat] = (np.sum(obs[:, groups[group]['index']] 
-                                            == cat))
+                obs_cat_freq[group][cat] = np.sum(g_obs == cat)
             except IndexError:
                 exc = ('Category {0} in group {1} turned up empty. Use '
                        'extract_valid() to remove items with '
                        'no variation or collapse categories.').format(cat, group)
                 raise IndexError(exc)
                            
-    # Category probability matrices
+    # Category probabilities, a cats x rows x items array per group
     cat_probs = {}
-    for group in groups_list:
-        cat_probs_ = {}
 
-        for cat in cats[group]:
-            cat_probs_[cat] = np.zeros((nrows, len(groups[group]['index'])))
+    # Valid data in each row/column
+    if sparse is None:
+        obs_valid = obs != nanval
+        R_count = np.sum(obs_valid, axis=1)[:, np.newaxis].astype(float)
+        C_count = np.sum(obs_valid, axis=0)[np.newaxis, :].astype(float)
 
-        cat_probs[group] = cat_probs_
+        def valid_sums(arr, valid=obs_valid, wt=None):
+            """Row and column sums of arr over the valid cells, the column
+            sums weighted by the row counts wt of collapsed rows."""
+            arr = np.where(valid, arr, 0.0)
+            R_sum = np.sum(arr, axis=1)[:, np.newaxis]
+            if wt is not None:
+                arr *= wt
 
-    # Create indices for valid data in each row/column
-    R_locval = {}
-    C_locval = {}
-    for i in xrange(nrows):
-        R_locval[i] = np.where(obs[i, :] != nanval)
+            return R_sum, np.sum(arr, axis=0)[np.newaxis, :]
 
-    for i in xrange(ncols):
-        C_locval[i] = np.where(obs[:, i] != nanval)
+    else:
+        obs_valid = None
+        R_count = np.bincount(cell_rows, minlength=nrows)[:, np.newaxis].astype(float)
+        C_count = np.bincount(cell_cols, minlength=ncols)[np.newaxis, :].astype(float)
+
+        def valid_sums(arr, valid=None, wt=None):
+            "Row and column sums of arr, an array of the observed cells."
+            return (np.bincount(cell_rows, arr, nrows)[:, np.newaxis],
+                    np.bincount(cell_cols, arr, ncols)[np.newaxis, :])
 
     # Get maximum raw score per row
     g_cols = []
@@ -5290,11 +5356,10 @@ def _rasch(_locals):
     max_row_logit = np.log((sum(g_cols) - j) / j)   # Same for each row
     min_row_logit = -1 * max_row_logit
 
-    max_col_logit = {}  # Differs across columns
-    min_col_logit = {}
-    for item in all_items:
-        max_col_logit[item] = np.log((nrows * len(cats_per_item[item]) - k) / k)
-        min_col_logit[item] = -1 * max_col_logit[item]
+    # Differs across columns
+    max_col_logit = np.log((nrows * np.array([len(cats_per_item[item])
+                                              for item in all_items]) - k) / k)
+    min_col_logit = -1 * max_col_logit
 
 
     #####################
@@ -5414,18 +5479,266 @@ def _rasch(_locals):
     ##  R, C, T    ##
     #################
 
+    # Columns of each group, as a slice where they are contiguous so
+    # that group sections are views rather than copies
+    if sparse is None:
+        g_ind = {}
+        for group in groups_list:
+            ind = np.asarray(groups[group]['index'])
+            if (len(ind) > 0
+                and np.array_equal(ind, np.arange(ind[0], ind[0] + len(ind)))
+                ):
+                ind = slice(ind[0], ind[0] + len(ind))
+            g_ind[group] = ind
+
+    # Row and column raw scores
+    R_obs, C_obs = valid_sums(obs if sparse is None else cell_obs)
+    scored = None
+
+    # Items and steps all anchored:  score the persons directly against
+    # them, then make the single pass with the persons held fixed
+    if (anchors is not None
+        and anc_fac == 1
+        and anchors['row_ents'] in [None, [None]]
+        and np.all(C_anc != nanval)
+        ):
+        C[:, :] = C_anc
+        T = T_anc
+
+        steps = np.zeros((ncols, max([len(cats[group]) for group in groups_list])))
+        steps += np.inf
+        for group in groups_list:
+            steps[groups[group]['index'], :len(cats[group])] = np.cumsum(T[group])
+
+        # Zero and perfect scores go to the logit limits, as in the
+        # iterations
+        scored = tools.rasch_score(obs, C[0], steps, nanval, j,
+                                   limits=[min_row_logit, max_row_logit])
+        R = np.clip(scored['Measures'], min_row_logit, max_row_logit)
+        R_nonanc_loc = (np.array([], dtype=int), np.array([], dtype=int))
+
+        if self.verbose is True:
+            print ('rasch() scored {0} rows against the anchors:  {1} item '
+                   'sets, {2} new (item set, score) cases\n'
+                   ).format(nrows, scored['nPatterns'], scored['nSolved'])
+
+    # Collapsed rows:  iterate on one row per response pattern or score
+    # group, weighted by its count, then run the final pass on all rows
+    collapsed = None
+    if collapse is not None and anchors is None and sparse is None:
+        collapsed = tools.collapse_rows(obs, nanval, collapse)
+        c_obs = obs[collapsed['Rows']]
+        c_valid = obs_valid[collapsed['Rows']]
+        c_wt = collapsed['Counts'][:, np.newaxis].astype(float)
+        c_est = np.zeros(np.shape(c_obs))
+        c_var = np.zeros(np.shape(c_obs))
+
+        R = np.zeros((collapsed['nGroups'], 1))
+        R_nonanc_loc = np.where(R == 0)
+
+        if self.verbose is True:
+            print 'rasch() collapsed', nrows, 'rows to', collapsed['nGroups'], '\n'
+
+    # PROX starting values, with steps from adjacent category frequencies
+    if 'PROX' in solver and anchors is None:
+        maxcat = [max(cats_per_item[item]) for item in all_items]
+        start = tools.prox(obs, maxcat, nanval, extreme)
+        R = np.clip(start['Rows'], min_row_logit, max_row_logit)
+        if collapsed is not None:
+            R = R[collapsed['Rows']]
+        C = np.clip(start['Cols'], min_col_logit, max_col_logit)
+
+        for group in groups_list:
+            freq = obs_cat_freq[group]
+            if 0 not in freq:
+                T[group][1:] = np.log(freq[:-1] / freq[1:])
+                T[group][1:] -= np.mean(T[group][1:])
+
+    # Steps need every category to be observed
+    if calc_T is True:
+        for group in groups_list:
+            if 0 in obs_cat_freq[group]:
+                exc = 'One of your rating categories is not represented in the data.  Adjust validchars attribute.\n'
+                raise rasch_Error(exc)
+
+    # Observed counts at or above each step of each group
+    obs_above = {}
+    for group in groups_list:
+        obs_above[group] = np.cumsum(obs_cat_freq[group][::-1])[::-1][1:]
+
+    def cell_gram(vals, wts):
+        """Sum over rows of wts times the outer product of the row's
+        observed cell values vals, cols x cols, for sparse.  Built a
+        block of rows at a time."""
+        gram = np.zeros((ncols, ncols))
+        nblock = max(1, 2**22 // ncols)
+
+        for start in xrange(0, nrows, nblock):
+            stop_ = min(start + nblock, nrows)
+            at = cell_byrow[row_bounds[start]:row_bounds[stop_]]
+            block = np.zeros((stop_ - start, ncols))
+            block[cell_rows[at] - start, cell_cols[at]] = vals[at]
+            gram += np.dot(block.T, block * wts[start:stop_, np.newaxis])
+
+        return gram
+
+    def newton_step(x_valid, x_est, x_var, x_wt, R_res, C_res, R_var, C_var):
+        """Newton-Raphson changes in R, C and the steps T of polytomous
+        groups.  The information matrix is diagonal in R, so R is
+        eliminated and the smaller items (plus steps) system solved.
+        Rows held at a logit limit by extreme scores stay there."""
+        wt = 1.0 if x_wt is None else x_wt
+        free = ~(((R >= max_row_logit) & (R_res > 0))
+                 | ((R <= min_row_logit) & (R_res < 0)))
+
+        # Information between R and (C, T), and the (C, T) blocks.  For
+        # sparse, the R-C block is the observed cells' -x_var.
+        B = [-np.where(x_valid, x_var, 0.0)] if sparse is None else []
+        g_T, J_CT, J_TT, T_groups = [], [], [], []
+
+        for group in groups_list:
+            ncats = len(cats[group])
+            if ncats < 3:
+                continue
+
+            ind = g_ind[group]
+            g_probs = cat_probs[group]
+            g_cats = np.array(cats[group]).reshape((-1,) + (1,) * (g_probs.ndim - 1))
+
+            # P(X >= k) and Cov(X, [X >= k]) for steps k = 1..ncats - 1
+            S = np.cumsum(g_probs[::-1], axis=0)[::-1][1:]
+            W = (np.cumsum((g_cats * g_probs)[::-1], axis=0)[::-1][1:]
+                 - x_est[..., ind] * S)
+            if sparse is None:
+                g_valid = x_valid[:, ind]
+                S *= g_valid
+                W *= g_valid
+
+            S_wt = (S * wt).reshape(ncats - 1, -1)
+            S_sum = np.sum(S_wt, axis=1)
+            k = np.arange(ncats - 1)
+            J_TT.append(S_sum[np.maximum.outer(k, k)]
+                        - np.dot(S_wt, S.reshape(ncats - 1, -1).T))
+            g_T.append(S_sum - obs_above[group])
+
+            if sparse is None:
+                B.append(-np.sum(W, axis=2).T)
+                CT = np.zeros((ncols, ncats - 1))
+                CT[ind] = np.sum(W * wt, axis=1).T
+            else:
+                B.append(-np.array([np.bincount(cell_rows[ind], w, nrows)
+                                    for w in W]).T)
+                CT = np.array([np.bincount(cell_cols[ind], w, ncols)
+                               for w in W]).T
+            J_CT.append(CT)
+            T_groups.append(group)
+
+        nT = sum([len(g) for g in g_T])
+        J = np.zeros((ncols + nT, ncols + nT))
+        J[:ncols, :ncols] = np.diag(C_var[0])
+        grad = np.concatenate([-C_res[0]] + g_T)
+
+        # Changes keep C, and the steps of each group, centred on zero
+        A = np.zeros((ncols + nT, 1 + len(T_groups)))
+        A[:ncols, 0] = 1
+        at = ncols
+        for i, group in enumerate(T_groups):
+            n_k = len(g_T[i])
+            J[:ncols, at:at + n_k] = J_CT[i]
+            J[at:at + n_k, :ncols] = J_CT[i].T
+            J[at:at + n_k, at:at + n_k] = J_TT[i]
+            A[at:at + n_k, 1 + i] = 1
+            at += n_k
+
+        # Schur complement of the R block
+        if sparse is None:
+            B = np.concatenate(B, axis=1)
+            B_wt = B * (wt * free / R_var)
+            J -= np.dot(B.T, B_wt)
+            grad -= np.dot(B_wt.T, R_res[:, 0])
+        else:
+            B = np.concatenate([np.zeros((nrows, 0))] + B, axis=1)
+            R_wt = (free / R_var)[:, 0]
+            B_wt = B * R_wt[:, np.newaxis]
+            J[:ncols, :ncols] -= cell_gram(x_var, R_wt)
+            for t in xrange(nT):
+                J[:ncols, ncols + t] += np.bincount(cell_cols,
+                                                    x_var * B_wt[cell_rows, t],
+                                                    ncols)
+            J[ncols:, :ncols] = J[:ncols, ncols:].T
+            J[ncols:, ncols:] -= np.dot(B.T, B_wt)
+            grad[:ncols] += np.bincount(cell_cols,
+                                        x_var * (R_wt * R_res[:, 0])[cell_rows],
+                                        ncols)
+            grad[ncols:] -= np.dot(B_wt.T, R_res[:, 0])
+
+        # Solve with the constraints bordering the system
+        K = np.append(np.append(J, A, axis=1),
+                      np.append(A.T, np.zeros((A.shape[1], A.shape[1])), axis=1),
+                      axis=0)
+        d_q = np.linalg.solve(K, np.append(grad, np.zeros(A.shape[1])))[:ncols + nT]
+        if sparse is None:
+            B_dq = np.dot(B, d_q)
+        else:
+            B_dq = (np.dot(B, d_q[ncols:])
+                    - np.bincount(cell_rows, x_var * d_q[cell_cols], nrows))
+        d_R = np.where(free, R_res - B_dq[:, np.newaxis], 0.0) / R_var
+
+        d_T = {}
+        at = ncols
+        for group in groups_list:
+            d_T[group] = np.zeros(len(cats[group]))
+            if group in T_groups:
+                n_k = len(cats[group]) - 1
+                d_T[group][1:] = d_q[at:at + n_k]
+                at += n_k
+
+        return d_R, d_q[np.newaxis, :ncols], d_T, free
+
+    def take_step(step):
+        """R, C and T a fraction step['size'] along a Newton step, each
+        change no larger than maxchange, within the logit limits."""
+        size = step['size']
+        R_ = np.clip(step['R'] + size * np.clip(step['d_R'], -maxchange, maxchange),
+                     min_row_logit, max_row_logit)
+        C_ = np.clip(step['C'] + size * np.clip(step['d_C'], -maxchange, maxchange),
+                     min_col_logit, max_col_logit)
+        C_ -= np.mean(C_)
+
+        T_ = {}
+        for group in groups_list:
+            T_[group] = step['T'][group] + size * np.clip(step['d_T'][group],
+                                                          -maxchange, maxchange)
+            T_[group][1:] -= np.mean(T_[group][1:])
+
+        return R_, C_, T_
+
     # Iterate to calculate row, column, step measures
     it = 0
     stop = 0 if anchors is None else 1
     max_res = 1
+    step = None
+    n_back = 0
 
     if self.verbose is True:
         print 'It\tChange'
 
     while stop < 2:
+        ItStart = time.time()
+
+        # Collapsed rows, or all rows with measures broadcast from them
+        if collapsed is not None and stop == 0:
+            x_obs, x_valid, x_wt, x_est, x_var = c_obs, c_valid, c_wt, c_est, c_var
+        else:
+            if collapsed is not None and x_wt is not None:
+                R = R[collapsed['Inverse']]
+                R_nonanc_loc = np.where(np.ones(np.shape(R), dtype=bool))
+            x_obs = obs if sparse is None else cell_obs
+            x_valid, x_wt, x_est, x_var = obs_valid, None, est, var
 
-        est[:, :] = 0
-        var[:, :] = 0
+        x_est[...] = 0
+        x_var[...] = 0
+        loglik = 0.0
 
         # Calculate category probability numerators.  Accumulate for denominators
         for group in groups_list:
@@ -5439,142 +5752,172 @@ def _rasch(_locals):
                 elif anc_fac == 1:
                     C[C_anc_loc] = C_anc[C_anc_loc]
 
-            # Pull group section of main arrays
-            ind = groups[group]['index']
-            g_C = C[:, ind]
-            g_est = np.zeros((nrows, len(ind)))
-            g_obs = obs[:, ind]
-            g_est_fin = np.zeros((nrows, len(ind)))
-            g_var = np.zeros((nrows, len(ind)))
-            g_var_fin = np.zeros((nrows, len(ind)))
-
-            # Initialize denominator = sum(all numerators)
-            cat_prob_denom = np.zeros((nrows, len(groups[group]['items'])))
-
+            # Pull group section of main arrays.  For sparse, the group's
+            # observed cells, none missing.
+            ind = g_ind[group]
+            g_steps = np.array([np.sum(T[group][:i + 1])
+                                for i in range(len(cats[group]))])
 
+            if sparse is None:
+                g_cats = np.array(cats[group])[:, np.newaxis, np.newaxis]
+                g_miss = ~x_valid[:, ind]
+                g_theta = (R - C[:, ind])[np.newaxis, :, :]
+            else:
+                g_cats = np.array(cats[group])[:, np.newaxis]
+                g_miss = False
+                g_theta = (R[cell_rows[ind], 0] - C[0, cell_cols[ind]])[np.newaxis, :]
 
             # TODO:  Check the formula -- top and (top-1) categories have same sum
             # See MMEdits_Poly_Rasch_Demo_v3.xlsx
 
-            for i, cat in enumerate(cats[group]):
-                try:
-                    cat_probs[group][cat] = np.exp(cat * (R - g_C) 
-                                                   - np.sum(T[group][:i + 1]))
-                except TypeError:
-                    exc = ('Found non-integer values.  Make sure inputs are '
-                           'integers.\n')
-                    raise rasch_Error(exc)
+            # Category probabilities for all cells at once, cats x rows x items
+            # (cats x cells for sparse):  numerators over their sum across
+            # categories
+            try:
+                g_probs = np.exp(g_cats * g_theta - g_steps.reshape(g_cats.shape))
+            except TypeError:
+                exc = ('Found non-integer values.  Make sure inputs are '
+                       'integers.\n')
+                raise rasch_Error(exc)
 
-                cat_prob_denom += cat_probs[group][cat]
+            g_sums = np.sum(g_probs, axis=0)
+            g_probs /= g_sums
+            cat_probs[group] = g_probs
 
-            # For each category:  Numerator / Denominator
-            for cat in cats[group]:
-                cat_probs[group][cat] = cat_probs[group][cat] / cat_prob_denom
+            # Log-likelihood, for line search:  the normalizing terms here
+            if newton:
+                g_ll = np.where(g_miss, 0.0, np.log(g_sums))
+                loglik -= np.sum(g_ll if x_wt is None else g_ll * x_wt)
 
-            # Calculate expected values (estimates)
-            for cat in cats[group]:
-                g_est = np.where(g_obs == nanval, nanval,
-                                 g_est + (cat * cat_probs[group][cat]))
+            # Expected values (estimates) and cell variances:
+            # sum(cat^2 * p[cat])[cats] - est^2
+            g_term = g_cats * g_probs
+            g_est_fin = np.sum(g_term, axis=0)
+            np.multiply(g_cats**2, g_probs, out=g_term)
+            g_var = np.sum(g_term, axis=0)
+            del g_term
 
-                # Estimates for final iteration, no nanvals
-                if stop == 1:
-                    g_est_fin += cat * cat_probs[group][cat]
+            g_est = np.where(g_miss, nanval, g_est_fin)
+            g_var = np.where(g_miss, nanval, g_var - g_est**2)
 
-            # Cell variances: sum(cat^2 * p[cat])[cats] - est^2)
-            for cat in cats[group]:
-                g_var = np.where(g_obs == nanval, nanval,
-                                 g_var + (cat**2 * cat_probs[group][cat]))
+            # Populate estimates array.  Final iteration keeps estimates
+            # of missing cells.
+            x_est[..., ind] = g_est
+            x_var[..., ind] = g_var
 
-                # Estimates for final iteration, no nanvals
-                if stop == 1:
-                    g_var_fin += (cat**2 * cat_probs[group][cat])
+            if stop == 1 and sparse is None:
+                est_fin[:, ind] = g_est_fin
 
-            # Add estimates term of variance formula above
-            g_var = np.where(g_obs == nanval, nanval,
-                             g_var - g_est**2)
+        # For sparse, keep the measures of the final pass to build est_fin
+        if stop == 1 and sparse is not None:
+            R_fin, C_fin = np.copy(R), np.copy(C)
+            T_fin = dict([(group, np.copy(T[group])) for group in groups_list])
 
-            if stop == 1:
-                g_var_fin += g_var_fin - g_est**2
+        # Log-likelihood terms of the raw scores, which collapsed rows
+        # keep, and of item and category counts, from all rows
+        if newton:
+            if x_wt is None:
+                loglik += np.sum(R * R_obs)
+            else:
+                loglik += np.sum(R * R_obs[collapsed['Rows']] * x_wt)
+            loglik -= np.sum(C * C_obs)
+            for group in groups_list:
+                loglik -= np.dot(T[group][1:], obs_above[group])
+
+        # Newton line search:  halve a step that lowered the likelihood
+        if (newton
+            and stop == 0
+            and step is not None
+            and loglik < step['loglik'] - 1e-10 * abs(step['loglik'])
+            and step['size'] > 1.0 / 64
+            ):
+            step['size'] /= 2
+            R, C, T = take_step(step)
+            n_back += 1
 
-            # Populate estimates array
-            est[:, ind] = g_est
-            var[:, ind] = g_var
+            if self.verbose is True:
+                print it, '\t', 'step size', step['size']
 
-            if stop == 1:
-                est_fin[:, ind] = g_est_fin
-                var_fin[:, ind] = g_var_fin
+            continue
 
         # Get row/col sums of variances
-        for i in xrange(nrows):
-            R_var[i, :] = np.sum(var[i, :][R_locval[i]])
-
-        for i in xrange(ncols):
-            C_var[:, i] = np.sum(var[:, i][C_locval[i]])
+        R_var, C_var = valid_sums(x_var, x_valid, x_wt)
 
         R_var = np.clip(R_var, minvar, np.inf)
         C_var = np.clip(C_var, minvar, np.inf)
 
         # Get residuals
-        res = np.where(obs == nanval, nanval, obs - est)
-
-        # Get row/col sums of residuals
-        for i in xrange(nrows):
-            R_res[i, :] = np.sum(res[i, :][R_locval[i]])
-
-        for i in xrange(ncols):
-            C_res[:, i] = np.sum(res[:, i][C_locval[i]])
+        if sparse is None:
+            res = np.where(x_valid, x_obs - x_est, nanval)
+        else:
+            res = x_obs - x_est
+
+        # Get row/col sums of residuals.  Collapsed score groups keep
+        # row raw scores but not column raw scores, so those come from
+        # the data.
+        R_res, C_res = valid_sums(res, x_valid, x_wt)
+        if x_wt is not None:
+            C_res = C_obs - valid_sums(x_est, x_valid, x_wt)[1]
+
+        # Newton-Raphson:  R, C, T together
+        if newton:
+            d_R, d_C, d_T, free = newton_step(x_valid, x_est, x_var, x_wt,
+                                              R_res, C_res, R_var, C_var)
+            step = {'R':R, 'C':C, 'T':T, 'd_R':d_R, 'd_C':d_C, 'd_T':d_T,
+                    'size':1.0, 'loglik':loglik}
+            R, C, T = take_step(step)
+
+            # Rows held at a logit limit, and the equal item residuals
+            # they leave under the centring of C, are not convergence
+            R_res = np.where(free, R_res, 0.0)
+            C_res = C_res - np.mean(C_res)
 
         # Calculate new R, C. Constrain change, constrain R and C.
-        R[R_nonanc_loc] = np.clip(R[R_nonanc_loc] +
-                                  np.clip(R_res[R_nonanc_loc] / R_var[R_nonanc_loc],
-                                          -1 * maxchange, maxchange),
-                                  min_row_logit,
-                                  max_row_logit)
-
-        # C handled differently because it has a group component
-        C[C_nonanc_loc] -= np.clip(C_res[C_nonanc_loc] / C_var[C_nonanc_loc],
-                                   -1 * maxchange, maxchange)
+        else:
+            R[R_nonanc_loc] = np.clip(R[R_nonanc_loc] +
+                                      np.clip(R_res[R_nonanc_loc] / R_var[R_nonanc_loc],
+                                              -1 * maxchange, maxchange),
+                                      min_row_logit,
+                                      max_row_logit)
 
-        # Impose limits on C
-        for i, item in enumerate(all_items):
-            if C[0][i] != nanval:
-                C[0][i] = np.clip(C[0][i], min_col_logit[item], max_col_logit[item])
+            # C handled differently because it has a group component
+            C[C_nonanc_loc] -= np.clip(C_res[C_nonanc_loc] / C_var[C_nonanc_loc],
+                                       -1 * maxchange, maxchange)
 
-        # Adjust C to have mean of zero
-        if (anchors is None
-            or anchors['col_ents'] is [None]):
-            C -= np.mean(C)
+            # Impose limits on C
+            C[0] = np.where(C[0] != nanval,
+                            np.clip(C[0], min_col_logit, max_col_logit),
+                            C[0])
 
-        # Calculate new T
-        if calc_T is True:
+            # Adjust C to have mean of zero
+            if (anchors is None
+                or anchors['col_ents'] is [None]):
+                C -= np.mean(C)
 
-            for group in groups_list:
-                if 0 in obs_cat_freq[group]:
-                    exc = 'One of your rating categories is not represented in the data.  Adjust validchars attribute.\n'
-                    raise rasch_Error(exc)
+            # Calculate new T
+            if calc_T is True:
 
-                for cat in cats[group]:
-                    valloc = np.where(cat_probs[group][cat] != nanval)
-                    exp_cat_freq[group][cat] = np.sum(cat_probs[group][cat][valloc])
+                for group in groups_list:
+                    g_probs = cat_probs[group]
+                    ncats = len(cats[group])
+                    if x_wt is not None:
+                        g_probs = g_probs * x_wt
+                    exp_cat_freq[group] = np.sum(g_probs.reshape(ncats, -1), axis=1)
 
                     # Bottom step category always set at zero
-                    if cat == 0:
-                        obs_step_rat[group][cat] = 0
-                        exp_step_rat[group][cat] = 0
-                        T[group][cat] = 0
+                    obs_step_rat[group][0] = 0
+                    exp_step_rat[group][0] = 0
+                    T[group][0] = 0
 
                     # Get ratios of adjacent observed cats and expected cats to get steps
-                    else:
-                        obs_step_rat[group][cat] = (obs_cat_freq[group][cat] /
-                                                    float(obs_cat_freq[group][cat - 1]))
-
-                        exp_step_rat[group][cat] = (exp_cat_freq[group][cat] /
-                                                    float(exp_cat_freq[group][cat - 1]))
+                    obs_step_rat[group][1:] = (obs_cat_freq[group][1:] /
+                                               obs_cat_freq[group][:-1].astype(float))
+                    exp_step_rat[group][1:] = (exp_cat_freq[group][1:] /
+                                               exp_cat_freq[group][:-1].astype(float))
+                    T[group][1:] += np.log(exp_step_rat[group][1:] / obs_step_rat[group][1:])
 
-                        T[group][cat] += np.log(exp_step_rat[group][cat] / obs_step_rat[group][cat])
-
-                # Adjust T to have mean of zero
-                T[group][1:] -= np.mean(T[group][1:])
+                    # Adjust T to have mean of zero
+                    T[group][1:] -= np.mean(T[group][1:])
 
         # Evaluate sums of residuals
         maxR_res = np.max(np.abs(R_res))
@@ -5587,9 +5930,28 @@ def _rasch(_locals):
         if self.verbose is True:
             print it, '\t', round(change, 4)
 
+        if Monitor is not None:
+            valid = res != nanval
+            if x_wt is None:
+                rmsr = np.sqrt(np.mean(res[valid]**2)) if np.any(valid) else None
+            else:
+                wts = np.where(valid, x_wt, 0.0)
+                rmsr = (np.sqrt(np.sum(wts * np.where(valid, res, 0.0)**2)
+                                / np.sum(wts)) if np.any(valid) else None)
+            Monitor({'iteration':it,
+                     'facet':None,
+                     'change':change,
+                     'max_res':max_res,
+                     'rmsr':rmsr,
+                     'seconds':time.time() - ItStart,
+                     'elapsed':time.time() - StartTime,
+                     'peak_mb':tools.peak_memory()
+                     })
+
         # Evaluate stopping conditions.  For extra iteration for final estimates.
         if (max_res < stop_when_change
             or it >= max_iteration - 1
+            or scored is not None
             ):
             stop += 1
 
@@ -5603,29 +5965,52 @@ def _rasch(_locals):
     ################
 
     # Get cell fit -- standardized residuals
-    fit = np.copy(obs)
-    valloc = np.where((res != nanval) & (var != nanval))  # was "or |" ??
-    fit[valloc] = res[valloc] / np.sqrt(var[valloc])
+    if sparse is None:
+        fit = np.copy(obs)
+        valloc = np.where((res != nanval) & (var != nanval))  # was "or |" ??
+        fit[valloc] = res[valloc] / np.sqrt(var[valloc])
+    else:
+        fit = res / np.sqrt(var)
 
     # Get standard errors
     R_se = np.sqrt(1 / R_var)
     C_se = np.sqrt(1 / C_var)
 
-    # Get row infit
-    for i in xrange(nrows):
-        R_infit[i, :] = np.sum(res[i, :][R_locval[i]]**2) / R_var[i, :]
-
-    # Get col infit
-    for i in xrange(ncols):
-        C_infit[:, i] = np.sum(res[:, i][C_locval[i]]**2) / C_var[:, i]
-
-    # Get row outfit
-    for i in xrange(nrows):
-        R_outfit[i, :] = np.average(fit[i, :][R_locval[i]]**2)
-
-    # Get col outfit
-    for i in xrange(ncols):
-        C_outfit[:, i] = np.average(fit[:, i][C_locval[i]]**2)
+    # Get row/col infit
+    R_res2, C_res2 = valid_sums(res**2)
+    R_infit = R_res2 / R_var
+    C_infit = C_res2 / C_var
+
+    # Get row/col outfit
+    R_fit2, C_fit2 = valid_sums(fit**2)
+    R_outfit = R_fit2 / R_count
+    C_outfit = C_fit2 / C_count
+
+    # For sparse, fill the cell arrays, and get the estimates of all
+    # cells from the final pass a block of rows at a time
+    if sparse is not None:
+        cells = (cell_rows, cell_cols)
+        res_, var_, fit_ = res, var, fit
+        res = np.zeros((nrows, ncols)) + nanval
+        res[cells] = res_
+        var = np.zeros((nrows, ncols)) + nanval
+        var[cells] = var_
+        fit = np.copy(obs)
+        fit[cells] = fit_
+        del res_, var_, fit_
+
+        est_fin = np.zeros((nrows, ncols))
+        nblock = max(1, 2**22 // ncols)
+        for start in xrange(0, nrows, nblock):
+            for group in groups_list:
+                ind = groups[group]['index']
+                g_cats = np.array(cats[group])[:, np.newaxis, np.newaxis]
+                g_steps = np.array([np.sum(T_fin[group][:i + 1])
+                                    for i in range(len(cats[group]))])
+                g_probs = np.exp(g_cats * (R_fin[start:start + nblock] - C_fin[:, ind])[np.newaxis, :, :]
+                                 - g_steps[:, np.newaxis, np.newaxis])
+                est_fin[start:start + nblock, ind] = (np.sum(g_cats * g_probs, axis=0)
+                                                      / np.sum(g_probs, axis=0))
 
     # Get row separation
     R_rmsr = tools.rmsr(None, None, R_se, nanval)
@@ -5933,6 +6318,14 @@ def _rasch(_locals):
                 'reliability':reliability
                 }
 
+    # Iteration counts
+    iterations = {'Solver':solver,
+                  'Iterations':it,
+                  'Backtracks':n_back,
+                  'Converged':(bool(max_res < stop_when_change)
+                               if scored is None else scored['Converged'])
+                  }
+
     # Output labels
     out = {'fac0coord':fac0coord,
            'fac1coord':fac1coord,
@@ -5948,7 +6341,8 @@ def _rasch(_locals):
            'fac0_outfit':fac0_outfit,
            'fac1_outfit':fac1_outfit,
            'reliability':reliability,
-           'summstat':summstat
+           'summstat':summstat,
+           'iterations':iterations
            }
 
     return out
@@ -5957,6 +6351,27 @@ def _rasch(_locals):
 
 
 
+######################################################################
+
+def _search_key(self, _locals, search, data, nanval, ndim):
+    "Cache key for a _bestdim() or _bestseed() search of data."
+
+    try:
+        psmsindex = self.pseudomiss_out['psmsindex']
+    except AttributeError:
+        psmsindex = None
+
+    args = {'search':search, 'ndim':ndim}
+    for key in ['runspecs', 'seed', 'homogenize', 'pseudomiss', 'miss_meth',
+                'solve_meth', 'solve_meth_specs', 'condcoord_', 'weightcoord',
+                'jolt_', 'feather']:
+        args[key] = _locals[key]
+
+    return tools.search_key(data, nanval, psmsindex, args)
+
+
+
+
 ######################################################################
 
 def _bestdim(_locals):
@@ -6038,7 +6453,9 @@ def _bestdim(_locals):
         if 'NonDegen' in SeedRStat:
             nondegen = True
 
-    elif isinstance(_locals['seed'],int):
+    elif (isinstance(_locals['seed'],int)
+          or _locals['seed'] == 'SVD'
+          ):
         DimSeed = _locals['seed'] #'Auto4BestDim_Fast'
         SeedRStat = None #'Stab'
 
@@ -6046,6 +6463,18 @@ def _bestdim(_locals):
         exc = 'Unable to figure out seed arg.\n'
         raise best_dim_in_coord_Error(exc)
 
+    # Reuse the result of an identical earlier search
+    cache = _locals['cache']
+    if cache is not None:
+        CacheKey = _search_key(self, _locals, 'bestdim', data, nanval, ndim)
+        cached = tools.search_cache(cache, CacheKey)
+        if cached is not None:
+            for attr in cached:
+                setattr(self, attr, cached[attr])
+            if self.verbose is True:
+                print 'Best Dimensionality = ',self.bestdim,'(cached)\n'
+            return None
+
     # Calculate maximum possible number of dimensions
     nInRow = [ncols - np.sum(data[i,:] == nanval) for i in range(nrows)]
     nInCol = [nrows - np.sum(data[:,i] == nanval) for i in range(ncols)]
@@ -6323,141 +6752,146 @@ def _bestdim(_locals):
     if self.verbose is True:
         print 'Getting best dimensionality...'
 
-    if 'search' not in ndim:
+    # Fit the dimensionalities in worker processes
+    refit = True if not (isinstance(DimSeed,int) or DimSeed == 'SVD') else None
+    workers = _locals['workers']
+    Pool = None
 
-        # Run coord() for each dimension
-        dim_stats = np.zeros((len(Dims),np.size(collabels,axis=1)))
-        for i,Dim in enumerate(Dims):
-            coord_args['ndim'] = [[Dim]]
+    # Or warm-start each dimensionality from the one below
+    Nested = {} if 'Nested' in ndim else None
 
-            if not isinstance(DimSeed,int):
+    if (workers is not None
+        and workers > 1
+        and format_ == 'array'
+        and len(Dims) > 1
+        and Nested is None
+        ):
+        Pool = tools.dimpool(workers,DimObj,stats,coord_args,SeedRStat,
+                             nanval,refit)
 
-                # Clear DimObj.seed for this dimensionality
-                try:
-                    del DimObj.seed
-                except AttributeError:
-                    pass
+    try:
+        if 'search' not in ndim or 'Fast' in ndim:
 
-                DimObj.coord(**coord_args)
+            # Or refit only the dims whose truncations of the highest one
+            # predict best
+            if 'Fast' in ndim:
+                if self.verbose is True:
+                    sys.stdout.write(str(np.max(Dims))+'(truncated)..')
+                Dims = tools.truncate_dims(DimObj,Dims,coord_args,nanval)['Refit']
 
+            # Run coord() for each dimension
             if self.verbose is True:
-                sys.stdout.write(str(Dim)+'..')
-
-            stats_out = tools.stats_per_dim(DimObj,stats,Dim,coord_args,SeedRStat,nanval)
-            dim_stats[i,0] = Dim
-            for j,stat in enumerate(stats):
-                dim_stats[i,j+1] = stats_out[stat]
+                sys.stdout.write('..'.join([str(Dim) for Dim in Dims])+'..')
 
-        objperdim = format_objperdim(collabels, dim_stats)
-        out = get_bestdim(objperdim,best_crit)
-        bestdim = out['bestdim']
-        objectivity = out['objectivity']
+            stats_outs = tools.stats_per_dims(DimObj,stats,Dims,coord_args,
+                                              SeedRStat,nanval,refit,Pool,Nested)
+            dim_stats = np.zeros((len(Dims),np.size(collabels,axis=1)))
+            for i,Dim in enumerate(Dims):
+                dim_stats[i,0] = Dim
+                for j,stat in enumerate(stats):
+                    dim_stats[i,j+1] = stats_outs[i][stat]
 
+            objperdim = format_objperdim(collabels, dim_stats)
+            out = get_bestdim(objperdim,best_crit)
+            bestdim = out['bestdim']
+            objectivity = out['objectivity']
 
-    ######################
-    ##  Binary 'search' ##
-    ##     method       ##
-    ######################
 
-    elif 'search' in ndim:
-
-        # Initialize variables
-        #Stop = False
-        it = 0
-        MinDim = np.min(Dims)
-        MaxDim = np.max(Dims)
-        range_ = MaxDim - MinDim
-        DimCutRange = [#int(np.ceil(0.25 * range_)),
-                       int(np.ceil(0.50 * range_)),
-                       #int(np.ceil(0.75 * range_))
-                       ]
-        DimCut = DimCutRange[0]
-        DimStep = 1
-        slope = 1
-        SlopeCut = 0.0
-        StopWhenChange = 1
-        MaxIteration = 10
-        crit_col = np.where(collabels == best_crit)[1][0]
-        objperdim = np.zeros((0,np.size(collabels)))
-
-        # Get best dimensionality with binary search using three different starting DimCuts
-        for DimCut in DimCutRange:
-            Stop = False
-            LoCut = MinDim
-            HiCut = MaxDim
-
-            while Stop is False:
-                PrevDimCut = np.copy(DimCut)
-
-                # Calc Dim1 error on first iteration to set error range
-                if it == 0:
-                    DimPair = [1,DimCut,DimCut + DimStep]
-                else:
-                    DimPair = [DimCut,DimCut + DimStep]
+        ######################
+        ##  Binary 'search' ##
+        ##     method       ##
+        ######################
 
-                # Calc error for pair of near-adjacent dims
-                dim_stats = np.zeros((len(DimPair),np.size(collabels,axis=1)))
+        elif 'search' in ndim:
+
+            # Initialize variables
+            #Stop = False
+            it = 0
+            MinDim = np.min(Dims)
+            MaxDim = np.max(Dims)
+            range_ = MaxDim - MinDim
+            DimCutRange = [#int(np.ceil(0.25 * range_)),
+                           int(np.ceil(0.50 * range_)),
+                           #int(np.ceil(0.75 * range_))
+                           ]
+            DimCut = DimCutRange[0]
+            DimStep = 1
+            slope = 1
+            SlopeCut = 0.0
+            StopWhenChange = 1
+            MaxIteration = 10
+            crit_col = np.where(collabels == best_crit)[1][0]
+            objperdim = np.zeros((0,np.size(collabels)))
+
+            # Get best dimensionality with binary search using three different starting DimCuts
+            for DimCut in DimCutRange:
+                Stop = False
+                LoCut = MinDim
+                HiCut = MaxDim
+
+                while Stop is False:
+                    PrevDimCut = np.copy(DimCut)
+
+                    # Calc Dim1 error on first iteration to set error range
+                    if it == 0:
+                        DimPair = [1,DimCut,DimCut + DimStep]
+                    else:
+                        DimPair = [DimCut,DimCut + DimStep]
 
-                for i,Dim in enumerate(DimPair):
-                    Dim = int(Dim)
-                    coord_args['ndim'] = [[Dim]]
+                    # Calc error for pair of near-adjacent dims
+                    dim_stats = np.zeros((len(DimPair),np.size(collabels,axis=1)))
+                    DimPair = [int(Dim) for Dim in DimPair]
 
                     if self.verbose is True:
-                        sys.stdout.write(str(Dim)+'..')
-
-                    if not isinstance(DimSeed,int):
+                        sys.stdout.write('..'.join([str(Dim) for Dim in DimPair])+'..')
 
-                        # Clear DimObj.seed for this dimensionality
-                        try:
-                            del DimObj.seed
-                        except AttributeError:
-                            pass
+                    stats_outs = tools.stats_per_dims(DimObj, stats, DimPair,
+                                                      coord_args, SeedRStat,
+                                                      nanval, refit, Pool, Nested)
 
-                        DimObj.coord(**coord_args)
+                    for i,Dim in enumerate(DimPair):
+                        dim_stats[i,0] = Dim
 
-                    stats_out = tools.stats_per_dim(DimObj, stats, Dim,
-                                                    coord_args, SeedRStat,
-                                                    nanval)
-                    dim_stats[i,0] = Dim
+                        for j,stat in enumerate(stats):
+                            dim_stats[i,j+1] = stats_outs[i][stat]
 
-                    for j,stat in enumerate(stats):
-                        dim_stats[i,j+1] = stats_out[stat]
+                    objperdim = np.append(objperdim, dim_stats, axis=0)
+                    base_err = np.abs(float(objperdim[0,crit_col]))
+                    left_err = objperdim[-2,crit_col]
+                    right_err = objperdim[-1,crit_col]
+                    slope = (left_err - right_err) / base_err
 
-                objperdim = np.append(objperdim, dim_stats, axis=0)
-                base_err = np.abs(float(objperdim[0,crit_col]))
-                left_err = objperdim[-2,crit_col]
-                right_err = objperdim[-1,crit_col]
-                slope = (left_err - right_err) / base_err
+                    if best_crit == 'Err':
+                        slope = -1 * slope
 
-                if best_crit == 'Err':
-                    slope = -1 * slope
-
-                if slope >= SlopeCut:
-                    HiCut = DimCut
-                    DimCut = DimCut - (DimCut - LoCut) / 2.
-                else:
-                    LoCut = DimCut
-                    DimCut = DimCut + (HiCut - DimCut) / 2.
+                    if slope >= SlopeCut:
+                        HiCut = DimCut
+                        DimCut = DimCut - (DimCut - LoCut) / 2.
+                    else:
+                        LoCut = DimCut
+                        DimCut = DimCut + (HiCut - DimCut) / 2.
 
-                DimCut = np.clip(int(np.ceil(DimCut)),1,np.inf)
-                LoCut = np.clip(int(np.ceil(LoCut)),1,np.inf)
-                HiCut = np.clip(int(np.ceil(HiCut)),1,np.inf)
+                    DimCut = np.clip(int(np.ceil(DimCut)),1,np.inf)
+                    LoCut = np.clip(int(np.ceil(LoCut)),1,np.inf)
+                    HiCut = np.clip(int(np.ceil(HiCut)),1,np.inf)
 
-                # Change in DimCuts
-                Change = abs(DimCut - PrevDimCut)
+                    # Change in DimCuts
+                    Change = abs(DimCut - PrevDimCut)
 
-                # Stopping condition
-                if (Change <= StopWhenChange
-                    or it >= MaxIteration
-                    ):
-                    Stop = True
+                    # Stopping condition
+                    if (Change <= StopWhenChange
+                        or it >= MaxIteration
+                        ):
+                        Stop = True
 
-                it += 1
+                    it += 1
 
-        objperdim = format_objperdim(collabels, objperdim)
-        out = get_bestdim(objperdim,best_crit)
-        bestdim = out['bestdim']
-        objectivity = out['objectivity']
+            objperdim = format_objperdim(collabels, objperdim)
+            out = get_bestdim(objperdim,best_crit)
+            bestdim = out['bestdim']
+            objectivity = out['objectivity']
+    finally:
+        tools.facpool_close(Pool)
 
     #################
     ##    Build    ##
@@ -6481,6 +6915,16 @@ def _bestdim(_locals):
     self.maxposdim = maxposdim
     self.objectivity = objectivity
 
+    if cache is not None:
+        cached = {'objperdim':objperdim,
+                  'bestdim':bestdim,
+                  'maxposdim':maxposdim,
+                  'objectivity':objectivity
+                  }
+        if 'homogenize' in ndim:
+            cached['homogenized'] = self.homogenized
+        tools.search_cache(cache, CacheKey, cached)
+
     return None
 
 
@@ -6554,6 +6998,18 @@ def _bestseed(_locals):
     except AttributeError:
         ndim = int(_locals['ndim'][0][0])
 
+    # Reuse the result of an identical earlier search
+    cache = _locals['cache']
+    if cache is not None:
+        CacheKey = _search_key(self, _locals, 'bestseed', data['coredata'],
+                               nanval, ndim)
+        cached = tools.search_cache(cache, CacheKey)
+        if cached is not None:
+            self.seed = cached
+            if self.verbose is True:
+                print 'Best coordinate seed is',cached['BestSeed'],'(cached)\n'
+            return None
+
     # Variables
     nrows = np.size(D.coredata,axis=0) + D.nheaders4cols
     ncols = np.size(D.coredata,axis=1) + D.nheaders4rows
@@ -6640,10 +7096,12 @@ def _bestseed(_locals):
     Stats = ['Acc','Stab','Obj','Speed','Err']
     G1 = {'Get':'NoneExcept','Labels':'index','Entities':Cols[D.nheaders4rows::2]}
     G2 = {'Get':'NoneExcept','Labels':'index','Entities':Cols[D.nheaders4rows+1::2]}
+    Halving = None
 
     if isinstance(seed,dict):
         s_keys = seed.keys()
         MinR = seed['MinR'] if 'MinR' in s_keys else MinR
+        Halving = seed['Halving'] if 'Halving' in s_keys else Halving
         Facet = seed['Facet'] if 'Facet' in s_keys else Facet
         Stats = seed['Stats'] if 'Stats' in s_keys else Stats
         G1 = seed['Group1'] if 'Group1' in s_keys else G1
@@ -6700,16 +7158,34 @@ def _bestseed(_locals):
     It = 0
     Floor = 0.000001
     Ceiling = 0.999999
+    runspecs = _locals['runspecs']
+
+    # Successive halving:  all seeds start with a few iterations,
+    # the better half go on with twice as many, and so on.  Survivors
+    # pick up from their fits of the last round ('Warm'), so they run
+    # only the iterations added since then ('Prev').
+    if Halving is not None:
+        FullIt = runspecs[1]
+        Round = {'Seeds':range(1, MaxIt + 1),
+                 'Budget':min(2 if Halving is True else int(Halving), FullIt),
+                 'Prev':0,
+                 'Next':0,
+                 'R':{},
+                 'Warm':{}
+                 }
+        if len(Round['Seeds']) == 1:
+            Round['Budget'] = FullIt
 
     # Get objperseed collabels
     collabels = Stats[:]
     collabels.insert(0,'Seed')
     collabels = np.array(collabels)[np.newaxis,:]
-    objperseed = np.zeros((0,np.size(collabels,axis=1)))
+    SeedRows = {}
 
     if ('Obj' in Stats
         or ('Stab' in Stats
             and ('Acc' in Stats
+                 or 'Err' in Stats
                  or 'PsMsResid' in Stats
                  or 'NonDegen' in Stats
                  )
@@ -6722,12 +7198,25 @@ def _bestseed(_locals):
     else:
         acc_in_stab = None
 
+    # Each seed's stats share one set of split-half fits
+    Fits = {}
+
     # Run different coordinate seeds until Corr > R
     while Stop is False:
 
+        if Halving is None:
+            Seed = It + 1
+            RunSpecs = runspecs
+            Warm = None
+        else:
+            Seed = Round['Seeds'][Round['Next']]
+            Warm = Round['Warm'].get(Seed)
+            Its = Round['Budget'] - (0 if Warm is None else Round['Prev'])
+            RunSpecs = [runspecs[0], Its] + list(runspecs[2:])
+
         coord_args = {'ndim':[[ndim]],
-                      'runspecs':_locals['runspecs'],
-                      'seed':It + 1,
+                      'runspecs':RunSpecs,
+                      'seed':Seed,
                       'miss_meth':_locals['miss_meth'],
                       'solve_meth':_locals['solve_meth'],
                       'solve_meth_specs':_locals['solve_meth_specs'],
@@ -6737,6 +7226,11 @@ def _bestseed(_locals):
                       'pseudomiss':True if 'Acc' in Stats else None
                       }
 
+        # Warm-start a surviving seed (see coord() startercoord)
+        if Warm is not None:
+            coord_args['startercoord'] = Warm
+        Fit = None
+
         # Delegate to stability() function
         if ('Stab' in Stats
             or 'Obj' in Stats
@@ -6748,12 +7242,13 @@ def _bestseed(_locals):
                                        group1 = G1,
                                        group2 = G2,
                                        nanval = nanval,
-                                       verbose = self.verbose
+                                       verbose = self.verbose,
+                                       fits = Fits
                                        )
 
             Stab = np.clip(stab_out['Stability'],Floor,Ceiling) if stab_out is not None else np.nan
-            StabDict[It + 1] = Stab
-            StabDict[It + 1] = Stab
+            StabDict[Seed] = Stab
+            Fit = stab_out['Fit'] if stab_out is not None else None
 
             if len(Stats) == 1:
                 R = Stab
@@ -6768,10 +7263,10 @@ def _bestseed(_locals):
             and stab_out is not None
             ):
             Acc = np.clip(stab_out['Accuracy'],Floor,Ceiling)
-            AccDict[It + 1] = Acc
+            AccDict[Seed] = Acc
 
             psmsresid = stab_out['Err']
-            PsMsDict[It + 1] = psmsresid
+            PsMsDict[Seed] = psmsresid
 
             NonDegen_ = stab_out['NonDegen']
 
@@ -6779,18 +7274,21 @@ def _bestseed(_locals):
 
         # Delegate to _accuracy() function
         elif ('Acc' in Stats
+              or 'Err' in Stats
               or 'PsMsResid' in Stats
-              or 'NonDegen'
+              or 'NonDegen' in Stats
+              or 'Speed' in Stats
               or 'Obj' in Stats
               ):
             nondegen = True if 'NonDegen' in Stats else None
-            acc_out = tools.accuracy(D,coord_args,nondegen,nanval)
+            acc_out = tools.accuracy(D,coord_args,nondegen,nanval,Fits)
+            Fit = acc_out['Fit']
 
             if ('Acc' in Stats
                 or 'Obj' in Stats
                 ):
                 Acc = np.clip(acc_out['Accuracy'],Floor, Ceiling)
-                AccDict[It + 1] = Acc
+                AccDict[Seed] = Acc
                 if len(Stats) == 1:
                     R = Acc
                     RDict = AccDict
@@ -6800,7 +7298,7 @@ def _bestseed(_locals):
 
             if 'Err' in Stats:
                 psmsresid = acc_out['Err']
-                PsMsDict[It + 1] = psmsresid
+                PsMsDict[Seed] = psmsresid
             else:
                 psmsresid = np.nan
                 PsMsDict = None
@@ -6817,6 +7315,7 @@ def _bestseed(_locals):
         else:
             Acc = np.nan
             AccDict = None
+            psmsresid = NonDegen_ = Speed = np.nan
 
         if (('Stab' in Stats
              and 'Acc' in Stats)
@@ -6824,7 +7323,7 @@ def _bestseed(_locals):
             ):
             stab_acc = np.log(np.array([Stab,Acc])[~np.isnan(np.array([Stab,Acc]))])
             Obj = np.exp(np.mean(stab_acc))
-            ObjDict[It + 1] = Obj
+            ObjDict[Seed] = Obj
             R = Obj
             RDict = ObjDict
         else:
@@ -6834,22 +7333,55 @@ def _bestseed(_locals):
         # Collect stats
         stat_dict = {'Stab':Stab,'Acc':Acc,'Obj':Obj,'Err':psmsresid,'NonDegen':NonDegen_,'Speed':Speed}
         seed_stats = np.zeros((1,np.size(collabels,axis=1)))
-        seed_stats[0,0] = It + 1
+        seed_stats[0,0] = Seed
 
         for i,stat in enumerate(Stats):
             seed_stats[0,i + 1] = stat_dict[stat]
 
-        objperseed = np.append(objperseed,seed_stats,axis=0)
+        # A seed's latest (longest) run replaces its earlier ones
+        SeedRows[Seed] = seed_stats
+        if Halving is not None and Fit is not None:
+            Round['Warm'][Seed] = Fit
 
         # Evaluate stop
         It += 1
 
-        if (R > MinR
-            or It == MaxIt
-            ):
-            Stop = True
+        if Halving is None:
+            if (R > MinR
+                or It == MaxIt
+                ):
+                Stop = True
+
+        else:
+            Round['R'][Seed] = R
+            Round['Next'] += 1
+
+            # End of round:  keep the better half, double the iterations
+            if Round['Next'] == len(Round['Seeds']):
+                if Round['Budget'] >= FullIt:
+                    Stop = True
+                else:
+                    Ranked = sorted(Round['Seeds'],
+                                    key = lambda s_: (-Round['R'][s_]
+                                                      if np.isfinite(Round['R'][s_])
+                                                      else np.inf, s_))
+                    Round['Seeds'] = sorted(Ranked[:(len(Ranked) + 1) // 2])
+                    Round['Prev'] = Round['Budget']
+                    Round['Budget'] = min(2 * Round['Budget'], FullIt)
+                    Round['Next'] = 0
+                    Round['R'] = {}
+                    Round['Warm'] = dict([(s_, Round['Warm'][s_])
+                                          for s_ in Round['Seeds']
+                                          if s_ in Round['Warm']])
+
+                    # A lone survivor is the best seed; its score from
+                    # this round stands
+                    if len(Round['Seeds']) == 1:
+                        Stop = True
 
     # Print objperseed array
+    objperseed = np.concatenate([SeedRows[Seed] for Seed in sorted(SeedRows)],
+                                axis=0)
     objperseed = format_objperseed(np.append(collabels,objperseed,axis=0))
 
     if self.verbose is True:
@@ -6868,6 +7400,12 @@ def _bestseed(_locals):
     ############
 
     SeedRs = np.array(RDict.items())
+    Attempts = np.size(SeedRs,axis=0)
+
+    # With halving, only the seeds of the last, full-length round compete
+    if Halving is not None:
+        SeedRs = SeedRs[np.in1d(SeedRs[:,0], Round['Seeds'])]
+
     SeedRs = np.where(np.logical_or(np.isnan(SeedRs),np.isinf(SeedRs)),nanval,SeedRs)
     ValLoc = np.where(SeedRs[:,1] != nanval)[0]
 
@@ -6878,7 +7416,6 @@ def _bestseed(_locals):
         raise seed_in_coord_Error(exc)
 
     BestSeed = int(SeedRs[:,0][np.where(SeedRs[:,1] == BestR)][0])
-    Attempts = np.size(SeedRs,axis=0)
 
     if self.verbose is True:
         print 'Best coordinate seed is',BestSeed,', out of',Attempts,'attempts.\n'
@@ -6898,6 +7435,8 @@ def _bestseed(_locals):
                  'StatsPerSeed':objperseed
                  }
 
+    if cache is not None:
+        tools.search_cache(cache, CacheKey, self.seed)
 
     return None
 
@@ -6910,6 +7449,8 @@ def _bestseed(_locals):
 def _coord(_locals):
     "Basis of the coord() method."
 
+    StartTime = time.time()
+
     ########################
     ##  Prepare Variables ##
     ########################
@@ -6963,19 +7504,22 @@ def _coord(_locals):
         ndim = [[1]]        # Just placeholder, not used
 
     # Get seed
-    try:
-        seed = self.seed['BestSeed']
+    if _locals['seed'] == 'SVD':
+        seed = 'SVD'
+    else:
         try:
-            seed = int(seed)
-        except TypeError:
-            pass
-    except AttributeError:
-        if _locals['seed'] in ['Auto','Auto4BestDim','Auto4BestDim_Fast']:    # Only triggered if _bestseed() fails
-            seed = 1
-        elif isinstance(_locals['seed'],dict):
-            seed = 1
-        else:
-            seed = _locals['seed']
+            seed = self.seed['BestSeed']
+            try:
+                seed = int(seed)
+            except TypeError:
+                pass
+        except AttributeError:
+            if _locals['seed'] in ['Auto','Auto4BestDim','Auto4BestDim_Fast']:    # Only triggered if _bestseed() fails
+                seed = 1
+            elif isinstance(_locals['seed'],dict):
+                seed = 1
+            else:
+                seed = _locals['seed']
 
     # Get _locals
     runspecs = _locals['runspecs']
@@ -6993,6 +7537,12 @@ def _coord(_locals):
     jolt_ = _locals['jolt_']
     feather = _locals['feather']
 
+    # A previous coord_out or bank given as startercoord warm-starts both facets
+    warmstart = None
+    if isinstance(startercoord, (dict, str)):
+        warmstart = startercoord
+        startercoord = None
+
     # Define label variables (pytables can also be read in this context)
     data = datadict['coredata']
     rowlabels = datadict['rowlabels']
@@ -7043,6 +7593,14 @@ def _coord(_locals):
     if startercoord is not None:
         ndim = np.size(startercoord[1],axis=1)
 
+    if warmstart is not None:
+        Warm = tools.warm_coords(warmstart,KeyRowLabels,KeyColLabels,nanval)
+        ndim = Warm['ndim']
+
+        if self.verbose is True:
+            print ('Warm start: matched',Warm['nmatched'][0],'of',nfac0,'rows and',
+                   Warm['nmatched'][1],'of',nfac1,'columns.\n')
+
 #                anchors = {'Bank':______    # no default, must be specified
 #                           'Facet':1        # assumes bank stores column entities
 #                           'Coord':'ent_coord'  # type of anchor
@@ -7172,6 +7730,10 @@ def _coord(_locals):
             print 'ndim =',ndim if all_same is False else 0
             raise coord_Error(exc)
 
+    # Stream the data in blocks of rows instead of loading it
+    if _locals['chunk'] is not None:
+        return _coord_stream(locals())
+
 
     ########################
     ##  Prep for Missing  ##
@@ -7245,8 +7807,14 @@ def _coord(_locals):
     Data1SD = DataSD
     facmetric = Data1SD
 
+    # Warm start from previous coordinates, initializing new entities
+    if warmstart is not None:
+        Warm = tools.warm_fill(Warm,Data0,nanval)
+        fac0coord = Warm['fac0coord']
+        fac1coord = Warm['fac1coord']
+
     # Use startercoord (user-specified starter values)
-    if startercoord is not None:
+    elif startercoord is not None:
         if startercoord[0] == 0:
             fac0coord = np.copy(startercoord[1])
             fac1coord = np.zeros((nfac1,ndim))
@@ -7277,7 +7845,12 @@ def _coord(_locals):
     # Create random starter values
     else:
         if all_same is False:
-            if seed is None:
+            if seed == 'SVD':
+                Svd = tools.svd_coords(Data0,ndim,None,nanval)
+                fac0coord = Svd['fac0coord']
+                fac1coord = Svd['fac1coord']
+
+            elif seed is None:
                 fac0coord = npr.rand(nfac0,ndim) * facmetric
                 fac1coord = npr.rand(nfac1,ndim) * facmetric
 
@@ -7345,45 +7918,32 @@ def _coord(_locals):
     ##    Indices    ##
     ###################
 
-    # Index non-missing cells for each row
-    RowDatIndex = []
-    RowCountIndex = []
-
-    RowCoord = FacDict[0]
-    rownan = np.zeros(np.size(RowCoord,axis=0))
-    rownan[np.where(RowCoord == nanval)[0]] = nanval
-
-    ColCoord = FacDict[1]
-    colnan = np.zeros(np.size(ColCoord,axis=0))
-    colnan[np.where(ColCoord == nanval)[0]] = nanval
-
-    for i in xrange(nfac0):
-        RowArr = Data0[i,:]
-        RowNonMissLoc = np.where(np.logical_and(RowArr != nanval,colnan != nanval))[0]
-        nRowNonMiss = len(RowNonMissLoc)
-        RowDatIndex.append(RowNonMissLoc)
-        RowCountIndex.append(nRowNonMiss)
-
-    # Index non-missing cells for each column
-    ColDatIndex = []
-    ColCountIndex = []
-
-    for i in xrange(nfac1):
-        ColArr = Data0[:,i]
-        ColNonMissLoc = np.where(np.logical_and(ColArr != nanval,rownan != nanval))[0]
-        nColNonMiss = len(ColNonMissLoc)
-        ColDatIndex.append(ColNonMissLoc)
-        ColCountIndex.append(nColNonMiss)
-
-    # Put missing data and count indices in dictionary
+    # Index non-missing cells for each row and column, skipping
+    # opposing entities whose coordinates are invalid
+    rowvalid = np.all(FacDict[0] != nanval,axis=1)
+    colvalid = np.all(FacDict[1] != nanval,axis=1)
+
     DataIndexDict = {}
-    DataIndexDict[0] = RowDatIndex
-    DataIndexDict[1] = ColDatIndex
+    DataIndexDict[0] = tools.csr_index(Data0,nanval,axis=0,oppvalid=colvalid)
+    DataIndexDict[1] = tools.csr_index(Data0,nanval,axis=1,oppvalid=rowvalid)
 
     # Counts
     CountIndexDict = {}
-    CountIndexDict[0] = RowCountIndex
-    CountIndexDict[1] = ColCountIndex
+    CountIndexDict[0] = DataIndexDict[0].counts()
+    CountIndexDict[1] = DataIndexDict[1].counts()
+
+    # Group entities by missing-data pattern.  When entities sit on a
+    # limited number of fixed forms, solve once per pattern.
+    EngineDict = {0:'Batch', 1:'Batch'}
+    PatternDict = {0:None, 1:None}
+    if (miss_meth == 'IgnoreCells'
+        and pytables is None
+        ):
+        for Fac, nOpp in [(0, nfac1), (1, nfac0)]:
+            Patterns = tools.miss_patterns(DataIndexDict[Fac], nOpp)
+            if Patterns['nPatterns'] <= 0.25 * len(DataIndexDict[Fac]):
+                EngineDict[Fac] = 'Pattern'
+                PatternDict[Fac] = Patterns
 
     # Put data in dictionary row-wise and column-wise
     datadict = {}
@@ -7403,6 +7963,17 @@ def _coord(_locals):
 
     Data0 = None
 
+    # Start worker processes to share the facet solves
+    Pool = None
+    workers = _locals['workers']
+    if (workers is not None
+        and workers > 1
+        and miss_meth == 'IgnoreCells'
+        and pytables is None
+        ):
+        Pool = tools.facpool(workers, Data1, FacDict[0], FacDict[1],
+                             DataIndexDict, PatternDict)
+
 
     #####################
     ##   Calculate     ##
@@ -7423,6 +7994,21 @@ def _coord(_locals):
     WarnDict = {}
     joltflag = False
     changelog = np.zeros((0,4))
+    Accel = tools.accel_init(runspecs)
+
+    # Per-entity freezing (see tools.freeze_init())
+    Freeze = None
+    if (miss_meth == 'IgnoreCells'
+        and solve_meth == 'LstSq'
+        and quickancs is None
+        and anchors is None
+        ):
+        Freeze = tools.freeze_init(runspecs)
+    activelog = np.zeros((0,3))
+    ForceSweep = False
+
+    # Per-iteration records for the monitor argument (see tools.iter_monitor())
+    Monitor = tools.iter_monitor(_locals['monitor'],method='coord',ndim=ndim)
 
     if 'EstConverge' in runspecs:
         RMSR = 10.0
@@ -7442,248 +8028,352 @@ def _coord(_locals):
             print 'Dim', '\t', 'Fac', '\t', 'Iter', '\t', 'Change', '\t', 'jolt_'
 
     # Iterate between row and col coordinates until stopping condition is met
-    while Stop == 0:
+    try:
+        while Stop == 0:
 
-        #####################
-        # Set order for computing facet coordinates
-        if (quickancs is not None and quickancs[0] == 0):
-            Facs = [1]
-            MaxFacIt = 1
-            MaxIteration = 1
-            W_All = None
-            condcoord_ = None
-
-        elif (quickancs is not None and quickancs[0] == 1):
-            Facs = [0]
-            MaxFacIt = 1
-            MaxIteration = 1
-            W_All = None
-            condcoord_ = None
-
-        elif (anchors is not None and AncFac == 0):
-            Facs = [1, 0]
-            MaxFacIt = 2
-            MaxIteration = 1
-            W_All = None
-            condcoord_ = None
-
-        elif (anchors is not None and AncFac == 1):
-            Facs = [0, 1]
-            MaxFacIt = 2
-            MaxIteration = 1
-            W_All = None
-            condcoord_ = None
-
-        elif (startercoord is not None and startercoord[0] == 0):
-            Facs = [1, 0]
-            MaxFacIt = 2
-            MaxIteration = MaxIteration
-            W_All = weightcoord
-
-        elif (startercoord is not None and startercoord[0] == 1):
-            Facs = [0, 1]
-            MaxFacIt = 2
-            MaxIteration = MaxIteration
-            W_All = weightcoord
-
-        # Compute facet coordinates without anchoring
-        else:
-            Facs = [0, 1]
-            if (isinstance(condcoord_, dict)
-                and 'first' in condcoord_
-                and condcoord_['first'] == 0):
-                Facs = [1, 0]
-            MaxFacIt = 2
-            MaxIteration = MaxIteration
-            W_All = weightcoord
+            # Solve only entities still changing, except on full sweeps
+            FullSweep = (Freeze is None
+                         or ForceSweep is True
+                         or it % Freeze['Sweep'] == 0)
+            ForceSweep = False
+            nActive = [nfac0, nfac1]
 
+            #####################
+            # Set order for computing facet coordinates
+            if (quickancs is not None and quickancs[0] == 0):
+                Facs = [1]
+                MaxFacIt = 1
+                MaxIteration = 1
+                W_All = None
+                condcoord_ = None
 
-        ######################
-        ##  Cycle through   ##
-        ##     Facets       ##
-        ######################
+            elif (quickancs is not None and quickancs[0] == 1):
+                Facs = [0]
+                MaxFacIt = 1
+                MaxIteration = 1
+                W_All = None
+                condcoord_ = None
+
+            elif (anchors is not None and AncFac == 0):
+                Facs = [1, 0]
+                MaxFacIt = 2
+                MaxIteration = 1
+                W_All = None
+                condcoord_ = None
 
-        for Fac in Facs:
+            elif (anchors is not None and AncFac == 1):
+                Facs = [0, 1]
+                MaxFacIt = 2
+                MaxIteration = 1
+                W_All = None
+                condcoord_ = None
 
-            # Baseline to measure change
-            if (quickancs is None and anchors is None):
-                PrevFacCoord = np.copy(FacDict[Fac])
+            elif (startercoord is not None and startercoord[0] == 0):
+                Facs = [1, 0]
+                MaxFacIt = 2
+                MaxIteration = MaxIteration
+                W_All = weightcoord
+
+            elif (startercoord is not None and startercoord[0] == 1):
+                Facs = [0, 1]
+                MaxFacIt = 2
+                MaxIteration = MaxIteration
+                W_All = weightcoord
+
+            # Resume iterating from warm-start coordinates
+            elif warmstart is not None:
+                Facs = [1 - Warm['basis'], Warm['basis']]
+                MaxFacIt = 2
+                MaxIteration = MaxIteration
+                W_All = weightcoord
+
+            # Compute facet coordinates without anchoring
             else:
-                PrevFacCoord = None
+                Facs = [0, 1]
+                if (isinstance(condcoord_, dict)
+                    and 'first' in condcoord_
+                    and condcoord_['first'] == 0):
+                    Facs = [1, 0]
+                MaxFacIt = 2
+                MaxIteration = MaxIteration
+                W_All = weightcoord
+
+
+            ######################
+            ##  Cycle through   ##
+            ##     Facets       ##
+            ######################
+
+            HalfSteps = []
+            for Fac in Facs:
+                HalfStart = time.time()
+
+                # Baseline to measure change
+                if (quickancs is None and anchors is None):
+                    PrevFacCoord = np.copy(FacDict[Fac])
+                else:
+                    PrevFacCoord = None
 
-            # Define opposing facet
-            oppfac = list(set([0,1]) - set([Fac]))[0]
-            OppFacCoord = FacDict[oppfac]
+                # Define opposing facet
+                oppfac = list(set([0,1]) - set([Fac]))[0]
+                OppFacCoord = FacDict[oppfac]
 
-             # IRLS mode
-            if (solve_meth == 'IRLS'
-                and IRLSMode == 0
-                ):
-                Method1 = 'LstSq'
-            else:
-                Method1 = solve_meth
-
-            # Prepare weights for 'LstSq'
-            if W_All is not None:
-                if Method1 == 'LstSq':
-                    OppCount = np.array(CountIndexDict[oppfac])[:,np.newaxis]
-                    logn = np.where(OppCount < 1, 0, np.log(OppCount + 1))    # Prevent LogFacN = 0
-                    W_All = tools.weight_coord(OppFacCoord, logn, 'R', nanval)
-
-            # jolt_ coordinates of opposing (basis) facet if they look degenerate
-            if jolt_ is not None:
-                JoltOut = tools.jolt(U = OppFacCoord,     # [ent x dims coordinates array]
-                                     sigma = jolt_[0], # [(Max - Mean)/SD above which jolting is indicated]
-                                     jolt_ = jolt_[1],  # [jolt_*rand() amount of randomness to add to U]
-                                     joltflag = joltflag,  # [<True,False> => True if previous facet called for a jolt]
-                                     condcoord_ = condcoord_,  # [<None,condcoord() args> => condition jolt noise]
-                                     facet = 'Fac0' if oppfac == 0 else 'Fac1',  # [<None,'Fac0','Fac1'> => facet of U (used only by condcoord_)]
-                                     nanval = nanval # [Not-a-number value]
+                 # IRLS mode
+                if (solve_meth == 'IRLS'
+                    and IRLSMode == 0
+                    ):
+                    Method1 = 'LstSq'
+                else:
+                    Method1 = solve_meth
+
+                # Prepare weights for 'LstSq'
+                if W_All is not None:
+                    if Method1 == 'LstSq':
+                        OppCount = np.array(CountIndexDict[oppfac])[:,np.newaxis]
+                        logn = np.where(OppCount < 1, 0, np.log(OppCount + 1))    # Prevent LogFacN = 0
+                        W_All = tools.weight_coord(OppFacCoord, logn, 'R', nanval)
+
+                # jolt_ coordinates of opposing (basis) facet if they look degenerate
+                if jolt_ is not None:
+                    JoltOut = tools.jolt(U = OppFacCoord,     # [ent x dims coordinates array]
+                                         sigma = jolt_[0], # [(Max - Mean)/SD above which jolting is indicated]
+                                         jolt_ = jolt_[1],  # [jolt_*rand() amount of randomness to add to U]
+                                         joltflag = joltflag,  # [<True,False> => True if previous facet called for a jolt]
+                                         condcoord_ = condcoord_,  # [<None,condcoord() args> => condition jolt noise]
+                                         facet = 'Fac0' if oppfac == 0 else 'Fac1',  # [<None,'Fac0','Fac1'> => facet of U (used only by condcoord_)]
+                                         nanval = nanval # [Not-a-number value]
+                                         )
+                    OppFacCoord = JoltOut[0]
+                    joltflag = JoltOut[1]
+
+                # Tells faccoord not to skip anchored nanval coords
+                anchored = True if Fac == AncFac else False
+
+                Active = None
+                if FullSweep is False:
+                    Active = tools.freeze_active(Freeze,Fac)
+                    if Active is not None:
+                        nActive[Fac] = int(np.sum(Active))
+
+                # Calc coordinates for all entities in Fac facet
+                Out = tools.faccoord(targfac = [Fac,FacDict[Fac], anchored], # [ [FacetNum,FacetArray], e.g., [0,FacetArray0] => existing facet array to recalculate] ]
+                                     targdatindex = DataIndexDict[Fac], # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
+                                     data = datadict[Fac],   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
+                                     oppfac = OppFacCoord, # [Ents x dims array of coordinates of opposite facet(s), or their product]
+                                     oppweights = W_All,  # [array of weights corresponding to opposite facet array]
+                                     solve_meth = Method1, # [method for calculating coordinates <'LstSq','IRLS'>]
+                                     solve_meth_specs = solve_meth_specs,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
+                                     condcoord_ = condcoord_,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
+                                     miss_meth = miss_meth, # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
+                                     nanval = nanval, # [Not-a-Number value, to label non-numerical outputs]
+                                     engine = EngineDict[Fac],  # [<'Batch','Pattern','Loop'> => how to solve the 'LstSq' equations]
+                                     targpatterns = PatternDict[Fac],   # [None, output of miss_patterns() for targdatindex]
+                                     pool = Pool,   # [None, output of facpool() => worker processes]
+                                     active = Active,   # [None, boolean array => solve only these entities]
                                      )
-                OppFacCoord = JoltOut[0]
-                joltflag = JoltOut[1]
-
-            # Tells faccoord not to skip anchored nanval coords
-            anchored = True if Fac == AncFac else False
-
-            # Calc coordinates for all entities in Fac facet
-            Out = tools.faccoord(targfac = [Fac,FacDict[Fac], anchored], # [ [FacetNum,FacetArray], e.g., [0,FacetArray0] => existing facet array to recalculate] ]
-                                 targdatindex = DataIndexDict[Fac], # [None,targdatindex, e.g., TargDatInd0 => index of valid data per targ entity]
-                                 data = datadict[Fac],   # [2-D targfac x oppfac array of data (rotates so that targfac is always rows)]
-                                 oppfac = OppFacCoord, # [Ents x dims array of coordinates of opposite facet(s), or their product]
-                                 oppweights = W_All,  # [array of weights corresponding to opposite facet array]
-                                 solve_meth = Method1, # [method for calculating coordinates <'LstSq','IRLS'>]
-                                 solve_meth_specs = solve_meth_specs,  # [None, dictionary of specs specific to method, e.g. for IRLS -- {'runspecs':[0.001,10],'ecutmaxpos':[0.5,1.4],...}]
-                                 condcoord_ = condcoord_,  # [None,'Std','Orthonormal','Pos_1D_Dichot',funcstep dict => {0:'Fac = f0(Fac)',1:'Fac = f1(Fac)',...}>,} ]
-                                 miss_meth = miss_meth, # ['ImputeCells' => impute iterable values for missing cells; 'IgnoreCells' => skip missing cells entirely (preferred)]
-                                 nanval = nanval, # [Not-a-Number value, to label non-numerical outputs]
-                                 )
 
-            FacCoord = Out['FacCoord']
+                FacCoord = Out['FacCoord']
 
-            # Update facet dictionary
-            FacDict[Fac] = FacCoord
+                # Update facet dictionary
+                FacDict[Fac] = FacCoord
 
-            # Update warning dictionary
-            WarnDict[Fac] = [Out['Warn1'],Out['Warn2']]
+                # Time and change of the half-step, for the monitor
+                if Monitor is not None:
+                    HalfSteps.append({'iteration':it,
+                                      'facet':Fac,
+                                      'change':None if PrevFacCoord is None else
+                                               np.sqrt(np.mean((FacCoord - PrevFacCoord)**2))
+                                               / float(facmetric),
+                                      'seconds':time.time() - HalfStart
+                                      })
 
-            # report on iteration
-            if self.verbose is True:
-                try:
-                    if JoltOut[1] is True:
-                        JoltMsg = 'jolt_ >>>>'
-                    else:
-                        JoltMsg = ''
-                except NameError:
-                    JoltMsg = ''
+                # Record which entities are still moving
+                if Freeze is not None:
+                    tools.freeze_update(Freeze,Fac,PrevFacCoord,FacCoord,facmetric,nanval)
 
-                if 'EstConverge' in runspecs:
-                    print ndim, '\t', Fac, '\t', it, '\t', round(Change, 5), '\t', RMSR, '\t', RMSRChange
-                else:
-                    print ndim, '\t', Fac, '\t', it, '\t', round(Change, 5), '\t', JoltMsg
+                # Update warning dictionary
+                WarnDict[Fac] = [Out['Warn1'],Out['Warn2']]
 
-            # Set facet stop status
-            FacIt += 1
-            if FacIt >= MaxFacIt:
-                FacIt = 0
-                break
+                # report on iteration
+                if self.verbose is True:
+                    try:
+                        if JoltOut[1] is True:
+                            JoltMsg = 'jolt_ >>>>'
+                        else:
+                            JoltMsg = ''
+                    except NameError:
+                        JoltMsg = ''
+
+                    if 'EstConverge' in runspecs:
+                        print ndim, '\t', Fac, '\t', it, '\t', round(Change, 5), '\t', RMSR, '\t', RMSRChange
+                    else:
+                        print ndim, '\t', Fac, '\t', it, '\t', round(Change, 5), '\t', JoltMsg
 
-            # Record change for this facet
-            if (quickancs is None and anchors is None):
-                ChangeDict[Fac] = (np.sqrt(np.mean((FacCoord - PrevFacCoord)**2)) 
-                                   / float(facmetric))
+                # Set facet stop status
+                FacIt += 1
+                if FacIt >= MaxFacIt:
+                    FacIt = 0
+                    break
 
+                # Record change for this facet
+                if (quickancs is None and anchors is None):
+                    ChangeDict[Fac] = (np.sqrt(np.mean((FacCoord - PrevFacCoord)**2)) 
+                                       / float(facmetric))
+
+
+            ########################
+            ##  Evaluate Results  ##
+            ##   of Iteration i   ##
+            ########################
+
+            # Used for checking estimate convergence only
+            if 'EstConverge' in runspecs:
+                ValRows = np.where(FacDict[0][:,0] != nanval)[0]
+                ValCols = np.where(FacDict[1][:,0] != nanval)[0]
+
+                R = FacDict[0][ValRows]
+                C = FacDict[1][ValCols]
+                Est = np.dot(R,np.transpose(C))
+                Obs = Data1[ValRows]
+                Obs = np.transpose(np.transpose(Obs)[ValCols])
+                Val = np.where(Obs != nanval)
+                RMSRTemp = np.sqrt(np.mean((Obs[Val] - Est[Val])**2))
+                RMSRChange = RMSR - RMSRTemp
+                RMSR = RMSRTemp
+            else:
+                RMSR = np.nan
+                RMSRChange = np.nan
+
+            # Update missing cells, if necessary
+            if miss_meth == 'ImputeCells':
+
+                # Update missing cells with expected values
+                for h in xrange(nMsIndex):
+                    i = msindex[0][h]
+                    j = msindex[1][h]
+                    if np.logical_or(FacDict[0][i,0] == nanval,FacDict[1][j,0] == nanval):
+                        Data1[i,j] = nanval
+                    else:
+                        Data1[i,j] = np.dot(FacDict[0][i,:],np.transpose(FacDict[1][j,:]))
 
-        ########################
-        ##  Evaluate Results  ##
-        ##   of Iteration i   ##
-        ########################
+            # Reimpose anchors unless AncFresh is True, in which case all items
+            # will be refreshed.  AncFresh is False means all items not specified
+            # in anchors['Entities'] will keep their refreshed values.
+            if (anchors is not None
+                and AncFresh is False
+                ):
+                ix_ = AncValIndexDict[AncFac]
+                FacDict[AncFac][ix_] = AncFacDict[AncFac][ix_, :]
 
-        # Used for checking estimate convergence only
-        if 'EstConverge' in runspecs:
-            ValRows = np.where(FacDict[0][:,0] != nanval)[0]
-            ValCols = np.where(FacDict[1][:,0] != nanval)[0]
-
-            R = FacDict[0][ValRows]
-            C = FacDict[1][ValCols]
-            Est = np.dot(R,np.transpose(C))
-            Obs = Data1[ValRows]
-            Obs = np.transpose(np.transpose(Obs)[ValCols])
-            Val = np.where(Obs != nanval)
-            RMSRTemp = np.sqrt(np.mean((Obs[Val] - Est[Val])**2))
-            RMSRChange = RMSR - RMSRTemp
-            RMSR = RMSRTemp
-        else:
-            RMSR = np.nan
-            RMSRChange = np.nan
-
-        # Update missing cells, if necessary
-        if miss_meth == 'ImputeCells':
-
-            # Update missing cells with expected values
-            for h in xrange(nMsIndex):
-                i = msindex[0][h]
-                j = msindex[1][h]
-                if np.logical_or(FacDict[0][i,0] == nanval,FacDict[1][j,0] == nanval):
-                    Data1[i,j] = nanval
+            # Calculate change in coordinates
+            if (quickancs is None
+                and anchors is None
+                ):
+                if StopWhenChange == 0:
+                    Change = 1
                 else:
-                    Data1[i,j] = np.dot(FacDict[0][i,:],np.transpose(FacDict[1][j,:]))
+                    Change = max(ChangeDict.values())
 
-        # Reimpose anchors unless AncFresh is True, in which case all items
-        # will be refreshed.  AncFresh is False means all items not specified
-        # in anchors['Entities'] will keep their refreshed values.
-        if (anchors is not None
-            and AncFresh is False
-            ):
-            ix_ = AncValIndexDict[AncFac]
-            FacDict[AncFac][ix_] = AncFacDict[AncFac][ix_, :]
+            # Change table
+            changelog = np.append(changelog, 
+                                  np.array([[it, Change, RMSR, RMSRChange]]),
+                                  axis=0)
 
-        # Calculate change in coordinates
-        if (quickancs is None
-            and anchors is None
-            ):
-            if StopWhenChange == 0:
-                Change = 1
-            else:
-                Change = max(ChangeDict.values())
+            # Active-set table
+            activelog = np.append(activelog,
+                                  np.array([[it, nActive[0], nActive[1]]]),
+                                  axis=0)
 
-        # Change table
-        changelog = np.append(changelog, 
-                              np.array([[it, Change, RMSR, RMSRChange]]),
-                              axis=0)
+            # Send the half-step records to the monitor
+            if Monitor is not None:
+                if 'EstConverge' in runspecs:
+                    RMSR_ = RMSR
+                else:
+                    RMSR_ = tools.rmsr_index(FacDict[0],FacDict[1],DataIndexDict[0],
+                                             datadict[0],nanval)
+                for record in HalfSteps:
+                    record['rmsr'] = RMSR_
+                    record['elapsed'] = time.time() - StartTime
+                    record['peak_mb'] = tools.peak_memory()
+                    Monitor(record)
+
+            # Increment iteration
+            it += 1
+
+            # Set stop flag
+            if solve_meth != 'IRLS':
+                if (it < MaxIteration
+                    and Change > StopWhenChange
+                    ):
+                    Stop = 0
+                else:
+                    Stop = 1
 
-        # Increment iteration
-        it += 1
+            # Reset stop parameters for IRLS mode
+            elif solve_meth == 'IRLS':
+                if (it < MaxIteration
+                    and Change > StopWhenChange
+                    and IRLSMode == 0   # To prevent sliding back from IRLSMode = 1 to IRLSMode = 0
+                    ):
+                    IRLSMode = 0
+                    Stop = 0
+                else:
+                    IRLSMode = 1
+                    it_dich += 1
 
-        # Set stop flag
-        if solve_meth != 'IRLS':
-            if (it < MaxIteration
-                and Change > StopWhenChange
-                ):
-                Stop = 0
-            else:
-                Stop = 1
+            # Set stop flag if in IRLS mode
+            if IRLSMode == 1:
+                if (it_dich < MaxIterationDich
+                    and Change > StopWhenChangeDich
+                    ):
+                    Stop = 0
+                else:
+                    Stop = 1
 
-        # Reset stop parameters for IRLS mode
-        elif solve_meth == 'IRLS':
-            if (it < MaxIteration
-                and Change > StopWhenChange
-                and IRLSMode == 0   # To prevent sliding back from IRLSMode = 1 to IRLSMode = 0
+            # When freezing, stop only after a full sweep
+            if (Freeze is not None
+                and Stop == 1
+                and nActive != [nfac0, nfac1]
+                and it < MaxIteration
                 ):
-                IRLSMode = 0
                 Stop = 0
-            else:
-                IRLSMode = 1
-                it_dich += 1
+                ForceSweep = True
 
-        # Set stop flag if in IRLS mode
-        if IRLSMode == 1:
-            if (it_dich < MaxIterationDich
-                and Change > StopWhenChangeDich
+            # Accelerate convergence by extrapolating the coordinates of the
+            # facet computed last (never on the final iteration)
+            if (Accel is not None
+                and Stop == 0
+                and IRLSMode == 0
+                and PrevFacCoord is not None
                 ):
-                Stop = 0
-            else:
-                Stop = 1
+                FacDict[Fac] = tools.accelerate(PrevFacCoord,FacDict[Fac],Accel,nanval)
+    finally:
+        tools.facpool_close(Pool)
+
+    # Report on acceleration.  If asked, repeat the run without it to
+    # measure the iterations and time saved.
+    if Accel is not None:
+        RunTime = time.time() - StartTime
+        accel = {'meth':Accel['Meth'],
+                 'param':Accel['Param'],
+                 'iterations':it,
+                 'accel_its':Accel['nAccel'],
+                 'resets':Accel['nReset'],
+                 'time':RunTime,
+                 'its_saved':None,
+                 'time_saved':None
+                 }
+        if (Accel['Compare'] is True
+            and pytables is None
+            ):
+            _locals_ = _locals.copy()
+            _locals_['runspecs'] = Accel['PlainSpecs']
+            PlainStart = time.time()
+            PlainOut = _coord(_locals_)
+            accel['its_saved'] = len(PlainOut['changelog']) - it
+            accel['time_saved'] = time.time() - PlainStart - RunTime
+    else:
+        accel = None
         
 
     ###############
@@ -7773,7 +8463,9 @@ def _coord(_locals):
             'ndim':ndim if all_same is False else 0,
             'changelog':changelog,
             'anchors':anchors,
-            'facs_per_ent':facs_per_ent
+            'facs_per_ent':facs_per_ent,
+            'accel':accel,
+            'activelog':activelog if Freeze is not None else None
             }
 
 
@@ -7781,6 +8473,342 @@ def _coord(_locals):
 
 ######################################################################
 
+def _coord_stream(_clocals):
+    "coord() with chunk, streaming the data.  Called by _coord()."
+
+    # Get _coord() variables
+    self = _clocals['self']
+    _locals = _clocals['_locals']
+    data = _clocals['data']
+    ndim = _clocals['ndim']
+    seed = _clocals['seed']
+    runspecs = _clocals['runspecs']
+    startercoord = _clocals['startercoord']
+    condcoord_ = _clocals['condcoord_']
+    nanval = _clocals['nanval']
+    rowlabels = _clocals['rowlabels']
+    collabels = _clocals['collabels']
+
+    # Options that need the whole data array in memory
+    Unsupported = [('anchors', _clocals['anchors'] is not None),
+                   ('quickancs', _clocals['quickancs'] is not None),
+                   ('a warm start', _clocals['warmstart'] is not None),
+                   ('row startercoord', startercoord is not None
+                                        and startercoord[0] == 0),
+                   ("miss_meth = 'ImputeCells'",
+                    _clocals['miss_meth'] != 'IgnoreCells'),
+                   ("solve_meth = 'IRLS'", _clocals['solve_meth'] != 'LstSq'),
+                   ('jolt_', _clocals['jolt_'] is not None),
+                   ('feather', _clocals['feather'] is not None),
+                   ('workers', _locals['workers'] not in [None, 1]),
+                   ('pytables', _clocals['pytables'] is not None),
+                   ('runspecs flags', len(runspecs) > 2),
+                   ('ndim = 0', _clocals['all_same'] is True),
+                   ("condcoord 'first'", isinstance(condcoord_, dict)
+                                         and 'first' in condcoord_),
+                   ]
+    for name, found in Unsupported:
+        if found:
+            exc = 'chunk does not support '+name+'.\n'
+            raise coord_Error(exc)
+
+    # Get pseudo-missing cells
+    psmsindex = None
+    if _locals['pseudomiss'] is True:
+        try:
+            psmsindex = self.pseudomiss_out['parsed_psmsindex']
+            if psmsindex is None:
+                psmsindex = self.pseudomiss_out['psmsindex']
+        except AttributeError:
+            pass
+
+    if self.verbose is True:
+        print 'Streaming data in blocks of',_locals['chunk'],'rows.\n'
+        print 'Dim', '\t', 'Fac', '\t', 'Iter', '\t', 'Change'
+
+    Out = tools.stream_coord(data = data,
+                             ndim = ndim,
+                             runspecs = runspecs,
+                             chunk = _locals['chunk'],
+                             seed = seed,
+                             startercoord = None if startercoord is None else startercoord[1],
+                             condcoord_ = condcoord_,
+                             weightcoord = _clocals['weightcoord'],
+                             psmsindex = psmsindex,
+                             nanval = nanval,
+                             verbose = self.verbose,
+                             monitor = tools.iter_monitor(_locals['monitor'],method='coord',
+                                                          ndim=ndim,chunk=_locals['chunk']),
+                             )
+
+    if self.verbose is True:
+        print '\n'
+
+    if Out['Warn1'] is True:
+        print "Warning: Encountered a linear algebra error calculating an entity's coordinates.  Converting coordinates to nanval."
+
+    # Prepare fac0coord data object
+    nheaders4rows = _clocals['nheaders4rows']
+    nheaders4cols = _clocals['nheaders4cols']
+    key4rows = _clocals['key4rows']
+    key4cols = _clocals['key4cols']
+
+    F0RowLabels = np.append(rowlabels[key4cols,:][np.newaxis,:],rowlabels[nheaders4cols:,:],axis=0)
+    F0ColLabels = np.append(rowlabels[key4cols,:][np.newaxis,:],np.array(range(1,ndim + 1),ndmin=2),axis=1)
+
+    Fac0CoordRCD = {'rowlabels':F0RowLabels, 'collabels':F0ColLabels,
+                    'coredata':Out['fac0coord'], 'nheaders4rows':nheaders4rows,
+                    'key4rows':key4rows, 'rowkeytype':_clocals['rowkeytype'],
+                    'nheaders4cols':1, 'key4cols':0, 'colkeytype':int,
+                    'nanval':nanval, 'validchars':['All',['All'],'Num'],
+                    'opp_count':len(Out['fac1coord'])
+                    }
+
+    # Prepare fac1coord data object
+    F1RowLabels = np.transpose(np.append(collabels[:,key4rows][:,np.newaxis],collabels[:,nheaders4rows:],axis=1))
+    F1ColLabels = np.append(collabels[:,key4rows][np.newaxis,:],np.array(range(1,ndim + 1),ndmin=2),axis=1)
+
+    Fac1CoordRCD = {'rowlabels':F1RowLabels, 'collabels':F1ColLabels,
+                    'coredata':Out['fac1coord'], 'nheaders4rows':nheaders4cols,
+                    'key4rows':key4cols, 'rowkeytype':_clocals['colkeytype'],
+                    'nheaders4cols':1, 'key4cols':0, 'colkeytype':int,
+                    'nanval':nanval, 'validchars':['All',['All'],'Num'],
+                    'opp_count':len(Out['fac0coord'])
+                    }
+
+    return {'fac0coord':Fac0CoordRCD,
+            'fac1coord':Fac1CoordRCD,
+            'ndim':ndim,
+            'changelog':Out['changelog'],
+            'anchors':None,
+            'facs_per_ent':[1,2],
+            'accel':None,
+            'activelog':None
+            }
+
+
+
+
+######################################################################
+
+_SUBPOOL = {}
+
+def _subpool_init(specs):
+    "Worker initializer:  keep the sub_coord() data and specs."
+
+    _SUBPOOL.clear()
+    _SUBPOOL.update(specs)
+
+
+def _subpool_task(task):
+    "Worker task:  run one sub_coord() step for one subspace."
+
+    func, sub = task
+    return func(sub, _SUBPOOL)
+
+
+def _sub_map(func, subs, specs, workers):
+    """Run func(sub, specs) for each subspace, in worker processes if
+    workers > 1, and return the outputs in the order of subs."""
+
+    if (workers is not None
+        and workers > 1
+        and len(subs) > 1
+        ):
+        pool_ = mp.Pool(processes = min(workers, len(subs)),
+                        initializer = _subpool_init,
+                        initargs = (specs,))
+        try:
+            return pool_.map(_subpool_task, [(func, sub) for sub in subs])
+        finally:
+            tools.facpool_close({'Pool':pool_})
+    else:
+        return [func(sub, specs) for sub in subs]
+
+
+def _sub_tag(monitor, stage, sub, pred=None):
+    "Passes the monitor to a sub_coord() coord() run, tagged with where it is."
+
+    return tools.iter_monitor(monitor, caller='sub_coord', stage=stage,
+                              subspace=sub, predictor=pred)
+
+
+def _sub_fit(sub, specs):
+    "sub_coord():  get R coordinates and estimates for one subspace."
+
+    d = specs['Damon']
+    sub_params = specs['SubParams']
+    verbose = specs['Verbose']
+
+    sub_x = d.extract(d,
+                      getrows = {'Get':'AllExcept', 'Labels':'key', 'Rows':[None]},
+                      getcols = {'Get':'NoneExcept', 'Labels':specs['SubRow'], 'Cols':[sub]}
+                      )
+    sub_obj = dmn.core.Damon(sub_x, 'datadict', verbose=verbose)
+
+    if verbose is True:
+        print '\n\nRunning coord() on subspace', sub
+
+    if sub_params[sub] is not None:
+        sub_obj.coord(monitor=_sub_tag(specs['Monitor'], 'subspace', sub),
+                      **sub_params[sub])
+        sub_obj.base_est()
+
+    # Handle case where no coord() parameters are given
+    else:
+        pseudo_coords = {}
+        pseudo_coords['fac0coord'] = sub_x
+        sub_obj.coord_out = pseudo_coords
+        sub_obj.base_est_out = sub_x
+
+    return sub_obj
+
+
+def _sub_targ(targ, specs):
+    """sub_coord():  combine the target subspace with the unique
+    components of each predictor subspace, get its coordinates and
+    estimates."""
+
+    subs = specs['Subs']
+    sub_dict = specs['SubDict']
+    sub_params = specs['SubParams']
+    resid_params = specs['ResidParams']
+    unique_weights = specs['UniqueWeights']
+    share_if = specs['ShareIf']
+    min_rel = specs['MinRel']
+    rpt_optimal = specs['RptOptimal']
+    nrows = specs['NRows']
+    nanval = specs['NanVal']
+    verbose = specs['Verbose']
+    monitor = specs['Monitor']
+    optimal_weight = None
+
+
+    preds = list(set(subs) - set([targ]))
+
+    if len(preds) == len(subs):
+        exc = ('Buggy behavior:  number of predictors should be one less '
+               'than number of subspaces.')
+        raise sub_coord_Error(exc)
+
+    ntarg =  np.size(sub_dict[targ].coredata, axis=1)
+    targ_est = np.zeros((nrows, ntarg + ntarg * len(preds)))
+    est = sub_dict[targ].base_est_out['coredata']
+    end = np.size(est, axis=1)
+    targ_est[:, 0:end] = est
+
+    # Get estimates from each predictor subspace
+    for i, pred in enumerate(preds):
+        npred = np.size(sub_dict[pred].coredata, axis=1)
+
+        if (ntarg < share_if['targ_<']
+            and npred > share_if['pred_>']
+            and sub_dict[pred] is not None
+            ):
+            R_comm = sub_dict[pred].coord_out['fac0coord']['coredata']
+
+            # Get target residuals
+            targ_obj = dmn.core.Damon(sub_dict[targ].data_out, 'datadict', verbose=None)
+            targ_obj.coord(quickancs = [0, R_comm], feather=0.0001,
+                           monitor=_sub_tag(monitor, 'common', targ, pred))
+            targ_obj.base_est()
+            targ_obj.base_resid()
+            res = targ_obj.base_resid_out
+
+            # Calculate unique R
+            if verbose is True:
+                print '\n\nRunning coord() on residuals. Target:', targ, ', Predictor:', pred
+
+            res_obj = dmn.core.Damon(res, 'datadict', verbose=verbose)
+
+            try:
+                res_obj.coord(monitor=_sub_tag(monitor, 'residuals', targ, pred),
+                              **resid_params[targ])
+
+                # If searching, does ndim = 0 give lowest error?  If so, there is no unique dimension.
+                try:
+                    dim = res_obj.objperdim.core_col['Dim']
+                    err = res_obj.objperdim.core_col['Err']
+                    low_dim = dim[np.amin(err) == err[0]]
+
+                    if low_dim == 0:
+                        R_both = R_comm
+                        dim_unique = 0
+                        unique_weight_ = 0
+                    else:
+                        unique_weight_ = tools.get_unique_weight(targ, targ_obj, res_obj,
+                                                                 unique_weights, min_rel,
+                                                                 rpt_optimal)
+                        R_unique = res_obj.coord_out['fac0coord']['coredata']
+                        dim_unique = np.size(R_unique, axis=1)
+                        R_both = np.append(R_comm, R_unique, axis=1)
+
+                except AttributeError:
+                    unique_weight_ = tools.get_unique_weight(targ, targ_obj, res_obj,
+                                                             unique_weights, min_rel,
+                                                             rpt_optimal)
+                    R_unique = res_obj.coord_out['fac0coord']['coredata']
+                    dim_unique = np.size(R_unique, axis=1)
+                    R_both = np.append(R_comm, R_unique, axis=1)
+
+            except (coord_Error, TypeError):
+                R_unique = res_obj.coredata
+                dim_unique = np.size(R_unique, axis=1)
+                R_both = np.append(R_comm, R_unique, axis=1)
+                uw = unique_weights[targ] if unique_weights[targ] is not None else 0.0
+                unique_weight_ = {'unique_weight':uw, 'optimal_weight':None}
+
+            dim_both = np.size(R_both, axis=1)
+
+            # Apply weights to R
+            weights = np.ones((dim_both))
+            if dim_unique != 0:
+                weights[-dim_unique:] = unique_weight_['unique_weight']
+            optimal_weight = unique_weight_['optimal_weight']
+
+            # Get weighted estimates from combined R
+            targ_obj_ = dmn.core.Damon(targ_obj, 'Damon', verbose=None)
+            targ_obj_.coord(quickancs = [0, R_both], feather = 0.001,
+                            monitor=_sub_tag(monitor, 'combined', targ, pred))
+            C = targ_obj_.coord_out['fac1coord']['coredata']
+            est = tools.estimate(R_both * weights, C, nanval)
+
+            # Add latest estimates to targ_est
+            start = ntarg + i * ntarg
+            end = start + ntarg
+            targ_est[:, start:end] = est
+
+    # Lop off extra zeros from targ_est (caused by unused predictors)
+    zeros = np.all(targ_est == 0, axis=0)
+    targ_est = targ_est[:, zeros == False]
+
+    # Analyze targ_est
+    if verbose is True:
+        print '\n\nRunning coord() on composite estimates. Target:', targ
+
+    targ_est_obj = dmn.core.Damon(targ_est, 'array', verbose=verbose)
+
+    try:
+        targ_ndim = sub_params[targ]['ndim']
+    except TypeError:
+        targ_ndim = [[1]]
+
+    targ_est_obj.coord(ndim=targ_ndim, monitor=_sub_tag(monitor, 'composite', targ))
+    R = targ_est_obj.coord_out['fac0coord']['coredata']
+
+    # Apply R back to original target data
+    targ_obj_2 = dmn.core.Damon(sub_dict[targ].data_out, 'datadict', verbose=None)
+    targ_obj_2.coord(quickancs = [0, R], feather = 0.001,
+                     monitor=_sub_tag(monitor, 'final', targ))
+    targ_obj_2.base_est()
+    targ_est_obj = dmn.core.Damon(targ_obj_2.base_est_out, 'datadict', verbose=None)
+
+    return {'coord_out':targ_obj_2.coord_out,
+            'estimates':targ_est_obj,
+            'optimal_weight':optimal_weight
+            }
+
+
 def _sub_coord(_locals):
     "Basis of the sub_coord() method"
 
@@ -7793,6 +8821,8 @@ def _sub_coord(_locals):
     share_if = _locals['share_if']
     min_rel = _locals['min_rel']
     rpt_optimal = _locals['rpt_optimal']
+    monitor = _locals['monitor']
+    workers = _locals['workers']
     verbose = self.verbose
 
     # Get data
@@ -7912,154 +8942,39 @@ def _sub_coord(_locals):
     est_keys = tools.getkeys(est_dict, 'Col', 'Core', 'Auto', None)
 
     # Get R coordinates for each subspace (treated as "common")
-    sub_dict = {}
-    for sub in subs:
-        sub_x = d.extract(d,
-                          getrows = {'Get':'AllExcept', 'Labels':'key', 'Rows':[None]},
-                          getcols = {'Get':'NoneExcept', 'Labels':subrow, 'Cols':[sub]}
-                          )
-        sub_obj = dmn.core.Damon(sub_x, 'datadict', verbose=verbose)           
-
-        if verbose is True:
-            print '\n\nRunning coord() on subspace', sub
-
-        # Add subspace object to sub_dict
-        if sub_params[sub] is not None:
-            sub_obj.coord(**sub_params[sub])
-            sub_obj.base_est()
-            sub_dict[sub] = sub_obj
-
-        # Handle case where no coord() parameters are given
-        else:
-            pseudo_coords = {}
-            pseudo_coords['fac0coord'] = sub_x
-            sub_obj.coord_out = pseudo_coords
-            sub_obj.base_est_out = sub_x
-            sub_dict[sub] = sub_obj
+    specs = {'Damon':d,
+             'SubRow':subrow,
+             'SubParams':sub_params,
+             'Verbose':verbose,
+             'Monitor':monitor
+             }
+    sub_dict = dict(zip(subs, _sub_map(_sub_fit, subs, specs, workers)))
 
     # Compute coordinates and estimates for each subspace
-    for targ in subs:
-        
-        preds = list(set(subs) - set([targ]))
-
-        if len(preds) == len(subs):
-            exc = ('Buggy behavior:  number of predictors should be one less '
-                   'than number of subspaces.')
-            raise sub_coord_Error(exc)
-        
-        ntarg =  np.size(sub_dict[targ].coredata, axis=1)
-        targ_est = np.zeros((nrows, ntarg + ntarg * len(preds)))
-        est = sub_dict[targ].base_est_out['coredata']
-        end = np.size(est, axis=1)
-        targ_est[:, 0:end] = est
-
-        # Get estimates from each predictor subspace
-        for i, pred in enumerate(preds):
-            npred = np.size(sub_dict[pred].coredata, axis=1)
-
-            if (ntarg < share_if['targ_<']
-                and npred > share_if['pred_>']
-                and sub_dict[pred] is not None
-                ):
-                R_comm = sub_dict[pred].coord_out['fac0coord']['coredata']
-
-                # Get target residuals
-                targ_obj = dmn.core.Damon(sub_dict[targ].data_out, 'datadict', verbose=None)
-                targ_obj.coord(quickancs = [0, R_comm], feather=0.0001)
-                targ_obj.base_est()
-                targ_obj.base_resid()
-                res = targ_obj.base_resid_out
-
-                # Calculate unique R
-                if verbose is True:
-                    print '\n\nRunning coord() on residuals. Target:', targ, ', Predictor:', pred
-
-                res_obj = dmn.core.Damon(res, 'datadict', verbose=verbose)
-                
-                try:
-                    res_obj.coord(**resid_params[targ])
-
-                    # If searching, does ndim = 0 give lowest error?  If so, there is no unique dimension.
-                    try:
-                        dim = res_obj.objperdim.core_col['Dim']
-                        err = res_obj.objperdim.core_col['Err']
-                        low_dim = dim[np.amin(err) == err[0]]
-
-                        if low_dim == 0:
-                            R_both = R_comm
-                            dim_unique = 0
-                            unique_weight_ = 0
-                        else:
-                            unique_weight_ = tools.get_unique_weight(targ, targ_obj, res_obj,
-                                                                     unique_weights, min_rel,
-                                                                     rpt_optimal)
-                            R_unique = res_obj.coord_out['fac0coord']['coredata']
-                            dim_unique = np.size(R_unique, axis=1)
-                            R_both = np.append(R_comm, R_unique, axis=1)
-
-                    except AttributeError:
-                        unique_weight_ = tools.get_unique_weight(targ, targ_obj, res_obj,
-                                                                 unique_weights, min_rel,
-                                                                 rpt_optimal)
-                        R_unique = res_obj.coord_out['fac0coord']['coredata']
-                        dim_unique = np.size(R_unique, axis=1)
-                        R_both = np.append(R_comm, R_unique, axis=1)
-
-                except (coord_Error, TypeError):
-                    R_unique = res_obj.coredata
-                    dim_unique = np.size(R_unique, axis=1)
-                    R_both = np.append(R_comm, R_unique, axis=1)
-                    uw = unique_weights[targ] if unique_weights[targ] is not None else 0.0
-                    unique_weight_ = {'unique_weight':uw, 'optimal_weight':None}
-
-                dim_both = np.size(R_both, axis=1)
-
-                # Apply weights to R
-                weights = np.ones((dim_both))
-                if dim_unique != 0:
-                    weights[-dim_unique:] = unique_weight_['unique_weight']
-                optimal_weights[targ] = unique_weight_['optimal_weight']
-
-                # Get weighted estimates from combined R
-                targ_obj_ = dmn.core.Damon(targ_obj, 'Damon', verbose=None)
-                targ_obj_.coord(quickancs = [0, R_both], feather = 0.001)
-                C = targ_obj_.coord_out['fac1coord']['coredata']
-                est = tools.estimate(R_both * weights, C, nanval)
-
-                # Add latest estimates to targ_est
-                start = ntarg + i * ntarg
-                end = start + ntarg
-                targ_est[:, start:end] = est
-
-        # Lop off extra zeros from targ_est (caused by unused predictors)
-        zeros = np.all(targ_est == 0, axis=0)
-        targ_est = targ_est[:, zeros == False]
-
-        # Analyze targ_est
-        if verbose is True:
-            print '\n\nRunning coord() on composite estimates. Target:', targ
-
-        targ_est_obj = dmn.core.Damon(targ_est, 'array', verbose=verbose)
-
-        try:
-            targ_ndim = sub_params[targ]['ndim']
-        except TypeError:
-            targ_ndim = [[1]]
-
-        targ_est_obj.coord(ndim=targ_ndim)
-        R = targ_est_obj.coord_out['fac0coord']['coredata']
+    specs = {'Subs':subs,
+             'SubDict':sub_dict,
+             'SubParams':sub_params,
+             'ResidParams':resid_params,
+             'UniqueWeights':unique_weights,
+             'ShareIf':share_if,
+             'MinRel':min_rel,
+             'RptOptimal':rpt_optimal,
+             'NRows':nrows,
+             'NanVal':nanval,
+             'Verbose':verbose,
+             'Monitor':monitor
+             }
+    targ_outs = _sub_map(_sub_targ, subs, specs, workers)
 
-        # Apply R back to original target data
-        targ_obj_2 = dmn.core.Damon(sub_dict[targ].data_out, 'datadict', verbose=None)
-        targ_obj_2.coord(quickancs = [0, R], feather = 0.001)
-        targ_obj_2.base_est()
-        targ_est_obj = dmn.core.Damon(targ_obj_2.base_est_out, 'datadict', verbose=None)
+    for targ, targ_out in zip(subs, targ_outs):
+        optimal_weights[targ] = targ_out['optimal_weight']
 
         # Output coordinates
-        sub_coord_out[targ] = targ_obj_2.coord_out
+        sub_coord_out[targ] = targ_out['coord_out']
 
         # Load estimates into est_obj array
-        targ_keys = tools.getkeys(targ_obj_2, 'Col', 'Core', 'Auto', None)
+        targ_est_obj = targ_out['estimates']
+        targ_keys = tools.getkeys(targ_est_obj, 'Col', 'Core', 'Auto', None)
 
         for key in targ_keys:
             est = est_dict['coredata']
@@ -8105,6 +9020,7 @@ def _objectify(_locals):
     summdim = _locals['summdim']
     center = _locals['center']
     overwrite = _locals['overwrite']
+    workers = _locals['workers']
 
     # Extract the correct data to analyze
     try:
@@ -8352,6 +9268,15 @@ def _objectify(_locals):
     ##  Get Ests   ##
     #################
 
+    # Fit each distinct set of predictor entities once, possibly in parallel
+    pred_sets = [pred_dict[targ_ent][pred_sub]
+                 for targ_ent in targ_ents
+                 for pred_sub in pred_dict[targ_ent]]
+    RPerPreds = tools.coords_per_preds(d, pred_sets,
+                                       {'ndim':dim,'runspecs':runspecs,'seed':seed},
+                                       fac1start if starters_ is True else None,
+                                       workers)
+
     # Calculate objectivized estimates for each target entity
     for targ_ent in targ_ents:
 
@@ -8368,29 +9293,9 @@ def _objectify(_locals):
         sub_est = np.zeros((nrows,len(pred_subs))) + d.nanval
 
         for i,pred_sub in enumerate(pred_subs):
-            pred_data = d.extract(d,
-                                  getrows = {'Get':'AllExcept','Labels':'key','Rows':[None]},
-                                  getcols = {'Get':'NoneExcept','Labels':'key','Cols':pred_dict[targ_ent][pred_sub]},
-                                  labels_only = None,
-                                  )
-
-            if starters_ is True:
-                pred_coords = d.extract(fac1start,
-                                        getrows = {'Get':'NoneExcept','Labels':'key','Rows':pred_dict[targ_ent][pred_sub]},
-                                        getcols = {'Get':'AllExcept','Labels':'key','Cols':[None]},
-                                        labels_only = None
-                                        )
-                starter = [1,pred_coords['coredata']]
-                condcoord_ = None
-
-            else:
-                starter = None
-                condcoord_ = {'Fac0':'Orthonormal','Fac1':None}
 
-            # Calculate R
-            pred_obj = dmn.core.Damon(pred_data,'datadict_link',verbose=None)
-            pred_obj.coord(dim,runspecs,seed,startercoord=starter,condcoord_=condcoord_)
-            R = np.copy(pred_obj.coord_out['fac0coord']['coredata'])
+            # Get R
+            R = np.copy(RPerPreds[tuple(sorted(pred_dict[targ_ent][pred_sub]))])
 
             # Center estimates on observations
             if center is True: